@@ -0,0 +1,11 @@
+"""
+Benchmarks de rendimiento de Widget Sidebar
+
+- generator: bibliotecas sintéticas deterministas (semilla) de cualquier tamaño
+- runner: ejecuta los benchmarks y guarda los resultados en JSON
+- compare: compara dos archivos de resultados (p.ej. entre versiones)
+
+Uso:
+    python -m benchmarks run --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks compare before.json after.json
+"""
@@ -0,0 +1,69 @@
+"""
+CLI de benchmarks
+
+    python -m benchmarks run --sizes 1000 10000 --output results.json
+    python -m benchmarks generate --size 100000 --output library.db
+    python -m benchmarks compare before.json after.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from benchmarks.generator import generate_library, DEFAULT_SEED, USAGE_ROWS_PER_ITEM
+from benchmarks.runner import (
+    run_benchmarks, compare_results, format_results, format_comparison,
+    save_results, load_results, DEFAULT_SIZES, DEFAULT_REPEAT
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks", description="Benchmarks de Widget Sidebar")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Ejecutar la suite y guardar resultados JSON")
+    run.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    run.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    run.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    run.add_argument('--workdir', type=Path, default=root_dir / 'benchmarks' / '.work',
+                     help="Directorio de bibliotecas generadas (se reutilizan)")
+    run.add_argument('--output', type=Path, default=Path('benchmark_results.json'))
+
+    generate = commands.add_parser('generate', help="Generar solo una biblioteca")
+    generate.add_argument('--size', type=int, required=True)
+    generate.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    generate.add_argument('--usage-per-item', type=int, default=USAGE_ROWS_PER_ITEM)
+    generate.add_argument('--output', type=Path, required=True)
+
+    compare = commands.add_parser('compare', help="Comparar dos archivos de resultados")
+    compare.add_argument('before', type=Path)
+    compare.add_argument('after', type=Path)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.command == 'run':
+        results = run_benchmarks(args.workdir, args.sizes, args.seed, args.repeat)
+        save_results(results, args.output)
+        print(format_results(results))
+        print(f"\nResultados guardados en {args.output}")
+        return 0
+
+    if args.command == 'generate':
+        summary = generate_library(str(args.output), args.size, args.seed, args.usage_per_item)
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    rows = compare_results(load_results(args.before), load_results(args.after))
+    print(format_comparison(rows))
+    return 1 if any(row['regression'] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Generador determinista de bibliotecas grandes para benchmarks
+
+Con la misma semilla y tamaño genera siempre los mismos datos:
+- Categorías (~1 cada 200 items)
+- Items de los 4 tipos con tags de distribución Zipf (pocos tags muy
+  frecuentes, cola larga de tags raros)
+- Items sensibles (cifrados si `cryptography` está disponible)
+- Listas de 3 a 8 pasos, favoritos y algunos contenidos grandes
+- Historial de uso (item_usage_history, creada por la migración 5) con
+  popularidad Zipf por item; use_count y last_used de cada item son
+  coherentes con su historial
+
+Las fechas son relativas a `reference` (por defecto hoy a medianoche) para
+que las consultas "últimos N días" encuentren datos.
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from utils.compression import compress_text, CONTENT_COMPRESSION_THRESHOLD
+
+DEFAULT_SEED = 42
+USAGE_ROWS_PER_ITEM = 20          # 100k items -> 2M filas de historial
+ITEMS_PER_CATEGORY = 200
+TAG_VOCABULARY_SIZE = 300
+SENSITIVE_RATIO = 0.03
+LIST_RATIO = 0.05
+FAVORITE_RATIO = 0.02
+LARGE_CONTENT_RATIO = 0.01
+NEVER_USED_RATIO = 0.25
+BATCH_SIZE = 10000
+
+TYPE_WEIGHTS = {'TEXT': 40, 'CODE': 30, 'URL': 20, 'PATH': 10}
+TAGS_PER_ITEM_WEIGHTS = [15, 30, 25, 15, 10, 5]  # 0..5 tags
+
+WORDS = [
+    'git', 'docker', 'python', 'deploy', 'build', 'test', 'server', 'backup',
+    'config', 'login', 'api', 'database', 'query', 'report', 'script', 'cloud',
+    'linux', 'network', 'proxy', 'cache', 'log', 'monitor', 'release', 'branch',
+]
+
+
+def _get_encryption_manager():
+    """EncryptionManager de la app, o None si cryptography no está instalado"""
+    try:
+        from core.encryption_manager import EncryptionManager
+    except ImportError:
+        return None
+    return EncryptionManager()
+
+
+def _format_ts(value: datetime) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _make_content(rng: random.Random, item_type: str, index: int) -> str:
+    words = rng.sample(WORDS, 3)
+    if item_type == 'URL':
+        return f"https://{words[0]}.example.com/{words[1]}/{index}?q={words[2]}"
+    if item_type == 'PATH':
+        return f"C:\\Users\\dev\\{words[0]}\\{words[1]}\\{words[2]}_{index}.txt"
+    if item_type == 'CODE':
+        return f"{words[0]} {words[1]} --{words[2]} {index}"
+    return f"{words[0].capitalize()} {words[1]} {words[2]} note #{index}"
+
+
+def _make_large_content(rng: random.Random, index: int) -> str:
+    lines = [f"2026-01-01 00:00:{i % 60:02d} INFO {rng.choice(WORDS)} request {index}-{i}"
+             for i in range(800)]
+    return "\n".join(lines)
+
+
+def generate_library(db_path: str, size: int, seed: int = DEFAULT_SEED,
+                     usage_rows_per_item: int = USAGE_ROWS_PER_ITEM,
+                     reference: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Crear una biblioteca sintética en db_path (que no debe existir)
+
+    Args:
+        db_path: Ruta de la base de datos a crear
+        size: Número de items
+        seed: Semilla del generador
+        usage_rows_per_item: Filas medias de historial de uso por item
+        reference: Fecha de referencia para created_at/used_at
+
+    Returns:
+        Dict: Resumen con los conteos generados
+    """
+    if Path(db_path).exists():
+        raise FileExistsError(f"Database already exists: {db_path}")
+
+    rng = random.Random(seed)
+    reference = reference or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    encryption_manager = _get_encryption_manager()
+
+    db = DBManager(str(db_path))
+    conn = db.connect()
+
+    # Categorías
+    category_count = max(5, size // ITEMS_PER_CATEGORY)
+    category_ids = []
+    with db.transaction():
+        for i in range(category_count):
+            cursor = conn.execute(
+                "INSERT INTO categories (name, icon, order_index) VALUES (?, ?, ?)",
+                (f"{rng.choice(WORDS).capitalize()} {i}", '📁', i)
+            )
+            category_ids.append(cursor.lastrowid)
+
+    # Vocabulario de tags con pesos Zipf (rango 1 es el más frecuente)
+    tags = [f"{WORDS[i % len(WORDS)]}-{i}" for i in range(TAG_VOCABULARY_SIZE)]
+    tag_weights = [1.0 / (rank ** 1.1) for rank in range(1, TAG_VOCABULARY_SIZE + 1)]
+    types, type_weights = zip(*TYPE_WEIGHTS.items())
+
+    summary = {
+        'size': size, 'seed': seed, 'categories': category_count,
+        'sensitive': 0, 'list_items': 0, 'lists': 0, 'favorites': 0,
+        'large_items': 0, 'usage_rows': 0,
+        'encryption': encryption_manager is not None,
+    }
+
+    # Items
+    rows = []
+    index = 0
+    favorite_order = 0
+    while index < size:
+        category_id = rng.choice(category_ids)
+        created_at = _format_ts(reference - timedelta(minutes=rng.randrange(2 * 365 * 24 * 60)))
+
+        # Lista secuencial de 3 a 8 pasos
+        if rng.random() < LIST_RATIO / 5:
+            steps = min(rng.randint(3, 8), size - index)
+            list_group = f"Lista {summary['lists'] + 1}"
+            summary['lists'] += 1
+            for step in range(1, steps + 1):
+                content = f"{rng.choice(WORDS)} step {step} --target {index}"
+                rows.append((category_id, f"Paso {step}", content, 0, 'CODE', 0, 0, 0,
+                             json.dumps(['lista']), 1, list_group, step, created_at))
+                index += 1
+            summary['list_items'] += steps
+            continue
+
+        item_type = rng.choices(types, type_weights)[0]
+        tag_count = rng.choices(range(len(TAGS_PER_ITEM_WEIGHTS)), TAGS_PER_ITEM_WEIGHTS)[0]
+        item_tags = sorted(set(rng.choices(tags, tag_weights, k=tag_count)))
+
+        content = _make_content(rng, item_type, index)
+        content_compressed = 0
+        is_sensitive = 0
+        if rng.random() < LARGE_CONTENT_RATIO:
+            content, content_compressed = compress_text(_make_large_content(rng, index),
+                                                        CONTENT_COMPRESSION_THRESHOLD)
+            content_compressed = int(content_compressed)
+            summary['large_items'] += 1
+        elif encryption_manager and rng.random() < SENSITIVE_RATIO:
+            content = encryption_manager.encrypt(f"password-{index}")
+            is_sensitive = 1
+            summary['sensitive'] += 1
+
+        is_favorite = 1 if rng.random() < FAVORITE_RATIO else 0
+        if is_favorite:
+            favorite_order += 1
+            summary['favorites'] += 1
+
+        rows.append((category_id, f"{item_type.title()} {index}", content, content_compressed,
+                     item_type, is_sensitive, is_favorite, favorite_order if is_favorite else 0,
+                     json.dumps(item_tags), 0, None, 0, created_at))
+        index += 1
+
+    with db.transaction():
+        conn.executemany("""
+            INSERT INTO items
+                (category_id, label, content, content_compressed, type, is_sensitive,
+                 is_favorite, favorite_order, tags, is_list, list_group, orden_lista, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+    item_ids = [row[0] for row in conn.execute("SELECT id FROM items ORDER BY id")]
+
+    # Historial de uso: popularidad Zipf sobre una permutación de los items
+    used_ids = [item_id for item_id in item_ids if rng.random() >= NEVER_USED_RATIO]
+    rng.shuffle(used_ids)
+    popularity = [1.0 / (rank ** 0.9) for rank in range(1, len(used_ids) + 1)]
+    total_rows = size * usage_rows_per_item
+    stats = {}  # item_id -> [use_count, last_used]
+
+    with db.transaction():
+        remaining = total_rows if used_ids else 0
+        while remaining > 0:
+            batch = min(BATCH_SIZE, remaining)
+            picked = rng.choices(used_ids, popularity, k=batch)
+            usage_rows = []
+            for item_id in picked:
+                used_at = _format_ts(reference - timedelta(seconds=rng.randrange(365 * 24 * 3600)))
+                success = 1 if rng.random() < 0.97 else 0
+                usage_rows.append((item_id, used_at, rng.randint(5, 3000), success,
+                                   None if success else "Exit code 1"))
+                entry = stats.setdefault(item_id, [0, used_at])
+                entry[0] += 1
+                if used_at > entry[1]:
+                    entry[1] = used_at
+            conn.executemany("""
+                INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success, error_message)
+                VALUES (?, ?, ?, ?, ?)
+            """, usage_rows)
+            remaining -= batch
+
+        conn.executemany(
+            "UPDATE items SET use_count = ?, last_used = ? WHERE id = ?",
+            [(count, last_used, item_id) for item_id, (count, last_used) in stats.items()]
+        )
+
+    summary['usage_rows'] = total_rows if used_ids else 0
+    summary['db_size_bytes'] = Path(db_path).stat().st_size
+    db.close()
+    return summary
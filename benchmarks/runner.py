@@ -0,0 +1,395 @@
+"""
+Ejecución de benchmarks sobre bibliotecas generadas
+
+Cada caso se repite `repeat` veces y se guardan mínimo y mediana en ms.
+Un caso que falla (p.ej. falta `cryptography` o PyQt6 en el entorno) se
+registra con {'error': ...} sin interrumpir el resto.
+
+Las bibliotecas se generan en el directorio de trabajo y se reutilizan
+entre ejecuciones (library_<size>_s<seed>.db); el benchmark de importación
+masiva trabaja sobre una copia para no alterar la biblioteca base.
+"""
+
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Any, Callable, Dict, List
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from benchmarks.generator import generate_library, DEFAULT_SEED
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+BULK_IMPORT_ITEMS = 500
+RESULTS_FORMAT_VERSION = 1
+# Un caso es regresión si la mediana empeora en este factor...
+REGRESSION_FACTOR = 1.20
+# ...y en al menos estos milisegundos
+REGRESSION_MIN_MS = 2.0
+
+
+def time_case(func: Callable[[], Any], repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    Medir una función
+
+    Returns:
+        Dict: {'min_ms', 'median_ms', 'runs', 'result_size'} o {'error'}
+    """
+    timings = []
+    result = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000)
+    except Exception as e:
+        logger.debug("Benchmark case failed", exc_info=True)
+        return {'error': f"{e.__class__.__name__}: {e}"}
+
+    measurement = {
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(median(timings), 3),
+        'runs': repeat,
+    }
+    if isinstance(result, (list, tuple, dict)):
+        measurement['result_size'] = len(result)
+    return measurement
+
+
+def library_path(workdir: Path, size: int, seed: int) -> Path:
+    return Path(workdir) / f"library_{size}_s{seed}.db"
+
+
+def ensure_library(workdir: Path, size: int, seed: int) -> Dict[str, Any]:
+    """Generar la biblioteca si no existe y devolver su resumen"""
+    db_path = library_path(workdir, size, seed)
+    summary_path = db_path.with_suffix('.json')
+    if db_path.exists() and summary_path.exists():
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    if db_path.exists():
+        db_path.unlink()
+    start = time.perf_counter()
+    summary = generate_library(str(db_path), size, seed)
+    summary['generation_s'] = round(time.perf_counter() - start, 2)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def _load_items(db_path: Path) -> List:
+    """Items como objetos Item a partir de filas crudas (sin descifrar)"""
+    from models.item import Item, ItemType
+
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute("SELECT * FROM items").fetchall()
+    finally:
+        conn.close()
+
+    items = []
+    for row in rows:
+        item = Item(
+            item_id=str(row['id']),
+            label=row['label'],
+            content=row['content'],
+            item_type=ItemType(row['type'].lower()),
+            is_sensitive=bool(row['is_sensitive']),
+            is_favorite=bool(row['is_favorite']),
+            tags=json.loads(row['tags']) if row['tags'] else [],
+            is_list=bool(row['is_list']),
+            list_group=row['list_group'],
+            orden_lista=row['orden_lista'] or 0,
+            content_compressed=bool(row['content_compressed']),
+        )
+        item.use_count = row['use_count'] or 0
+        item.created_at = datetime.fromisoformat(row['created_at'])
+        item.last_used = datetime.fromisoformat(row['last_used']) if row['last_used'] else None
+        items.append(item)
+    return items
+
+
+def _popular_tag(db_path: Path) -> str:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute("SELECT tags FROM items WHERE tags != '[]' ORDER BY id LIMIT 1").fetchone()
+    finally:
+        conn.close()
+    return json.loads(row[0])[0] if row else ''
+
+
+# ========== CASOS ==========
+
+def bench_startup(db_path: Path, workdir: Path, repeat: int) -> Dict[str, Any]:
+    """Carga de categorías con sus items (lo que hace MainController.load_data)"""
+    from core.config_manager import ConfigManager
+
+    def load():
+        config = ConfigManager(str(db_path), base_dir=workdir)
+        try:
+            return config.get_categories()
+        finally:
+            config.db.close()
+
+    return {'startup.load_categories': time_case(load, repeat)}
+
+
+def bench_search(db_path: Path, repeat: int) -> Dict[str, Any]:
+    """DBManager.search_items con términos frecuentes, raros y sin resultados"""
+    from database.db_manager import DBManager
+
+    db = DBManager(str(db_path))
+    queries = {'common': 'git', 'rare': 'note #77', 'miss': 'zzz-no-match'}
+    try:
+        return {
+            f"search_items.{name}": time_case(lambda q=query: db.search_items(q, limit=50), repeat)
+            for name, query in queries.items()
+        }
+    finally:
+        db.close()
+
+
+def bench_filters(db_path: Path, repeat: int) -> Dict[str, Any]:
+    """AdvancedFilterEngine: apply_filters en memoria y build_query en SQL"""
+    from core.advanced_filter_engine import AdvancedFilterEngine
+
+    items = _load_items(db_path)
+    engine = AdvancedFilterEngine()
+    tag = _popular_tag(db_path)
+    cases = {
+        'type': {'type': ['CODE', 'URL']},
+        'tags_and_favorite': {'tags': {'values': [tag], 'mode': 'AND'}, 'is_favorite': False},
+        'use_count': {'use_count': {'operator': '>', 'value': 5}},
+        'combined': {
+            'type': ['TEXT', 'CODE'],
+            'has_tags': True,
+            'use_count': {'operator': '>=', 'value': 1},
+            'sort_by': 'use_count',
+            'top_n': 50,
+        },
+    }
+    results = {
+        f"filters.{name}": time_case(lambda f=filters: engine.apply_filters(items, f), repeat)
+        for name, filters in cases.items()
+    }
+
+    # Mismos filtros compilados a SQL: la base de datos devuelve las filas que cumplen
+    from database.db_manager import DBManager
+    db = DBManager(str(db_path))
+    try:
+        for name, filters in cases.items():
+            results[f"filters_sql.{name}"] = time_case(
+                lambda f=filters: engine.fetch_items(db, f, include_inactive=True),
+                repeat)
+    finally:
+        db.close()
+    return results
+
+
+def bench_dashboard(db_path: Path, repeat: int) -> Dict[str, Any]:
+    """DashboardManager.get_full_structure sin caché"""
+    from database.db_manager import DBManager
+    from core.dashboard_manager import DashboardManager
+
+    db = DBManager(str(db_path))
+    try:
+        manager = DashboardManager(db)
+        return {'dashboard.full_structure': time_case(
+            lambda: manager.get_full_structure(force_refresh=True), repeat)}
+    finally:
+        db.close()
+
+
+def bench_stats(db_path: Path, repeat: int) -> Dict[str, Any]:
+    """Consultas de StatsManager usadas por el dashboard de estadísticas"""
+    from core.stats_manager import StatsManager
+
+    stats = StatsManager(str(db_path))
+    cases = {
+        'most_used_30d': lambda: stats.get_most_used_items(limit=10, days=30),
+        'trending_7d': lambda: stats.get_trending_items(days=7, limit=10),
+        'never_used': stats.get_never_used_items,
+        'dashboard_stats': stats.get_dashboard_stats,
+        'usage_by_category': stats.get_usage_by_category,
+        'suggest_favorites': lambda: stats.suggest_favorites(limit=5),
+        'slowest_items': lambda: stats.get_slowest_items(limit=10),
+    }
+    return {f"stats.{name}": time_case(func, repeat) for name, func in cases.items()}
+
+
+def bench_bulk_import(db_path: Path, workdir: Path, items: int = BULK_IMPORT_ITEMS) -> Dict[str, Any]:
+    """AIBulkItemManager.create_items_bulk sobre una copia de la biblioteca"""
+    from database.db_manager import DBManager
+    from core.ai_bulk_manager import AIBulkItemManager
+    from models.bulk_item_data import BulkItemData
+
+    copy_path = Path(workdir) / f"{db_path.stem}_bulk.db"
+    shutil.copyfile(db_path, copy_path)
+    db = DBManager(str(copy_path))
+    try:
+        category_id = db.execute_query("SELECT id FROM categories ORDER BY id LIMIT 1")[0]['id']
+        bulk_items = [
+            BulkItemData(label=f"Bulk {i}", content=f"echo bulk {i}", type='CODE', tags='bulk,bench')
+            for i in range(items)
+        ]
+        manager = AIBulkItemManager(db)
+        result = time_case(lambda: manager.create_items_bulk(bulk_items, category_id), repeat=1)
+        result['items'] = items
+        return {'bulk_import': result}
+    finally:
+        db.close()
+        copy_path.unlink(missing_ok=True)
+
+
+def run_size(workdir: Path, size: int, seed: int, repeat: int) -> Dict[str, Any]:
+    """Ejecutar todos los casos para un tamaño de biblioteca"""
+    library = ensure_library(workdir, size, seed)
+    db_path = library_path(workdir, size, seed)
+
+    groups = {
+        'startup': lambda: bench_startup(db_path, workdir, repeat),
+        'search_items': lambda: bench_search(db_path, repeat),
+        'filters': lambda: bench_filters(db_path, repeat),
+        'dashboard': lambda: bench_dashboard(db_path, repeat),
+        'stats': lambda: bench_stats(db_path, repeat),
+        'bulk_import': lambda: bench_bulk_import(db_path, workdir),
+    }
+    results: Dict[str, Any] = {}
+    for name, group in groups.items():
+        try:
+            results.update(group())
+        except Exception as e:
+            # Típicamente un import que falla (dependencia no instalada)
+            logger.debug(f"Benchmark group {name} failed", exc_info=True)
+            results[name] = {'error': f"{e.__class__.__name__}: {e}"}
+    return {'library': library, 'results': results}
+
+
+def run_benchmarks(workdir: Path, sizes: List[int] = None, seed: int = DEFAULT_SEED,
+                   repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    Ejecutar la suite completa
+
+    Args:
+        workdir: Directorio para bibliotecas, .env y archivos temporales
+        sizes: Tamaños de biblioteca (número de items)
+        seed: Semilla del generador
+        repeat: Repeticiones por caso
+
+    Returns:
+        Dict: Resultados serializables a JSON
+    """
+    sizes = sizes or DEFAULT_SIZES
+    workdir = Path(workdir).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    # DBManager/EncryptionManager usan rutas relativas (.env) - aislarlas en workdir
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        runs = {str(size): run_size(workdir, size, seed, repeat) for size in sizes}
+    finally:
+        os.chdir(previous_cwd)
+
+    return {
+        'format': RESULTS_FORMAT_VERSION,
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'sizes': runs,
+    }
+
+
+# ========== COMPARACIÓN ==========
+
+def compare_results(before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Comparar dos resultados caso a caso (mediana)
+
+    Returns:
+        List[Dict]: [{'size', 'case', 'before_ms', 'after_ms', 'ratio', 'regression'}]
+    """
+    rows = []
+    for size, run in after.get('sizes', {}).items():
+        previous = before.get('sizes', {}).get(size, {}).get('results', {})
+        for case, measurement in run.get('results', {}).items():
+            old = previous.get(case, {})
+            before_ms = old.get('median_ms')
+            after_ms = measurement.get('median_ms')
+            ratio = (after_ms / before_ms
+                     if before_ms and after_ms is not None else None)
+            regression = (
+                ratio is not None
+                and ratio > REGRESSION_FACTOR
+                and after_ms - before_ms >= REGRESSION_MIN_MS
+            )
+            rows.append({
+                'size': size,
+                'case': case,
+                'before_ms': before_ms,
+                'after_ms': after_ms,
+                'ratio': round(ratio, 3) if ratio is not None else None,
+                'regression': regression,
+                'error': measurement.get('error') or old.get('error'),
+            })
+    return rows
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """Tabla de texto con la mediana de cada caso"""
+    lines = []
+    for size, run in results.get('sizes', {}).items():
+        library = run['library']
+        lines.append("=" * 60)
+        lines.append(f"BIBLIOTECA {size} items - {library['usage_rows']} usos "
+                     f"({library['db_size_bytes'] / (1024 * 1024):.1f} MB)")
+        lines.append("=" * 60)
+        for case, measurement in run['results'].items():
+            if 'error' in measurement:
+                lines.append(f"  {case:<32} ERROR {measurement['error']}")
+            else:
+                lines.append(f"  {case:<32} {measurement['median_ms']:>10.2f} ms")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Tabla de texto de compare_results"""
+    def fmt(value):
+        return f"{value:.2f}" if value is not None else "-"
+
+    lines = [f"{'size':>7}  {'caso':<32}{'antes':>10}{'después':>10}{'ratio':>8}"]
+    for row in rows:
+        flag = "  ⚠ REGRESIÓN" if row['regression'] else ""
+        lines.append(f"{row['size']:>7}  {row['case']:<32}{fmt(row['before_ms']):>10}"
+                     f"{fmt(row['after_ms']):>10}{fmt(row['ratio']):>8}{flag}")
+    return "\n".join(lines)
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    """Guardar resultados con claves ordenadas (diffs estables)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -8,12 +8,16 @@ License: MIT
 """
 
 import sys
+import time
+_STARTUP_T0 = time.perf_counter()  # Origen del timeline de arranque
+
 import logging
 import traceback
 from pathlib import Path
 from datetime import datetime
+from PyQt6.QtCore import Qt, QCoreApplication, QTimer
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtWebEngineWidgets import QWebEngineView  # Necesario para inicializar QtWebEngine
+_QT_IMPORTED = time.perf_counter()
 
 # Fix encoding for Windows console
 if sys.platform == 'win32' and sys.stdout:
@@ -67,12 +71,16 @@ if not getattr(sys, 'frozen', False):
     src_path = Path(__file__).parent / 'src'
     sys.path.insert(0, str(src_path))
 
+from utils.startup_tracer import get_startup_tracer, startup_span, save_launch, TIMELINE_FILENAME
+_APP_IMPORTS_T0 = time.perf_counter()
+
 from controllers.main_controller import MainController
 from views.main_window import MainWindow
 from core.auth_manager import AuthManager
 from core.session_manager import SessionManager
 from views.first_time_wizard import FirstTimeWizard
 from views.login_dialog import LoginDialog
+_APP_IMPORTED = time.perf_counter()
 
 
 def get_app_dir() -> Path:
@@ -89,6 +97,29 @@ def get_app_dir() -> Path:
         return Path(__file__).parent
 
 
+def start_startup_trace(app_dir: Path) -> None:
+    """Start the startup timeline, including the import phases measured above"""
+    tracer = get_startup_tracer()
+    tracer.start(origin=_STARTUP_T0, output_path=app_dir / TIMELINE_FILENAME)
+    tracer.record('imports.qt', _STARTUP_T0, _QT_IMPORTED)
+    tracer.record('imports.app', _APP_IMPORTS_T0, _APP_IMPORTED)
+
+
+def finish_startup_trace(controller) -> None:
+    """Close the startup timeline once the event loop is running and persist it"""
+    tracer = get_startup_tracer()
+    try:
+        categories = controller.get_categories(include_filtered=False)
+        tracer.set_metadata('categories', len(categories))
+        tracer.set_metadata('items', sum(len(cat.items) for cat in categories))
+        launch = tracer.finish()
+        if launch:
+            save_launch(launch, tracer.output_path)
+            logger.info(f"Startup completed in {launch['total_ms']:.0f} ms (timeline: {tracer.output_path})")
+    except Exception as e:
+        logger.warning(f"Could not save startup timeline: {e}")
+
+
 def ensure_database(db_path: Path) -> None:
     """
     Ensure database exists, create if necessary
@@ -115,6 +146,7 @@ def authenticate() -> bool:
         True if authenticated successfully, False if user cancelled
     """
     logger.info("Starting authentication flow...")
+    tracer = get_startup_tracer()
 
     auth_manager = AuthManager()
     session_manager = SessionManager()
@@ -127,6 +159,7 @@ def authenticate() -> bool:
     # Check if first time
     if auth_manager.is_first_time():
         logger.info("First time execution - showing FirstTimeWizard")
+        tracer.set_metadata('auth_prompted', True)
         wizard = FirstTimeWizard()
         result = wizard.exec()
 
@@ -139,6 +172,7 @@ def authenticate() -> bool:
 
     # Show login dialog
     logger.info("No valid session - showing LoginDialog")
+    tracer.set_metadata('auth_prompted', True)
     login = LoginDialog()
     result = login.exec()
 
@@ -161,26 +195,34 @@ def main():
         logger.info("Getting application directory...")
         app_dir = get_app_dir()
         logger.info(f"App directory: {app_dir}")
+        start_startup_trace(app_dir)
 
         db_path = app_dir / "widget_sidebar.db"
         logger.info(f"Database path: {db_path}")
 
         # Ensure database exists
         logger.info("Ensuring database exists...")
-        ensure_database(db_path)
+        with startup_span('db.open'):
+            ensure_database(db_path)
         logger.info("Database ready")
 
         # Initialize PyQt6 application
         logger.info("Initializing PyQt6 application...")
-        app = QApplication(sys.argv)
-        app.setApplicationName("Widget Sidebar")
+        with startup_span('qt.application'):
+            # QtWebEngine se importa al abrir el navegador (lazy); este atributo
+            # es lo que requiere que esté fijado antes de crear la QApplication
+            QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+            app = QApplication(sys.argv)
+            app.setApplicationName("Widget Sidebar")
         logger.info("PyQt6 application initialized")
 
         # Authentication flow
         logger.info("=" * 60)
         logger.info("AUTHENTICATION")
         logger.info("=" * 60)
-        if not authenticate():
+        with startup_span('auth'):
+            authenticated = authenticate()
+        if not authenticated:
             logger.info("Authentication cancelled - exiting application")
             sys.exit(0)
         logger.info("Authentication successful")
@@ -188,12 +230,14 @@ def main():
 
         # Initialize main controller with database path
         logger.info("Initializing MVC architecture...")
-        controller = MainController()
+        with startup_span('controller'):
+            controller = MainController()
         logger.info("MainController initialized")
 
         # Create main window with controller
         logger.info("Creating main window...")
-        window = MainWindow(controller)
+        with startup_span('window.create'):
+            window = MainWindow(controller)
         logger.info("MainWindow created")
 
         # Set controller's main_window reference for bidirectional communication
@@ -209,14 +253,19 @@ def main():
         categories = controller.get_categories()
         logger.info(f"Loaded {len(categories)} categories")
 
-        window.load_categories(categories)
+        with startup_span('window.load_categories'):
+            window.load_categories(categories)
         logger.info("Categories loaded into sidebar")
 
         # Show window
         logger.info("Showing window...")
-        window.show()
+        with startup_span('window.show'):
+            window.show()
         logger.info("Window shown")
 
+        # The timeline closes on the first event loop iteration
+        QTimer.singleShot(0, lambda: finish_startup_trace(controller))
+
         logger.info(f"[OK] Loaded {len(categories)} categories from SQLite")
         logger.info("[OK] UI fully functional")
         logger.info("Application ready!")
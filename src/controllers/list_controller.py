@@ -275,6 +275,39 @@ class ListController(QObject):
             logger.error(f"Error al obtener items de lista: {e}", exc_info=True)
             return []
 
+    def get_lists_with_steps(self, category_id: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las listas de una categoría con sus pasos (sin contenido)
+        en una sola consulta
+
+        Args:
+            category_id: ID de la categoría
+
+        Returns:
+            Lista de diccionarios con info de listas y sus 'steps' ordenados
+        """
+        try:
+            return self.db.get_lists_with_steps(category_id)
+        except Exception as e:
+            logger.error(f"Error al obtener listas con pasos: {e}", exc_info=True)
+            return []
+
+    def get_step_contents(self, item_ids: List[int]) -> Dict[int, str]:
+        """
+        Obtiene el contenido de los pasos de una lista (al expandirla)
+
+        Args:
+            item_ids: IDs de los pasos
+
+        Returns:
+            Contenido por ID de item
+        """
+        try:
+            return self.db.get_list_step_contents(item_ids)
+        except Exception as e:
+            logger.error(f"Error al obtener contenido de pasos: {e}", exc_info=True)
+            return {}
+
     def get_list_count(self, category_id: int) -> int:
         """
         Obtiene el número total de listas en una categoría
@@ -8,15 +8,17 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
 from core.clipboard_manager import ClipboardManager
+from core.clipboard_monitor import ClipboardMonitor
 from core.category_filter_engine import CategoryFilterEngine
 from core.pinned_panels_manager import PinnedPanelsManager
-from core.simple_browser_manager import SimpleBrowserManager
-from core.notebook_manager import NotebookManager
-from core.workarea_manager import WorkareaManager
+from core.lazy_manager import LazyManager
+from core.db_maintenance import DatabaseMaintenanceService
+from database.query_profiler import get_query_profiler
 from controllers.clipboard_controller import ClipboardController
 from controllers.list_controller import ListController
 from models.category import Category
 from models.item import Item
+from utils.startup_tracer import startup_span
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,17 +29,8 @@ class MainController:
 
     def __init__(self):
         # Initialize managers
-        self.config_manager = ConfigManager(db_path="widget_sidebar.db")
-        self.clipboard_manager = ClipboardManager()
-        self.category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
-        self.pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
-        self.browser_manager = SimpleBrowserManager(self.config_manager.db, controller=self)
-        self.notebook_manager = NotebookManager(self.config_manager.db)
-        self.workarea_manager = WorkareaManager()
-
-        # Initialize controllers
-        self.clipboard_controller = ClipboardController(self.clipboard_manager)
-        self.list_controller = ListController(self.config_manager.db, self.clipboard_manager)
+        with startup_span('controller.managers'):
+            self._init_managers()
 
         # Data
         self.categories: List[Category] = []  # All categories (unfiltered, for compatibility)
@@ -48,7 +41,50 @@ class MainController:
         self.main_window = None  # Will be set by main.py
 
         # Load initial data
-        self.load_data()
+        with startup_span('controller.load_data'):
+            self.load_data()
+
+    def _init_managers(self) -> None:
+        """Create managers and sub-controllers"""
+        self.config_manager = ConfigManager(db_path="widget_sidebar.db")
+        # SQL profiling is a developer setting (off unless enabled)
+        get_query_profiler().enabled = self.config_manager.settings.get_bool('query_profiler_enabled', False)
+        self.clipboard_monitor = ClipboardMonitor(self.config_manager.db, settings=self.config_manager.settings)
+        self.clipboard_manager = ClipboardManager(history_recorder=self.clipboard_monitor.record_copy)
+        self.category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
+        self.pinned_panels_manager = PinnedPanelsManager(
+            self.config_manager.db, state_store=self.config_manager.settings
+        )
+        # Heavy subsystems are created on first use (see core.lazy_manager)
+        self.browser_manager = LazyManager(
+            'SimpleBrowserManager', self._create_browser_manager,
+            deferred_calls=('set_main_window',), noop_until_loaded=('cleanup',)
+        )
+        self.notebook_manager = LazyManager('NotebookManager', self._create_notebook_manager)
+        self.workarea_manager = LazyManager('WorkareaManager', self._create_workarea_manager)
+
+        # Initialize controllers
+        self.clipboard_controller = ClipboardController(self.clipboard_manager)
+        self.list_controller = ListController(self.config_manager.db, self.clipboard_manager)
+
+        # Database maintenance runs in background when the user is idle
+        self.maintenance_service = DatabaseMaintenanceService(db_path="widget_sidebar.db")
+        self.maintenance_service.start()
+
+    def _create_browser_manager(self):
+        """Factory for the lazy browser manager"""
+        from core.simple_browser_manager import SimpleBrowserManager
+        return SimpleBrowserManager(self.config_manager.db, controller=self)
+
+    def _create_notebook_manager(self):
+        """Factory for the lazy notebook manager"""
+        from core.notebook_manager import NotebookManager
+        return NotebookManager(self.config_manager.db)
+
+    def _create_workarea_manager(self):
+        """Factory for the lazy workarea manager"""
+        from core.workarea_manager import WorkareaManager
+        return WorkareaManager()
 
     def load_data(self) -> None:
         """Load configuration and categories"""
@@ -88,6 +124,7 @@ class MainController:
 
     def set_current_category(self, category_id: str) -> bool:
         """Set the currently active category"""
+        self.maintenance_service.notify_activity()
         category = self.get_category(category_id)
         if category:
             self.current_category = category
@@ -101,12 +138,17 @@ class MainController:
 
     def copy_item_to_clipboard(self, item: Item) -> bool:
         """Copy an item to clipboard"""
+        self.maintenance_service.notify_activity()
         return self.clipboard_controller.copy_item(item)
 
     def get_clipboard_history(self, limit: int = 10):
         """Get clipboard history"""
         return self.clipboard_controller.get_history(limit)
 
+    def get_persistent_clipboard_history(self, limit: int = 100, offset: int = 0):
+        """Get persisted (deduplicated) clipboard history from the database"""
+        return self.config_manager.get_history(limit, offset)
+
     def get_setting(self, key: str, default=None):
         """Get a configuration setting"""
         return self.config_manager.get_setting(key, default)
@@ -250,7 +292,9 @@ class MainController:
             raise
 
     def __del__(self):
-        """Cleanup: close database connection and browser"""
+        """Cleanup: stop maintenance, close database connection and browser"""
+        if hasattr(self, 'maintenance_service'):
+            self.maintenance_service.stop()
         if hasattr(self, 'browser_manager'):
             self.browser_manager.cleanup()
         if hasattr(self, 'config_manager'):
@@ -0,0 +1,59 @@
+"""
+User Activity Filter - Detección de actividad del usuario en toda la aplicación
+
+Filtro de eventos instalado en QApplication que informa de cualquier entrada
+del usuario (teclado, ratón, rueda) en cualquier ventana de la aplicación.
+DatabaseMaintenanceService lo usa para posponer el mantenimiento mientras
+el usuario trabaja. Las notificaciones se limitan a una por intervalo para
+no añadir coste a cada movimiento del ratón.
+"""
+
+import time
+import logging
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QEvent
+
+logger = logging.getLogger(__name__)
+
+
+# Segundos mínimos entre dos notificaciones
+ACTIVITY_THROTTLE_SECONDS = 1.0
+
+ACTIVITY_EVENTS = frozenset({
+    QEvent.Type.KeyPress,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.MouseMove,
+    QEvent.Type.Wheel,
+    QEvent.Type.TouchBegin,
+})
+
+
+class UserActivityFilter(QObject):
+    """Filtro de eventos que llama a on_activity cuando el usuario interactúa"""
+
+    def __init__(self, on_activity: Callable[[], None],
+                 throttle_seconds: float = ACTIVITY_THROTTLE_SECONDS, parent=None):
+        """
+        Inicializar filtro
+
+        Args:
+            on_activity: Callback sin argumentos (p. ej. notify_activity)
+            throttle_seconds: Segundos mínimos entre llamadas
+        """
+        super().__init__(parent)
+        self.on_activity = on_activity
+        self.throttle_seconds = throttle_seconds
+        self._last_notified = 0.0
+
+    def eventFilter(self, obj, event):
+        if event.type() in ACTIVITY_EVENTS:
+            now = time.monotonic()
+            if now - self._last_notified >= self.throttle_seconds:
+                self._last_notified = now
+                try:
+                    self.on_activity()
+                except Exception as e:
+                    logger.error(f"Error in user activity callback: {e}")
+        return False  # No consumir el evento
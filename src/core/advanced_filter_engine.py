@@ -3,7 +3,7 @@ Advanced Filter Engine
 Motor de filtrado avanzado para items
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -22,8 +22,34 @@ class AdvancedFilterEngine:
     - Uso y popularidad (use_count, last_used)
     - Tags (multi-selección con AND/OR)
     - Fechas (created_at, last_used)
+
+    Los mismos filtros se pueden compilar a SQL parametrizado (build_query /
+    fetch_items) para traer de la base de datos solo los items que cumplen;
+    apply_filters queda para listas en memoria (items no guardados).
     """
 
+    # Columnas epoch indexadas (migración add_epoch_timestamps)
+    SQL_DATE_COLUMNS = {'last_used': 'i.last_used_ts', 'created_at': 'i.created_at_ts'}
+    SQL_USE_COUNT_OPERATORS = ('>', '>=', '<', '<=', '=')
+    SQL_SORT = {
+        'use_count_desc': "COALESCE(i.use_count, 0) DESC",
+        'use_count_asc': "COALESCE(i.use_count, 0) ASC",
+        'recent': "i.last_used_ts DESC",
+        'oldest': "i.created_at_ts ASC",
+        'label_asc': "LOWER(i.label) ASC",
+        'label_desc': "LOWER(i.label) DESC",
+    }
+    # Tags en JSON (formato actual) o CSV (legacy), coincidencia exacta
+    SQL_HAS_TAG = (
+        "(CASE WHEN json_valid(i.tags) "
+        "THEN EXISTS (SELECT 1 FROM json_each(i.tags) WHERE json_each.value = ?) "
+        "ELSE instr(',' || REPLACE(REPLACE(i.tags, ', ', ','), ' ,', ',') || ',', ',' || ? || ',') > 0 END)"
+    )
+    SQL_HAS_ANY_TAG = (
+        "(CASE WHEN json_valid(i.tags) THEN json_array_length(i.tags) > 0 "
+        "ELSE TRIM(REPLACE(COALESCE(i.tags, ''), ',', '')) <> '' END)"
+    )
+
     def __init__(self):
         """Inicializar el motor de filtrado"""
         self.cache = {}  # Caché para resultados de filtros (optimización futura)
@@ -451,6 +477,211 @@ class AdvancedFilterEngine:
         else:
             return items
 
+    # ==================== Compilación a SQL ====================
+
+    def build_query(self, filters: Dict[str, Any], category_id: Optional[int] = None,
+                    include_inactive: bool = False, exclude_lists: bool = False,
+                    base_order: str = "i.created_at DESC") -> Tuple[str, List]:
+        """
+        Traducir el diccionario de filtros a una consulta SQL parametrizada
+
+        Acepta los mismos filtros que apply_filters. Las fechas se comparan
+        contra las columnas epoch indexadas (created_at_ts, last_used_ts).
+
+        Args:
+            filters: Diccionario con los criterios de filtrado
+            category_id: Limitar a una categoría (None = todas)
+            include_inactive: Incluir items de categorías inactivas
+            exclude_lists: Excluir items que forman parte de una lista
+            base_order: Orden por defecto (y desempate de sort_by)
+
+        Returns:
+            Tuple[str, List]: (query, parámetros)
+        """
+        filters = filters or {}
+        conditions = []
+        params: List[Any] = []
+
+        if category_id is not None:
+            conditions.append("i.category_id = ?")
+            params.append(category_id)
+        if not include_inactive:
+            conditions.append("c.is_active = 1")
+        if exclude_lists:
+            conditions.append("COALESCE(i.is_list, 0) = 0")
+
+        if filters.get('type'):
+            types = [t.upper() for t in filters['type']]
+            conditions.append(f"i.type IN ({', '.join('?' * len(types))})")
+            params.extend(types)
+
+        for key, column in (('is_favorite', 'i.is_favorite'), ('is_sensitive', 'i.is_sensitive'),
+                            ('is_list', 'i.is_list')):
+            if filters.get(key) is not None:
+                conditions.append(f"COALESCE({column}, 0) = ?")
+                params.append(1 if filters[key] else 0)
+
+        if filters.get('has_tags') is not None:
+            has_tags = self.SQL_HAS_ANY_TAG
+            conditions.append(has_tags if filters['has_tags'] else f"NOT {has_tags}")
+
+        tag_filter = filters.get('tags')
+        if tag_filter and tag_filter.get('values'):
+            joiner = " AND " if tag_filter.get('mode', 'OR').upper() == 'AND' else " OR "
+            conditions.append("(" + joiner.join([self.SQL_HAS_TAG] * len(tag_filter['values'])) + ")")
+            for tag in tag_filter['values']:
+                params.extend([tag, tag])
+
+        count_filter = filters.get('use_count')
+        if count_filter:
+            operator = count_filter.get('operator', '>')
+            if operator in self.SQL_USE_COUNT_OPERATORS:
+                conditions.append(f"COALESCE(i.use_count, 0) {operator} ?")
+                params.append(count_filter.get('value', 0))
+
+        for key, column in self.SQL_DATE_COLUMNS.items():
+            date_filter = filters.get(key)
+            if not date_filter:
+                continue
+            if key == 'last_used' and date_filter.get('preset') == 'never':
+                conditions.append("COALESCE(i.use_count, 0) = 0")
+                continue
+            date_range = self._resolve_date_range(date_filter)
+            if date_range is None:
+                continue
+            start, end = date_range
+            conditions.append(f"{column} >= ?")
+            params.append(int(start.timestamp()))
+            if end is not None:
+                conditions.append(f"{column} <= ?")
+                params.append(int(end.timestamp()))
+
+        order_by = base_order
+        sort_sql = self.SQL_SORT.get(filters.get('sort_by'))
+        if sort_sql:
+            order_by = f"{sort_sql}, {base_order}"
+
+        query = f"""
+            SELECT
+                i.*,
+                c.name as category_name,
+                c.icon as category_icon,
+                c.color as category_color
+            FROM items i
+            JOIN categories c ON i.category_id = c.id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            ORDER BY {order_by}
+        """
+        if filters.get('top_n'):
+            query += " LIMIT ?"
+            params.append(int(filters['top_n']))
+
+        return query, params
+
+    @staticmethod
+    def _resolve_date_range(date_filter: Dict[str, Any]) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        """
+        Convertir un preset o rango personalizado en (desde, hasta)
+
+        Returns:
+            None si el filtro no se reconoce (se ignora, como en apply_filters)
+        """
+        if 'preset' in date_filter:
+            now = datetime.now()
+            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            starts = {
+                'today': today,
+                'this_week': today - timedelta(days=now.weekday()),
+                'this_month': today.replace(day=1),
+                'last_7_days': now - timedelta(days=7),
+                'last_30_days': now - timedelta(days=30),
+                'last_90_days': now - timedelta(days=90),
+            }
+            start = starts.get(date_filter['preset'])
+            return (start, None) if start else None
+
+        if 'custom_from' in date_filter and 'custom_to' in date_filter:
+            return date_filter['custom_from'], date_filter['custom_to']
+
+        return None
+
+    def fetch_items(self, db_manager, filters: Dict[str, Any], category_id: Optional[int] = None,
+                    include_inactive: bool = False, exclude_lists: bool = False,
+                    unsaved_items: Optional[List[Item]] = None) -> List[Item]:
+        """
+        Ejecutar los filtros en la base de datos y devolver solo los items que cumplen
+
+        Args:
+            db_manager: DBManager de la base de datos de items
+            filters: Diccionario con los criterios de filtrado
+            category_id: Limitar a una categoría (None = todas)
+            include_inactive: Incluir items de categorías inactivas
+            exclude_lists: Excluir items que forman parte de una lista
+            unsaved_items: Items en memoria; los que aún no están en la base de
+                           datos (ID no numérico) se filtran con apply_filters y se
+                           añaden al resultado. Los guardados se ignoran.
+
+        Returns:
+            Lista de items filtrados y ordenados
+        """
+        query, params = self.build_query(filters, category_id=category_id,
+                                         include_inactive=include_inactive,
+                                         exclude_lists=exclude_lists)
+        rows = db_manager.get_items_by_query(query, tuple(params))
+
+        items = []
+        for row in rows:
+            try:
+                items.append(self._row_to_item(row))
+            except Exception as e:
+                import logging
+                logging.getLogger(__name__).error(f"Error converting item {row.get('id')}: {e}")
+
+        pending = [item for item in unsaved_items or [] if not str(item.id).isdigit()]
+        if pending:
+            items.extend(self.apply_filters(pending, filters))
+            if filters.get('sort_by'):
+                items = self._sort_items(items, filters['sort_by'])
+            if filters.get('top_n'):
+                items = items[:filters['top_n']]
+        return items
+
+    @staticmethod
+    def _row_to_item(row: Dict[str, Any]) -> Item:
+        """Construir un Item desde una fila de get_items_by_query"""
+        try:
+            item_type = ItemType((row.get('type') or 'text').lower())
+        except ValueError:
+            item_type = ItemType.TEXT
+
+        item = Item(
+            item_id=str(row['id']),
+            label=row['label'],
+            content=row['content'],
+            item_type=item_type,
+            icon=row.get('icon'),
+            is_sensitive=bool(row.get('is_sensitive', False)),
+            is_favorite=bool(row.get('is_favorite', False)),
+            tags=row.get('tags', []),
+            description=row.get('description'),
+            working_dir=row.get('working_dir'),
+            color=row.get('color'),
+            is_active=bool(row.get('is_active', True)),
+            is_archived=bool(row.get('is_archived', False)),
+            is_list=bool(row.get('is_list', False)),
+            list_group=row.get('list_group'),
+            orden_lista=row.get('orden_lista', 0)
+        )
+        item.category_name = row.get('category_name', '')
+        item.category_icon = row.get('category_icon', '')
+        item.category_color = row.get('category_color', '')
+        item.use_count = row.get('use_count') or 0
+        if row.get('created_at_ts') is not None:
+            item.created_at = datetime.fromtimestamp(row['created_at_ts'])
+        if row.get('last_used_ts') is not None:
+            item.last_used = datetime.fromtimestamp(row['last_used_ts'])
+        return item
+
     def get_available_tags(self, items: List[Item]) -> Dict[str, int]:
         """
         Obtener todos los tags únicos con su conteo de items
@@ -22,6 +22,7 @@ from models.bulk_item_data import (
 from utils.json_validator import BulkJSONValidator
 from utils.prompt_templates import PromptTemplate
 from database.db_manager import DBManager
+from database import ordering
 
 logger = logging.getLogger(__name__)
 
@@ -264,8 +265,8 @@ class AIBulkItemManager:
         # Inserción en transacción
         try:
             with self.db.transaction() as conn:
-                # Si los items son de lista, asignar orden secuencial (comenzando desde 1)
-                list_order_counter = 1
+                # Claves de orden con huecos para los pasos de lista
+                list_order_keys = self._list_order_keys(conn, selected_items, category_id)
 
                 for item in selected_items:
                     try:
@@ -274,11 +275,7 @@ class AIBulkItemManager:
                         # Ej: "git,deploy,automation" → ["git", "deploy", "automation"]
                         tags_list = [tag.strip() for tag in item.tags.split(',') if tag.strip()] if item.tags else []
 
-                        # Asignar orden_lista secuencial si es lista
-                        orden_lista = None
-                        if item.is_list == 1:
-                            orden_lista = item.orden_lista if item.orden_lista is not None else list_order_counter
-                            list_order_counter += 1
+                        orden_lista = list_order_keys.get(id(item))
 
                         # Crear item usando el método del DBManager
                         item_id = self.db.add_item(
@@ -338,6 +335,41 @@ class AIBulkItemManager:
 
         return result
 
+    def _list_order_keys(self, conn, items: List[BulkItemData], category_id: int) -> Dict[int, int]:
+        """
+        Calcula las claves orden_lista de los pasos de lista a crear.
+
+        Los pasos de cada lista se ordenan por su orden_lista del JSON (o por
+        su posición en la importación) y reciben claves con huecos
+        (ordering.spaced_keys, como create_list), detrás de los pasos que la
+        lista ya tenga.
+
+        Args:
+            conn: Conexión de la transacción
+            items: Items a crear
+            category_id: ID de la categoría destino
+
+        Returns:
+            Diccionario id(item) -> clave orden_lista
+        """
+        groups: Dict[Optional[str], List[BulkItemData]] = {}
+        for item in items:
+            if item.is_list == 1:
+                groups.setdefault(item.list_group, []).append(item)
+
+        keys = {}
+        collection = ordering.COLLECTIONS['list_items']
+        for list_group, steps in groups.items():
+            positions = {
+                id(step): step.orden_lista if step.orden_lista is not None else index
+                for index, step in enumerate(steps, start=1)
+            }
+            steps = sorted(steps, key=lambda step: positions[id(step)])
+            offset = ordering.next_key(conn, collection, (category_id, list_group)) - ordering.ORDER_GAP
+            for step, key in zip(steps, ordering.spaced_keys(len(steps))):
+                keys[id(step)] = offset + key
+        return keys
+
     def get_statistics(self, items: List[BulkItemData]) -> Dict[str, Any]:
         """
         Genera estadísticas sobre los items a importar.
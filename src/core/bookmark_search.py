@@ -0,0 +1,105 @@
+"""
+Bookmark Search - Búsqueda de marcadores y autocompletado de la barra de URL
+
+- La búsqueda del panel de marcadores usa el índice FTS bookmarks_fts
+  (DBManager.search_bookmarks).
+- El autocompletado de la barra de URL usa un índice de prefijos en memoria
+  (lista ordenada + bisect), sin consultas a la BD por pulsación salvo la
+  lectura de bookmarks_version para detectar cambios.
+"""
+
+import bisect
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_COMPLETION_LIMIT = 8
+
+_URL_PREFIXES = ('https://', 'http://', 'www.')
+
+
+def normalize_url_key(url: str) -> str:
+    """Clave de búsqueda de una URL: minúsculas, sin esquema ni 'www.'"""
+    key = url.strip().lower()
+    for prefix in _URL_PREFIXES:
+        if key.startswith(prefix):
+            key = key[len(prefix):]
+    return key
+
+
+class UrlPrefixIndex:
+    """Índice de prefijos de URL en memoria"""
+
+    def __init__(self, bookmarks: List[Dict] = None):
+        self._keys: List[str] = []
+        self._urls: List[str] = []
+        self.build(bookmarks or [])
+
+    def build(self, bookmarks: List[Dict]):
+        """Reconstruir el índice a partir de dicts con 'url'"""
+        entries = sorted(
+            (normalize_url_key(bookmark['url']), bookmark['url'])
+            for bookmark in bookmarks if bookmark.get('url')
+        )
+        self._keys = [key for key, _ in entries]
+        self._urls = [url for _, url in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, text: str, limit: int = DEFAULT_COMPLETION_LIMIT) -> List[str]:
+        """
+        URLs cuyo prefijo coincide con el texto escrito
+
+        Args:
+            text: Texto de la barra de URL (con o sin esquema / 'www.')
+            limit: Número máximo de sugerencias
+
+        Returns:
+            List[str]: URLs en orden alfabético de su clave
+        """
+        prefix = normalize_url_key(text)
+        if not prefix:
+            return []
+
+        results = []
+        index = bisect.bisect_left(self._keys, prefix)
+        while index < len(self._keys) and len(results) < limit:
+            if not self._keys[index].startswith(prefix):
+                break
+            if self._urls[index] not in results:
+                results.append(self._urls[index])
+            index += 1
+        return results
+
+
+class BookmarkSearchService:
+    """Búsqueda de marcadores y autocompletado de URLs sobre un DBManager"""
+
+    def __init__(self, db_manager):
+        """
+        Args:
+            db_manager: DBManager con la tabla bookmarks
+        """
+        self.db = db_manager
+        self.prefix_index = UrlPrefixIndex()
+        self._indexed_version = None
+
+    def _ensure_index(self):
+        """Reconstruir el índice de prefijos si cambiaron los marcadores"""
+        version = self.db.get_bookmarks_version()
+        if version != self._indexed_version:
+            self.prefix_index.build(self.db.get_bookmarks())
+            self._indexed_version = version
+            logger.debug(f"URL prefix index rebuilt: {len(self.prefix_index)} bookmarks")
+
+    def complete_url(self, text: str, limit: int = DEFAULT_COMPLETION_LIMIT) -> List[str]:
+        """Sugerencias de URL para la barra de direcciones"""
+        self._ensure_index()
+        return self.prefix_index.complete(text, limit)
+
+    def search(self, query: str, limit: int = 200) -> List[Dict]:
+        """Marcadores que coinciden con el texto (título o URL)"""
+        return self.db.search_bookmarks(query, limit)
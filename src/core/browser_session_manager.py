@@ -4,15 +4,28 @@ Author: Widget Sidebar Team
 Date: 2025-11-03
 """
 
+import time
 import logging
-from typing import List, Dict, Optional
+import threading
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_AUTOSAVE_SNAPSHOTS = 5
+SNAPSHOT_ROTATION_SECONDS = 30 * 60
+
+
 class BrowserSessionManager:
-    """Manager para gestionar sesiones del navegador embebido."""
+    """
+    Manager para gestionar sesiones del navegador embebido.
+
+    El auto-guardado periódico (autosave_snapshot / autosave_async) mantiene
+    un anillo de sesiones auto-save: cada apertura del navegador, y cada
+    SNAPSHOT_ROTATION_SECONDS, empieza un snapshot nuevo; entre medias solo
+    se escriben las pestañas que cambiaron desde el último guardado.
+    """
 
     def __init__(self, db_manager):
         """
@@ -23,6 +36,14 @@ class BrowserSessionManager:
         """
         self.db = db_manager
 
+        # Estado del snapshot auto-save en curso
+        self._snapshot_session_id: Optional[int] = None
+        self._snapshot_started = 0.0
+        self._snapshot_rows: List[tuple] = []
+        self._autosave_lock = threading.Lock()
+        self._autosave_thread: Optional[threading.Thread] = None
+        self._autosave_db = None
+
     def save_current_session(self, tabs_data: List[Dict], name: str = None, is_auto_save: bool = False) -> Optional[int]:
         """
         Guarda la sesión actual del navegador.
@@ -181,4 +202,106 @@ class BrowserSessionManager:
             logger.debug("No hay pestañas para auto-guardar")
             return None
 
-        return self.save_current_session(tabs_data, is_auto_save=True)
+        if self._autosave_thread is not None:
+            self._autosave_thread.join()
+        result = self.autosave_snapshot(tabs_data)
+        self._close_autosave_db()
+        return result.get('session_id')
+
+    # ==================== Auto-guardado periódico ====================
+
+    def get_snapshot_limit(self) -> int:
+        """Número de snapshots auto-save que se conservan (setting browser_session_snapshots)"""
+        try:
+            return max(1, int(self.db.get_setting('browser_session_snapshots', DEFAULT_AUTOSAVE_SNAPSHOTS)))
+        except (TypeError, ValueError):
+            return DEFAULT_AUTOSAVE_SNAPSHOTS
+
+    def autosave_snapshot(self, tabs_data: List[Dict]) -> Dict:
+        """
+        Auto-guarda la sesión escribiendo solo las pestañas que cambiaron.
+
+        Args:
+            tabs_data: Lista de pestañas [{url, title, position, is_active}]
+
+        Returns:
+            Dict: session_id, written (pestañas escritas) y new_snapshot
+        """
+        with self._autosave_lock:
+            tabs = sorted(tabs_data, key=lambda tab: tab.get('position', 0))
+            tabs = [dict(tab, position=i) for i, tab in enumerate(tabs)]
+            rows = [(tab.get('url', ''), tab.get('title', 'Nueva pestaña'), bool(tab.get('is_active')))
+                    for tab in tabs]
+            db = self._get_autosave_db()
+
+            rotate = time.monotonic() - self._snapshot_started >= SNAPSHOT_ROTATION_SECONDS
+            if self._snapshot_session_id is not None and not rotate:
+                if rows == self._snapshot_rows:
+                    return {'session_id': self._snapshot_session_id, 'written': 0, 'new_snapshot': False}
+
+                previous = self._snapshot_rows
+                updated = [tab for tab, row in zip(tabs, rows)
+                           if tab['position'] < len(previous) and row != previous[tab['position']]]
+                inserted = tabs[len(previous):]
+                if db.apply_session_tabs_diff(self._snapshot_session_id, updated, inserted, len(tabs)):
+                    self._snapshot_rows = rows
+                    return {'session_id': self._snapshot_session_id,
+                            'written': len(updated) + len(inserted), 'new_snapshot': False}
+                logger.info("Snapshot auto-save eliminado, creando uno nuevo")
+
+            # Nuevo snapshot completo (apertura, rotación o snapshot eliminado)
+            name = f"Auto-guardado {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            session_id = db.save_session(name, tabs, is_auto_save=True,
+                                         keep_auto_saves=self.get_snapshot_limit())
+            if session_id:
+                self._snapshot_session_id = session_id
+                self._snapshot_started = time.monotonic()
+                self._snapshot_rows = rows
+            return {'session_id': session_id, 'written': len(tabs), 'new_snapshot': True}
+
+    def autosave_async(self, tabs_data: List[Dict],
+                       on_finished: Optional[Callable[[Dict], None]] = None) -> bool:
+        """
+        Auto-guarda la sesión en un hilo en segundo plano.
+
+        Args:
+            tabs_data: Pestañas obtenidas en el hilo de la UI
+            on_finished: Callback con el resultado (se invoca desde el hilo worker)
+
+        Returns:
+            bool: False si ya había un auto-guardado en curso o no hay pestañas
+        """
+        if not tabs_data:
+            return False
+        if self._autosave_thread is not None and self._autosave_thread.is_alive():
+            return False
+
+        def _run():
+            try:
+                result = self.autosave_snapshot(tabs_data)
+            except Exception as e:
+                logger.error(f"Error en auto-guardado de sesión: {e}")
+                result = {'session_id': None, 'written': 0, 'error': str(e)}
+            if on_finished:
+                try:
+                    on_finished(result)
+                except Exception as e:
+                    logger.error(f"Error in session autosave callback: {e}")
+
+        self._autosave_thread = threading.Thread(target=_run, name="BrowserSessionAutosave", daemon=True)
+        self._autosave_thread.start()
+        return True
+
+    def _get_autosave_db(self):
+        """Conexión propia para el auto-guardado (no comparte la del hilo de la UI)"""
+        if str(self.db.db_path) == ':memory:':
+            return self.db
+        if self._autosave_db is None:
+            self._autosave_db = type(self.db)(str(self.db.db_path))
+        return self._autosave_db
+
+    def _close_autosave_db(self):
+        with self._autosave_lock:
+            if self._autosave_db is not None:
+                self._autosave_db.close()
+                self._autosave_db = None
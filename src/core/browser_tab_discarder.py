@@ -0,0 +1,77 @@
+"""
+Browser Tab Discarder - Política de descarte de pestañas del navegador embebido
+
+Cada QWebEngineView vivo mantiene un renderer de Chromium. Las pestañas en
+segundo plano que exceden el límite se sustituyen por un placeholder con
+URL, título y posición de scroll, y se recargan al activarlas.
+
+El límite de pestañas vivas es el menor entre:
+- browser_max_live_tabs (setting)
+- browser_tab_memory_budget_mb / ESTIMATED_TAB_MEMORY_MB
+
+Qt no expone la memoria de cada renderer, por eso el presupuesto se traduce
+a pestañas con un coste estimado por pestaña.
+"""
+
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_LIVE_TABS = 4
+DEFAULT_MEMORY_BUDGET_MB = 400
+ESTIMATED_TAB_MEMORY_MB = 80
+
+
+class BrowserTabDiscardPolicy:
+    """Decide qué pestañas en segundo plano se descartan"""
+
+    def __init__(self, db_manager=None):
+        """
+        Args:
+            db_manager: DBManager para leer los límites (opcional)
+        """
+        self.db = db_manager
+        self.max_tabs = DEFAULT_MAX_LIVE_TABS
+        self.memory_budget_mb = DEFAULT_MEMORY_BUDGET_MB
+        self.reload_settings()
+
+    def reload_settings(self):
+        """Leer límites desde settings"""
+        if not self.db:
+            return
+        try:
+            self.max_tabs = int(self.db.get_setting('browser_max_live_tabs', DEFAULT_MAX_LIVE_TABS))
+            self.memory_budget_mb = int(self.db.get_setting(
+                'browser_tab_memory_budget_mb', DEFAULT_MEMORY_BUDGET_MB))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid browser tab limits, using defaults: {e}")
+            self.max_tabs = DEFAULT_MAX_LIVE_TABS
+            self.memory_budget_mb = DEFAULT_MEMORY_BUDGET_MB
+
+    def max_live_tabs(self) -> int:
+        """Número máximo de pestañas con renderer vivo (al menos la activa)"""
+        by_memory = self.memory_budget_mb // ESTIMATED_TAB_MEMORY_MB
+        return max(1, min(self.max_tabs, by_memory))
+
+    def select_tabs_to_discard(self, tabs: List[Dict]) -> List:
+        """
+        Elegir pestañas vivas a descartar
+
+        Args:
+            tabs: Pestañas vivas: dicts con key, last_active y can_discard
+                  (False para la activa o las que reproducen audio)
+
+        Returns:
+            List: keys a descartar, de la menos a la más recientemente usada
+        """
+        excess = len(tabs) - self.max_live_tabs()
+        if excess <= 0:
+            return []
+
+        candidates = sorted(
+            (tab for tab in tabs if tab['can_discard']),
+            key=lambda tab: tab['last_active']
+        )
+        return [tab['key'] for tab in candidates[:excess]]
@@ -24,6 +24,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.category import Category
+from database.query_profiler import ProfiledConnection
 
 logger = logging.getLogger(__name__)
 
@@ -136,7 +137,7 @@ class CategoryFilterEngine:
             self.last_params = params
 
             # Ejecutar query
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -386,7 +387,7 @@ class CategoryFilterEngine:
             Lista de colores (hex) únicos
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -413,7 +414,7 @@ class CategoryFilterEngine:
             Diccionario con fechas mínimas y máximas
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -451,7 +452,7 @@ class CategoryFilterEngine:
             Diccionario con estadísticas min/max/avg
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             cursor = conn.cursor()
 
             cursor.execute("""
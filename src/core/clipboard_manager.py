@@ -2,7 +2,7 @@
 Clipboard Manager
 """
 import pyperclip
-from typing import Optional, List
+from typing import Optional, List, Callable
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -21,9 +21,12 @@ class ClipboardHistory:
 class ClipboardManager:
     """Manages clipboard operations"""
 
-    def __init__(self, max_history: int = 20):
+    def __init__(self, max_history: int = 20,
+                 history_recorder: Optional[Callable[[str, Optional[str], bool], object]] = None):
         self.max_history = max_history
         self.history: List[ClipboardHistory] = []
+        # Persistent history recorder (content, item_id, is_sensitive) - e.g. ClipboardMonitor.record_copy
+        self.history_recorder = history_recorder
 
     def copy_text(self, content: str) -> bool:
         """Copy text to clipboard"""
@@ -43,6 +46,8 @@ class ClipboardManager:
                 item.update_last_used()
                 # Add to history
                 self.add_to_history(item)
+                if self.history_recorder:
+                    self.history_recorder(item.content, item.id, item.is_sensitive)
             return success
         except Exception as e:
             print(f"Error copying item to clipboard: {e}")
@@ -0,0 +1,156 @@
+"""
+Clipboard Monitor - Registro del historial de portapapeles del sistema
+
+Escucha QClipboard.dataChanged para registrar en clipboard_history todo lo
+que se copia (no solo las copias hechas desde la aplicación). La
+deduplicación, compresión y recorte del historial los hace
+DBManager.add_to_history en una sola transacción.
+
+Los límites del historial se leen del SettingsStore de la aplicación (en
+memoria), no de la base de datos en cada copia.
+
+La captura se desactiva con la setting clipboard_history_enabled, y nunca se
+guarda lo que un gestor de contraseñas marca como oculto (formatos MIME de
+exclusión de Windows, KDE y macOS).
+"""
+
+import time
+import logging
+from typing import Optional, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import CLIPBOARD_HISTORY_MAX_ENTRIES, CLIPBOARD_HISTORY_MAX_BYTES
+from utils.compression import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+# Contenido mayor se ignora (p.ej. volcados binarios pegados como texto)
+MAX_CAPTURE_BYTES = 8 * 1024 * 1024
+# Ventana para ignorar el eco de dataChanged tras una copia propia
+ECHO_WINDOW_S = 2.0
+
+# Formatos con los que los gestores de contraseñas marcan contenido que no
+# debe guardarse en historiales (Windows, KDE/KeePassXC, macOS)
+CONCEALED_FORMAT_HINTS = (
+    'ExcludeClipboardContentFromMonitorProcessing',
+    'x-kde-passwordManagerHint',
+    'org.nspasteboard.ConcealedType',
+    'application/x-nspasteboard-concealed-type',
+)
+# Windows: DWORD 0 en este formato excluye el contenido del historial
+CLIPBOARD_HISTORY_OPT_OUT_FORMAT = 'CanIncludeInClipboardHistory'
+
+
+def is_concealed(mime_data) -> bool:
+    """True si el contenido viene marcado como oculto por un gestor de contraseñas"""
+    for fmt in mime_data.formats():
+        if any(hint in fmt for hint in CONCEALED_FORMAT_HINTS):
+            return True
+        if CLIPBOARD_HISTORY_OPT_OUT_FORMAT in fmt:
+            value = bytes(mime_data.data(fmt))
+            if value and not any(value):
+                return True
+    return False
+
+
+class ClipboardMonitor(QObject):
+    """Monitor del portapapeles del sistema"""
+
+    history_changed = pyqtSignal(int)  # history_id
+
+    def __init__(self, db_manager, clipboard=None, parent=None, settings=None):
+        """
+        Inicializar monitor
+
+        Args:
+            db_manager: Instancia de DBManager
+            clipboard: QClipboard a escuchar (None = portapapeles de la aplicación)
+            settings: SettingsStore de la aplicación (None = leer de db_manager)
+        """
+        super().__init__(parent)
+        self.db = db_manager
+        self.settings = settings
+        self.clipboard = clipboard or QApplication.clipboard()
+        self._last_hash: Optional[str] = None
+        self._last_recorded_at = 0.0
+
+        self.clipboard.dataChanged.connect(self._on_data_changed)
+        logger.info("ClipboardMonitor initialized")
+
+    def record_copy(self, content: str, item_id: Optional[int] = None,
+                    is_sensitive: bool = False) -> Optional[int]:
+        """
+        Registrar una copia hecha desde la aplicación (asociada a un item)
+
+        Con el historial desactivado no se guarda nada.
+
+        Args:
+            content: Contenido copiado
+            item_id: ID del item de origen (opcional)
+            is_sensitive: Si es contenido sensible no se guarda (solo se ignora su eco)
+
+        Returns:
+            Optional[int]: ID de la entrada de historial
+        """
+        if is_sensitive or not self.is_enabled():
+            self._last_hash = content_hash(content or '')
+            self._last_recorded_at = time.monotonic()
+            return None
+        return self._record(content, item_id)
+
+    def is_enabled(self) -> bool:
+        """True si el usuario tiene activado el historial del portapapeles"""
+        if self.settings is not None:
+            return self.settings.get_bool('clipboard_history_enabled', True)
+        return bool(self.db.get_setting('clipboard_history_enabled', True))
+
+    def history_limits(self) -> Tuple[Optional[int], Optional[int]]:
+        """(máximo de entradas, máximo de bytes); None = que DBManager los lea"""
+        if self.settings is None:
+            return None, None
+        return (self.settings.get_int('clipboard_history_max_entries', CLIPBOARD_HISTORY_MAX_ENTRIES),
+                self.settings.get_int('clipboard_history_max_bytes', CLIPBOARD_HISTORY_MAX_BYTES))
+
+    def _on_data_changed(self):
+        """Registrar el nuevo contenido del portapapeles del sistema"""
+        if not self.is_enabled():
+            return
+
+        mime_data = self.clipboard.mimeData()
+        if mime_data is None or not mime_data.hasText():
+            return
+        if is_concealed(mime_data):
+            logger.debug("Clipboard content marked as concealed, not recorded")
+            return
+
+        text = self.clipboard.text()
+        if not text or not text.strip():
+            return
+
+        # Ignorar el eco de una copia propia recién registrada
+        digest = content_hash(text)
+        if digest == self._last_hash and time.monotonic() - self._last_recorded_at < ECHO_WINDOW_S:
+            return
+
+        self._record(text, None, digest)
+
+    def _record(self, content: str, item_id: Optional[int],
+                digest: Optional[str] = None) -> Optional[int]:
+        if not content or len(content) > MAX_CAPTURE_BYTES:
+            return None
+
+        item_id = int(item_id) if item_id is not None and str(item_id).isdigit() else None
+        try:
+            max_entries, max_bytes = self.history_limits()
+            history_id = self.db.add_to_history(item_id, content, max_entries, max_bytes)
+        except Exception as e:
+            logger.error(f"Error recording clipboard history: {e}")
+            return None
+
+        self._last_hash = digest or content_hash(content)
+        self._last_recorded_at = time.monotonic()
+        self.history_changed.emit(history_id)
+        return history_id
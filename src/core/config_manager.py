@@ -11,8 +11,9 @@ from typing import Dict, List, Any, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
 from models.item import Item, ItemType
-from database.db_manager import DBManager
+from database.db_manager import DBManager, CLIPBOARD_HISTORY_MAX_ENTRIES, CLIPBOARD_HISTORY_MAX_BYTES
 from core.encryption_manager import EncryptionManager
+from core.settings_store import SettingsStore
 
 
 class ConfigManager:
@@ -45,6 +46,9 @@ class ConfigManager:
         # Initialize database manager
         self.db = DBManager(self.db_path)
 
+        # Settings served from memory, written in coalesced batches
+        self.settings = SettingsStore(self.db)
+
         # Initialize encryption manager
         env_path = str(self.base_dir / ".env")
         self.encryption_manager = EncryptionManager(env_path)
@@ -59,7 +63,7 @@ class ConfigManager:
         Returns:
             Dict containing settings
         """
-        return {"settings": self.db.get_all_settings()}
+        return {"settings": self.settings.all()}
 
     def save_config(self) -> bool:
         """
@@ -68,8 +72,9 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        # Settings are saved immediately when set_setting() is called
-        # This method exists for backward compatibility
+        # Settings are written in background batches by SettingsStore;
+        # this forces pending writes (kept for backward compatibility)
+        self.settings.flush()
         return True
 
     def load_default_categories(self) -> List[Category]:
@@ -100,8 +105,8 @@ class ConfigManager:
             # Convert database dict to Category object
             category = self._dict_to_category(cat_data)
 
-            # Load items for this category
-            items_data = self.db.get_items_by_category(cat_data['id'])
+            # Load items for this category (content decompressed on first access)
+            items_data = self.db.get_items_by_category(cat_data['id'], decompress=False)
             for item_data in items_data:
                 item = self._dict_to_item(item_data)
                 category.add_item(item)
@@ -142,19 +147,29 @@ class ConfigManager:
             if not cat_data:
                 return None
 
-            category = self._dict_to_category(cat_data)
-
-            # Load items
-            items_data = self.db.get_items_by_category(cat_id)
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
-                category.add_item(item)
-
-            return category
+            # Load items (content decompressed on first access)
+            items_data = self.db.get_items_by_category(cat_id, decompress=False)
+            return self.build_category(cat_data, items_data)
 
         except (ValueError, TypeError):
             return None
 
+    def build_category(self, cat_data: Dict, items_data: List[Dict]) -> Category:
+        """
+        Build a Category with its items from database rows
+
+        Args:
+            cat_data: Category row as dict
+            items_data: Item rows as dicts (e.g. read by PinnedPanelContentLoader)
+
+        Returns:
+            Category: Category object with items
+        """
+        category = self._dict_to_category(cat_data)
+        for item_data in items_data:
+            category.add_item(self._dict_to_item(item_data))
+        return category
+
     def add_category(self, category: Category) -> bool:
         """
         Add a new category
@@ -311,7 +326,7 @@ class ConfigManager:
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
-        Get a specific setting
+        Get a specific setting (served from memory by SettingsStore)
 
         Args:
             key: Setting key
@@ -320,11 +335,11 @@ class ConfigManager:
         Returns:
             Any: Setting value
         """
-        return self.db.get_setting(key, default)
+        return self.settings.get(key, default)
 
     def set_setting(self, key: str, value: Any) -> bool:
         """
-        Set a specific setting
+        Set a specific setting (written to the database in the next batch)
 
         Args:
             key: Setting key
@@ -334,23 +349,24 @@ class ConfigManager:
             bool: True if successful
         """
         try:
-            self.db.set_setting(key, value)
+            self.settings.set(key, value)
             return True
         except Exception as e:
             print(f"Error setting value: {e}")
             return False
 
-    def get_history(self, limit: int = 20) -> List[Dict]:
+    def get_history(self, limit: int = 20, offset: int = 0) -> List[Dict]:
         """
         Get clipboard history
 
         Args:
             limit: Maximum number of entries
+            offset: Entries to skip
 
         Returns:
             List[Dict]: History entries
         """
-        return self.db.get_history(limit)
+        return self.db.get_history(limit, offset)
 
     def add_to_history(self, content: str, item_id: Optional[int] = None) -> bool:
         """
@@ -364,7 +380,11 @@ class ConfigManager:
             bool: True if successful
         """
         try:
-            self.db.add_to_history(item_id, content)
+            self.db.add_to_history(
+                item_id, content,
+                max_entries=self.settings.get_int('clipboard_history_max_entries', CLIPBOARD_HISTORY_MAX_ENTRIES),
+                max_bytes=self.settings.get_int('clipboard_history_max_bytes', CLIPBOARD_HISTORY_MAX_BYTES)
+            )
             return True
         except Exception as e:
             print(f"Error adding to history: {e}")
@@ -382,7 +402,7 @@ class ConfigManager:
         """
         try:
             # Get all data from database
-            settings = self.db.get_all_settings()
+            settings = self.settings.all()
             categories = self.get_categories()
 
             export_data = {
@@ -415,9 +435,12 @@ class ConfigManager:
                 data = json.load(f)
 
             # Import settings
-            settings = data.get('settings', {})
-            for key, value in settings.items():
-                self.db.set_setting(key, value)
+            settings = dict(data.get('settings', {}))
+            # Older exports: max_history is now clipboard_history_max_entries
+            if 'max_history' in settings:
+                settings.setdefault('clipboard_history_max_entries', settings.pop('max_history'))
+            self.settings.set_many(settings)
+            self.settings.flush()
 
             # Import categories
             categories_data = data.get('categories', [])
@@ -467,7 +490,8 @@ class ConfigManager:
             return False
 
     def close(self):
-        """Close database connection"""
+        """Write pending settings and close database connection"""
+        self.settings.close()
         self.db.close()
 
     # ========== PRIVATE HELPER METHODS ==========
@@ -535,7 +559,8 @@ class ConfigManager:
             working_dir=data.get('working_dir'),
             color=data.get('color'),
             is_active=bool(data.get('is_active', True)),  # Add is_active (default True)
-            is_archived=bool(data.get('is_archived', False))  # Add is_archived (default False)
+            is_archived=bool(data.get('is_archived', False)),  # Add is_archived (default False)
+            content_compressed=bool(data.get('content_compressed', False))
         )
         return item
 
@@ -0,0 +1,386 @@
+"""
+Database Maintenance Service - Mantenimiento de la base de datos en segundo plano
+
+Ejecuta en un hilo daemon, cuando el usuario está inactivo y ha pasado el
+intervalo configurado, los pasos de mantenimiento:
+
+1. history_retention: borra item_usage_history anterior a la retención
+   (solo si el usuario configuró history_retention_days; por defecto se conserva todo)
+2. order_keys: renumera los grupos reordenables con huecos de orden agotados
+3. optimize: PRAGMA optimize (ANALYZE acotado de las tablas que lo necesitan)
+4. incremental_vacuum: devuelve al sistema las páginas libres
+5. wal_checkpoint: checkpoint pasivo (solo en modo WAL)
+6. quick_check: verificación de integridad tabla a tabla (en la ejecución
+   programada se omiten las tablas de más de QUICK_CHECK_MAX_ROWS filas;
+   la ejecución manual las comprueba todas)
+
+Cada paso trabaja en porciones pequeñas (lotes de borrado, N páginas de
+vacuum, una tabla acotada por check); entre porciones el servicio cede el acceso a
+la base de datos y, si el usuario vuelve a estar activo, espera. Cada
+ejecución queda registrada en la setting `maintenance_log`.
+
+Settings:
+    maintenance_enabled (bool), maintenance_interval_hours (int),
+    maintenance_idle_seconds (int), history_retention_days (int, 0 = sin límite, por defecto)
+"""
+
+import sys
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import DBManager
+from database.ordering import COLLECTIONS as ORDERED_COLLECTIONS
+from core.usage_tracker import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL_HOURS = 24
+DEFAULT_IDLE_SECONDS = 120
+DEFAULT_RETENTION_DAYS = 0  # Conservar todo el historial salvo que el usuario fije un límite
+MAINTENANCE_LOG_SIZE = 20
+
+
+class DatabaseMaintenanceService:
+    """Programador de mantenimiento de la base de datos"""
+
+    STARTUP_DELAY_SECONDS = 300     # No competir con el arranque
+    CHECK_INTERVAL_SECONDS = 60     # Frecuencia con la que se evalúa si toca
+    SLICE_BUDGET_MS = 50            # Trabajo máximo antes de ceder
+    SLICE_PAUSE_SECONDS = 0.05      # Pausa entre porciones
+    HISTORY_BATCH_SIZE = 500        # Filas de historial por transacción
+    VACUUM_PAGES_PER_SLICE = 256    # Páginas por PRAGMA incremental_vacuum
+    BUSY_TIMEOUT_MS = 2000
+    ANALYSIS_LIMIT = 1000
+    QUICK_CHECK_MAX_ROWS = 20000    # Tablas mayores: solo en ejecuciones manuales
+
+    STEPS = ('history_retention', 'order_keys', 'optimize', 'incremental_vacuum', 'wal_checkpoint', 'quick_check')
+
+    def __init__(self, db_path: str = "widget_sidebar.db"):
+        """
+        Inicializar servicio
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+        """
+        self.db_path = str(db_path)
+        self._thread: Optional[threading.Thread] = None
+        self._run_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._run_lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self.idle_seconds = DEFAULT_IDLE_SECONDS
+        self.last_result: Optional[Dict] = None
+
+    # ==================== Actividad del usuario ====================
+
+    def notify_activity(self):
+        """Registrar interacción del usuario (pospone el mantenimiento; ver UserActivityFilter)"""
+        self._last_activity = time.monotonic()
+
+    def is_idle(self) -> bool:
+        """True si no hay interacción desde hace idle_seconds"""
+        return time.monotonic() - self._last_activity >= self.idle_seconds
+
+    # ==================== Programador ====================
+
+    def start(self, startup_delay: Optional[float] = None) -> bool:
+        """
+        Iniciar el programador en un hilo en segundo plano
+
+        Returns:
+            bool: True si se inició, False si ya estaba en ejecución
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return False
+
+        delay = self.STARTUP_DELAY_SECONDS if startup_delay is None else startup_delay
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._scheduler_loop, args=(delay,), name="DatabaseMaintenance", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Detener el programador y la ejecución en curso (en la próxima porción)"""
+        self._stop_event.set()
+
+    def is_running(self) -> bool:
+        """Indica si hay un mantenimiento en curso (o a punto de empezar)"""
+        if self._run_thread is not None and self._run_thread.is_alive():
+            return True
+        return self._run_lock.locked()
+
+    def _scheduler_loop(self, delay: float):
+        if self._stop_event.wait(delay):
+            return
+        while not self._stop_event.is_set():
+            try:
+                if self.is_due():
+                    self.run()
+            except Exception as e:
+                logger.error(f"Database maintenance scheduler error: {e}")
+            if self._stop_event.wait(self.CHECK_INTERVAL_SECONDS):
+                return
+
+    def is_due(self) -> bool:
+        """Habilitado, intervalo cumplido y usuario inactivo"""
+        config = self.get_config()
+        if not config['enabled']:
+            return False
+        self.idle_seconds = config['idle_seconds']
+        if not self.is_idle():
+            return False
+        last_run = config['last_run']
+        if not last_run:
+            return True
+        try:
+            elapsed = datetime.now() - datetime.fromisoformat(last_run)
+        except ValueError:
+            return True
+        return elapsed >= timedelta(hours=config['interval_hours'])
+
+    def get_config(self) -> Dict:
+        """Configuración actual (desde settings)"""
+        db = DBManager(self.db_path)
+        try:
+            return {
+                'enabled': bool(db.get_setting('maintenance_enabled', True)),
+                'interval_hours': int(db.get_setting('maintenance_interval_hours', DEFAULT_INTERVAL_HOURS)),
+                'idle_seconds': int(db.get_setting('maintenance_idle_seconds', DEFAULT_IDLE_SECONDS)),
+                'retention_days': int(db.get_setting('history_retention_days', DEFAULT_RETENTION_DAYS)),
+                'last_run': db.get_setting('maintenance_last_run'),
+            }
+        finally:
+            db.close()
+
+    def run_async(self, force: bool = True,
+                  on_finished: Optional[Callable[[Dict], None]] = None) -> bool:
+        """
+        Ejecutar un mantenimiento ahora, en un hilo en segundo plano
+
+        Args:
+            force: No esperar inactividad (ejecución manual)
+            on_finished: Callback con el resumen (se invoca desde el hilo worker)
+
+        Returns:
+            bool: False si ya había un mantenimiento en curso
+        """
+        if self.is_running():
+            return False
+
+        def _run():
+            result = self.run(force=force)
+            if on_finished:
+                try:
+                    on_finished(result)
+                except Exception as e:
+                    logger.error(f"Error in maintenance callback: {e}")
+
+        self._stop_event.clear()
+        self._run_thread = threading.Thread(target=_run, name="DatabaseMaintenanceRun", daemon=True)
+        self._run_thread.start()
+        return True
+
+    # ==================== Ejecución ====================
+
+    def run(self, force: bool = False, steps: Optional[List[str]] = None) -> Dict:
+        """
+        Ejecutar el mantenimiento de forma síncrona (en el hilo llamante)
+
+        Args:
+            force: No esperar inactividad entre porciones; permite además
+                   convertir la base de datos a auto_vacuum incremental
+            steps: Pasos a ejecutar (por defecto todos)
+
+        Returns:
+            Dict: started_at, duration_ms, forced, cancelled y un resumen por paso
+        """
+        if not self._run_lock.acquire(blocking=False):
+            return {'skipped': 'already running'}
+
+        result = {
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'forced': force,
+            'cancelled': False,
+            'steps': {},
+        }
+        start = time.perf_counter()
+        db = DBManager(self.db_path)
+        try:
+            conn = db.connect()
+            conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+            config = self.get_config()
+
+            runners = {
+                'history_retention': lambda summary: self._history_retention(config['retention_days'], summary),
+                'order_keys': lambda summary: self._order_keys(db, summary),
+                'optimize': lambda summary: self._optimize(conn, summary),
+                'incremental_vacuum': lambda summary: self._incremental_vacuum(conn, force, summary),
+                'wal_checkpoint': lambda summary: self._wal_checkpoint(conn, summary),
+                'quick_check': lambda summary: self._quick_check(conn, force, summary),
+            }
+            for name in steps or self.STEPS:
+                summary: Dict = {}
+                step_start = time.perf_counter()
+                try:
+                    completed = self._run_sliced(runners[name](summary), force)
+                except Exception as e:
+                    logger.error(f"Maintenance step {name} failed: {e}")
+                    summary['error'] = str(e)
+                    completed = True
+                summary['duration_ms'] = round((time.perf_counter() - step_start) * 1000, 1)
+                result['steps'][name] = summary
+                if not completed:
+                    result['cancelled'] = True
+                    break
+
+            result['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self._save_log(db, result)
+            logger.info(f"Database maintenance finished in {result['duration_ms']:.0f} ms: {result['steps']}")
+        except Exception as e:
+            logger.error(f"Database maintenance failed: {e}")
+            result['error'] = str(e)
+        finally:
+            db.close()
+            self._run_lock.release()
+
+        self.last_result = result
+        return result
+
+    def _run_sliced(self, step: Iterator, force: bool) -> bool:
+        """
+        Consumir un paso porción a porción, cediendo entre porciones
+
+        Returns:
+            bool: False si se detuvo el servicio antes de terminar
+        """
+        step_started = time.monotonic()
+        slice_start = time.perf_counter()
+        for _ in step:
+            if self._stop_event.is_set():
+                return False
+            if (time.perf_counter() - slice_start) * 1000 >= self.SLICE_BUDGET_MS:
+                if self._stop_event.wait(self.SLICE_PAUSE_SECONDS):
+                    return False
+                # El usuario volvió durante el paso: esperar a que quede inactivo
+                while not force and self._last_activity > step_started and not self.is_idle():
+                    if self._stop_event.wait(1.0):
+                        return False
+                slice_start = time.perf_counter()
+        return True
+
+    def _save_log(self, db: DBManager, result: Dict):
+        """Agregar la ejecución al registro (últimas MAINTENANCE_LOG_SIZE)"""
+        log = db.get_setting('maintenance_log', []) or []
+        log.append(result)
+        db.set_setting('maintenance_log', log[-MAINTENANCE_LOG_SIZE:])
+        if not result['cancelled']:
+            db.set_setting('maintenance_last_run', result['started_at'])
+
+    def get_log(self) -> List[Dict]:
+        """Ejecuciones registradas (más reciente primero)"""
+        db = DBManager(self.db_path)
+        try:
+            return list(reversed(db.get_setting('maintenance_log', []) or []))
+        finally:
+            db.close()
+
+    # ==================== Pasos ====================
+
+    def _history_retention(self, retention_days: int, summary: Dict) -> Iterator:
+        summary['deleted'] = 0
+        summary['retention_days'] = retention_days
+        if retention_days <= 0:
+            summary['skipped'] = 'retention disabled'
+            return
+        tracker = UsageTracker(self.db_path)
+        while True:
+            deleted = tracker.cleanup_old_history_batch(retention_days, self.HISTORY_BATCH_SIZE)
+            summary['deleted'] += deleted
+            if deleted < self.HISTORY_BATCH_SIZE:
+                return
+            yield
+
+    def _order_keys(self, db: DBManager, summary: Dict) -> Iterator:
+        summary['renumbered'] = 0
+        for name in ORDERED_COLLECTIONS:
+            summary['renumbered'] += db.renormalize_order_keys([name])[name]
+            yield
+
+    def _optimize(self, conn, summary: Dict) -> Iterator:
+        conn.execute(f"PRAGMA analysis_limit = {self.ANALYSIS_LIMIT}")
+        conn.execute("PRAGMA optimize")
+        summary['done'] = True
+        yield
+
+    def _incremental_vacuum(self, conn, force: bool, summary: Dict) -> Iterator:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        summary['free_pages'] = free_before
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+        if auto_vacuum != 2:
+            # Bases de datos anteriores: la conversión requiere un VACUUM completo,
+            # solo en ejecuciones manuales
+            if not force:
+                summary['skipped'] = 'auto_vacuum is not incremental'
+                return
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            summary['converted'] = True
+            summary['freed_bytes'] = free_before * page_size
+            yield
+            return
+
+        while conn.execute("PRAGMA freelist_count").fetchone()[0] > 0:
+            conn.execute(f"PRAGMA incremental_vacuum({self.VACUUM_PAGES_PER_SLICE})").fetchall()
+            yield
+        summary['freed_bytes'] = free_before * page_size
+
+    def _wal_checkpoint(self, conn, summary: Dict) -> Iterator:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if str(mode).lower() != 'wal':
+            summary['skipped'] = f"journal_mode={mode}"
+            return
+        busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        summary.update({'busy': busy, 'log_frames': log_frames, 'checkpointed': checkpointed})
+        yield
+
+    def _quick_check(self, conn, force: bool, summary: Dict) -> Iterator:
+        # Las tablas virtuales (FTS) se verifican a través de sus tablas internas
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "AND sql NOT LIKE 'CREATE VIRTUAL TABLE%'"
+        )]
+        problems = []
+        skipped = []
+        for table in tables:
+            if not force and self._exceeds_rows(conn, table, self.QUICK_CHECK_MAX_ROWS):
+                # Una tabla grande no cabe en una porción: queda para la ejecución manual
+                skipped.append(table)
+                yield
+                continue
+            rows = [row[0] for row in conn.execute(f'PRAGMA quick_check("{table}")')]
+            if rows != ['ok']:
+                problems.extend(f"{table}: {row}" for row in rows)
+            yield
+        summary['tables'] = len(tables) - len(skipped)
+        if skipped:
+            summary['skipped_tables'] = skipped
+        summary['ok'] = not problems
+        if problems:
+            summary['problems'] = problems[:20]
+            logger.error(f"Database quick_check found problems: {problems[:5]}")
+
+    @staticmethod
+    def _exceeds_rows(conn, table: str, limit: int) -> bool:
+        """True si la tabla tiene más de limit filas (lee como mucho limit + 1)"""
+        row = conn.execute(f'SELECT COUNT(*) FROM (SELECT 1 FROM "{table}" LIMIT ?)', (limit + 1,)).fetchone()
+        return row[0] > limit
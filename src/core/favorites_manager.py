@@ -9,6 +9,10 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from utils.compression import restore_content
+from database.query_profiler import ProfiledConnection
+from database import ordering
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +29,7 @@ class FavoritesManager:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -140,7 +144,7 @@ class FavoritesManager:
             results = cursor.fetchall()
             conn.close()
 
-            favorites = [dict(row) for row in results]
+            favorites = [restore_content(dict(row)) for row in results]
             logger.info(f"Retrieved {len(favorites)} favorites")
             return favorites
 
@@ -163,7 +167,7 @@ class FavoritesManager:
             results = cursor.fetchall()
             conn.close()
 
-            favorites = [dict(row) for row in results]
+            favorites = [restore_content(dict(row)) for row in results]
             logger.info(f"Retrieved {len(favorites)} favorites for category {category_id}")
             return favorites
 
@@ -194,21 +198,19 @@ class FavoritesManager:
     # ==================== Ordenamiento ====================
 
     def reorder_favorite(self, item_id: int, new_order: int) -> bool:
-        """Cambiar orden de un favorito"""
+        """Mover un favorito a la posición new_order (1, 2, 3...) cambiando solo su clave"""
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                UPDATE items
-                SET favorite_order = ?,
-                    updated_at = datetime('now')
-                WHERE id = ? AND is_favorite = 1
-            """, (new_order, item_id))
-
+            written = ordering.move_to_position(
+                conn, ordering.COLLECTIONS['favorites'], item_id, new_order - 1
+            )
             conn.commit()
             conn.close()
 
+            if written is None:
+                logger.warning(f"Item {item_id} is not a favorite")
+                return False
+
             logger.info(f"Item {item_id} reordered to position {new_order}")
             return True
 
@@ -217,24 +219,14 @@ class FavoritesManager:
             return False
 
     def reorder_favorites(self, item_ids: List[int]) -> bool:
-        """Reordenar múltiples favoritos (drag & drop)"""
+        """Reordenar múltiples favoritos (drag & drop); solo cambian las claves de los movidos"""
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Asignar orden basado en posición en la lista
-            for order, item_id in enumerate(item_ids, start=1):
-                cursor.execute("""
-                    UPDATE items
-                    SET favorite_order = ?,
-                        updated_at = datetime('now')
-                    WHERE id = ? AND is_favorite = 1
-                """, (order, item_id))
-
+            written = ordering.apply_order(conn, ordering.COLLECTIONS['favorites'], item_ids)
             conn.commit()
             conn.close()
 
-            logger.info(f"Reordered {len(item_ids)} favorites")
+            logger.info(f"Reordered {len(item_ids)} favorites ({written} keys updated)")
             return True
 
         except Exception as e:
@@ -265,13 +257,7 @@ class FavoritesManager:
             item_ids = [row['id'] for row in results]
 
             # Actualizar orden
-            for order, item_id in enumerate(item_ids, start=1):
-                cursor.execute("""
-                    UPDATE items
-                    SET favorite_order = ?,
-                        updated_at = datetime('now')
-                    WHERE id = ?
-                """, (order, item_id))
+            ordering.apply_order(conn, ordering.COLLECTIONS['favorites'], item_ids)
 
             conn.commit()
             conn.close()
@@ -289,23 +275,13 @@ class FavoritesManager:
         """Obtener siguiente índice de orden disponible"""
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT MAX(favorite_order) as max_order
-                FROM items
-                WHERE is_favorite = 1
-            """)
-
-            result = cursor.fetchone()
+            next_order = ordering.next_key(conn, ordering.COLLECTIONS['favorites'])
             conn.close()
-
-            max_order = result['max_order'] if result and result['max_order'] else 0
-            return max_order + 1
+            return next_order
 
         except Exception as e:
             logger.error(f"Error getting next order index: {e}")
-            return 1
+            return ordering.ORDER_GAP
 
     def get_favorite_stats(self) -> Dict:
         """Estadísticas de favoritos"""
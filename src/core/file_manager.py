@@ -22,6 +22,7 @@ from datetime import datetime
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.item import Item
+from core.file_storage_reconciler import FileStorageReconciler
 
 logger = logging.getLogger(__name__)
 
@@ -535,25 +536,33 @@ class FileManager:
         """
         Obtiene estadísticas del almacenamiento de archivos
 
+        Lee la tabla agregada file_storage_stats, mantenida de forma
+        incremental al crear/eliminar items PATH, por lo que no recorre
+        el disco ni la tabla items.
+
         Returns:
             Dict con estadísticas:
                 - total_items: Total de items PATH
                 - total_size: Tamaño total en bytes
                 - total_size_formatted: Tamaño formateado
-                - by_type: Diccionario con conteo por tipo
+                - by_type: Diccionario tipo -> {'count', 'size'}
         """
         try:
-            # Obtener todos los items de tipo PATH
-            # Nota: esto requeriría un método en DBManager para filtrar por tipo
-            # Por ahora retornamos estructura básica
-            stats = {
-                'total_items': 0,
-                'total_size': 0,
-                'total_size_formatted': '0 B',
-                'by_type': {}
+            rows = self.db_manager.get_file_storage_stats()
+
+            by_type = {
+                row['file_type']: {'count': row['file_count'], 'size': row['total_size']}
+                for row in rows
             }
+            total_items = sum(entry['count'] for entry in by_type.values())
+            total_size = sum(entry['size'] for entry in by_type.values())
 
-            return stats
+            return {
+                'total_items': total_items,
+                'total_size': total_size,
+                'total_size_formatted': self.format_file_size(total_size),
+                'by_type': by_type
+            }
 
         except Exception as e:
             logger.error(f"Error getting storage stats: {e}")
@@ -563,3 +572,21 @@ class FileManager:
                 'total_size_formatted': '0 B',
                 'by_type': {}
             }
+
+    def start_storage_reconcile(self, on_finished=None) -> Optional[FileStorageReconciler]:
+        """
+        Inicia en segundo plano la reconciliación de estadísticas con el disco
+
+        Args:
+            on_finished: Callback opcional con el resumen (se invoca desde el hilo worker)
+
+        Returns:
+            FileStorageReconciler en ejecución, o None si no hay ruta base configurada
+        """
+        base_path = self.get_base_path()
+        if not base_path:
+            return None
+
+        reconciler = FileStorageReconciler(str(self.db_manager.db_path), base_path)
+        reconciler.start(on_finished)
+        return reconciler
@@ -0,0 +1,217 @@
+"""
+File Storage Reconciler - Corrección en segundo plano de estadísticas de almacenamiento
+
+Recorre la carpeta base de archivos con os.scandir en lotes, compara el
+tamaño real de cada archivo con el file_size registrado en su item PATH y
+corrige las diferencias. Al terminar recalcula la tabla file_storage_stats
+para eliminar cualquier desviación acumulada.
+
+Se ejecuta en un hilo daemon con su propia conexión a la base de datos, de
+modo que nunca bloquea la interfaz.
+"""
+
+import os
+import sys
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+
+class FileStorageReconciler:
+    """Reconciliador de estadísticas de almacenamiento de archivos"""
+
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, db_path: str, base_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Inicializar reconciliador
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            base_path: Carpeta raíz de almacenamiento de archivos
+            batch_size: Archivos procesados por lote (una transacción por lote)
+        """
+        self.db_path = str(db_path)
+        self.base_path = Path(base_path) if base_path else None
+        self.batch_size = max(1, int(batch_size))
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.last_result: Optional[Dict] = None
+
+    # ==================== Control del hilo ====================
+
+    def start(self, on_finished: Optional[Callable[[Dict], None]] = None) -> bool:
+        """
+        Iniciar la reconciliación en un hilo en segundo plano
+
+        Args:
+            on_finished: Callback opcional con el resumen (se invoca desde el hilo worker)
+
+        Returns:
+            bool: True si se inició, False si ya estaba en ejecución
+        """
+        if self.is_running():
+            logger.debug("File storage reconcile already running")
+            return False
+
+        self._stop_event.clear()
+
+        def _run():
+            result = self.reconcile()
+            if on_finished:
+                try:
+                    on_finished(result)
+                except Exception as e:
+                    logger.error(f"Error in reconcile callback: {e}")
+
+        self._thread = threading.Thread(target=_run, name="FileStorageReconciler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Solicitar la detención de la reconciliación en curso"""
+        self._stop_event.set()
+
+    def is_running(self) -> bool:
+        """Indica si hay una reconciliación en curso"""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==================== Reconciliación ====================
+
+    def reconcile(self) -> Dict:
+        """
+        Ejecutar la reconciliación de forma síncrona
+
+        Returns:
+            Dict con el resumen: scanned_files, scanned_bytes, updated_items,
+            missing_files, untracked_files, untracked_bytes, cancelled
+        """
+        result = {
+            'scanned_files': 0,
+            'scanned_bytes': 0,
+            'updated_items': 0,
+            'missing_files': 0,
+            'untracked_files': 0,
+            'untracked_bytes': 0,
+            'cancelled': False,
+        }
+
+        if not self.base_path or not self.base_path.is_dir():
+            logger.warning(f"File storage base path not available: {self.base_path}")
+            self.last_result = result
+            return result
+
+        db = DBManager(self.db_path)
+        try:
+            index = self._load_index(db)
+
+            for batch in self._scan_batches():
+                if self._stop_event.is_set():
+                    result['cancelled'] = True
+                    break
+                self._apply_batch(db, batch, index, result)
+
+            if not result['cancelled']:
+                result['missing_files'] = sum(len(entries) for entries in index.values())
+                db.rebuild_file_storage_stats()
+
+            logger.info(f"File storage reconciled: {result}")
+        except Exception as e:
+            logger.error(f"Error reconciling file storage: {e}")
+        finally:
+            db.close()
+
+        self.last_result = result
+        return result
+
+    def _load_index(self, db: DBManager) -> Dict[str, List[Tuple[int, int]]]:
+        """Mapear ruta relativa -> [(item_id, file_size registrado)]"""
+        rows = db.execute_query("""
+            SELECT id, content, file_size
+            FROM items
+            WHERE type = 'PATH' AND file_hash IS NOT NULL AND is_sensitive = 0
+        """)
+
+        index: Dict[str, List[Tuple[int, int]]] = {}
+        for row in rows:
+            key = self._normalize_path(row['content'])
+            if key:
+                index.setdefault(key, []).append((row['id'], row['file_size'] or 0))
+        return index
+
+    def _normalize_path(self, path: str) -> Optional[str]:
+        """Normalizar una ruta de item a ruta relativa a la carpeta base"""
+        if not path:
+            return None
+
+        normalized = path.strip().replace('\\', '/')
+        candidate = Path(normalized)
+        if candidate.is_absolute():
+            try:
+                normalized = candidate.relative_to(self.base_path).as_posix()
+            except ValueError:
+                return None
+        return normalized
+
+    def _scan_batches(self) -> Iterator[List[Tuple[str, int]]]:
+        """Recorrer la carpeta base con os.scandir devolviendo lotes (ruta relativa, tamaño)"""
+        batch: List[Tuple[str, int]] = []
+        pending_dirs = [str(self.base_path)]
+
+        while pending_dirs:
+            if self._stop_event.is_set():
+                return
+
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                relative = os.path.relpath(entry.path, self.base_path).replace(os.sep, '/')
+                                batch.append((relative, entry.stat(follow_symlinks=False).st_size))
+                        except OSError as e:
+                            logger.debug(f"Skipping {entry.path}: {e}")
+                            continue
+
+                        if len(batch) >= self.batch_size:
+                            yield batch
+                            batch = []
+            except OSError as e:
+                logger.warning(f"Cannot scan {current_dir}: {e}")
+
+        if batch:
+            yield batch
+
+    def _apply_batch(self, db: DBManager, batch: List[Tuple[str, int]],
+                     index: Dict[str, List[Tuple[int, int]]], result: Dict):
+        """Corregir file_size de los items del lote cuyo tamaño real difiere"""
+        updates = []
+
+        for relative, size in batch:
+            result['scanned_files'] += 1
+            result['scanned_bytes'] += size
+
+            entries = index.pop(relative, None)
+            if entries is None:
+                result['untracked_files'] += 1
+                result['untracked_bytes'] += size
+                continue
+
+            for item_id, recorded_size in entries:
+                if recorded_size != size:
+                    updates.append((size, item_id))
+
+        if updates:
+            # Los triggers de file_storage_stats ajustan los totales en la misma transacción
+            with db.transaction() as conn:
+                conn.executemany("UPDATE items SET file_size = ? WHERE id = ?", updates)
+            result['updated_items'] += len(updates)
@@ -0,0 +1,89 @@
+"""
+Lazy Manager - Proxy de inicialización diferida para subsistemas pesados
+
+El manager real (navegador, notebook, workarea, ...) se construye en el
+primer acceso a cualquiera de sus atributos, de modo que los usuarios que
+nunca abren el subsistema no pagan su import ni su inicialización.
+
+Antes de la carga:
+- Las llamadas listadas en deferred_calls se guardan y se reproducen sobre
+  la instancia real cuando se construya (p.ej. set_main_window).
+- Las llamadas listadas en noop_until_loaded no hacen nada (p.ej. cleanup:
+  no hay nada que limpiar si nunca se creó).
+"""
+
+import logging
+import time
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+class LazyManager:
+    """Proxy que construye el manager real en el primer uso"""
+
+    def __init__(self, name: str, factory: Callable[[], Any],
+                 deferred_calls: Iterable[str] = (),
+                 noop_until_loaded: Iterable[str] = ()):
+        """
+        Args:
+            name: Nombre para logs
+            factory: Callable sin argumentos que crea el manager real
+            deferred_calls: Métodos que se encolan hasta la carga
+            noop_until_loaded: Métodos ignorados mientras no se haya cargado
+        """
+        self._lazy_name = name
+        self._lazy_factory = factory
+        self._lazy_instance = None
+        self._lazy_deferred = frozenset(deferred_calls)
+        self._lazy_noop = frozenset(noop_until_loaded)
+        self._lazy_pending = []  # [(method, args, kwargs)]
+
+    @property
+    def lazy_loaded(self) -> bool:
+        """True si el manager real ya fue construido"""
+        return self._lazy_instance is not None
+
+    def lazy_get(self) -> Any:
+        """Obtener (construyendo si hace falta) el manager real"""
+        if self._lazy_instance is None:
+            start = time.perf_counter()
+            instance = self._lazy_factory()
+            for method, args, kwargs in self._lazy_pending:
+                getattr(instance, method)(*args, **kwargs)
+            self._lazy_pending = []
+            self._lazy_instance = instance
+            logger.info(f"{self._lazy_name} loaded on first use "
+                        f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+        return self._lazy_instance
+
+    def _lazy_defer(self, method: str, *args, **kwargs):
+        if self._lazy_instance is not None:
+            return getattr(self._lazy_instance, method)(*args, **kwargs)
+        self._lazy_pending.append((method, args, kwargs))
+        return None
+
+    def __getattr__(self, attr: str) -> Any:
+        # Solo se llama para atributos que no existen en el proxy
+        if attr.startswith('_lazy_'):
+            raise AttributeError(attr)
+        if self._lazy_instance is None:
+            if attr in self._lazy_noop:
+                return _noop
+            if attr in self._lazy_deferred:
+                return lambda *args, **kwargs: self._lazy_defer(attr, *args, **kwargs)
+        return getattr(self.lazy_get(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        if attr.startswith('_lazy_'):
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self.lazy_get(), attr, value)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.lazy_loaded else 'not loaded'
+        return f"<LazyManager {self._lazy_name} ({state})>"
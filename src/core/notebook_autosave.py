@@ -0,0 +1,253 @@
+"""
+Notebook Autosave Service - Auto-guardado incremental de pestañas del notebook
+
+Cada cambio (tras el debounce de NotebookTab) se registra con mark_dirty:
+se calcula un hash del contenido y, si difiere del último guardado, la
+pestaña queda pendiente y el cambio se añade al journal (una línea JSON,
+append sin fsync). El flush periódico escribe solo las pestañas pendientes,
+en una transacción y en un hilo en segundo plano con su propia conexión.
+
+Tras un flush correcto el journal se vacía. Si la aplicación se cierra sin
+flush, recover() aplica al arrancar la última versión de cada pestaña que
+quedó en el journal.
+"""
+
+import sys
+import json
+import hashlib
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+
+JOURNAL_SUFFIX = '.notebook-journal'
+
+
+def content_hash(fields: Dict) -> str:
+    """Hash estable de los campos de una pestaña"""
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class NotebookAutosaveService:
+    """Seguimiento de pestañas modificadas y guardado por lotes"""
+
+    def __init__(self, db_path: str, journal_path: Optional[str] = None):
+        """
+        Inicializar servicio
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            journal_path: Ruta del journal (por defecto junto a la base de datos)
+        """
+        self.db_path = str(db_path)
+        self.journal_path = Path(journal_path or f"{self.db_path}{JOURNAL_SUFFIX}")
+        self._saved_hashes: Dict[int, str] = {}
+        self._pending: Dict[int, Dict] = {}
+        self._pending_hashes: Dict[int, str] = {}
+        self._state_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._db: Optional[DBManager] = None
+
+    # ==================== Seguimiento de cambios ====================
+
+    def set_saved(self, tab_id: int, fields: Dict):
+        """Registrar el estado ya persistido de una pestaña (al cargarla)"""
+        with self._state_lock:
+            self._saved_hashes[tab_id] = content_hash(fields)
+
+    def mark_dirty(self, tab_id: int, fields: Dict) -> bool:
+        """
+        Registrar el estado actual de una pestaña
+
+        Returns:
+            bool: True si difiere de lo guardado y queda pendiente
+        """
+        digest = content_hash(fields)
+        with self._state_lock:
+            if self._pending_hashes.get(tab_id, self._saved_hashes.get(tab_id)) == digest:
+                return False
+            if digest == self._saved_hashes.get(tab_id):
+                # Volvió al estado guardado: nada que escribir
+                if self._pending.pop(tab_id, None) is not None:
+                    self._pending_hashes.pop(tab_id, None)
+                    self._rewrite_journal()
+                return False
+            self._pending[tab_id] = dict(fields)
+            self._pending_hashes[tab_id] = digest
+            self._append_journal(tab_id, fields)
+        return True
+
+    def is_dirty(self, tab_id: int) -> bool:
+        """Indica si la pestaña tiene cambios sin escribir en la BD"""
+        with self._state_lock:
+            return tab_id in self._pending
+
+    def dirty_tab_ids(self) -> List[int]:
+        """IDs de las pestañas pendientes"""
+        with self._state_lock:
+            return list(self._pending)
+
+    def discard(self, tab_id: int):
+        """Olvidar una pestaña (p. ej. al eliminarla)"""
+        with self._state_lock:
+            self._pending.pop(tab_id, None)
+            self._pending_hashes.pop(tab_id, None)
+            self._saved_hashes.pop(tab_id, None)
+            self._rewrite_journal()
+
+    # ==================== Guardado ====================
+
+    def is_flushing(self) -> bool:
+        """Indica si hay un guardado en curso"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return True
+        return self._flush_lock.locked()
+
+    def flush(self) -> Dict:
+        """
+        Escribir las pestañas pendientes en una transacción (en el hilo llamante)
+
+        Returns:
+            Dict: saved (IDs guardados), duration_ms y error si falló
+        """
+        with self._flush_lock:
+            with self._state_lock:
+                batch = {tab_id: dict(fields) for tab_id, fields in self._pending.items()}
+                hashes = {tab_id: self._pending_hashes[tab_id] for tab_id in batch}
+            if not batch:
+                return {'saved': [], 'duration_ms': 0.0}
+
+            started = time.perf_counter()
+            try:
+                saved = self._get_db().update_notebook_tabs(batch)
+            except Exception as e:
+                logger.error(f"Notebook autosave failed: {e}")
+                return {'saved': [], 'duration_ms': 0.0, 'error': str(e)}
+
+            with self._state_lock:
+                for tab_id in batch:
+                    if tab_id in saved:
+                        self._saved_hashes[tab_id] = hashes[tab_id]
+                    # Si cambió durante el flush sigue pendiente con su nueva versión;
+                    # las pestañas que ya no existen se descartan
+                    if self._pending_hashes.get(tab_id) == hashes[tab_id]:
+                        self._pending.pop(tab_id, None)
+                        self._pending_hashes.pop(tab_id, None)
+                self._rewrite_journal()
+
+            duration_ms = (time.perf_counter() - started) * 1000
+            logger.debug(f"Notebook autosave: {len(saved)} tabs in {duration_ms:.1f}ms")
+            return {'saved': saved, 'duration_ms': round(duration_ms, 2)}
+
+    def flush_async(self, on_finished: Optional[Callable[[Dict], None]] = None) -> bool:
+        """
+        Guardar las pestañas pendientes en un hilo en segundo plano
+
+        Args:
+            on_finished: Callback con el resultado (se invoca desde el hilo worker)
+
+        Returns:
+            bool: False si no hay cambios o ya había un guardado en curso
+        """
+        if self.is_flushing() or not self.dirty_tab_ids():
+            return False
+
+        def _run():
+            result = self.flush()
+            if on_finished:
+                try:
+                    on_finished(result)
+                except Exception as e:
+                    logger.error(f"Error in notebook autosave callback: {e}")
+
+        self._flush_thread = threading.Thread(target=_run, name="NotebookAutosave", daemon=True)
+        self._flush_thread.start()
+        return True
+
+    def close(self):
+        """Esperar el guardado en curso y cerrar la conexión propia"""
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        with self._flush_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _get_db(self) -> DBManager:
+        # Conexión propia: el flush no comparte la conexión del hilo de la UI
+        if self._db is None:
+            self._db = DBManager(self.db_path)
+        return self._db
+
+    # ==================== Journal ====================
+
+    def recover(self) -> int:
+        """
+        Aplicar los cambios que quedaron en el journal (cierre sin guardar)
+
+        Returns:
+            int: Número de pestañas recuperadas
+        """
+        entries = self._read_journal()
+        if not entries:
+            return 0
+
+        with self._state_lock:
+            for tab_id, fields in entries.items():
+                self._pending[tab_id] = fields
+                self._pending_hashes[tab_id] = content_hash(fields)
+        result = self.flush()
+        if result.get('error'):
+            return 0
+
+        logger.info(f"Recovered {len(result['saved'])} notebook tabs from journal")
+        return len(result['saved'])
+
+    def _read_journal(self) -> Dict[int, Dict]:
+        """Última versión de cada pestaña en el journal (las líneas corruptas se ignoran)"""
+        entries = {}
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries[int(entry['tab_id'])] = entry['fields']
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read notebook journal: {e}")
+        return entries
+
+    def _append_journal(self, tab_id: int, fields: Dict):
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'tab_id': tab_id, 'fields': fields},
+                                   ensure_ascii=False, default=str) + '\n')
+        except OSError as e:
+            logger.warning(f"Could not write notebook journal: {e}")
+
+    def _rewrite_journal(self):
+        """Dejar en el journal solo lo pendiente (se llama con _state_lock)"""
+        try:
+            if not self._pending:
+                self.journal_path.unlink(missing_ok=True)
+                return
+            tmp_path = self.journal_path.with_name(self.journal_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for tab_id, fields in self._pending.items():
+                    f.write(json.dumps({'tab_id': tab_id, 'fields': fields},
+                                       ensure_ascii=False, default=str) + '\n')
+            tmp_path.replace(self.journal_path)
+        except OSError as e:
+            logger.warning(f"Could not rewrite notebook journal: {e}")
@@ -33,6 +33,42 @@ class NotebookManager:
         logger.debug(f"Retrieved {len(tabs)} tabs")
         return tabs
 
+    def get_tab_summaries(self):
+        """
+        Obtener metadatos de las pestañas (sin contenido) ordenadas por posición
+
+        Returns:
+            List[Dict]: Lista de pestañas con content_size en lugar de content
+        """
+        tabs = self.db.get_notebook_tab_summaries()
+        logger.debug(f"Retrieved {len(tabs)} tab summaries")
+        return tabs
+
+    @staticmethod
+    def select_tabs_to_unload(loaded_tabs, budget):
+        """
+        Elegir pestañas a descargar para respetar el presupuesto de memoria
+
+        Args:
+            loaded_tabs: Lista de dicts con id, size, last_active y can_unload
+            budget: Tamaño máximo total (caracteres) de las pestañas cargadas
+
+        Returns:
+            List: IDs a descargar, de la menos a la más recientemente usada
+        """
+        total = sum(tab['size'] for tab in loaded_tabs)
+        to_unload = []
+        candidates = sorted(
+            (tab for tab in loaded_tabs if tab['can_unload']),
+            key=lambda tab: tab['last_active']
+        )
+        for tab in candidates:
+            if total <= budget:
+                break
+            to_unload.append(tab['id'])
+            total -= tab['size']
+        return to_unload
+
     def get_tab(self, tab_id):
         """
         Obtener una pestaña específica
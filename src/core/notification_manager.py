@@ -9,6 +9,8 @@ from typing import List, Dict, Optional
 from pathlib import Path
 import logging
 
+from database.query_profiler import ProfiledConnection
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,7 +126,7 @@ class NotificationManager:
     def _get_failing_items(self, min_executions: int = 10, min_error_rate: int = 30) -> List[Dict]:
         """Obtener items con alta tasa de error"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -165,7 +167,7 @@ class NotificationManager:
     def _get_slow_items(self, min_executions: int = 10, min_avg_time_seconds: float = 5.0) -> List[Dict]:
         """Obtener items con tiempo de ejecución lento"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -205,7 +207,7 @@ class NotificationManager:
     def _get_popular_items_without_shortcuts(self, min_use_count: int = 30) -> List[Dict]:
         """Obtener items populares sin atajos asignados"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
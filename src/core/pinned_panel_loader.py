@@ -0,0 +1,139 @@
+"""
+Pinned Panel Content Loader - Carga en segundo plano del contenido de paneles anclados
+
+Al arrancar, los paneles anclados se restauran como ventanas vacías con su
+geometría guardada. Las filas de la categoría y sus items se leen aquí, en un
+único hilo worker con su propia conexión, en el orden en que se solicitan
+(los paneles maximizados antes de tener contenido pasan al frente).
+El panel construye los ItemButton la primera vez que es visible.
+"""
+
+import sys
+import threading
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_category_rows(db: DBManager, category_id: int) -> Optional[Dict]:
+    """
+    Leer categoría e items (contenido sin descomprimir, como ConfigManager.get_category)
+
+    Returns:
+        Dict: {'category': fila de categoría, 'items': filas de items} o None si no existe
+    """
+    category = db.get_category(category_id)
+    if not category:
+        return None
+    return {
+        'category': category,
+        'items': db.get_items_by_category(category_id, decompress=False),
+    }
+
+
+class PinnedPanelContentLoader:
+    """Cola de lecturas de contenido de paneles anclados en un hilo worker"""
+
+    def __init__(self, db_path: str,
+                 on_loaded: Optional[Callable[[int, Optional[Dict]], None]] = None,
+                 fetch: Callable[[DBManager, int], Optional[Dict]] = fetch_category_rows):
+        """
+        Inicializar loader
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            on_loaded: Callback (panel_id, contenido o None) invocado desde el hilo worker
+            fetch: Función que lee el contenido de una categoría con la conexión del worker
+        """
+        self.db_path = str(db_path)
+        self.on_loaded = on_loaded
+        self.fetch = fetch
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._current = None  # (panel_id, category_id) en lectura
+        self._db: Optional[DBManager] = None
+
+    def request(self, panel_id: int, category_id: int, priority: bool = False):
+        """
+        Encolar la lectura del contenido de un panel
+
+        Args:
+            panel_id: ID del panel
+            category_id: ID de la categoría que muestra
+            priority: True para leerlo antes que los pendientes (panel ya maximizado)
+        """
+        with self._lock:
+            entry = (panel_id, int(category_id))
+            if entry == self._current:
+                return
+            if entry in self._queue:
+                if not priority:
+                    return
+                self._queue.remove(entry)
+            if priority:
+                self._queue.appendleft(entry)
+            else:
+                self._queue.append(entry)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="PinnedPanelLoader", daemon=True)
+                self._thread.start()
+
+    def cancel(self, panel_id: int):
+        """Descartar la lectura pendiente de un panel (p.ej. al cerrarlo)"""
+        with self._lock:
+            for entry in [entry for entry in self._queue if entry[0] == panel_id]:
+                self._queue.remove(entry)
+
+    def pending_count(self) -> int:
+        """Número de lecturas en cola"""
+        with self._lock:
+            return len(self._queue)
+
+    def is_running(self) -> bool:
+        """True si el hilo worker está procesando la cola"""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def close(self):
+        """Vaciar la cola, esperar la lectura en curso y cerrar la conexión propia"""
+        with self._lock:
+            self._queue.clear()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._thread = None
+                    self._current = None
+                    return
+                self._current = self._queue.popleft()
+                panel_id, category_id = self._current
+
+            try:
+                # Conexión propia: la lectura no comparte la conexión del hilo de la UI
+                if self._db is None:
+                    self._db = DBManager(self.db_path)
+                content = self.fetch(self._db, category_id)
+            except Exception as e:
+                logger.error(f"Error loading content for pinned panel {panel_id}: {e}")
+                content = None
+
+            if self.on_loaded:
+                try:
+                    self.on_loaded(panel_id, content)
+                except Exception as e:
+                    logger.error(f"Error in pinned panel loader callback: {e}")
@@ -13,16 +13,24 @@ logger = logging.getLogger(__name__)
 class PinnedPanelsManager:
     """Manager for pinned panel persistence and management"""
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, state_store=None):
         """
         Initialize the pinned panels manager
 
         Args:
             db_manager: DBManager instance for database operations
+            state_store: SettingsStore for coalesced position/size/filter writes
+                         (optional; without it updates are written immediately)
         """
         self.db = db_manager
+        self.state_store = state_store
         logger.info("PinnedPanelsManager initialized")
 
+    def _flush_panel_state(self):
+        """Write staged panel state before reading panel rows"""
+        if self.state_store and self.state_store.has_pending(panels_only=True):
+            self.state_store.flush()
+
     def _serialize_filter_config(self, panel_widget) -> Optional[str]:
         """
         Serialize panel's filter configuration to JSON string
@@ -193,7 +201,11 @@ class PinnedPanelsManager:
                 filter_config = self._serialize_filter_config(panel_widget)
                 update_data['filter_config'] = filter_config
 
-            self.db.update_pinned_panel(panel_id=panel_id, **update_data)
+            if self.state_store:
+                # Agrupado con el resto de escrituras de settings/estado
+                self.state_store.stage_panel_state(panel_id, update_data)
+            else:
+                self.db.update_pinned_panel(panel_id=panel_id, **update_data)
             logger.debug(f"Panel {panel_id} state updated (filters: {include_filters})")
         except Exception as e:
             logger.error(f"Failed to update panel state: {e}")
@@ -203,10 +215,14 @@ class PinnedPanelsManager:
         """
         Get all active panels to restore on application startup
 
+        Only panel rows (geometry, customization, category name) are read;
+        the category items are loaded later by PinnedPanelContentLoader.
+
         Returns:
             List[Dict]: List of panel dictionaries with configuration
         """
         try:
+            self._flush_panel_state()
             panels = self.db.get_pinned_panels(active_only=True)
             logger.info(f"Retrieved {len(panels)} active panels for restoration")
             return panels
@@ -227,6 +243,19 @@ class PinnedPanelsManager:
         except Exception as e:
             logger.error(f"Failed to mark panel as opened: {e}")
 
+    def mark_panels_opened(self, panel_ids: List[int]):
+        """
+        Update statistics of several panels at once (startup restoration)
+
+        Args:
+            panel_ids: Panel IDs in database
+        """
+        try:
+            self.db.update_panels_last_opened(panel_ids)
+            logger.debug(f"{len(panel_ids)} panels marked as opened")
+        except Exception as e:
+            logger.error(f"Failed to mark panels as opened: {e}")
+
     def get_recent_history(self, limit: int = 10) -> List[Dict]:
         """
         Get recently used panels for history dropdown
@@ -336,6 +365,7 @@ class PinnedPanelsManager:
             Optional[Dict]: Panel data if exists, None otherwise
         """
         try:
+            self._flush_panel_state()
             panel = self.db.get_panel_by_category(category_id)
             if panel:
                 logger.debug(f"Found existing panel for category {category_id}")
@@ -355,6 +385,7 @@ class PinnedPanelsManager:
             List[Dict]: List of all panel dictionaries
         """
         try:
+            self._flush_panel_state()
             panels = self.db.get_pinned_panels(active_only=active_only)
             logger.debug(f"Retrieved {len(panels)} panels (active_only={active_only})")
             return panels
@@ -373,6 +404,7 @@ class PinnedPanelsManager:
             Optional[Dict]: Panel data if found, None otherwise
         """
         try:
+            self._flush_panel_state()
             panel = self.db.get_panel_by_id(panel_id)
             if panel:
                 logger.debug(f"Retrieved panel {panel_id}")
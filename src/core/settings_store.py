@@ -0,0 +1,265 @@
+"""
+Settings Store - Caché de settings y estado de UI con escritura diferida
+
+Todas las settings se leen una vez al crear el store y las lecturas se
+sirven desde memoria (con accesores tipados get_int/get_float/get_bool/get_str).
+
+Las escrituras actualizan la memoria, notifican a los listeners y quedan
+pendientes; un hilo en segundo plano con su propia conexión las escribe cada
+flush_interval segundos en una sola transacción (DBManager.write_state_batch),
+junto con el estado de paneles anclados (posición, tamaño, filtros) que las
+ventanas registran con stage_panel_state. Varias escrituras de la misma clave
+o del mismo panel dentro del intervalo se agrupan en una.
+
+close() (o flush()) escribe lo pendiente de forma síncrona al salir.
+
+El store se registra en DBManager (add_settings_observer): las escrituras
+directas con DBManager.set_setting sobre la misma base de datos, desde
+cualquier conexión, actualizan también la memoria.
+"""
+
+import copy
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FLUSH_SECONDS = 2.0
+
+_MISSING = object()
+_TRUE_STRINGS = ('1', 'true', 'yes', 'on')
+
+
+class SettingsStore:
+    """Settings en memoria con escritura diferida y notificación de cambios"""
+
+    def __init__(self, db_manager, flush_interval: float = DEFAULT_FLUSH_SECONDS):
+        """
+        Inicializar store (lee todas las settings)
+
+        Args:
+            db_manager: DBManager de la aplicación
+            flush_interval: Segundos entre escrituras agrupadas
+        """
+        self.db = db_manager
+        self.flush_interval = flush_interval
+        self._values: Dict[str, Any] = db_manager.get_all_settings()
+        self._pending_settings: Dict[str, Any] = {}
+        self._pending_panels: Dict[int, Dict[str, Any]] = {}
+        self._listeners: List[Tuple[Optional[str], Callable[[str, Any], None]]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._writer_db = None
+        self._closed = False
+        db_manager.add_settings_observer(self)
+        logger.debug(f"SettingsStore loaded {len(self._values)} settings")
+
+    # ==================== Lectura ====================
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Valor de una setting (copia si es lista o dict)"""
+        with self._lock:
+            value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        """Setting como int (default si falta o no es convertible)"""
+        return self._coerce(key, default, int)
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        """Setting como float (default si falta o no es convertible)"""
+        return self._coerce(key, default, float)
+
+    def get_str(self, key: str, default: str = "") -> str:
+        """Setting como str"""
+        return self._coerce(key, default, str)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Setting como bool ('true'/'1'/'yes'/'on' en texto cuentan como True)"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        if isinstance(value, str):
+            return value.strip().lower() in _TRUE_STRINGS
+        return bool(value)
+
+    def _coerce(self, key: str, default, cast):
+        value = self.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Setting '{key}' has invalid value {value!r}, using default")
+            return default
+
+    def all(self) -> Dict[str, Any]:
+        """Copia de todas las settings"""
+        with self._lock:
+            return copy.deepcopy(self._values)
+
+    # ==================== Escritura ====================
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Guardar una setting (memoria inmediata, BD diferida)
+
+        Returns:
+            bool: True si el valor cambió
+        """
+        with self._lock:
+            if self._values.get(key, _MISSING) == value:
+                return False
+            self._values[key] = copy.deepcopy(value)
+            self._pending_settings[key] = copy.deepcopy(value)
+
+        self._notify(key, value)
+        self._schedule_flush()
+        return True
+
+    def setting_written(self, key: str, value: Any):
+        """
+        Reflejar una escritura directa en la BD (DBManager.set_setting)
+
+        La escritura directa gana a un valor pendiente de la misma clave.
+        """
+        with self._lock:
+            changed = self._values.get(key, _MISSING) != value
+            self._values[key] = copy.deepcopy(value)
+            self._pending_settings.pop(key, None)
+        if changed:
+            self._notify(key, value)
+
+    def set_many(self, values: Dict[str, Any]) -> int:
+        """Guardar varias settings; devuelve cuántas cambiaron"""
+        return sum(1 for key, value in values.items() if self.set(key, value))
+
+    def stage_panel_state(self, panel_id: int, fields: Dict[str, Any]):
+        """
+        Registrar estado de un panel anclado para la próxima escritura
+
+        Args:
+            panel_id: ID del panel
+            fields: Campos de pinned_panels (x_position, width, filter_config, ...)
+        """
+        with self._lock:
+            self._pending_panels.setdefault(panel_id, {}).update(fields)
+        self._schedule_flush()
+
+    def has_pending(self, panels_only: bool = False) -> bool:
+        """True si hay escrituras pendientes"""
+        with self._lock:
+            return bool(self._pending_panels or (not panels_only and self._pending_settings))
+
+    def flush(self) -> int:
+        """
+        Escribir lo pendiente en una transacción
+
+        Returns:
+            int: Número de settings y paneles escritos (0 si nada o si falló)
+        """
+        with self._flush_lock:
+            with self._lock:
+                settings, self._pending_settings = self._pending_settings, {}
+                panels, self._pending_panels = self._pending_panels, {}
+            if not settings and not panels:
+                return 0
+
+            try:
+                self._get_writer_db().write_state_batch(settings, panels)
+            except Exception as e:
+                logger.error(f"Error writing settings batch: {e}")
+                with self._lock:
+                    # Reencolar sin pisar cambios posteriores
+                    for key, value in settings.items():
+                        self._pending_settings.setdefault(key, value)
+                    for panel_id, fields in panels.items():
+                        merged = dict(fields)
+                        merged.update(self._pending_panels.get(panel_id, {}))
+                        self._pending_panels[panel_id] = merged
+                return 0
+
+            logger.debug(f"Settings batch flushed: {len(settings)} settings, {len(panels)} panels")
+            return len(settings) + len(panels)
+
+    def close(self):
+        """Detener el hilo de escritura, escribir lo pendiente y cerrar la conexión propia"""
+        self._stop_event.set()
+        with self._lock:
+            self._closed = True
+            thread = self._flush_thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+        self.db.remove_settings_observer(self)
+        with self._flush_lock:
+            if self._writer_db is not None and self._writer_db is not self.db:
+                self._writer_db.close()
+            self._writer_db = None
+
+    def _get_writer_db(self):
+        # Conexión propia: la escritura no comparte la conexión del hilo de la UI
+        if self._writer_db is None:
+            if str(self.db.db_path) == ":memory:":
+                self._writer_db = self.db
+            else:
+                self._writer_db = type(self.db)(self.db.db_path)
+        return self._writer_db
+
+    def _schedule_flush(self):
+        with self._lock:
+            closed = self._closed
+            if not closed and self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="SettingsStoreFlush", daemon=True
+                )
+                self._flush_thread.start()
+        if closed:
+            # Tras close() no hay hilo: escribir directamente
+            self.flush()
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+            with self._lock:
+                if not self._pending_settings and not self._pending_panels:
+                    self._flush_thread = None
+                    return
+        with self._lock:
+            self._flush_thread = None
+
+    # ==================== Notificación de cambios ====================
+
+    def add_listener(self, callback: Callable[[str, Any], None], key: Optional[str] = None):
+        """
+        Registrar callback(key, value) para cambios de settings
+
+        Se invoca en el hilo que llamó a set() (o a DBManager.set_setting);
+        las vistas lo reenvían con una señal Qt.
+
+        Args:
+            callback: Función a invocar
+            key: Solo cambios de esta clave (None = todas)
+        """
+        with self._lock:
+            self._listeners.append((key, callback))
+
+    def remove_listener(self, callback: Callable[[str, Any], None]):
+        """Eliminar un callback registrado"""
+        with self._lock:
+            self._listeners = [(key, cb) for key, cb in self._listeners if cb != callback]
+
+    def _notify(self, key: str, value: Any):
+        with self._lock:
+            listeners = [cb for listen_key, cb in self._listeners if listen_key in (None, key)]
+        for callback in listeners:
+            try:
+                callback(key, value)
+            except Exception as e:
+                logger.error(f"Error in settings listener for '{key}': {e}")
@@ -36,12 +36,18 @@ class SimpleBrowserManager:
         self.main_window = main_window
         self.browser_window: Optional['SimpleBrowserWindow'] = None
         self._home_url: Optional[str] = None
+        # BrowserProfileManager importa QtWebEngine: se crea al abrir el navegador
+        self._profile_manager = None
 
-        # Inicializar BrowserProfileManager para persistencia de sesiones web
-        from src.core.browser_profile_manager import BrowserProfileManager
-        self.profile_manager = BrowserProfileManager(db_manager)
+        logger.info("SimpleBrowserManager inicializado")
 
-        logger.info("SimpleBrowserManager inicializado con perfil persistente")
+    @property
+    def profile_manager(self):
+        """BrowserProfileManager para persistencia de sesiones web (lazy)"""
+        if self._profile_manager is None:
+            from src.core.browser_profile_manager import BrowserProfileManager
+            self._profile_manager = BrowserProfileManager(self.db)
+        return self._profile_manager
 
     def toggle_browser(self):
         """
@@ -241,8 +247,8 @@ class SimpleBrowserManager:
         if self.browser_window:
             self.close_browser()
 
-        # Limpiar profile manager
-        if self.profile_manager:
-            self.profile_manager.cleanup()
+        # Limpiar profile manager (solo si llegó a crearse)
+        if self._profile_manager:
+            self._profile_manager.cleanup()
 
         logger.info("SimpleBrowserManager limpiado")
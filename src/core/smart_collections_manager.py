@@ -8,14 +8,31 @@ que son filtros guardados con criterios múltiples para búsquedas dinámicas de
 
 import sqlite3
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
+from utils.compression import restore_content, register_sqlite_functions
+from database.query_profiler import ProfiledConnection
+
 logger = logging.getLogger(__name__)
 
 
 class SmartCollectionsManager:
-    """Gestor de Smart Collections (filtros guardados inteligentes)"""
+    """
+    Gestor de Smart Collections (filtros guardados inteligentes)
+
+    La pertenencia de cada colección guardada está materializada en
+    smart_collection_members (migración add_smart_collection_members):
+    al leer solo se reevalúan los items modificados desde la última lectura
+    y los conteos se leen de smart_collection_counts.
+    """
+
+    # Campos de la colección que definen sus filtros
+    FILTER_FIELDS = {
+        'tags_include', 'tags_exclude', 'category_id', 'item_type',
+        'is_favorite', 'is_sensitive', 'is_active_filter', 'is_archived_filter',
+        'search_text', 'date_from', 'date_to'
+    }
 
     def __init__(self, db_path: str):
         """
@@ -34,9 +51,10 @@ class SmartCollectionsManager:
         Returns:
             Conexión SQLite
         """
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=ProfiledConnection)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        register_sqlite_functions(conn)
         return conn
 
     # ========== CREATE ==========
@@ -290,12 +308,7 @@ class SmartCollectionsManager:
                 return False
 
             # Campos permitidos para actualización
-            allowed_fields = {
-                'name', 'description', 'icon', 'color',
-                'tags_include', 'tags_exclude', 'category_id', 'item_type',
-                'is_favorite', 'is_sensitive', 'is_active_filter', 'is_archived_filter',
-                'search_text', 'date_from', 'date_to', 'is_active'
-            }
+            allowed_fields = {'name', 'description', 'icon', 'color', 'is_active'} | self.FILTER_FIELDS
 
             # Filtrar solo campos permitidos
             updates = []
@@ -338,6 +351,8 @@ class SmartCollectionsManager:
             conn.close()
 
             if rows_affected > 0:
+                if any(field in self.FILTER_FIELDS for field in kwargs):
+                    self._invalidate_members(collection_id)
                 logger.info(f"Smart collection updated: {collection_id}")
                 return True
             else:
@@ -371,6 +386,8 @@ class SmartCollectionsManager:
                 DELETE FROM smart_collections
                 WHERE id = ?
             """, (collection_id,))
+            cursor.execute("DELETE FROM smart_collection_counts WHERE collection_id = ?", (collection_id,))
+            cursor.execute("DELETE FROM smart_collection_members WHERE collection_id = ?", (collection_id,))
 
             conn.commit()
             rows_affected = cursor.rowcount
@@ -417,7 +434,19 @@ class SmartCollectionsManager:
                 logger.error(f"Collection {collection_id} not found")
                 return []
 
-            return self._execute_filters(collection)
+            conn = self._get_connection()
+            try:
+                self._sync_members(conn, [collection])
+                rows = conn.execute("""
+                    SELECT i.* FROM smart_collection_members m
+                    JOIN items i ON i.id = m.item_id
+                    WHERE m.collection_id = ?
+                    ORDER BY i.last_used DESC, i.created_at DESC
+                """, (collection_id,)).fetchall()
+            finally:
+                conn.close()
+
+            return [restore_content(dict(row)) for row in rows]
 
         except Exception as e:
             logger.error(f"Error executing collection {collection_id}: {e}", exc_info=True)
@@ -425,7 +454,10 @@ class SmartCollectionsManager:
 
     def _execute_filters(self, collection: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Ejecutar los filtros de una colección
+        Ejecutar los filtros de una colección directamente sobre items
+
+        Se usa para colecciones no guardadas (vista previa del editor); las
+        guardadas se leen de la pertenencia materializada (execute_collection).
 
         Args:
             collection: Diccionario con los datos de la colección
@@ -437,73 +469,7 @@ class SmartCollectionsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            # Construir query dinámica basada en los filtros
-            where_clauses = []
-            params = []
-
-            # Filtro por categoría
-            if collection.get('category_id'):
-                where_clauses.append("category_id = ?")
-                params.append(collection['category_id'])
-
-            # Filtro por tipo de item
-            if collection.get('item_type'):
-                where_clauses.append("item_type = ?")
-                params.append(collection['item_type'])
-
-            # Filtro por favorito
-            if collection.get('is_favorite') is not None:
-                where_clauses.append("is_favorite = ?")
-                params.append(collection['is_favorite'])
-
-            # Filtro por sensible
-            if collection.get('is_sensitive') is not None:
-                where_clauses.append("is_sensitive = ?")
-                params.append(collection['is_sensitive'])
-
-            # Filtro por activo
-            if collection.get('is_active_filter') is not None:
-                where_clauses.append("is_active = ?")
-                params.append(collection['is_active_filter'])
-
-            # Filtro por archivado
-            if collection.get('is_archived_filter') is not None:
-                where_clauses.append("is_archived = ?")
-                params.append(collection['is_archived_filter'])
-
-            # Filtro por texto de búsqueda
-            if collection.get('search_text'):
-                search_pattern = f"%{collection['search_text']}%"
-                where_clauses.append("(label LIKE ? OR content LIKE ?)")
-                params.extend([search_pattern, search_pattern])
-
-            # Filtro por tags incluidos (debe tener al menos uno)
-            if collection.get('tags_include'):
-                tags_list = [tag.strip() for tag in collection['tags_include'].split(',')]
-                if tags_list:
-                    tag_conditions = []
-                    for tag in tags_list:
-                        tag_conditions.append("tags LIKE ?")
-                        params.append(f"%{tag}%")
-                    where_clauses.append(f"({' OR '.join(tag_conditions)})")
-
-            # Filtro por tags excluidos (no debe tener ninguno)
-            if collection.get('tags_exclude'):
-                tags_list = [tag.strip() for tag in collection['tags_exclude'].split(',')]
-                for tag in tags_list:
-                    where_clauses.append("(tags NOT LIKE ? OR tags IS NULL)")
-                    params.append(f"%{tag}%")
-
-            # Filtro por rango de fechas
-            if collection.get('date_from'):
-                where_clauses.append("created_at >= ?")
-                params.append(collection['date_from'])
-
-            if collection.get('date_to'):
-                where_clauses.append("created_at <= ?")
-                params.append(collection['date_to'])
-
-            # Construir query final
+            where_clauses, params = self._build_filter_clauses(collection)
             if where_clauses:
                 where_sql = "WHERE " + " AND ".join(where_clauses)
             else:
@@ -519,7 +485,7 @@ class SmartCollectionsManager:
             rows = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in rows]
+            items = [restore_content(dict(row)) for row in rows]
             logger.debug(f"Collection '{collection['name']}' returned {len(items)} items")
             return items
 
@@ -527,9 +493,89 @@ class SmartCollectionsManager:
             logger.error(f"Error executing filters: {e}", exc_info=True)
             return []
 
+    def _build_filter_clauses(self, collection: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """
+        Construir las condiciones WHERE (sobre items) de una colección
+
+        Args:
+            collection: Diccionario con los datos de la colección
+
+        Returns:
+            Tuple: (lista de condiciones, parámetros)
+        """
+        where_clauses = []
+        params = []
+
+        # Filtro por categoría
+        if collection.get('category_id'):
+            where_clauses.append("category_id = ?")
+            params.append(collection['category_id'])
+
+        # Filtro por tipo de item
+        if collection.get('item_type'):
+            where_clauses.append("type = ?")
+            params.append(collection['item_type'])
+
+        # Filtro por favorito
+        if collection.get('is_favorite') is not None:
+            where_clauses.append("is_favorite = ?")
+            params.append(collection['is_favorite'])
+
+        # Filtro por sensible
+        if collection.get('is_sensitive') is not None:
+            where_clauses.append("is_sensitive = ?")
+            params.append(collection['is_sensitive'])
+
+        # Filtro por activo
+        if collection.get('is_active_filter') is not None:
+            where_clauses.append("is_active = ?")
+            params.append(collection['is_active_filter'])
+
+        # Filtro por archivado
+        if collection.get('is_archived_filter') is not None:
+            where_clauses.append("is_archived = ?")
+            params.append(collection['is_archived_filter'])
+
+        # Filtro por texto de búsqueda
+        if collection.get('search_text'):
+            search_pattern = f"%{collection['search_text']}%"
+            where_clauses.append(
+                "(label LIKE ? OR (CASE WHEN content_compressed = 1"
+                " THEN content_text(content, 1) ELSE content END) LIKE ?)"
+            )
+            params.extend([search_pattern, search_pattern])
+
+        # Filtro por tags incluidos (debe tener al menos uno)
+        if collection.get('tags_include'):
+            tags_list = [tag.strip() for tag in collection['tags_include'].split(',')]
+            if tags_list:
+                tag_conditions = []
+                for tag in tags_list:
+                    tag_conditions.append("tags LIKE ?")
+                    params.append(f"%{tag}%")
+                where_clauses.append(f"({' OR '.join(tag_conditions)})")
+
+        # Filtro por tags excluidos (no debe tener ninguno)
+        if collection.get('tags_exclude'):
+            tags_list = [tag.strip() for tag in collection['tags_exclude'].split(',')]
+            for tag in tags_list:
+                where_clauses.append("(tags NOT LIKE ? OR tags IS NULL)")
+                params.append(f"%{tag}%")
+
+        # Filtro por rango de fechas
+        if collection.get('date_from'):
+            where_clauses.append("created_at >= ?")
+            params.append(collection['date_from'])
+
+        if collection.get('date_to'):
+            where_clauses.append("created_at <= ?")
+            params.append(collection['date_to'])
+
+        return where_clauses, params
+
     def get_collection_count(self, collection_id: int) -> int:
         """
-        Obtener el número de items que coinciden con una colección (sin cargar todos los items)
+        Obtener el número de items que coinciden con una colección (conteo materializado)
 
         Args:
             collection_id: ID de la colección
@@ -538,8 +584,20 @@ class SmartCollectionsManager:
             Número de items que cumplen con los criterios
         """
         try:
-            items = self.execute_collection(collection_id)
-            return len(items)
+            collection = self.get_collection(collection_id)
+            if not collection:
+                return 0
+
+            conn = self._get_connection()
+            try:
+                self._sync_members(conn, [collection])
+                row = conn.execute(
+                    "SELECT item_count FROM smart_collection_counts WHERE collection_id = ?",
+                    (collection_id,)
+                ).fetchone()
+            finally:
+                conn.close()
+            return row['item_count'] if row else 0
         except Exception as e:
             logger.error(f"Error getting collection count: {e}", exc_info=True)
             return 0
@@ -595,12 +653,148 @@ class SmartCollectionsManager:
             Lista de colecciones con campo 'item_count' agregado
         """
         collections = self.get_all_collections()
+        if not collections:
+            return collections
+
+        try:
+            conn = self._get_connection()
+            try:
+                self._sync_members(conn, collections)
+                counts = {
+                    row['collection_id']: row['item_count']
+                    for row in conn.execute("SELECT collection_id, item_count FROM smart_collection_counts")
+                }
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Error getting collection counts: {e}", exc_info=True)
+            counts = {}
 
         for collection in collections:
-            collection['item_count'] = self.get_collection_count(collection['id'])
+            collection['item_count'] = counts.get(collection['id'], 0)
 
         return collections
 
+    # ========== PERTENENCIA MATERIALIZADA ==========
+
+    def _sync_members(self, conn: sqlite3.Connection, collections: List[Dict[str, Any]]) -> None:
+        """
+        Poner al día la pertenencia materializada antes de leerla
+
+        1. Reevalúa contra las colecciones ya materializadas solo los items
+           encolados en smart_collection_dirty (insertados / modificados)
+        2. Materializa desde cero las colecciones indicadas que aún no lo están
+           (nuevas o con la definición editada)
+        """
+        if not self._has_pending_members(conn, collections):
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            built = {row['collection_id'] for row in conn.execute(
+                "SELECT collection_id FROM smart_collection_counts")}
+
+            dirty_count = conn.execute("SELECT COUNT(*) FROM smart_collection_dirty").fetchone()[0]
+            if dirty_count:
+                for collection in self._get_collections(conn, built):
+                    self._evaluate_members(conn, collection, dirty_only=True)
+                conn.execute("DELETE FROM smart_collection_dirty")
+                logger.debug(f"Smart collection membership refreshed for {dirty_count} items")
+
+            for collection in collections:
+                if collection['id'] not in built:
+                    self._rebuild_members(conn, collection)
+                    built.add(collection['id'])
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _has_pending_members(conn: sqlite3.Connection, collections: List[Dict[str, Any]]) -> bool:
+        """Hay items pendientes o colecciones sin materializar (sin bloquear escritura)"""
+        if conn.execute("SELECT 1 FROM smart_collection_dirty LIMIT 1").fetchone():
+            return True
+        built = {row['collection_id'] for row in conn.execute(
+            "SELECT collection_id FROM smart_collection_counts")}
+        return any(collection['id'] not in built for collection in collections)
+
+    @staticmethod
+    def _get_collections(conn: sqlite3.Connection, collection_ids) -> List[Dict[str, Any]]:
+        if not collection_ids:
+            return []
+        ids = list(collection_ids)
+        rows = conn.execute(
+            f"SELECT * FROM smart_collections WHERE id IN ({', '.join('?' * len(ids))})", ids
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _evaluate_members(self, conn: sqlite3.Connection, collection: Dict[str, Any],
+                          dirty_only: bool) -> None:
+        """Reemplazar la pertenencia de una colección (todos los items o solo los pendientes)"""
+        where_clauses, params = self._build_filter_clauses(collection)
+        scope = "item_id IN (SELECT item_id FROM smart_collection_dirty)" if dirty_only else "1 = 1"
+
+        conn.execute(
+            f"DELETE FROM smart_collection_members WHERE collection_id = ? AND {scope}",
+            (collection['id'],)
+        )
+        if dirty_only:
+            where_clauses = ["id IN (SELECT item_id FROM smart_collection_dirty)"] + where_clauses
+        where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+        conn.execute(f"""
+            INSERT INTO smart_collection_members (collection_id, item_id)
+            SELECT ?, id FROM items
+            {where_sql}
+        """, [collection['id']] + params)
+
+    def _rebuild_members(self, conn: sqlite3.Connection, collection: Dict[str, Any]) -> None:
+        """Materializar una colección completa"""
+        conn.execute("DELETE FROM smart_collection_members WHERE collection_id = ?", (collection['id'],))
+        conn.execute("""
+            INSERT OR REPLACE INTO smart_collection_counts (collection_id, item_count, built_at)
+            VALUES (?, 0, CURRENT_TIMESTAMP)
+        """, (collection['id'],))
+        self._evaluate_members(conn, collection, dirty_only=False)
+
+    def _invalidate_members(self, collection_id: int) -> None:
+        """Descartar la pertenencia de una colección (se rematerializa al leerla)"""
+        conn = self._get_connection()
+        try:
+            conn.execute("DELETE FROM smart_collection_counts WHERE collection_id = ?", (collection_id,))
+            conn.execute("DELETE FROM smart_collection_members WHERE collection_id = ?", (collection_id,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def rebuild_all(self) -> int:
+        """
+        Rematerializar todas las colecciones desde cero
+
+        Returns:
+            Número de colecciones reconstruidas
+        """
+        try:
+            conn = self._get_connection()
+            try:
+                collections = [dict(row) for row in conn.execute("SELECT * FROM smart_collections")]
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("DELETE FROM smart_collection_counts")
+                conn.execute("DELETE FROM smart_collection_members")
+                conn.execute("DELETE FROM smart_collection_dirty")
+                for collection in collections:
+                    self._rebuild_members(conn, collection)
+                conn.commit()
+            finally:
+                conn.close()
+
+            logger.info(f"Smart collections rebuilt: {len(collections)}")
+            return len(collections)
+        except Exception as e:
+            logger.error(f"Error rebuilding smart collections: {e}", exc_info=True)
+            return 0
+
 
 if __name__ == "__main__":
     """
@@ -2,31 +2,185 @@
 Speed Dial Generator - Genera página HTML personalizada para accesos rápidos
 Author: Widget Sidebar Team
 Date: 2025-11-02
+
+La página renderizada se cachea en memoria y en disco, indexada por la
+versión de datos de speed dials (DBManager.get_speed_dial_version, que se
+incrementa al agregar, editar, eliminar o reordenar) y por la huella (ruta,
+mtime, tamaño) de las imágenes locales (thumbnail_path), que se incrustan
+como data URI una sola vez por archivo.
+
+La setting speed_dial_cache_id identifica el contador de versión: si falta
+(base de datos nueva o recreada, el contador vuelve a empezar) se crea otra
+y se borra la caché de esa base de datos, para no servir páginas de otra BD
+con el mismo número de versión.
 """
 
+import sys
+import hashlib
 import logging
+import mimetypes
+import threading
+import uuid
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import base64
 
 logger = logging.getLogger(__name__)
 
 
+# Incrementar al cambiar la plantilla para invalidar la caché en disco
+TEMPLATE_VERSION = 1
+
+_IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp', '.bmp'}
+
+# Cachés del proceso: (db_path, id, versión, huella) -> HTML,
+# (db_path, id, versión) -> rutas de thumbnails y (ruta, mtime) -> data URI
+_html_cache: Dict[tuple, str] = {}
+_thumbnail_paths: Dict[tuple, Tuple[str, ...]] = {}
+_asset_cache: Dict[tuple, str] = {}
+_cache_lock = threading.Lock()
+
+CACHE_ID_SETTING = 'speed_dial_cache_id'
+
+
+def get_default_cache_dir() -> Path:
+    """Carpeta de caché por defecto junto a la aplicación"""
+    if getattr(sys, 'frozen', False):
+        base_dir = Path(sys.executable).parent
+    else:
+        base_dir = Path(__file__).parent.parent.parent
+    return base_dir / "speed_dial_cache"
+
+
 class SpeedDialGenerator:
     """Generador de página HTML para Speed Dial."""
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, cache_dir: Optional[str] = None):
         """
         Inicializa el generador.
 
         Args:
             db_manager: Instancia de DBManager
+            cache_dir: Carpeta de la caché en disco (None = carpeta por defecto)
         """
         self.db = db_manager
+        self.cache_dir = Path(cache_dir) if cache_dir else get_default_cache_dir()
+        db_path = str(getattr(db_manager, 'db_path', ''))
+        self._db_key = hashlib.sha1(db_path.encode('utf-8')).hexdigest()[:12]
 
     def generate_html(self) -> str:
         """
-        Genera el HTML completo del Speed Dial.
+        Obtiene el HTML del Speed Dial (desde caché si los datos no cambiaron).
+
+        Returns:
+            str: HTML completo de la página
+        """
+        cache_id = self._get_cache_id()
+        version = self.db.get_speed_dial_version()
+        key = (self._db_key, cache_id, version, self._assets_fingerprint(cache_id, version))
+
+        with _cache_lock:
+            html = _html_cache.get(key)
+        if html is not None:
+            return html
+
+        cache_file = self._cache_file(*key[1:])
+        html = self._read_disk_cache(cache_file)
+        if html is None:
+            html = self.render_html()
+            self._write_disk_cache(cache_file, html)
+
+        with _cache_lock:
+            # Solo se conserva la versión actual de cada base de datos
+            for old_key in [k for k in _html_cache if k[0] == self._db_key]:
+                del _html_cache[old_key]
+            _html_cache[key] = html
+        return html
+
+    def _get_cache_id(self) -> str:
+        """Identificador del contador de versión (se crea, limpiando la caché, si falta)"""
+        cache_id = self.db.get_setting(CACHE_ID_SETTING)
+        if not cache_id:
+            cache_id = uuid.uuid4().hex[:12]
+            self.db.set_setting(CACHE_ID_SETTING, cache_id)
+            self.clear_cache()
+        return str(cache_id)
+
+    def _assets_fingerprint(self, cache_id: str, version: int) -> str:
+        """
+        Huella de las imágenes locales incrustadas (ruta, mtime y tamaño).
+
+        Las rutas se consultan una vez por versión; después solo se hace stat.
+        """
+        paths_key = (self._db_key, cache_id, version)
+        with _cache_lock:
+            paths = _thumbnail_paths.get(paths_key)
+        if paths is None:
+            paths = tuple(self.db.get_speed_dial_thumbnail_paths())
+            with _cache_lock:
+                for old_key in [k for k in _thumbnail_paths if k[0] == self._db_key]:
+                    del _thumbnail_paths[old_key]
+                _thumbnail_paths[paths_key] = paths
+
+        digest = hashlib.sha1()
+        for path in paths:
+            if Path(path).suffix.lower() not in _IMAGE_SUFFIXES:
+                continue
+            try:
+                stat = Path(path).stat()
+                digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode('utf-8'))
+            except OSError:
+                digest.update(f"{path}|-\n".encode('utf-8'))
+        return digest.hexdigest()[:12]
+
+    # ==================== Caché en disco ====================
+
+    def _cache_file(self, cache_id: str, version: int, assets: str) -> Path:
+        return self.cache_dir / (
+            f"speed_dial_{self._db_key}_{cache_id}_v{version}_a{assets}_t{TEMPLATE_VERSION}.html"
+        )
+
+    def _read_disk_cache(self, cache_file: Path) -> Optional[str]:
+        try:
+            return cache_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"No se pudo leer la caché de Speed Dial: {e}")
+            return None
+
+    def _write_disk_cache(self, cache_file: Path, html: str):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix('.tmp')
+            tmp_path.write_text(html, encoding='utf-8')
+            tmp_path.replace(cache_file)
+            self._remove_disk_cache(keep=cache_file)
+        except OSError as e:
+            logger.warning(f"No se pudo escribir la caché de Speed Dial: {e}")
+
+    def _remove_disk_cache(self, keep: Optional[Path] = None):
+        """Eliminar las páginas en disco de esta base de datos (salvo keep)"""
+        for old_file in self.cache_dir.glob(f"speed_dial_{self._db_key}_*.html"):
+            if old_file != keep:
+                old_file.unlink(missing_ok=True)
+
+    def clear_cache(self):
+        """Descartar las páginas cacheadas (memoria y disco) de esta base de datos"""
+        with _cache_lock:
+            for cache in (_html_cache, _thumbnail_paths):
+                for old_key in [k for k in cache if k[0] == self._db_key]:
+                    del cache[old_key]
+        try:
+            self._remove_disk_cache()
+        except OSError as e:
+            logger.warning(f"No se pudo limpiar la caché de Speed Dial: {e}")
+
+    # ==================== Renderizado ====================
+
+    def render_html(self) -> str:
+        """
+        Genera el HTML completo del Speed Dial (sin caché).
 
         Returns:
             str: HTML completo de la página
@@ -139,6 +293,12 @@ class SpeedDialGenerator:
             z-index: 1;
         }}
 
+        .speed-dial-icon-img {{
+            width: 56px;
+            height: 56px;
+            object-fit: contain;
+        }}
+
         .speed-dial-tile:hover .speed-dial-icon {{
             transform: scale(1.15) rotate(5deg);
         }}
@@ -312,6 +472,11 @@ class SpeedDialGenerator:
             # Truncar URL para mostrar
             display_url = url[:40] + '...' if len(url) > 40 else url
 
+            # Imagen local (favicon/miniatura) incrustada, o el emoji
+            image_uri = self._inline_asset(sd.get('thumbnail_path'))
+            if image_uri:
+                icon = f'<img src="{image_uri}" alt="" class="speed-dial-icon-img">'
+
             tiles_html += f"""
         <a href="{url}" class="speed-dial-tile" style="background-color: {bg_color};">
             <div class="speed-dial-icon">{icon}</div>
@@ -332,6 +497,36 @@ class SpeedDialGenerator:
 
         return tiles_html
 
+    @staticmethod
+    def _inline_asset(path: Optional[str]) -> Optional[str]:
+        """
+        Data URI de una imagen local (codificada una vez por archivo y mtime).
+
+        Returns:
+            Optional[str]: data URI, o None si no es una imagen local existente
+        """
+        if not path or Path(path).suffix.lower() not in _IMAGE_SUFFIXES:
+            return None
+        try:
+            mtime = Path(path).stat().st_mtime_ns
+        except OSError:
+            return None
+
+        key = (str(path), mtime)
+        with _cache_lock:
+            uri = _asset_cache.get(key)
+        if uri is None:
+            try:
+                data = Path(path).read_bytes()
+            except OSError as e:
+                logger.warning(f"No se pudo leer el icono {path}: {e}")
+                return None
+            mime = mimetypes.guess_type(str(path))[0] or 'image/png'
+            uri = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+            with _cache_lock:
+                _asset_cache[key] = uri
+        return uri
+
     def save_to_file(self, file_path: str = None) -> str:
         """
         Guarda la página HTML en un archivo.
@@ -0,0 +1,261 @@
+"""
+Stats Dashboard Loader - Carga en segundo plano de las pestañas de estadísticas
+
+Cada pestaña del dashboard se lee la primera vez que se activa, en un único
+hilo worker con su propio StatsManager. Antes de las consultas de la pestaña
+se lee la versión de los datos (StatsManager.get_data_version); si coincide
+con la de lo que ya se muestra, no se repiten las consultas.
+Los gráficos ya dibujados se guardan en un ChartCache por
+(gráfico, período, versión) para que cambiar de pestaña o de período no
+vuelva a dibujarlos.
+"""
+
+import sys
+import threading
+import logging
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.stats_manager import StatsManager
+
+logger = logging.getLogger(__name__)
+
+# Puntos máximos de una línea de tiempo (el resto se reduce con LTTB)
+MAX_TIMELINE_POINTS = 120
+
+# Gráficos dibujados que se conservan entre cambios de pestaña/período
+MAX_CACHED_CHARTS = 12
+
+# Pestañas del dashboard, en el orden de las pestañas
+TABS = ('summary', 'usage', 'categories', 'performance', 'health')
+
+
+# ==================== Reducción de Series ====================
+
+def downsample_series(points: List[Dict], max_points: int = MAX_TIMELINE_POINTS,
+                      value_key: str = 'count') -> List[Dict]:
+    """
+    Reducir una serie temporal a max_points con Largest-Triangle-Three-Buckets
+
+    Conserva el primer y el último punto y, en cada tramo, el punto que más
+    área forma con sus vecinos, de modo que picos y valles siguen visibles.
+    Los puntos devueltos son los originales (mismas fechas y valores).
+
+    Args:
+        points: Puntos ordenados por fecha (dicts con value_key)
+        max_points: Número máximo de puntos del resultado (mínimo 3)
+        value_key: Clave del valor en cada punto
+
+    Returns:
+        List[Dict]: Subconjunto ordenado de points
+    """
+    total = len(points)
+    if max_points < 3 or total <= max_points:
+        return list(points)
+
+    values = [point[value_key] or 0 for point in points]
+    sampled = [points[0]]
+    bucket_size = (total - 2) / (max_points - 2)
+    selected = 0
+
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Promedio del tramo siguiente (el último punto para el último tramo)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, total)
+        if next_start >= next_end:
+            avg_x, avg_y = total - 1, values[-1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        ax, ay = selected, values[selected]
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((ax - avg_x) * (values[index] - ay) - (ax - index) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = index, area
+
+        sampled.append(points[best])
+        selected = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def fetch_tab_data(stats: StatsManager, tab: str, period: Optional[int] = None) -> Dict:
+    """
+    Leer los datos de una pestaña del dashboard
+
+    Args:
+        stats: StatsManager del hilo worker
+        tab: Pestaña (ver TABS)
+        period: Días de la línea de tiempo (solo pestaña 'usage')
+
+    Returns:
+        Dict: Datos de la pestaña, listos para dibujar
+    """
+    if tab == 'summary':
+        return {
+            'stats': stats.get_dashboard_stats(),
+            'most_used': stats.get_most_used_items(limit=10),
+        }
+    if tab == 'usage':
+        return {
+            'by_day': downsample_series(stats.get_usage_by_day(days=period or 7)),
+            'by_hour': stats.get_usage_by_hour(days=7),
+        }
+    if tab == 'categories':
+        return {'categories': stats.get_usage_by_category()}
+    if tab == 'performance':
+        return {
+            'slow': stats.get_slowest_items(limit=10, min_executions=5),
+            'failing': stats.get_most_failing_items(limit=10, min_executions=5),
+        }
+    if tab == 'health':
+        return {'report': stats.get_health_report()}
+    raise ValueError(f"Unknown dashboard tab: {tab}")
+
+
+# ==================== Caché de Gráficos ====================
+
+class ChartCache:
+    """Caché LRU de gráficos dibujados por (gráfico, período, versión)"""
+
+    def __init__(self, max_entries: int = MAX_CACHED_CHARTS):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Obtener un gráfico y marcarlo como reciente (None si no está)"""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Tuple, value: Any) -> List[Any]:
+        """
+        Guardar un gráfico
+
+        Returns:
+            List: Gráficos expulsados (el llamador libera sus recursos)
+        """
+        evicted = []
+        if key in self._entries and self._entries[key] is not value:
+            evicted.append(self._entries[key])
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False)[1])
+        return evicted
+
+    def discard_stale(self, version: Hashable) -> List[Any]:
+        """Quitar los gráficos de versiones distintas de version"""
+        stale = [key for key in self._entries if key[-1] != version]
+        return [self._entries.pop(key) for key in stale]
+
+    def clear(self) -> List[Any]:
+        """Vaciar la caché"""
+        evicted = list(self._entries.values())
+        self._entries.clear()
+        return evicted
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ==================== Worker ====================
+
+class StatsDashboardLoader:
+    """Cola de lecturas de pestañas del dashboard en un hilo worker"""
+
+    def __init__(self, db_path: str,
+                 on_loaded: Optional[Callable[[str, Optional[int], Tuple, Optional[Dict]], None]] = None,
+                 fetch: Callable[[StatsManager, str, Optional[int]], Dict] = fetch_tab_data):
+        """
+        Inicializar loader
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            on_loaded: Callback (tab, period, versión, datos o None si no cambiaron)
+                invocado desde el hilo worker; si la lectura falla, datos es
+                {'error': mensaje}
+            fetch: Función que lee los datos de una pestaña
+        """
+        self.db_path = str(db_path)
+        self.on_loaded = on_loaded
+        self.fetch = fetch
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Optional[StatsManager] = None
+
+    def request(self, tab: str, period: Optional[int] = None, known_version: Optional[Tuple] = None):
+        """
+        Encolar la lectura de una pestaña
+
+        Args:
+            tab: Pestaña (ver TABS)
+            period: Días de la línea de tiempo (solo pestaña 'usage')
+            known_version: Versión de lo que ya se muestra; si no cambió,
+                on_loaded recibe datos None y no se consulta nada más
+        """
+        with self._lock:
+            # Una sola lectura pendiente por pestaña: la última petición gana
+            for entry in [entry for entry in self._queue if entry[0] == tab]:
+                self._queue.remove(entry)
+            self._queue.append((tab, period, known_version))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="StatsDashboardLoader", daemon=True)
+                self._thread.start()
+
+    def pending_count(self) -> int:
+        """Número de lecturas en cola"""
+        with self._lock:
+            return len(self._queue)
+
+    def is_running(self) -> bool:
+        """True si el hilo worker está procesando la cola"""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def close(self):
+        """Vaciar la cola y esperar la lectura en curso"""
+        with self._lock:
+            self._queue.clear()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._thread = None
+                    return
+                tab, period, known_version = self._queue.popleft()
+
+            version, data = (), None
+            try:
+                if self._stats is None:
+                    self._stats = StatsManager(self.db_path)
+                version = self._stats.get_data_version()
+                if version != known_version:
+                    data = self.fetch(self._stats, tab, period)
+            except Exception as e:
+                logger.error(f"Error loading dashboard tab {tab}: {e}")
+                data = {'error': str(e)}
+
+            if self.on_loaded:
+                try:
+                    self.on_loaded(tab, period, version, data)
+                except Exception as e:
+                    logger.error(f"Error in stats dashboard loader callback: {e}")
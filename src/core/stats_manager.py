@@ -6,8 +6,12 @@ Fecha: 2025-01-23
 
 import sqlite3
 import logging
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from database.query_profiler import ProfiledConnection
+from utils.compression import restore_content
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +29,15 @@ class StatsManager:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
         conn.row_factory = sqlite3.Row
         return conn
 
+    @staticmethod
+    def _item_rows(rows) -> List[Dict]:
+        """Filas de items como dicts con el contenido descomprimido"""
+        return [restore_content(dict(row)) for row in rows]
+
     # ==================== Items Populares ====================
 
     def get_most_used_items(self, limit: int = 10, days: Optional[int] = None, period: Optional[str] = None) -> List[Dict]:
@@ -76,7 +85,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -110,7 +119,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -133,7 +142,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -159,7 +168,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -184,7 +193,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -207,7 +216,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -238,7 +247,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -263,7 +272,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -287,7 +296,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -313,7 +322,7 @@ class StatsManager:
             # Ejecuciones hoy
             cursor.execute("""
                 SELECT COUNT(*) as total FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                WHERE used_at >= date('now') AND used_at < date('now', '+1 day')
             """)
             executions_today = cursor.fetchone()['total']
 
@@ -420,9 +429,10 @@ class StatsManager:
             cursor.execute("""
                 SELECT
                     c.name as category,
+                    c.name as category_name,
                     c.badge,
                     COUNT(i.id) as item_count,
-                    SUM(i.use_count) as total_uses,
+                    COALESCE(SUM(i.use_count), 0) as total_uses,
                     ROUND(100.0 * SUM(i.use_count) /
                         (SELECT SUM(use_count) FROM items WHERE use_count > 0), 2) as percentage
                 FROM categories c
@@ -442,6 +452,84 @@ class StatsManager:
             logger.error(f"Error getting usage by category: {e}")
             return []
 
+    # ==================== Uso en el Tiempo ====================
+
+    def get_usage_by_day(self, days: int = 30) -> List[Dict]:
+        """Ejecuciones por día de los últimos X días (días sin uso con 0)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT date(used_at) as day, COUNT(*) as count
+                FROM item_usage_history
+                WHERE used_at >= date('now', '-' || ? || ' days')
+                GROUP BY day
+            """, (days - 1,))
+            counts = {row['day']: row['count'] for row in cursor.fetchall()}
+            cursor.execute("SELECT date('now') as today")
+            today = date.fromisoformat(cursor.fetchone()['today'])
+            conn.close()
+
+            result = []
+            for offset in range(days - 1, -1, -1):
+                day = (today - timedelta(days=offset)).isoformat()
+                result.append({'date': day, 'count': counts.get(day, 0)})
+            return result
+
+        except Exception as e:
+            logger.error(f"Error getting usage by day: {e}")
+            return []
+
+    def get_usage_by_hour(self, days: int = 7) -> List[Dict]:
+        """Ejecuciones por hora del día de los últimos X días (24 horas)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT CAST(strftime('%H', used_at) AS INTEGER) as hour, COUNT(*) as count
+                FROM item_usage_history
+                WHERE used_at >= datetime('now', '-' || ? || ' days')
+                GROUP BY hour
+            """, (days,))
+            counts = {row['hour']: row['count'] for row in cursor.fetchall()}
+            conn.close()
+
+            return [{'hour': hour, 'count': counts.get(hour, 0)} for hour in range(24)]
+
+        except Exception as e:
+            logger.error(f"Error getting usage by hour: {e}")
+            return []
+
+    def get_data_version(self) -> Tuple:
+        """
+        Versión de los datos que muestran las estadísticas
+
+        Cambia al registrar o borrar usos y al crear, editar o borrar items y
+        categorías. Solo lee máximos y el resumen por item, no el historial.
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    (SELECT MAX(id) FROM item_usage_history) as last_usage_id,
+                    (SELECT COALESCE(SUM(executions), 0) FROM item_usage_summary) as executions,
+                    (SELECT COUNT(*) FROM items) as item_count,
+                    (SELECT MAX(updated_at) FROM items) as items_updated,
+                    (SELECT COUNT(*) FROM categories) as category_count,
+                    (SELECT MAX(updated_at) FROM categories) as categories_updated
+            """)
+            version = tuple(cursor.fetchone())
+            conn.close()
+            return version
+
+        except Exception as e:
+            logger.error(f"Error getting stats data version: {e}")
+            return ()
+
     # ==================== Análisis de Rendimiento ====================
 
     def get_slowest_items(self, limit: int = 10, min_executions: int = 5) -> List[Dict]:
@@ -466,7 +554,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -495,7 +583,7 @@ class StatsManager:
             results = cursor.fetchall()
             conn.close()
 
-            items = [dict(row) for row in results]
+            items = self._item_rows(results)
             return items
 
         except Exception as e:
@@ -526,7 +614,7 @@ class StatsManager:
             # Ejecuciones hoy
             cursor.execute("""
                 SELECT COUNT(*) as total FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                WHERE used_at >= date('now') AND used_at < date('now', '+1 day')
             """)
             executions_today = cursor.fetchone()['total']
 
@@ -536,7 +624,7 @@ class StatsManager:
                     COUNT(*) as total,
                     SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful
                 FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                WHERE used_at >= date('now') AND used_at < date('now', '+1 day')
             """)
             result = cursor.fetchone()
             success_rate_today = 100.0
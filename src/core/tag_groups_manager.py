@@ -11,6 +11,8 @@ import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from database.query_profiler import ProfiledConnection
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +36,7 @@ class TagGroupsManager:
         Returns:
             Conexión SQLite
         """
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=ProfiledConnection)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
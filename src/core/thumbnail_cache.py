@@ -0,0 +1,194 @@
+"""
+Thumbnail Cache - Caché en disco de miniaturas para items PATH
+
+Las miniaturas se guardan como PNG en una carpeta de caché, con nombre
+derivado de (file_hash, tamaño). El tamaño total en disco está acotado:
+al superar max_bytes se eliminan las miniaturas menos usadas (LRU).
+
+El orden LRU se mantiene en memoria y se persiste entre sesiones mediante
+la fecha de modificación de cada archivo (se actualiza en cada acceso).
+Es seguro usarla desde varios hilos.
+"""
+
+import os
+import re
+import sys
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+_CACHE_FILE_RE = re.compile(r'^(?P<hash>[0-9A-Za-z\-_]+)_(?P<size>\d+)\.png$')
+
+
+def get_default_cache_dir() -> Path:
+    """Carpeta de caché por defecto junto a la base de datos"""
+    if getattr(sys, 'frozen', False):
+        base_dir = Path(sys.executable).parent
+    else:
+        base_dir = Path(__file__).parent.parent.parent
+    return base_dir / "thumbnails_cache"
+
+
+class ThumbnailCache:
+    """Caché LRU de miniaturas acotada por bytes totales"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Inicializar caché
+
+        Args:
+            cache_dir: Carpeta donde guardar las miniaturas (None = carpeta por defecto)
+            max_bytes: Tamaño máximo total de la caché en bytes
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_default_cache_dir()
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # nombre -> bytes (más antiguo primero)
+        self._total_bytes = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    # ==================== API pública ====================
+
+    @staticmethod
+    def make_key(file_hash: str, size: int) -> str:
+        """Clave/nombre de archivo para un hash y tamaño de miniatura"""
+        return f"{file_hash}_{int(size)}.png"
+
+    def get(self, file_hash: str, size: int) -> Optional[str]:
+        """
+        Obtener la ruta de una miniatura en caché
+
+        Args:
+            file_hash: Hash SHA256 del archivo original
+            size: Lado máximo de la miniatura en píxeles
+
+        Returns:
+            Optional[str]: Ruta al PNG, o None si no está en caché
+        """
+        key = self.make_key(file_hash, size)
+        path = self.cache_dir / key
+
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            if not path.exists():
+                self._total_bytes -= self._entries.pop(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return str(path)
+
+    def put(self, file_hash: str, size: int, data: bytes) -> Optional[str]:
+        """
+        Guardar una miniatura (PNG) y aplicar la política de expulsión
+
+        Args:
+            file_hash: Hash SHA256 del archivo original
+            size: Lado máximo de la miniatura en píxeles
+            data: Bytes del PNG
+
+        Returns:
+            Optional[str]: Ruta al PNG guardado, o None si no cabe en la caché
+        """
+        if not data or len(data) > self.max_bytes:
+            return None
+
+        key = self.make_key(file_hash, size)
+        path = self.cache_dir / key
+        tmp_path = path.with_name(f".{key}.{threading.get_ident()}.tmp")
+
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing thumbnail {key}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return None
+
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict_locked()
+
+        return str(path)
+
+    def contains(self, file_hash: str, size: int) -> bool:
+        """Indica si hay miniatura en caché (sin actualizar el orden LRU)"""
+        with self._lock:
+            return self.make_key(file_hash, size) in self._entries
+
+    def clear(self):
+        """Eliminar todas las miniaturas"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove_file(key)
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Estadísticas de la caché"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    # ==================== Internos ====================
+
+    def _load_index(self):
+        """Reconstruir el índice LRU a partir de los archivos existentes"""
+        found = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file() or not _CACHE_FILE_RE.match(entry.name):
+                        continue
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name, stat.st_size))
+        except OSError as e:
+            logger.warning(f"Cannot read thumbnail cache dir {self.cache_dir}: {e}")
+            return
+
+        with self._lock:
+            for _, name, size in sorted(found):
+                self._entries[name] = size
+                self._total_bytes += size
+            self._evict_locked()
+
+        logger.debug(f"Thumbnail cache loaded: {len(self._entries)} entries, {self._total_bytes} bytes")
+
+    def _evict_locked(self):
+        """Expulsar entradas menos usadas hasta respetar max_bytes (requiere lock)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._remove_file(key)
+            logger.debug(f"Thumbnail evicted: {key}")
+
+    def _remove_file(self, key: str):
+        try:
+            (self.cache_dir / key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error removing thumbnail {key}: {e}")
@@ -0,0 +1,293 @@
+"""
+Thumbnail Service - Generación de miniaturas en segundo plano
+
+Genera miniaturas de items PATH de tipo IMAGEN y VIDEO en un pool de hilos
+(QThreadPool) y las guarda en ThumbnailCache. Los widgets solicitan la
+miniatura cuando se pintan por primera vez (es decir, cuando son visibles)
+y la cancelan al ocultarse, así solo se decodifican las filas visibles.
+Cada solicitud registra su callback bajo la clave (hash, tamaño); al terminar
+el trabajo solo se llama a los callbacks de esa clave y se olvidan.
+
+- Imágenes: QImageReader con setScaledSize (decodifica ya reducida)
+- Videos: primer fotograma vía ffmpeg si está disponible en PATH
+"""
+
+import shutil
+import subprocess
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QBuffer, QByteArray, QIODevice, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from core.thumbnail_cache import ThumbnailCache
+
+logger = logging.getLogger(__name__)
+
+
+THUMBNAIL_SIZE = 48
+THUMBNAIL_FILE_TYPES = ('IMAGEN', 'VIDEO')
+MAX_WORKERS = 2
+FFMPEG_TIMEOUT_S = 10
+
+
+class _ThumbnailSignals(QObject):
+    """Señales emitidas desde los hilos worker"""
+    finished = pyqtSignal(str, str, int, str)  # key, file_hash, size, ruta del PNG ('' si falló)
+
+
+class _ThumbnailJob(QRunnable):
+    """Tarea de generación de una miniatura"""
+
+    def __init__(self, service: "ThumbnailService", key: str, file_hash: str,
+                 source_path: str, file_type: str, size: int):
+        super().__init__()
+        self.service = service
+        self.key = key
+        self.file_hash = file_hash
+        self.source_path = source_path
+        self.file_type = file_type
+        self.size = size
+
+    def run(self):
+        if not self.service._begin_job(self.key):
+            return  # Cancelada antes de empezar
+
+        result_path = ''
+        try:
+            cached = self.service.cache.get(self.file_hash, self.size)
+            if cached:
+                result_path = cached
+            else:
+                data = self.service._render(self.source_path, self.file_type, self.size)
+                if data:
+                    result_path = self.service.cache.put(self.file_hash, self.size, data) or ''
+        except Exception as e:
+            logger.error(f"Error generating thumbnail for {self.source_path}: {e}")
+
+        self.service._signals.finished.emit(self.key, self.file_hash, self.size, result_path)
+
+
+class ThumbnailService(QObject):
+    """Servicio de miniaturas con pool de hilos y caché en disco"""
+
+    # file_hash, size, ruta del PNG
+    thumbnail_ready = pyqtSignal(str, int, str)
+
+    def __init__(self, cache: Optional[ThumbnailCache] = None, base_path: str = '',
+                 max_workers: int = MAX_WORKERS, parent=None):
+        """
+        Inicializar servicio
+
+        Args:
+            cache: Caché de miniaturas (None = caché por defecto)
+            base_path: Carpeta base de archivos para resolver rutas relativas
+            max_workers: Hilos máximos dedicados a generar miniaturas
+        """
+        super().__init__(parent)
+        self.cache = cache or ThumbnailCache()
+        self.base_path = base_path or ''
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, max_workers))
+        self._signals = _ThumbnailSignals()
+        self._signals.finished.connect(self._on_job_finished)
+        self._lock = threading.Lock()
+        self._pending = set()  # Claves encoladas o en ejecución
+        self._running = set()
+        self._callbacks: Dict[str, List[Callable[[str], None]]] = {}  # Clave -> callbacks(ruta)
+        self._ffmpeg = shutil.which('ffmpeg')
+
+    # ==================== API pública ====================
+
+    @staticmethod
+    def supports(file_type: Optional[str]) -> bool:
+        """Indica si el tipo de archivo admite miniatura"""
+        return bool(file_type) and file_type.upper() in THUMBNAIL_FILE_TYPES
+
+    def set_base_path(self, base_path: str):
+        """Actualizar la carpeta base para resolver rutas relativas"""
+        self.base_path = base_path or ''
+
+    def get_cached(self, file_hash: str, size: int = THUMBNAIL_SIZE) -> Optional[str]:
+        """Ruta de la miniatura si ya está en caché (sin generar)"""
+        if not file_hash:
+            return None
+        return self.cache.get(file_hash, size)
+
+    def request(self, file_hash: str, source_path: str, file_type: str,
+                size: int = THUMBNAIL_SIZE,
+                callback: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """
+        Solicitar una miniatura
+
+        Si ya está en caché se devuelve su ruta inmediatamente. Si no, se
+        encola su generación y al terminar se llama a callback con la ruta
+        (solo si se generó) y se emite thumbnail_ready.
+
+        Args:
+            callback: Función (ruta del PNG) para esta solicitud
+
+        Returns:
+            Optional[str]: Ruta en caché, o None si se generará en segundo plano
+        """
+        if not file_hash or not source_path or not self.supports(file_type):
+            return None
+
+        cached = self.cache.get(file_hash, size)
+        if cached:
+            return cached
+
+        if file_type.upper() == 'VIDEO' and not self._ffmpeg:
+            return None
+
+        key = ThumbnailCache.make_key(file_hash, size)
+        with self._lock:
+            if callback is not None:
+                self._callbacks.setdefault(key, []).append(callback)
+            if key in self._pending:
+                return None
+            self._pending.add(key)
+
+        job = _ThumbnailJob(self, key, file_hash, self._resolve(source_path), file_type.upper(), size)
+        self._pool.start(job)
+        return None
+
+    def cancel(self, file_hash: str, size: int = THUMBNAIL_SIZE,
+               callback: Optional[Callable[[str], None]] = None):
+        """
+        Cancelar una solicitud (fila ya no visible)
+
+        Quita callback (o todos si es None); si no queda ninguno y la tarea
+        aún no ha empezado, se descarta.
+        """
+        key = ThumbnailCache.make_key(file_hash, size)
+        with self._lock:
+            callbacks = self._callbacks.get(key, [])
+            if callback is None:
+                callbacks.clear()
+            elif callback in callbacks:
+                callbacks.remove(callback)
+            if callbacks:
+                return
+            self._callbacks.pop(key, None)
+            # La tarea encolada terminará sin trabajo al no encontrar su clave
+            if key not in self._running:
+                self._pending.discard(key)
+
+    def shutdown(self):
+        """Descartar trabajos pendientes y esperar a los que están en curso"""
+        with self._lock:
+            self._pending.clear()
+            self._callbacks.clear()
+        self._pool.clear()
+        self._pool.waitForDone(2000)
+
+    # ==================== Internos ====================
+
+    def _begin_job(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._pending:
+                return False
+            self._running.add(key)
+            return True
+
+    def _on_job_finished(self, key: str, file_hash: str, size: int, path: str):
+        with self._lock:
+            self._pending.discard(key)
+            self._running.discard(key)
+            callbacks = self._callbacks.pop(key, [])
+
+        if not path:
+            return
+        for callback in callbacks:
+            try:
+                callback(path)
+            except RuntimeError as e:
+                # Widget destruido sin cancelar su solicitud
+                logger.debug(f"Thumbnail callback for deleted widget: {e}")
+        self.thumbnail_ready.emit(file_hash, size, path)
+
+    def _resolve(self, source_path: str) -> str:
+        path = Path(source_path.replace('\\', '/'))
+        if not path.is_absolute() and self.base_path:
+            path = Path(self.base_path) / path
+        return str(path)
+
+    def _render(self, source_path: str, file_type: str, size: int) -> Optional[bytes]:
+        """Generar PNG de la miniatura (se ejecuta en un hilo worker)"""
+        if not Path(source_path).is_file():
+            return None
+
+        if file_type == 'IMAGEN':
+            image = self._read_image(source_path, size)
+        else:
+            image = self._read_video_frame(source_path, size)
+
+        if image is None or image.isNull():
+            return None
+        return self._to_png(image)
+
+    def _read_image(self, source_path: str, size: int) -> Optional[QImage]:
+        reader = QImageReader(source_path)
+        reader.setAutoTransform(True)
+        original = reader.size()
+        if original.isValid():
+            # Decodificar directamente a tamaño reducido (rápido en JPEG)
+            reader.setScaledSize(original.scaled(QSize(size, size), Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            logger.debug(f"Cannot decode image {source_path}: {reader.errorString()}")
+            return None
+        if image.width() > size or image.height() > size:
+            image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        return image
+
+    def _read_video_frame(self, source_path: str, size: int) -> Optional[QImage]:
+        if not self._ffmpeg:
+            return None
+        try:
+            completed = subprocess.run(
+                [self._ffmpeg, '-v', 'error', '-ss', '1', '-i', source_path,
+                 '-frames:v', '1', '-vf', f'scale={size}:{size}:force_original_aspect_ratio=decrease',
+                 '-f', 'image2pipe', '-vcodec', 'png', '-'],
+                capture_output=True, timeout=FFMPEG_TIMEOUT_S
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"ffmpeg failed for {source_path}: {e}")
+            return None
+
+        image = QImage()
+        if completed.returncode != 0 or not image.loadFromData(completed.stdout, 'PNG'):
+            return None
+        return image
+
+    @staticmethod
+    def _to_png(image: QImage) -> bytes:
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, 'PNG')
+        buffer.close()
+        return bytes(data)
+
+
+_thumbnail_service: Optional[ThumbnailService] = None
+
+
+def get_thumbnail_service(base_path: Optional[str] = None) -> ThumbnailService:
+    """
+    Instancia compartida del servicio de miniaturas (crear en el hilo GUI)
+
+    Args:
+        base_path: Carpeta base de archivos (files_base_path de ConfigManager);
+            si se indica, actualiza la del servicio ya creado
+    """
+    global _thumbnail_service
+    if _thumbnail_service is None:
+        _thumbnail_service = ThumbnailService(base_path=base_path or '')
+    elif base_path is not None:
+        _thumbnail_service.set_base_path(base_path)
+    return _thumbnail_service
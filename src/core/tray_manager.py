@@ -20,6 +20,8 @@ class TrayManager(QObject):
     hide_window_requested = pyqtSignal()
     settings_requested = pyqtSignal()
     stats_dashboard_requested = pyqtSignal()
+    startup_report_requested = pyqtSignal()
+    query_profiler_requested = pyqtSignal()
     popular_items_requested = pyqtSignal()
     forgotten_items_requested = pyqtSignal()
     pinned_panels_requested = pyqtSignal()
@@ -114,6 +116,16 @@ class TrayManager(QObject):
         forgotten_action.triggered.connect(self._on_forgotten_items)
         self.tray_menu.addAction(forgotten_action)
 
+        # Startup report action
+        startup_report_action = QAction("⏱ Informe de Arranque", self.tray_menu)
+        startup_report_action.triggered.connect(self._on_startup_report)
+        self.tray_menu.addAction(startup_report_action)
+
+        # Query profiler action (panel de desarrollo)
+        query_profiler_action = QAction("🛠 Perfil de Consultas SQL", self.tray_menu)
+        query_profiler_action.triggered.connect(self._on_query_profiler)
+        self.tray_menu.addAction(query_profiler_action)
+
         # Separator
         self.tray_menu.addSeparator()
 
@@ -180,6 +192,14 @@ class TrayManager(QObject):
         """Handle forgotten items menu action"""
         self.forgotten_items_requested.emit()
 
+    def _on_startup_report(self):
+        """Handle startup report menu action"""
+        self.startup_report_requested.emit()
+
+    def _on_query_profiler(self):
+        """Handle query profiler menu action"""
+        self.query_profiler_requested.emit()
+
     def _on_pinned_panels(self):
         """Handle pinned panels menu action"""
         self.pinned_panels_requested.emit()
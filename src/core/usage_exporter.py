@@ -0,0 +1,287 @@
+"""
+Usage History Exporter - Exportación en streaming de item_usage_history
+
+Escribe el historial de uso junto con los datos del item y su categoría en
+CSV o NDJSON (un objeto JSON por línea), opcionalmente comprimido con gzip.
+Las filas se leen del cursor en lotes (fetchmany) por idx_usage_used_at,
+en orden de fecha, y se escriben según llegan: la memoria no depende del
+tamaño del historial. El archivo se escribe como <destino>.part y se renombra
+al terminar; si se cancela o falla, se borra.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.query_profiler import ProfiledConnection
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+# Columnas exportadas (nombre de salida, expresión SQL)
+EXPORT_COLUMNS = (
+    ('usage_id', 'h.id'),
+    ('used_at', 'h.used_at'),
+    ('item_id', 'h.item_id'),
+    ('item_label', 'i.label'),
+    ('item_type', 'i.type'),
+    ('category_id', 'i.category_id'),
+    ('category_name', 'c.name'),
+    ('execution_time_ms', 'h.execution_time_ms'),
+    ('success', 'h.success'),
+    ('error_message', 'h.error_message'),
+)
+
+DEFAULT_BATCH_SIZE = 2000
+
+DateLike = Union[str, date, datetime, None]
+
+
+def _date_bound(value: DateLike) -> Optional[str]:
+    """Normalizar un límite de fecha a 'YYYY-MM-DD'"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(str(value)[:10]).isoformat()
+
+
+def build_export_query(date_from: DateLike = None, date_to: DateLike = None,
+                       category_ids: Optional[Iterable[int]] = None) -> Tuple[str, str, list]:
+    """
+    Construir las consultas de exportación
+
+    Args:
+        date_from: Primer día incluido (None = sin límite)
+        date_to: Último día incluido (None = sin límite)
+        category_ids: Categorías a exportar (None = todas)
+
+    Returns:
+        Tuple: (SELECT de filas, SELECT COUNT(*), parámetros de ambas)
+    """
+    conditions = []
+    params = []
+
+    start = _date_bound(date_from)
+    if start:
+        conditions.append("h.used_at >= ?")
+        params.append(start)
+    end = _date_bound(date_to)
+    if end:
+        conditions.append("h.used_at < date(?, '+1 day')")
+        params.append(end)
+    if category_ids is not None:
+        category_ids = [int(category_id) for category_id in category_ids]
+        placeholders = ", ".join("?" for _ in category_ids) or "NULL"
+        conditions.append(f"i.category_id IN ({placeholders})")
+        params.extend(category_ids)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    columns = ", ".join(f"{sql} AS {name}" for name, sql in EXPORT_COLUMNS)
+    # CROSS JOIN fija el historial como tabla externa: se recorre por
+    # idx_usage_used_at ya en orden, sin ordenar antes de la primera fila
+    select_sql = f"""
+        SELECT {columns}
+        FROM item_usage_history h
+        CROSS JOIN items i ON i.id = h.item_id
+        LEFT JOIN categories c ON c.id = i.category_id
+        {where}
+        ORDER BY h.used_at
+    """
+    count_sql = f"""
+        SELECT COUNT(*)
+        FROM item_usage_history h
+        JOIN items i ON i.id = h.item_id
+        {where}
+    """
+    return select_sql, count_sql, params
+
+
+class UsageHistoryExporter:
+    """Exportación en streaming del historial de uso"""
+
+    def __init__(self, db_path: str = "widget_sidebar.db", batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Inicializar exporter
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            batch_size: Filas leídas del cursor por lote
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if not self.db_path.exists():
+            logger.error(f"Database not found: {self.db_path}")
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Obtener conexión a la base de datos"""
+        return sqlite3.connect(self.db_path, factory=ProfiledConnection)
+
+    # ==================== Exportación ====================
+
+    def export(self, path: str, fmt: str = 'csv', date_from: DateLike = None,
+               date_to: DateLike = None, category_ids: Optional[Iterable[int]] = None,
+               compress: Optional[bool] = None,
+               on_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Exportar el historial de forma síncrona (en el hilo llamante)
+
+        Args:
+            path: Archivo de destino
+            fmt: 'csv' o 'ndjson'
+            date_from: Primer día incluido
+            date_to: Último día incluido
+            category_ids: Categorías a exportar (None = todas)
+            compress: gzip; por defecto si path termina en .gz
+            on_progress: Callback (filas escritas, total) tras cada lote
+
+        Returns:
+            Dict: path, format, compressed, rows, total, bytes, duration_ms,
+                  cancelled y error (si falló)
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+
+        path = Path(path)
+        if compress is None:
+            compress = path.suffix == '.gz'
+        part_path = path.with_name(path.name + '.part')
+        started = time.perf_counter()
+        result = {
+            'path': str(path),
+            'format': fmt,
+            'compressed': compress,
+            'rows': 0,
+            'total': 0,
+            'bytes': 0,
+            'cancelled': False,
+        }
+
+        conn = None
+        try:
+            select_sql, count_sql, params = build_export_query(date_from, date_to, category_ids)
+            conn = self._get_connection()
+            result['total'] = conn.execute(count_sql, params).fetchone()[0]
+            if on_progress:
+                on_progress(0, result['total'])
+
+            cursor = conn.execute(select_sql, params)
+            names = [name for name, _ in EXPORT_COLUMNS]
+            with self._open_output(part_path, compress) as output:
+                write_row = self._row_writer(output, fmt, names)
+                while True:
+                    if self._cancel_event.is_set():
+                        result['cancelled'] = True
+                        break
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        write_row(row)
+                    result['rows'] += len(rows)
+                    if on_progress:
+                        on_progress(result['rows'], result['total'])
+
+            if result['cancelled']:
+                part_path.unlink(missing_ok=True)
+                logger.info(f"Usage history export cancelled after {result['rows']} rows")
+            else:
+                os.replace(part_path, path)
+                result['bytes'] = path.stat().st_size
+                logger.info(f"Exported {result['rows']} usage rows to {path}")
+
+        except Exception as e:
+            logger.error(f"Error exporting usage history: {e}")
+            result['error'] = str(e)
+            part_path.unlink(missing_ok=True)
+        finally:
+            if conn is not None:
+                conn.close()
+
+        result['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def export_async(self, path: str, on_finished: Optional[Callable[[Dict], None]] = None,
+                     **options) -> bool:
+        """
+        Exportar en un hilo en segundo plano
+
+        Args:
+            path: Archivo de destino
+            on_finished: Callback con el resultado (se invoca desde el hilo worker)
+            **options: Argumentos de export() (fmt, fechas, categorías, compress, on_progress)
+
+        Returns:
+            bool: False si ya había una exportación en curso
+        """
+        if self.is_running():
+            return False
+
+        def _run():
+            result = self.export(path, **options)
+            if on_finished:
+                try:
+                    on_finished(result)
+                except Exception as e:
+                    logger.error(f"Error in usage export callback: {e}")
+
+        self._cancel_event.clear()
+        self._thread = threading.Thread(target=_run, name="UsageHistoryExport", daemon=True)
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        """Pedir la cancelación de la exportación en curso (se borra el archivo parcial)"""
+        self._cancel_event.set()
+
+    def is_running(self) -> bool:
+        """True si hay una exportación en segundo plano en curso"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Esperar la exportación en curso; False si sigue tras timeout"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    # ==================== Salida ====================
+
+    @staticmethod
+    def _open_output(path: Path, compress: bool):
+        """Abrir el archivo de salida en texto UTF-8 (gzip si compress)"""
+        if compress:
+            return io.TextIOWrapper(gzip.open(path, 'wb'), encoding='utf-8', newline='')
+        return open(path, 'w', encoding='utf-8', newline='')
+
+    @staticmethod
+    def _row_writer(output, fmt: str, names: list) -> Callable[[tuple], None]:
+        """Función que escribe una fila en el formato pedido"""
+        if fmt == 'csv':
+            writer = csv.writer(output)
+            writer.writerow(names)
+            return writer.writerow
+
+        def write_json(row):
+            record = dict(zip(names, row))
+            record['success'] = bool(record['success'])
+            output.write(json.dumps(record, ensure_ascii=False))
+            output.write('\n')
+        return write_json
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
+from database.query_profiler import ProfiledConnection
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +29,7 @@ class UsageTracker:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, factory=ProfiledConnection)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -178,7 +180,7 @@ class UsageTracker:
                 SELECT h.*, i.label, i.badge
                 FROM item_usage_history h
                 JOIN items i ON h.item_id = i.id
-                WHERE date(h.used_at) = date('now')
+                WHERE h.used_at >= date('now') AND h.used_at < date('now', '+1 day')
                 ORDER BY h.used_at DESC
             """)
 
@@ -222,7 +224,7 @@ class UsageTracker:
             cursor.execute("""
                 SELECT COUNT(*) as total
                 FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                WHERE used_at >= date('now') AND used_at < date('now', '+1 day')
             """)
 
             result = cursor.fetchone()
@@ -255,96 +257,74 @@ class UsageTracker:
             logger.error(f"Error getting week executions: {e}")
             return 0
 
-    def get_average_execution_time(self, item_id: int) -> float:
-        """Tiempo promedio de ejecución de un item (en segundos)"""
+    def get_item_summary(self, item_id: int) -> Optional[Dict]:
+        """
+        Fila de item_usage_summary junto con use_count/last_used del item
+
+        Una búsqueda por clave primaria; el resumen lo mantienen los triggers
+        de item_usage_history en la misma transacción que cada registro.
+        """
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
-                SELECT AVG(execution_time_ms) as avg_time
-                FROM item_usage_history
-                WHERE item_id = ? AND success = 1
+                SELECT i.use_count, i.last_used, s.*
+                FROM items i
+                LEFT JOIN item_usage_summary s ON s.item_id = i.id
+                WHERE i.id = ?
             """, (item_id,))
 
             result = cursor.fetchone()
             conn.close()
 
-            if result and result['avg_time']:
-                return round(result['avg_time'] / 1000.0, 2)
-            return 0.0
+            return dict(result) if result else None
 
         except Exception as e:
-            logger.error(f"Error getting average execution time for item {item_id}: {e}")
-            return 0.0
-
-    def get_success_rate(self, item_id: int) -> float:
-        """Tasa de éxito de un item (0-100%)"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful
-                FROM item_usage_history
-                WHERE item_id = ?
-            """, (item_id,))
+            logger.error(f"Error getting usage summary for item {item_id}: {e}")
+            return None
 
-            result = cursor.fetchone()
-            conn.close()
+    @staticmethod
+    def _average_execution_time(summary: Optional[Dict]) -> float:
+        if summary and summary.get('success_count'):
+            return round(summary['success_time_ms'] / summary['success_count'] / 1000.0, 2)
+        return 0.0
+
+    @staticmethod
+    def _success_rate(summary: Optional[Dict]) -> float:
+        if summary and summary.get('executions'):
+            return round((summary['success_count'] / summary['executions']) * 100, 2)
+        return 100.0  # Si no hay registros, asumir 100%
+
+    @staticmethod
+    def _last_error(summary: Optional[Dict], item_id: int) -> Optional[Dict]:
+        if not summary or summary.get('last_error_id') is None:
+            return None
+        return {
+            'id': summary['last_error_id'],
+            'item_id': item_id,
+            'used_at': summary['last_error_at'],
+            'execution_time_ms': summary['last_error_time_ms'],
+            'success': 0,
+            'error_message': summary['last_error_message'],
+        }
 
-            if result and result['total'] > 0:
-                return round((result['successful'] / result['total']) * 100, 2)
-            return 100.0  # Si no hay registros, asumir 100%
+    def get_average_execution_time(self, item_id: int) -> float:
+        """Tiempo promedio de ejecución de un item (en segundos)"""
+        return self._average_execution_time(self.get_item_summary(item_id))
 
-        except Exception as e:
-            logger.error(f"Error getting success rate for item {item_id}: {e}")
-            return 100.0
+    def get_success_rate(self, item_id: int) -> float:
+        """Tasa de éxito de un item (0-100%)"""
+        return self._success_rate(self.get_item_summary(item_id))
 
     def get_error_count(self, item_id: int) -> int:
         """Cantidad de errores de un item"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT COUNT(*) as errors
-                FROM item_usage_history
-                WHERE item_id = ? AND success = 0
-            """, (item_id,))
-
-            result = cursor.fetchone()
-            conn.close()
-
-            return result['errors'] if result else 0
-
-        except Exception as e:
-            logger.error(f"Error getting error count for item {item_id}: {e}")
-            return 0
+        summary = self.get_item_summary(item_id)
+        return (summary or {}).get('error_count') or 0
 
     def get_last_error(self, item_id: int) -> Optional[Dict]:
         """Último error registrado de un item"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM item_usage_history
-                WHERE item_id = ? AND success = 0
-                ORDER BY used_at DESC
-                LIMIT 1
-            """, (item_id,))
-
-            result = cursor.fetchone()
-            conn.close()
-
-            return dict(result) if result else None
-
-        except Exception as e:
-            logger.error(f"Error getting last error for item {item_id}: {e}")
-            return None
+        return self._last_error(self.get_item_summary(item_id), item_id)
 
     # ==================== Análisis Temporal ====================
 
@@ -435,18 +415,43 @@ class UsageTracker:
             logger.error(f"Error cleaning up old history: {e}")
             return 0
 
-    def get_item_stats(self, item_id: int) -> Dict:
-        """Estadísticas completas de un item"""
+    def cleanup_old_history_batch(self, days: int = 90, batch_size: int = 500) -> int:
+        """
+        Eliminar un lote de historial antiguo en una transacción corta
+
+        Usado por el mantenimiento en segundo plano: llamar hasta que retorne
+        menos de batch_size registros.
+        """
         try:
-            return {
-                'use_count': self.get_use_count(item_id),
-                'last_used': self.get_last_used(item_id),
-                'avg_execution_time': self.get_average_execution_time(item_id),
-                'success_rate': self.get_success_rate(item_id),
-                'error_count': self.get_error_count(item_id),
-                'last_error': self.get_last_error(item_id)
-            }
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                DELETE FROM item_usage_history
+                WHERE id IN (
+                    SELECT id FROM item_usage_history
+                    WHERE used_at < datetime('now', '-' || ? || ' days')
+                    LIMIT ?
+                )
+            """, (days, batch_size))
+            count = cursor.rowcount
+
+            conn.commit()
+            conn.close()
+            return count
 
         except Exception as e:
-            logger.error(f"Error getting item stats for {item_id}: {e}")
-            return {}
+            logger.error(f"Error cleaning up old history batch: {e}")
+            return 0
+
+    def get_item_stats(self, item_id: int) -> Dict:
+        """Estadísticas completas de un item (una consulta al resumen)"""
+        summary = self.get_item_summary(item_id) or {}
+        return {
+            'use_count': summary.get('use_count') or 0,
+            'last_used': summary.get('last_used'),
+            'avg_execution_time': self._average_execution_time(summary),
+            'success_rate': self._success_rate(summary),
+            'error_count': summary.get('error_count') or 0,
+            'last_error': self._last_error(summary, item_id)
+        }
@@ -6,20 +6,39 @@ Manages SQLite database operations for settings, categories, items, and clipboar
 import sqlite3
 import json
 import logging
+import threading
+import weakref
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
+from utils.compression import (
+    compress_text, decompress_text, content_hash, payload_size,
+    restore_content, register_sqlite_functions, CONTENT_COMPRESSION_THRESHOLD
+)
+from utils.startup_tracer import startup_span
+from database.query_profiler import ProfiledConnection
+from database import ordering
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Clipboard history limits (overridable via settings)
+CLIPBOARD_HISTORY_MAX_ENTRIES = 1000
+CLIPBOARD_HISTORY_MAX_BYTES = 16 * 1024 * 1024
+CLIPBOARD_COMPRESSION_THRESHOLD = 4096
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
+    # In-memory settings caches (SettingsStore) per database file
+    _settings_observers: Dict[str, 'weakref.WeakSet'] = {}
+    _settings_observers_lock = threading.Lock()
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """
         Initialize database manager
@@ -38,10 +57,22 @@ class DBManager:
         is_memory_db = str(self.db_path) == ":memory:"
         if is_memory_db or not self.db_path.exists():
             logger.info("Creating new database...")
-            self._create_database()
+            with startup_span('db.create'):
+                self._create_database()
         else:
             logger.info("Database already exists")
 
+        with startup_span('db.migrations'):
+            self._apply_schema_migrations()
+
+    def _apply_schema_migrations(self):
+        """Apply pending versioned schema migrations (see database.migrations)"""
+        from .migrations import apply_pending_migrations
+
+        applied = apply_pending_migrations(self.connect())
+        if applied:
+            logger.info(f"Schema migrations applied: {applied}")
+
     def connect(self) -> sqlite3.Connection:
         """
         Establish connection to the database
@@ -52,11 +83,14 @@ class DBManager:
         if self.connection is None:
             self.connection = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                factory=ProfiledConnection
             )
             self.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # content_text() para buscar en contenido comprimido
+            register_sqlite_functions(self.connection)
         return self.connection
 
     def close(self):
@@ -90,6 +124,9 @@ class DBManager:
         conn = self.connect()
         cursor = conn.cursor()
 
+        # Vacuum incremental (solo surte efecto antes de crear la primera tabla)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Create tables
         cursor.executescript("""
             -- Tabla de configuración general
@@ -237,8 +274,7 @@ class DBManager:
                 ('always_on_top', 'true'),
                 ('start_with_windows', 'false'),
                 ('animation_speed', '300'),
-                ('opacity', '0.95'),
-                ('max_history', '20');
+                ('opacity', '0.95');
         """)
 
         conn.commit()
@@ -331,6 +367,14 @@ class DBManager:
                 return default
         return default
 
+    SETTING_UPSERT_SQL = """
+        INSERT INTO settings (key, value, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            updated_at = CURRENT_TIMESTAMP
+    """
+
     def set_setting(self, key: str, value: Any) -> None:
         """
         Save or update configuration setting
@@ -340,15 +384,68 @@ class DBManager:
             value: Setting value (will be JSON encoded)
         """
         value_json = json.dumps(value)
-        query = """
-            INSERT INTO settings (key, value, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(key) DO UPDATE SET
-                value = excluded.value,
-                updated_at = CURRENT_TIMESTAMP
-        """
-        self.execute_update(query, (key, value_json))
+        self.execute_update(self.SETTING_UPSERT_SQL, (key, value_json))
         logger.debug(f"Setting saved: {key} = {value}")
+        self._notify_settings_observers(key, value)
+
+    def add_settings_observer(self, observer) -> None:
+        """
+        Register a settings cache to keep in sync with direct writes
+
+        Every set_setting() on any DBManager for the same database file calls
+        observer.setting_written(key, value). Observers are held weakly.
+        """
+        with self._settings_observers_lock:
+            self._settings_observers.setdefault(self._settings_observer_key(), weakref.WeakSet()).add(observer)
+
+    def remove_settings_observer(self, observer) -> None:
+        """Unregister a settings cache"""
+        with self._settings_observers_lock:
+            observers = self._settings_observers.get(self._settings_observer_key())
+            if observers is not None:
+                observers.discard(observer)
+
+    def _settings_observer_key(self) -> str:
+        # In-memory databases are private to their DBManager
+        if str(self.db_path) == ":memory:":
+            return f":memory:{id(self)}"
+        return str(self.db_path.resolve())
+
+    def _notify_settings_observers(self, key: str, value: Any) -> None:
+        with self._settings_observers_lock:
+            observers = list(self._settings_observers.get(self._settings_observer_key(), ()))
+        for observer in observers:
+            try:
+                observer.setting_written(key, value)
+            except Exception as e:
+                logger.error(f"Error notifying settings observer for '{key}': {e}")
+
+    def write_state_batch(self, settings: Dict[str, Any] = None,
+                          panels: Dict[int, Dict[str, Any]] = None) -> None:
+        """
+        Write settings and pinned panel state in a single transaction
+
+        Used by SettingsStore to flush coalesced writes.
+
+        Args:
+            settings: {key: value} (values JSON encoded)
+            panels: {panel_id: {field: value}} (see update_pinned_panel)
+        """
+        statements = []
+        for panel_id, fields in (panels or {}).items():
+            statement = self._build_pinned_panel_update(panel_id, fields)
+            if statement is not None:
+                statements.append(statement)
+
+        with self.transaction() as conn:
+            if settings:
+                conn.executemany(
+                    self.SETTING_UPSERT_SQL,
+                    [(key, json.dumps(value)) for key, value in settings.items()]
+                )
+            for query, params in statements:
+                conn.execute(query, params)
+        logger.debug(f"State batch written: {len(settings or {})} settings, {len(statements)} panels")
 
     def get_all_settings(self) -> Dict[str, Any]:
         """
@@ -416,10 +513,7 @@ class DBManager:
         """
         # Use provided order_index or calculate next one
         if order_index is None:
-            max_order = self.execute_query(
-                "SELECT MAX(order_index) as max_order FROM categories"
-            )
-            order_index = (max_order[0]['max_order'] or 0) + 1
+            order_index = ordering.next_key(self.connect(), ordering.COLLECTIONS['categories'])
 
         query = """
             INSERT INTO categories (name, icon, order_index, is_predefined, updated_at)
@@ -480,22 +574,48 @@ class DBManager:
         """
         Reorder categories by providing ordered list of IDs
 
+        Only the keys of moved categories are rewritten (gapped order keys).
+
         Args:
             category_ids: List of category IDs in desired order
         """
-        updates = [(i, cat_id) for i, cat_id in enumerate(category_ids)]
-        query = "UPDATE categories SET order_index = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-        self.execute_many(query, updates)
-        logger.info(f"Categories reordered: {len(category_ids)} items")
+        with self.transaction() as conn:
+            written = ordering.apply_order(conn, ordering.COLLECTIONS['categories'], category_ids)
+        logger.info(f"Categories reordered: {len(category_ids)} items, {written} keys updated")
+
+    # ========== ORDER KEYS ==========
+
+    def renormalize_order_keys(self, collections: List[str] = None,
+                               min_gap: Optional[int] = ordering.RENORMALIZE_MIN_GAP) -> Dict[str, int]:
+        """
+        Renumber order keys of groups whose gaps are exhausted
+
+        Args:
+            collections: Names from ordering.COLLECTIONS (default: all)
+            min_gap: Smallest acceptable gap (None = renumber every group)
+
+        Returns:
+            Dict: Rows rewritten per collection
+        """
+        written = {}
+        for name in collections or ordering.COLLECTIONS:
+            with self.transaction() as conn:
+                written[name] = ordering.renormalize(conn, ordering.COLLECTIONS[name], min_gap)
+        if 'speed_dials' in written and written['speed_dials']:
+            self._bump_speed_dial_version()
+        logger.debug(f"Order keys renormalized: {written}")
+        return written
 
     # ========== ITEMS ==========
 
-    def get_items_by_category(self, category_id: int) -> List[Dict]:
+    def get_items_by_category(self, category_id: int, decompress: bool = True) -> List[Dict]:
         """
         Get all items for a specific category
 
         Args:
             category_id: Category ID
+            decompress: If False, compressed content is returned as stored
+                        (content_compressed=1) to be decompressed on demand
 
         Returns:
             List[Dict]: List of item dictionaries (content decrypted if sensitive)
@@ -527,6 +647,9 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            if decompress:
+                restore_content(item)
+
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -566,6 +689,8 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            restore_content(item)
+
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 from core.encryption_manager import EncryptionManager
@@ -606,6 +731,8 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            restore_content(item)
+
             # Decrypt sensitive content if needed
             if item.get('is_sensitive') and item.get('content'):
                 from core.encryption_manager import EncryptionManager
@@ -675,6 +802,8 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            restore_content(item)
+
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -739,15 +868,18 @@ class DBManager:
             content = encryption_manager.encrypt(content)
             logger.info(f"Content encrypted for sensitive item: {label}")
 
+        # Compress large content (never sensitive content)
+        content, content_compressed = self._encode_content(content, is_sensitive)
+
         tags_json = json.dumps(tags or [])
         query = """
             INSERT INTO items
-            (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, badge, is_active, is_archived, is_list, list_group, orden_lista, file_size, file_type, file_extension, original_filename, file_hash, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            (category_id, label, content, content_compressed, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, badge, is_active, is_archived, is_list, list_group, orden_lista, file_size, file_type, file_extension, original_filename, file_hash, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """
         item_id = self.execute_update(
             query,
-            (category_id, label, content, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, badge, is_active, is_archived, is_list, list_group, orden_lista, file_size, file_type, file_extension, original_filename, file_hash)
+            (category_id, label, content, content_compressed, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, badge, is_active, is_archived, is_list, list_group, orden_lista, file_size, file_type, file_extension, original_filename, file_hash)
         )
         list_info = f", List: {list_group}[{orden_lista}]" if is_list else ""
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info})")
@@ -789,6 +921,12 @@ class DBManager:
                         value = encryption_manager.encrypt(value)
                         logger.info(f"Content encrypted for item ID: {item_id}")
 
+                # Compress large content (never sensitive content)
+                if field == 'content':
+                    value, content_compressed = self._encode_content(value, will_be_sensitive)
+                    updates.append("content_compressed = ?")
+                    params.append(content_compressed)
+
                 updates.append(f"{field} = ?")
                 params.append(value)
 
@@ -799,6 +937,30 @@ class DBManager:
             self.execute_update(query, tuple(params))
             logger.info(f"Item updated: ID {item_id}")
 
+    def get_content_compression_threshold(self) -> int:
+        """
+        Get size threshold (bytes) above which item/notebook content is compressed
+
+        Returns:
+            int: Threshold in bytes (0 disables compression)
+        """
+        return int(self.get_setting('content_compression_threshold', CONTENT_COMPRESSION_THRESHOLD) or 0)
+
+    def _encode_content(self, content: Any, is_sensitive: bool = False) -> tuple:
+        """
+        Compress content for storage if it exceeds the threshold
+
+        Sensitive (encrypted) content is never compressed.
+
+        Returns:
+            tuple: (value to store, content_compressed flag)
+        """
+        threshold = self.get_content_compression_threshold()
+        if is_sensitive or not threshold or not isinstance(content, str):
+            return content, 0
+        payload, is_compressed = compress_text(content, threshold)
+        return payload, int(is_compressed)
+
     def delete_item(self, item_id: int) -> None:
         """
         Delete item
@@ -843,11 +1005,25 @@ class DBManager:
             WHERE c.is_active = 1 OR ? = 1
             ORDER BY i.created_at DESC
         """
-        results = self.execute_query(query, (include_inactive,))
+        return self.get_items_by_query(query, (include_inactive,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+    def get_items_by_query(self, query: str, params: tuple = ()) -> List[Dict]:
+        """
+        Execute an item SELECT and prepare the rows like get_all_items
+
+        Used by AdvancedFilterEngine to run filters compiled to SQL.
+
+        Args:
+            query: SELECT returning item columns (i.* and optional category info)
+            params: Query parameters
+
+        Returns:
+            List[Dict]: Items with parsed tags and content decompressed/decrypted
+        """
+        results = self.execute_query(query, params)
+
+        # Encryption manager is only created when a sensitive row is returned
+        encryption_manager = None
 
         # Parse tags and decrypt sensitive content
         for item in results:
@@ -865,9 +1041,14 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            restore_content(item)
+
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
+                    if encryption_manager is None:
+                        from core.encryption_manager import EncryptionManager
+                        encryption_manager = EncryptionManager()
                     item['content'] = encryption_manager.decrypt(item['content'])
                     logger.debug(f"Content decrypted for item ID: {item['id']}")
                 except Exception as e:
@@ -891,7 +1072,10 @@ class DBManager:
             SELECT i.*, c.name as category_name
             FROM items i
             JOIN categories c ON i.category_id = c.id
-            WHERE i.label LIKE ? OR i.content LIKE ? OR i.tags LIKE ?
+            WHERE i.label LIKE ?
+               OR (CASE WHEN i.content_compressed = 1
+                        THEN content_text(i.content, 1) ELSE i.content END) LIKE ?
+               OR i.tags LIKE ?
             ORDER BY i.last_used DESC
             LIMIT ?
         """
@@ -903,6 +1087,7 @@ class DBManager:
 
         # Parse tags
         for item in results:
+            restore_content(item)
             if item['tags']:
                 try:
                     # Try to parse as JSON first
@@ -918,6 +1103,39 @@ class DBManager:
 
         return results
 
+    # ========== FILE STORAGE STATS ==========
+
+    def get_file_storage_stats(self) -> List[Dict]:
+        """
+        Get stored file totals grouped by file_type
+
+        Totals are maintained incrementally by triggers on items
+        (see migrations/add_file_storage_stats.py).
+
+        Returns:
+            List[Dict]: Rows with file_type, file_count and total_size
+        """
+        query = """
+            SELECT file_type, file_count, total_size
+            FROM file_storage_stats
+            WHERE file_count > 0
+            ORDER BY total_size DESC
+        """
+        return self.execute_query(query)
+
+    def rebuild_file_storage_stats(self) -> None:
+        """Recompute file_storage_stats from the items table (drift correction)"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM file_storage_stats")
+            conn.execute("""
+                INSERT INTO file_storage_stats (file_type, file_count, total_size)
+                SELECT COALESCE(file_type, 'OTROS'), COUNT(*), COALESCE(SUM(file_size), 0)
+                FROM items
+                WHERE type = 'PATH' AND file_hash IS NOT NULL
+                GROUP BY COALESCE(file_type, 'OTROS')
+            """)
+        logger.info("File storage stats rebuilt")
+
     # ========== LISTAS AVANZADAS ==========
 
     def create_list(self, category_id: int, list_name: str, items_data: List[Dict[str, Any]]) -> List[int]:
@@ -947,6 +1165,7 @@ class DBManager:
 
         try:
             with self.transaction() as conn:
+                order_keys = ordering.spaced_keys(len(items_data))
                 for orden, item_data in enumerate(items_data, start=1):
                     # Agregar item con campos de lista
                     item_id = self.add_item(
@@ -963,7 +1182,7 @@ class DBManager:
                         # Campos de lista
                         is_list=True,
                         list_group=list_name,
-                        orden_lista=orden
+                        orden_lista=order_keys[orden - 1]
                     )
                     item_ids.append(item_id)
 
@@ -1012,6 +1231,96 @@ class DBManager:
         logger.debug(f"Encontradas {len(results)} listas en categoría {category_id}")
         return results
 
+    def get_lists_with_steps(self, category_id: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las listas de una categoría con sus pasos, en una sola consulta
+
+        Recorre idx_items_orden_lista (category_id, list_group, orden_lista),
+        que ya entrega los pasos agrupados y ordenados. El contenido de los
+        pasos no se lee: se carga al expandir la lista (get_list_step_contents).
+
+        Args:
+            category_id: ID de la categoría
+
+        Returns:
+            List[Dict]: Mismo resumen que get_lists_by_category más 'steps'
+                (id, label, type, orden_lista, is_sensitive de cada paso, en orden)
+        """
+        query = """
+            SELECT id, list_group, label, type, orden_lista, is_sensitive, created_at, last_used
+            FROM items
+            WHERE category_id = ?
+            AND is_list = 1
+            AND is_active = 1
+            ORDER BY list_group, orden_lista, id
+        """
+        lists: Dict[str, Dict[str, Any]] = {}
+        for row in self.execute_query(query, (category_id,)):
+            list_data = lists.get(row['list_group'])
+            if list_data is None:
+                list_data = lists[row['list_group']] = {
+                    'list_group': row['list_group'],
+                    'item_count': 0,
+                    'first_label': row['label'],
+                    'created_at': row['created_at'],
+                    'last_used': row['last_used'],
+                    'steps': [],
+                }
+            list_data['item_count'] += 1
+            # Mismos agregados que get_lists_by_category (MIN/MAX ignoran NULL)
+            if row['label'] is not None and (list_data['first_label'] is None or row['label'] < list_data['first_label']):
+                list_data['first_label'] = row['label']
+            if row['created_at'] is not None and (list_data['created_at'] is None or row['created_at'] < list_data['created_at']):
+                list_data['created_at'] = row['created_at']
+            if row['last_used'] is not None and (list_data['last_used'] is None or row['last_used'] > list_data['last_used']):
+                list_data['last_used'] = row['last_used']
+            list_data['steps'].append({
+                'id': row['id'],
+                'label': row['label'],
+                'type': row['type'],
+                'orden_lista': row['orden_lista'],
+                'is_sensitive': row['is_sensitive'],
+            })
+
+        results = sorted(lists.values(), key=lambda data: data['created_at'] or '', reverse=True)
+        logger.debug(f"Encontradas {len(results)} listas con pasos en categoría {category_id}")
+        return results
+
+    def get_list_step_contents(self, item_ids: List[int]) -> Dict[int, str]:
+        """
+        Obtiene el contenido de varios pasos de lista (descomprimido y desencriptado)
+
+        Args:
+            item_ids: IDs de los pasos
+
+        Returns:
+            Dict[int, str]: Contenido por ID de item
+        """
+        if not item_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(item_ids))
+        results = self.execute_query(
+            f"SELECT id, content, content_compressed, is_sensitive FROM items WHERE id IN ({placeholders})",
+            tuple(item_ids)
+        )
+
+        encryption_manager = None
+        contents = {}
+        for item in results:
+            restore_content(item)
+            if item.get('is_sensitive') and item.get('content'):
+                if encryption_manager is None:
+                    from core.encryption_manager import EncryptionManager
+                    encryption_manager = EncryptionManager()
+                try:
+                    item['content'] = encryption_manager.decrypt(item['content'])
+                except Exception as e:
+                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                    item['content'] = "[DECRYPTION ERROR]"
+            contents[item['id']] = item['content'] or ''
+        return contents
+
     def get_list_items(self, category_id: int, list_group: str) -> List[Dict[str, Any]]:
         """
         Obtiene todos los items de una lista específica, ordenados por orden_lista
@@ -1050,6 +1359,8 @@ class DBManager:
             else:
                 item['tags'] = []
 
+            restore_content(item)
+
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -1062,10 +1373,34 @@ class DBManager:
         logger.debug(f"Obtenidos {len(results)} items de lista '{list_group}'")
         return results
 
+    def get_list_item_position(self, item_id: int) -> Optional[int]:
+        """
+        Posición de un paso dentro de su lista (orden_lista es una clave con huecos)
+
+        Args:
+            item_id: ID del item
+
+        Returns:
+            Optional[int]: Posición 1, 2, 3... o None si no es un paso activo de una lista
+        """
+        rows = self.execute_query(
+            "SELECT category_id, list_group FROM items WHERE id = ? AND is_list = 1", (item_id,)
+        )
+        if not rows:
+            return None
+        group = (rows[0]['category_id'], rows[0]['list_group'])
+        order = ordering.load_order(self.connect(), ordering.COLLECTIONS['list_items'], group)
+        for position, (row_id, _) in enumerate(order, start=1):
+            if row_id == item_id:
+                return position
+        return None
+
     def reorder_list_item(self, item_id: int, new_orden: int) -> bool:
         """
         Cambia el orden de un item dentro de su lista
-        También reordena los demás items afectados
+
+        Solo se reescribe la clave del item movido: recibe un valor en el
+        hueco entre sus nuevos vecinos (la lista se renumera si no queda hueco)
 
         Args:
             item_id: ID del item a reordenar
@@ -1082,49 +1417,19 @@ class DBManager:
 
         category_id = item['category_id']
         list_group = item['list_group']
-        old_orden = item['orden_lista']
-
-        if old_orden == new_orden:
-            logger.debug(f"Item {item_id} ya está en la posición {new_orden}")
-            return True
 
         try:
             with self.transaction() as conn:
-                cursor = conn.cursor()
-
-                # Si movemos hacia arriba (new_orden < old_orden)
-                # Incrementar orden de los items entre new_orden y old_orden
-                if new_orden < old_orden:
-                    cursor.execute("""
-                        UPDATE items
-                        SET orden_lista = orden_lista + 1
-                        WHERE category_id = ?
-                        AND list_group = ?
-                        AND orden_lista >= ?
-                        AND orden_lista < ?
-                    """, (category_id, list_group, new_orden, old_orden))
-
-                # Si movemos hacia abajo (new_orden > old_orden)
-                # Decrementar orden de los items entre old_orden y new_orden
-                else:
-                    cursor.execute("""
-                        UPDATE items
-                        SET orden_lista = orden_lista - 1
-                        WHERE category_id = ?
-                        AND list_group = ?
-                        AND orden_lista > ?
-                        AND orden_lista <= ?
-                    """, (category_id, list_group, old_orden, new_orden))
-
-                # Actualizar el item movido
-                cursor.execute("""
-                    UPDATE items
-                    SET orden_lista = ?
-                    WHERE id = ?
-                """, (new_orden, item_id))
+                written = ordering.move_to_position(
+                    conn, ordering.COLLECTIONS['list_items'], item_id, new_orden - 1,
+                    group=(category_id, list_group)
+                )
+            if written is None:
+                logger.warning(f"Item {item_id} no está activo en la lista '{list_group}'")
+                return False
 
-                logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
-                return True
+            logger.info(f"Item {item_id} movido a la posición {new_orden} en lista '{list_group}' ({written} claves)")
+            return True
 
         except Exception as e:
             logger.error(f"Error al reordenar item {item_id}: {e}")
@@ -1254,48 +1559,88 @@ class DBManager:
 
     # ========== CLIPBOARD HISTORY ==========
 
-    def add_to_history(self, item_id: Optional[int], content: str) -> int:
+    def add_to_history(self, item_id: Optional[int], content: str,
+                       max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> int:
         """
         Add entry to clipboard history
 
+        Identical content is deduplicated by hash: the existing entry is moved
+        to the top (new id) and its copy_count incremented. Large content is stored
+        zlib-compressed. The history is trimmed by count and total bytes in
+        the same transaction.
+
+        Callers that record often (ClipboardMonitor) pass the limits from their
+        SettingsStore; otherwise they are read from the settings table.
+
         Args:
             item_id: Associated item ID (optional)
             content: Copied content
+            max_entries: Entry limit (None = clipboard_history_max_entries)
+            max_bytes: Total size limit (None = clipboard_history_max_bytes)
 
         Returns:
             int: History entry ID
         """
-        query = """
-            INSERT INTO clipboard_history (item_id, content)
-            VALUES (?, ?)
-        """
-        history_id = self.execute_update(query, (item_id, content))
-        logger.debug(f"History entry added: ID {history_id}")
-
-        # Auto-trim history to max_history setting
-        max_history = self.get_setting('max_history', 20)
-        self.trim_history(keep_latest=max_history)
-
+        digest = content_hash(content)
+        payload, is_compressed = compress_text(content, CLIPBOARD_COMPRESSION_THRESHOLD)
+        stored_text = '' if is_compressed else payload
+        stored_blob = payload if is_compressed else None
+
+        if max_entries is None:
+            max_entries = self.get_setting('clipboard_history_max_entries', CLIPBOARD_HISTORY_MAX_ENTRIES)
+        if max_bytes is None:
+            max_bytes = self.get_setting('clipboard_history_max_bytes', CLIPBOARD_HISTORY_MAX_BYTES)
+
+        with self.transaction() as conn:
+            # Re-insert duplicates so the AUTOINCREMENT id always reflects recency
+            existing = conn.execute(
+                "SELECT id, item_id, copy_count FROM clipboard_history WHERE content_hash = ?",
+                (digest,)
+            ).fetchone()
+            copy_count = 1
+            if existing:
+                conn.execute("DELETE FROM clipboard_history WHERE id = ?", (existing['id'],))
+                copy_count = (existing['copy_count'] or 1) + 1
+                if item_id is None:
+                    item_id = existing['item_id']
+
+            cursor = conn.execute("""
+                INSERT INTO clipboard_history
+                    (item_id, content, content_hash, content_size, is_compressed, compressed_content, copy_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (item_id, stored_text, digest, payload_size(payload), int(is_compressed), stored_blob, copy_count))
+            history_id = cursor.lastrowid
+            self._trim_history(conn, max_entries, max_bytes)
+
+        logger.debug(f"History entry added: ID {history_id} (compressed: {is_compressed})")
         return history_id
 
-    def get_history(self, limit: int = 20) -> List[Dict]:
+    def get_history(self, limit: int = 20, offset: int = 0) -> List[Dict]:
         """
         Get recent clipboard history
 
         Args:
             limit: Maximum entries to retrieve
+            offset: Entries to skip (pagination)
 
         Returns:
-            List[Dict]: List of history entries
+            List[Dict]: List of history entries (content decompressed)
         """
         query = """
-            SELECT h.*, i.label, i.type
+            SELECT h.id, h.item_id, h.content, h.copied_at, h.content_hash,
+                   h.content_size, h.is_compressed, h.compressed_content, h.copy_count,
+                   i.label, i.type
             FROM clipboard_history h
             LEFT JOIN items i ON h.item_id = i.id
-            ORDER BY h.copied_at DESC
-            LIMIT ?
-        """
-        return self.execute_query(query, (limit,))
+            ORDER BY h.id DESC
+            LIMIT ? OFFSET ?
+        """
+        results = self.execute_query(query, (limit, offset))
+        for entry in results:
+            blob = entry.pop('compressed_content')
+            if entry['is_compressed']:
+                entry['content'] = decompress_text(blob, True)
+        return results
 
     def clear_history(self) -> None:
         """Clear all clipboard history"""
@@ -1303,23 +1648,34 @@ class DBManager:
         self.execute_update(query)
         logger.info("Clipboard history cleared")
 
-    def trim_history(self, keep_latest: int = 20) -> None:
+    def trim_history(self, keep_latest: int = 20, max_bytes: int = None) -> None:
         """
-        Keep only the latest N history entries
+        Keep only the latest N history entries (and at most max_bytes stored)
 
         Args:
             keep_latest: Number of entries to keep
+            max_bytes: Maximum total stored bytes (optional)
         """
-        query = """
+        with self.transaction() as conn:
+            self._trim_history(conn, keep_latest, max_bytes)
+        logger.debug(f"History trimmed to {keep_latest} entries")
+
+    def _trim_history(self, conn: sqlite3.Connection, keep_latest: int, max_bytes: Optional[int]) -> None:
+        """Delete entries beyond the count or cumulative byte limit in one statement"""
+        conn.execute("""
             DELETE FROM clipboard_history
-            WHERE id NOT IN (
-                SELECT id FROM clipboard_history
-                ORDER BY copied_at DESC
-                LIMIT ?
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id,
+                           ROW_NUMBER() OVER recent AS position,
+                           SUM(content_size) OVER recent AS running_bytes
+                    FROM clipboard_history
+                    WINDOW recent AS (ORDER BY id DESC
+                                      ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+                )
+                WHERE position > ? OR (? IS NOT NULL AND running_bytes > ?)
             )
-        """
-        self.execute_update(query, (keep_latest,))
-        logger.debug(f"History trimmed to {keep_latest} entries")
+        """, (keep_latest, max_bytes, max_bytes))
 
     # ========== PINNED PANELS ==========
 
@@ -1420,25 +1776,33 @@ class DBManager:
         Returns:
             bool: True if update successful
         """
-        allowed_fields = [
-            'x_position', 'y_position', 'width', 'height', 'is_minimized',
-            'custom_name', 'custom_color', 'filter_config', 'keyboard_shortcut', 'is_active'
-        ]
+        statement = self._build_pinned_panel_update(panel_id, kwargs)
+        if statement is not None:
+            self.execute_update(*statement)
+            logger.info(f"Pinned panel updated: ID {panel_id}")
+            return True
+        return False
+
+    PINNED_PANEL_FIELDS = (
+        'x_position', 'y_position', 'width', 'height', 'is_minimized',
+        'custom_name', 'custom_color', 'filter_config', 'keyboard_shortcut', 'is_active'
+    )
+
+    def _build_pinned_panel_update(self, panel_id: int, fields: Dict[str, Any]):
+        """Build (query, params) for a pinned panel UPDATE, or None if no valid fields"""
         updates = []
         params = []
 
-        for field, value in kwargs.items():
-            if field in allowed_fields:
+        for field, value in fields.items():
+            if field in self.PINNED_PANEL_FIELDS:
                 updates.append(f"{field} = ?")
                 params.append(value)
 
-        if updates:
-            params.append(panel_id)
-            query = f"UPDATE pinned_panels SET {', '.join(updates)} WHERE id = ?"
-            self.execute_update(query, tuple(params))
-            logger.info(f"Pinned panel updated: ID {panel_id}")
-            return True
-        return False
+        if not updates:
+            return None
+
+        params.append(panel_id)
+        return f"UPDATE pinned_panels SET {', '.join(updates)} WHERE id = ?", tuple(params)
 
     def update_panel_last_opened(self, panel_id: int) -> None:
         """
@@ -1456,6 +1820,24 @@ class DBManager:
         self.execute_update(query, (panel_id,))
         logger.debug(f"Panel {panel_id} opened - statistics updated")
 
+    def update_panels_last_opened(self, panel_ids: List[int]) -> None:
+        """
+        Update last_opened/open_count of several panels in one transaction
+
+        Args:
+            panel_ids: Panel IDs
+        """
+        if not panel_ids:
+            return
+        query = """
+            UPDATE pinned_panels
+            SET last_opened = CURRENT_TIMESTAMP,
+                open_count = open_count + 1
+            WHERE id = ?
+        """
+        self.execute_many(query, [(panel_id,) for panel_id in panel_ids])
+        logger.debug(f"{len(panel_ids)} panels opened - statistics updated")
+
     def delete_pinned_panel(self, panel_id: int) -> bool:
         """
         Remove a pinned panel from database
@@ -1818,6 +2200,19 @@ class DBManager:
 
     # ==================== Bookmarks Management ====================
 
+    def get_bookmarks_version(self) -> int:
+        """
+        Versión de los datos de marcadores (el índice de autocompletado se reconstruye al cambiar).
+
+        Returns:
+            int: Versión actual (se incrementa en cada alta, edición o borrado)
+        """
+        return int(self.get_setting('bookmarks_version', 0) or 0)
+
+    def _bump_bookmarks_version(self):
+        """Invalidar el índice de prefijos de URL de los marcadores"""
+        self.set_setting('bookmarks_version', self.get_bookmarks_version() + 1)
+
     def add_bookmark(self, title: str, url: str, folder: str = None) -> Optional[int]:
         """
         Agrega un marcador a la base de datos.
@@ -1849,13 +2244,9 @@ class DBManager:
                 INSERT INTO bookmarks (title, url, folder, order_index)
                 VALUES (?, ?, ?, ?)
             """
-            self.execute_update(insert_query, (title, url, folder, next_order))
-
-            # Obtener el ID insertado
-            last_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(last_id_query)
-            bookmark_id = result[0]['id'] if result else None
+            bookmark_id = self.execute_update(insert_query, (title, url, folder, next_order))
 
+            self._bump_bookmarks_version()
             logger.info(f"Marcador agregado: '{title}' - {url}")
             return bookmark_id
 
@@ -1896,6 +2287,75 @@ class DBManager:
             logger.error(f"Error al obtener marcadores: {e}")
             return []
 
+    def _bookmarks_fts_tokenizer(self) -> Optional[str]:
+        """Tokenizador de bookmarks_fts ('trigram', 'unicode61') o None si no existe"""
+        if not hasattr(self, '_bookmarks_fts_mode'):
+            result = self.execute_query(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'bookmarks_fts'"
+            )
+            if not result:
+                self._bookmarks_fts_mode = None
+            elif 'trigram' in (result[0]['sql'] or ''):
+                self._bookmarks_fts_mode = 'trigram'
+            else:
+                self._bookmarks_fts_mode = 'unicode61'
+        return self._bookmarks_fts_mode
+
+    def search_bookmarks(self, query: str, limit: int = 200) -> List[Dict]:
+        """
+        Busca marcadores por título o URL usando el índice bookmarks_fts.
+
+        Cada término debe aparecer (como subcadena con trigram, como prefijo
+        de palabra con el tokenizador por defecto). Los términos de menos de
+        3 caracteres, o la ausencia de FTS5, usan LIKE sobre la tabla.
+
+        Args:
+            query: Texto a buscar
+            limit: Número máximo de resultados
+
+        Returns:
+            List[Dict]: Marcadores ordenados por relevancia
+        """
+        terms = query.split()
+        if not terms:
+            return self.get_bookmarks()[:limit]
+
+        tokenizer = self._bookmarks_fts_tokenizer()
+        try:
+            if tokenizer and (tokenizer != 'trigram' or min(len(t) for t in terms) >= 3):
+                quoted = ['"' + term.replace('"', '""') + '"' for term in terms]
+                if tokenizer != 'trigram':
+                    quoted = [f"{term}*" for term in quoted]
+                fts_query = """
+                    SELECT b.id, b.title, b.url, b.folder, b.icon, b.created_at, b.order_index
+                    FROM bookmarks_fts
+                    JOIN bookmarks b ON b.id = bookmarks_fts.rowid
+                    WHERE bookmarks_fts MATCH ?
+                    ORDER BY bm25(bookmarks_fts), b.order_index
+                    LIMIT ?
+                """
+                return self.execute_query(fts_query, (' '.join(quoted), limit))
+
+            conditions = []
+            params = []
+            for term in terms:
+                pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                conditions.append("(title LIKE ? ESCAPE '\\' OR url LIKE ? ESCAPE '\\')")
+                params.extend([pattern, pattern])
+            like_query = f"""
+                SELECT id, title, url, folder, icon, created_at, order_index
+                FROM bookmarks
+                WHERE {' AND '.join(conditions)}
+                ORDER BY order_index ASC
+                LIMIT ?
+            """
+            params.append(limit)
+            return self.execute_query(like_query, tuple(params))
+
+        except Exception as e:
+            logger.error(f"Error al buscar marcadores: {e}")
+            return []
+
     def delete_bookmark(self, bookmark_id: int) -> bool:
         """
         Elimina un marcador por su ID.
@@ -1909,6 +2369,7 @@ class DBManager:
         try:
             delete_query = "DELETE FROM bookmarks WHERE id = ?"
             self.execute_update(delete_query, (bookmark_id,))
+            self._bump_bookmarks_version()
             logger.info(f"Marcador eliminado: ID {bookmark_id}")
             return True
 
@@ -1955,6 +2416,7 @@ class DBManager:
             update_query = f"UPDATE bookmarks SET {', '.join(updates)} WHERE id = ?"
 
             self.execute_update(update_query, tuple(params))
+            self._bump_bookmarks_version()
             logger.info(f"Marcador actualizado: ID {bookmark_id}")
             return True
 
@@ -1983,6 +2445,19 @@ class DBManager:
 
     # ==================== Speed Dial Management ====================
 
+    def get_speed_dial_version(self) -> int:
+        """
+        Versión de los datos de speed dials (la caché de SpeedDialGenerator se indexa por ella).
+
+        Returns:
+            int: Versión actual (se incrementa en cada alta, edición, borrado o reordenación)
+        """
+        return int(self.get_setting('speed_dial_version', 0) or 0)
+
+    def _bump_speed_dial_version(self):
+        """Invalidar la página Speed Dial renderizada"""
+        self.set_setting('speed_dial_version', self.get_speed_dial_version() + 1)
+
     def add_speed_dial(self, title: str, url: str, icon: str = '🌐',
                       background_color: str = '#16213e', thumbnail_path: str = None) -> Optional[int]:
         """
@@ -2000,9 +2475,7 @@ class DBManager:
         """
         try:
             # Obtener la siguiente posición
-            max_pos_query = "SELECT COALESCE(MAX(position), -1) + 1 as next_pos FROM speed_dials"
-            result = self.execute_query(max_pos_query)
-            next_position = result[0]['next_pos'] if result else 0
+            next_position = ordering.next_key(self.connect(), ordering.COLLECTIONS['speed_dials'])
 
             # Insertar speed dial
             insert_query = """
@@ -2016,6 +2489,7 @@ class DBManager:
             result = self.execute_query(last_id_query)
             speed_dial_id = result[0]['id'] if result else None
 
+            self._bump_speed_dial_version()
             logger.info(f"Speed dial agregado: '{title}' - {url}")
             return speed_dial_id
 
@@ -2043,6 +2517,25 @@ class DBManager:
             logger.error(f"Error al obtener speed dials: {e}")
             return []
 
+    def get_speed_dial_thumbnail_paths(self) -> List[str]:
+        """
+        Rutas de thumbnail de los speed dials (para la clave de caché de la página).
+
+        Returns:
+            List[str]: Rutas no vacías, sin repetir
+        """
+        try:
+            result = self.execute_query("""
+                SELECT DISTINCT thumbnail_path FROM speed_dials
+                WHERE thumbnail_path IS NOT NULL AND thumbnail_path != ''
+                ORDER BY thumbnail_path
+            """)
+            return [row['thumbnail_path'] for row in result]
+
+        except Exception as e:
+            logger.error(f"Error al obtener thumbnails de speed dials: {e}")
+            return []
+
     def update_speed_dial(self, speed_dial_id: int, title: str = None, url: str = None,
                          icon: str = None, background_color: str = None,
                          thumbnail_path: str = None) -> bool:
@@ -2094,6 +2587,7 @@ class DBManager:
 
             update_query = f"UPDATE speed_dials SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(update_query, tuple(params))
+            self._bump_speed_dial_version()
             logger.info(f"Speed dial actualizado: ID {speed_dial_id}")
             return True
 
@@ -2116,8 +2610,8 @@ class DBManager:
             self.execute_update(delete_query, (speed_dial_id,))
             logger.info(f"Speed dial eliminado: ID {speed_dial_id}")
 
-            # Reorganizar posiciones
-            self._reorder_speed_dials()
+            # Las claves con huecos no necesitan reorganizarse al borrar
+            self._bump_speed_dial_version()
             return True
 
         except Exception as e:
@@ -2128,6 +2622,8 @@ class DBManager:
         """
         Cambia la posición de un speed dial.
 
+        Solo se reescribe la clave del speed dial movido.
+
         Args:
             speed_dial_id: ID del speed dial
             new_position: Nueva posición (0-based)
@@ -2136,9 +2632,14 @@ class DBManager:
             bool: True si se reordenó correctamente
         """
         try:
-            update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
-            self.execute_update(update_query, (new_position, speed_dial_id))
-            self._reorder_speed_dials()
+            with self.transaction() as conn:
+                written = ordering.move_to_position(
+                    conn, ordering.COLLECTIONS['speed_dials'], speed_dial_id, new_position
+                )
+            if written is None:
+                logger.warning(f"Speed dial {speed_dial_id} no encontrado")
+                return False
+            self._bump_speed_dial_version()
             logger.info(f"Speed dial reordenado: ID {speed_dial_id} -> posición {new_position}")
             return True
 
@@ -2146,24 +2647,20 @@ class DBManager:
             logger.error(f"Error al reordenar speed dial: {e}")
             return False
 
-    def _reorder_speed_dials(self):
-        """Reorganiza las posiciones de speed dials para que sean consecutivas (0, 1, 2, ...)."""
-        try:
-            # Obtener todos los speed dials ordenados por posición actual
-            speed_dials = self.get_speed_dials()
-
-            # Actualizar posiciones para que sean consecutivas
-            for index, sd in enumerate(speed_dials):
-                if sd['position'] != index:
-                    update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
-                    self.execute_update(update_query, (index, sd['id']))
-
-        except Exception as e:
-            logger.error(f"Error al reorganizar speed dials: {e}")
-
     # ==================== Browser Sessions Management ====================
 
-    def save_session(self, name: str, tabs_data: list, is_auto_save: bool = False) -> Optional[int]:
+    @staticmethod
+    def _session_tab_row(tab: Dict) -> tuple:
+        """(url, title, position, is_active) de una pestaña de sesión"""
+        return (
+            tab.get('url', ''),
+            tab.get('title', 'Nueva pestaña'),
+            tab.get('position', 0),
+            1 if tab.get('is_active', False) else 0
+        )
+
+    def save_session(self, name: str, tabs_data: list, is_auto_save: bool = False,
+                     keep_auto_saves: int = 1) -> Optional[int]:
         """
         Guarda una sesión del navegador con todas sus pestañas.
 
@@ -2171,45 +2668,28 @@ class DBManager:
             name: Nombre de la sesión
             tabs_data: Lista de diccionarios con datos de pestañas [{url, title, position, is_active}]
             is_auto_save: Si es una sesión de auto-guardado (True) o guardada manualmente (False)
+            keep_auto_saves: Sesiones auto-save que se conservan (incluida la nueva)
 
         Returns:
             int: ID de la sesión creada o None si falla
         """
         try:
-            # Si es auto-save, eliminar sesiones auto-save anteriores
-            if is_auto_save:
-                delete_query = "DELETE FROM browser_sessions WHERE is_auto_save = 1"
-                self.execute_update(delete_query)
-
-            # Crear sesión
-            insert_query = """
-                INSERT INTO browser_sessions (name, is_auto_save)
-                VALUES (?, ?)
-            """
-            self.execute_update(insert_query, (name, 1 if is_auto_save else 0))
-
-            # Obtener ID de la sesión creada
-            session_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(session_id_query)
-            if not result:
-                logger.error("No se pudo obtener el ID de la sesión")
-                return None
-
-            session_id = result[0]['id']
+            with self.transaction() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO browser_sessions (name, is_auto_save) VALUES (?, ?)",
+                    (name, 1 if is_auto_save else 0)
+                )
+                session_id = cursor.lastrowid
 
-            # Guardar pestañas
-            for tab in tabs_data:
-                tab_query = """
+                # Guardar pestañas
+                conn.executemany("""
                     INSERT INTO session_tabs (session_id, url, title, position, is_active)
                     VALUES (?, ?, ?, ?, ?)
-                """
-                self.execute_update(tab_query, (
-                    session_id,
-                    tab.get('url', ''),
-                    tab.get('title', 'Nueva pestaña'),
-                    tab.get('position', 0),
-                    1 if tab.get('is_active', False) else 0
-                ))
+                """, [(session_id, *self._session_tab_row(tab)) for tab in tabs_data])
+
+                # Si es auto-save, conservar solo las más recientes
+                if is_auto_save:
+                    self._prune_auto_save_sessions(conn, keep_auto_saves)
 
             logger.info(f"Sesión guardada: {name} (ID: {session_id}) con {len(tabs_data)} pestañas")
             return session_id
@@ -2218,6 +2698,61 @@ class DBManager:
             logger.error(f"Error al guardar sesión: {e}")
             return None
 
+    def _prune_auto_save_sessions(self, conn, keep: int):
+        """Eliminar las sesiones auto-save más antiguas, conservando `keep`"""
+        old_ids = [row[0] for row in conn.execute("""
+            SELECT id FROM browser_sessions
+            WHERE is_auto_save = 1
+            ORDER BY id DESC
+            LIMIT -1 OFFSET ?
+        """, (max(int(keep), 1),))]
+        if old_ids:
+            placeholders = ', '.join('?' * len(old_ids))
+            conn.execute(f"DELETE FROM session_tabs WHERE session_id IN ({placeholders})", old_ids)
+            conn.execute(f"DELETE FROM browser_sessions WHERE id IN ({placeholders})", old_ids)
+
+    def apply_session_tabs_diff(self, session_id: int, updated: list, inserted: list,
+                                tab_count: int) -> bool:
+        """
+        Actualiza una sesión existente escribiendo solo las pestañas cambiadas.
+
+        Args:
+            session_id: ID de la sesión
+            updated: Pestañas modificadas (dicts con position) en posiciones existentes
+            inserted: Pestañas nuevas (posiciones que la sesión aún no tenía)
+            tab_count: Número total de pestañas (se eliminan las posiciones >= tab_count)
+
+        Returns:
+            bool: False si la sesión ya no existe
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE browser_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (session_id,)
+            )
+            if cursor.rowcount == 0:
+                return False
+
+            if updated:
+                conn.executemany("""
+                    UPDATE session_tabs SET url = ?, title = ?, is_active = ?
+                    WHERE session_id = ? AND position = ?
+                """, [(url, title, is_active, session_id, position)
+                      for url, title, position, is_active in map(self._session_tab_row, updated)])
+            if inserted:
+                conn.executemany("""
+                    INSERT INTO session_tabs (session_id, url, title, position, is_active)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(session_id, *self._session_tab_row(tab)) for tab in inserted])
+            conn.execute(
+                "DELETE FROM session_tabs WHERE session_id = ? AND position >= ?",
+                (session_id, tab_count)
+            )
+
+        logger.debug(f"Sesión {session_id} actualizada: {len(updated)} modificadas, "
+                     f"{len(inserted)} nuevas, {tab_count} en total")
+        return True
+
     def get_sessions(self, include_auto_save: bool = False) -> List[Dict]:
         """
         Obtiene todas las sesiones guardadas.
@@ -2288,7 +2823,7 @@ class DBManager:
                 SELECT id, name, is_auto_save, created_at, updated_at
                 FROM browser_sessions
                 WHERE is_auto_save = 1
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT 1
             """
             result = self.execute_query(query)
@@ -2357,6 +2892,22 @@ class DBManager:
             List[Dict]: Lista de pestañas
         """
         query = f"SELECT * FROM notebook_tabs ORDER BY {order_by} ASC"
+        return [restore_content(tab) for tab in self.execute_query(query)]
+
+    def get_notebook_tab_summaries(self):
+        """
+        Obtener metadatos de las pestañas sin su contenido (carga diferida)
+
+        Returns:
+            List[Dict]: id, title, position, category_id, item_type, updated_at
+                        y content_size (bytes almacenados)
+        """
+        query = """
+            SELECT id, title, position, category_id, item_type, updated_at,
+                   LENGTH(content) AS content_size
+            FROM notebook_tabs
+            ORDER BY position ASC
+        """
         return self.execute_query(query)
 
     def get_notebook_tab(self, tab_id):
@@ -2371,7 +2922,7 @@ class DBManager:
         """
         query = "SELECT * FROM notebook_tabs WHERE id = ?"
         result = self.execute_query(query, (tab_id,))
-        return result[0] if result else None
+        return restore_content(result[0]) if result else None
 
     def add_notebook_tab(self, title='Sin título', position=None):
         """
@@ -2385,12 +2936,8 @@ class DBManager:
             int: ID de la pestaña creada
         """
         if position is None:
-            # Obtener última posición
-            result = self.execute_query(
-                "SELECT MAX(position) as max_pos FROM notebook_tabs"
-            )
-            max_pos = result[0]['max_pos'] if result and result[0]['max_pos'] is not None else -1
-            position = max_pos + 1
+            # Detrás de la última pestaña
+            position = ordering.next_key(self.connect(), ordering.COLLECTIONS['notebook_tabs'])
 
         query = """
             INSERT INTO notebook_tabs (title, position, updated_at)
@@ -2400,6 +2947,32 @@ class DBManager:
         logger.info(f"Notebook tab created: '{title}' (ID: {tab_id}, position: {position})")
         return tab_id
 
+    NOTEBOOK_TAB_FIELDS = (
+        'title', 'content', 'category_id', 'item_type', 'tags',
+        'description', 'is_sensitive', 'is_active', 'is_archived', 'position'
+    )
+
+    def _build_notebook_tab_update(self, tab_id, fields):
+        """Construir (query, params) del UPDATE de una pestaña, o None si no hay campos válidos"""
+        updates = []
+        values = []
+
+        for field, value in fields.items():
+            if field in self.NOTEBOOK_TAB_FIELDS:
+                if field == 'content':
+                    value, content_compressed = self._encode_content(value)
+                    updates.append("content_compressed = ?")
+                    values.append(content_compressed)
+                updates.append(f"{field} = ?")
+                values.append(value)
+
+        if not updates:
+            return None
+
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        values.append(tab_id)
+        return f"UPDATE notebook_tabs SET {', '.join(updates)} WHERE id = ?", tuple(values)
+
     def update_notebook_tab(self, tab_id, **fields):
         """
         Actualizar campos de una pestaña del notebook
@@ -2412,36 +2985,45 @@ class DBManager:
         Returns:
             bool: True si se actualizó correctamente
         """
-        allowed_fields = [
-            'title', 'content', 'category_id', 'item_type', 'tags',
-            'description', 'is_sensitive', 'is_active', 'is_archived', 'position'
-        ]
-
-        updates = []
-        values = []
-
-        for field, value in fields.items():
-            if field in allowed_fields:
-                updates.append(f"{field} = ?")
-                values.append(value)
-
-        if not updates:
+        statement = self._build_notebook_tab_update(tab_id, fields)
+        if statement is None:
             logger.warning(f"No valid fields to update for notebook tab {tab_id}")
             return False
 
-        updates.append("updated_at = CURRENT_TIMESTAMP")
-        values.append(tab_id)
-
-        query = f"UPDATE notebook_tabs SET {', '.join(updates)} WHERE id = ?"
-
         try:
-            self.execute_update(query, tuple(values))
+            self.execute_update(*statement)
             logger.debug(f"Notebook tab updated: ID {tab_id}")
             return True
         except Exception as e:
             logger.error(f"Error updating notebook tab {tab_id}: {e}")
             return False
 
+    def update_notebook_tabs(self, updates):
+        """
+        Actualizar varias pestañas en una sola transacción
+
+        Args:
+            updates: Dict {tab_id: {campo: valor}}
+
+        Returns:
+            List[int]: IDs de las pestañas actualizadas (las inexistentes se omiten)
+        """
+        statements = []
+        for tab_id, fields in updates.items():
+            statement = self._build_notebook_tab_update(tab_id, fields)
+            if statement is not None:
+                statements.append((tab_id, statement))
+        if not statements:
+            return []
+
+        updated = []
+        with self.transaction() as conn:
+            for tab_id, (query, params) in statements:
+                if conn.execute(query, params).rowcount:
+                    updated.append(tab_id)
+        logger.debug(f"Notebook tabs updated in batch: {updated}")
+        return updated
+
     def delete_notebook_tab(self, tab_id):
         """
         Eliminar una pestaña del notebook
@@ -2465,6 +3047,8 @@ class DBManager:
         """
         Reordenar pestañas según lista de IDs
 
+        Solo se reescriben las claves de las pestañas movidas.
+
         Args:
             tab_ids_in_order: Lista de IDs en el orden deseado
 
@@ -2473,13 +3057,8 @@ class DBManager:
         """
         try:
             with self.transaction() as conn:
-                cursor = conn.cursor()
-                for position, tab_id in enumerate(tab_ids_in_order):
-                    cursor.execute(
-                        "UPDATE notebook_tabs SET position = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                        (position, tab_id)
-                    )
-            logger.info(f"Notebook tabs reordered: {len(tab_ids_in_order)} tabs")
+                written = ordering.apply_order(conn, ordering.COLLECTIONS['notebook_tabs'], tab_ids_in_order)
+            logger.info(f"Notebook tabs reordered: {len(tab_ids_in_order)} tabs, {written} keys updated")
             return True
         except Exception as e:
             logger.error(f"Error reordering notebook tabs: {e}")
@@ -1,3 +1,77 @@
 """
 Database migrations module
+
+Las migraciones registradas en SCHEMA_MIGRATIONS se aplican automáticamente
+al abrir la base de datos (DBManager._apply_schema_migrations), en orden y una
+sola vez. La versión aplicada se guarda en PRAGMA user_version.
+
+Cada módulo de migración expone upgrade(conn) y downgrade(conn).
 """
+
+import importlib
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+# (versión, módulo) - Agregar nuevas migraciones siempre al final
+SCHEMA_MIGRATIONS = [
+    (1, 'add_file_storage_stats'),
+    (2, 'add_clipboard_history_dedupe'),
+    (3, 'add_notebook_tabs_table'),
+    (4, 'add_content_compression'),
+    (5, 'add_covering_indexes'),
+    (6, 'add_epoch_timestamps'),
+    (7, 'add_smart_collection_members'),
+    (8, 'add_browser_session_snapshots'),
+    (9, 'add_bookmarks_search_index'),
+    (10, 'add_gapped_order_keys'),
+    (11, 'add_item_usage_summary'),
+    (12, 'migrate_clipboard_history_limit'),
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Obtener la versión de esquema actual (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_pending_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Aplicar las migraciones pendientes en orden
+
+    Cada migración se ejecuta en su propia transacción junto con la
+    actualización de user_version, de modo que un fallo no deja la
+    versión adelantada.
+
+    Args:
+        conn: Conexión SQLite abierta
+
+    Returns:
+        int: Número de migraciones aplicadas
+    """
+    current_version = get_schema_version(conn)
+    applied = 0
+
+    for version, module_name in SCHEMA_MIGRATIONS:
+        if version <= current_version:
+            continue
+
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        logger.info(f"Applying schema migration {version}: {module_name}")
+
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            module.upgrade(conn)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Schema migration {version} ({module_name}) failed: {e}")
+            raise
+
+        applied += 1
+
+    return applied
@@ -0,0 +1,95 @@
+"""
+Migración: Índice de búsqueda de marcadores
+Fecha: 2026-10-19
+Versión: 1.0
+
+Crea bookmarks_fts, tabla FTS5 de contenido externo sobre bookmarks(title, url),
+y los triggers que la mantienen sincronizada. Se usa el tokenizador trigram
+(búsqueda por subcadena, SQLite >= 3.34); si no está disponible se usa el
+tokenizador por defecto con búsqueda por prefijo. Sin FTS5 no se crea nada y
+DBManager.search_bookmarks usa LIKE.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+FTS_TABLE = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5(
+        title, url,
+        content='bookmarks', content_rowid='id'{tokenize}
+    )
+"""
+
+TRIGGERS = {
+    'trg_bookmarks_fts_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_bookmarks_fts_insert
+        AFTER INSERT ON bookmarks
+        BEGIN
+            INSERT INTO bookmarks_fts (rowid, title, url) VALUES (NEW.id, NEW.title, NEW.url);
+        END
+    """,
+    'trg_bookmarks_fts_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_bookmarks_fts_delete
+        AFTER DELETE ON bookmarks
+        BEGIN
+            INSERT INTO bookmarks_fts (bookmarks_fts, rowid, title, url)
+            VALUES ('delete', OLD.id, OLD.title, OLD.url);
+        END
+    """,
+    'trg_bookmarks_fts_update': """
+        CREATE TRIGGER IF NOT EXISTS trg_bookmarks_fts_update
+        AFTER UPDATE OF title, url ON bookmarks
+        BEGIN
+            INSERT INTO bookmarks_fts (bookmarks_fts, rowid, title, url)
+            VALUES ('delete', OLD.id, OLD.title, OLD.url);
+            INSERT INTO bookmarks_fts (rowid, title, url) VALUES (NEW.id, NEW.title, NEW.url);
+        END
+    """,
+}
+
+
+def _create_fts_table(conn) -> bool:
+    """Crear la tabla FTS (trigram o por defecto). False si no hay FTS5"""
+    for tokenize in (", tokenize='trigram'", ""):
+        try:
+            conn.execute(FTS_TABLE.format(tokenize=tokenize))
+            logger.info(f"Table bookmarks_fts created ({'trigram' if tokenize else 'unicode61'})")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Could not create bookmarks_fts{tokenize}: {e}")
+    return False
+
+
+def upgrade(conn):
+    """Crear el índice FTS de marcadores, sus triggers e indexar los existentes"""
+    # La tabla bookmarks se crea en DBManager.create_tables; asegurarla para BDs antiguas
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS bookmarks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            folder TEXT DEFAULT NULL,
+            icon TEXT DEFAULT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            order_index INTEGER DEFAULT 0
+        )
+    """)
+
+    if not _create_fts_table(conn):
+        return
+
+    for name, sql in TRIGGERS.items():
+        conn.execute(sql)
+        logger.info(f"Trigger {name} created")
+
+    conn.execute("INSERT INTO bookmarks_fts (bookmarks_fts) VALUES ('rebuild')")
+
+
+def downgrade(conn):
+    """Eliminar triggers e índice FTS de marcadores"""
+    for name in TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    conn.execute("DROP TABLE IF EXISTS bookmarks_fts")
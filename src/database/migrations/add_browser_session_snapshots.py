@@ -0,0 +1,63 @@
+"""
+Migración: Tablas de sesiones del navegador para snapshots incrementales
+Fecha: 2026-10-19
+Versión: 1.0
+
+Crea browser_sessions y session_tabs si no existen (antes solo las creaba
+el script migrate_add_sessions.py) y agrega el índice (session_id, position)
+que usan las actualizaciones por diferencias del auto-guardado periódico
+(DBManager.apply_session_tabs_diff).
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS browser_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        is_auto_save BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS session_tabs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER NOT NULL,
+        url TEXT NOT NULL,
+        title TEXT DEFAULT 'Nueva pestaña',
+        position INTEGER DEFAULT 0,
+        is_active BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (session_id) REFERENCES browser_sessions(id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_session_tabs_session_id ON session_tabs(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_session_tabs_position ON session_tabs(position)",
+]
+
+INDEXES = {
+    'idx_session_tabs_session_position':
+        "CREATE INDEX IF NOT EXISTS idx_session_tabs_session_position ON session_tabs(session_id, position)",
+    'idx_browser_sessions_auto_save':
+        "CREATE INDEX IF NOT EXISTS idx_browser_sessions_auto_save ON browser_sessions(is_auto_save, id)",
+}
+
+
+def upgrade(conn):
+    """Crear tablas de sesiones (si faltan) e índices para snapshots"""
+    for sql in TABLES:
+        conn.execute(sql)
+    for name, sql in INDEXES.items():
+        conn.execute(sql)
+        logger.info(f"Index {name} created")
+
+
+def downgrade(conn):
+    """Eliminar los índices de snapshots (las tablas de sesiones se conservan)"""
+    for name in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
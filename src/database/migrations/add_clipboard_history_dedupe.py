@@ -0,0 +1,74 @@
+"""
+Migración: Deduplicación y compresión del historial de portapapeles
+Fecha: 2026-10-19
+Versión: 1.0
+
+Agrega a clipboard_history:
+- content_hash: SHA256 del contenido, con índice único (deduplicación)
+- content_size: bytes almacenados (para recortar por tamaño total)
+- is_compressed / compressed_content: payload zlib para entradas grandes
+- copy_count: veces que se copió el mismo contenido
+
+Las entradas duplicadas existentes se fusionan conservando la más reciente.
+"""
+
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+NEW_COLUMNS = {
+    'content_hash': 'TEXT',
+    'content_size': 'INTEGER DEFAULT 0',
+    'is_compressed': 'INTEGER DEFAULT 0',
+    'compressed_content': 'BLOB',
+    'copy_count': 'INTEGER DEFAULT 1',
+}
+
+
+def upgrade(conn):
+    """Agregar columnas, fusionar duplicados y crear índice único por hash"""
+    existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(clipboard_history)")}
+    for column, definition in NEW_COLUMNS.items():
+        if column not in existing_columns:
+            conn.execute(f"ALTER TABLE clipboard_history ADD COLUMN {column} {definition}")
+
+    rows = conn.execute("""
+        SELECT id, content FROM clipboard_history
+        ORDER BY copied_at DESC, id DESC
+    """).fetchall()
+
+    kept = {}  # hash -> (id, copy_count)
+    duplicates = []
+    for row_id, content in rows:
+        raw = (content or '').encode('utf-8', errors='surrogatepass')
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest in kept:
+            kept_id, count = kept[digest]
+            kept[digest] = (kept_id, count + 1)
+            duplicates.append((row_id,))
+        else:
+            kept[digest] = (row_id, 1)
+            conn.execute(
+                "UPDATE clipboard_history SET content_hash = ?, content_size = ? WHERE id = ?",
+                (digest, len(raw), row_id)
+            )
+
+    conn.executemany("DELETE FROM clipboard_history WHERE id = ?", duplicates)
+    conn.executemany(
+        "UPDATE clipboard_history SET copy_count = ? WHERE id = ?",
+        [(count, kept_id) for kept_id, count in kept.values() if count > 1]
+    )
+
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_clipboard_history_hash
+        ON clipboard_history(content_hash)
+    """)
+
+    logger.info(f"Clipboard history deduplicated: {len(duplicates)} duplicate entries merged")
+
+
+def downgrade(conn):
+    """Eliminar índice de deduplicación (las columnas se conservan)"""
+    conn.execute("DROP INDEX IF EXISTS idx_clipboard_history_hash")
@@ -0,0 +1,74 @@
+"""
+Migración: Compresión transparente de contenido grande
+Fecha: 2026-10-19
+Versión: 1.0
+
+Agrega la columna marcador content_compressed a items y notebook_tabs y
+comprime una sola vez el contenido existente que supera el umbral
+(CONTENT_COMPRESSION_THRESHOLD). Los items sensibles (cifrados) no se
+comprimen: el texto cifrado no reduce su tamaño.
+
+El espacio liberado no se devuelve al sistema hasta ejecutar VACUUM.
+"""
+
+import logging
+
+from utils.compression import compress_text, decompress_text, CONTENT_COMPRESSION_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+TABLES = ('items', 'notebook_tabs')
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def upgrade(conn):
+    """Agregar content_compressed y comprimir el contenido grande existente"""
+    for table in TABLES:
+        if not _table_exists(conn, table):
+            continue
+
+        existing_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if 'content_compressed' not in existing_columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN content_compressed INTEGER DEFAULT 0")
+
+        # En items el contenido sensible está cifrado
+        sensitive_filter = "AND COALESCE(is_sensitive, 0) = 0" if table == 'items' else ""
+        rows = conn.execute(f"""
+            SELECT id, content FROM {table}
+            WHERE COALESCE(content_compressed, 0) = 0
+              {sensitive_filter}
+              AND typeof(content) = 'text'
+              AND length(CAST(content AS BLOB)) >= ?
+        """, (CONTENT_COMPRESSION_THRESHOLD,)).fetchall()
+
+        updates = []
+        for row_id, content in rows:
+            payload, is_compressed = compress_text(content, CONTENT_COMPRESSION_THRESHOLD)
+            if is_compressed:
+                updates.append((payload, row_id))
+
+        conn.executemany(
+            f"UPDATE {table} SET content = ?, content_compressed = 1 WHERE id = ?",
+            updates
+        )
+        logger.info(f"{table}: {len(updates)} rows compressed")
+
+
+def downgrade(conn):
+    """Descomprimir el contenido (la columna marcador se conserva a 0)"""
+    for table in TABLES:
+        if not _table_exists(conn, table):
+            continue
+        rows = conn.execute(
+            f"SELECT id, content FROM {table} WHERE content_compressed = 1"
+        ).fetchall()
+        conn.executemany(
+            f"UPDATE {table} SET content = ?, content_compressed = 0 WHERE id = ?",
+            [(decompress_text(content, True), row_id) for row_id, content in rows]
+        )
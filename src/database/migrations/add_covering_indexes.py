@@ -0,0 +1,85 @@
+"""
+Migración: Índices para las consultas frecuentes
+Fecha: 2026-10-19
+Versión: 1.0
+
+Agrega índices dirigidos (algunos parciales) para:
+- Favoritos: WHERE is_favorite = 1 ORDER BY favorite_order, use_count DESC
+- Historial de uso: filtros/agrupaciones por item_id y used_at; las
+  columnas success y execution_time_ms se incluyen para que las
+  estadísticas se resuelvan solo con el índice
+- Duplicados de archivos: WHERE file_hash = ?
+- Ordenación por popularidad: ORDER BY use_count DESC, last_used DESC
+
+También crea item_usage_history si falta (esquema documentado en
+util/DATABASE_SCHEMA.md) y reemplaza los índices simples idx_usage_item_id
+e idx_usage_date, que quedan cubiertos por los nuevos.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+INDEXES = {
+    'idx_items_favorites': """
+        CREATE INDEX IF NOT EXISTS idx_items_favorites
+        ON items(favorite_order, use_count DESC) WHERE is_favorite = 1
+    """,
+    'idx_items_favorites_category': """
+        CREATE INDEX IF NOT EXISTS idx_items_favorites_category
+        ON items(category_id, favorite_order, use_count DESC) WHERE is_favorite = 1
+    """,
+    'idx_items_file_hash': """
+        CREATE INDEX IF NOT EXISTS idx_items_file_hash
+        ON items(file_hash) WHERE file_hash IS NOT NULL
+    """,
+    'idx_items_use_count': """
+        CREATE INDEX IF NOT EXISTS idx_items_use_count
+        ON items(use_count, last_used)
+    """,
+    'idx_usage_item_used_at': """
+        CREATE INDEX IF NOT EXISTS idx_usage_item_used_at
+        ON item_usage_history(item_id, used_at, success, execution_time_ms)
+    """,
+    'idx_usage_used_at': """
+        CREATE INDEX IF NOT EXISTS idx_usage_used_at
+        ON item_usage_history(used_at, item_id, success, execution_time_ms)
+    """,
+}
+
+# Índices anteriores cubiertos por los nuevos (se restauran en downgrade)
+REPLACED_INDEXES = {
+    'idx_usage_item_id': "CREATE INDEX IF NOT EXISTS idx_usage_item_id ON item_usage_history(item_id)",
+    'idx_usage_date': "CREATE INDEX IF NOT EXISTS idx_usage_date ON item_usage_history(used_at)",
+}
+
+
+def upgrade(conn):
+    """Crear item_usage_history si falta y los índices de consultas frecuentes"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS item_usage_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_id INTEGER NOT NULL,
+            used_at TEXT NOT NULL DEFAULT (datetime('now')),
+            execution_time_ms INTEGER DEFAULT 0,
+            success INTEGER DEFAULT 1,
+            error_message TEXT,
+            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+        )
+    """)
+
+    for name, sql in INDEXES.items():
+        conn.execute(sql)
+        logger.info(f"Index {name} created")
+
+    for name in REPLACED_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade(conn):
+    """Eliminar los índices y restaurar los anteriores"""
+    for name in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for sql in REPLACED_INDEXES.values():
+        conn.execute(sql)
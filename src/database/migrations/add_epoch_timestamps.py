@@ -0,0 +1,80 @@
+"""
+Migración: Timestamps epoch indexados en items
+Fecha: 2026-10-19
+Versión: 1.0
+
+Agrega created_at_ts y last_used_ts (segundos Unix, INTEGER) como espejo
+de created_at / last_used (TEXT en UTC). Los filtros avanzados compilados a
+SQL (AdvancedFilterEngine.build_query) comparan contra estas columnas con
+índices en lugar de parsear fechas en Python.
+
+Los triggers mantienen las columnas sincronizadas en cualquier escritura,
+por lo que el código existente que actualiza created_at / last_used no
+necesita cambios.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+EPOCH_COLUMNS = {
+    'created_at_ts': 'created_at',
+    'last_used_ts': 'last_used',
+}
+
+TRIGGERS = {
+    'trg_items_epoch_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_items_epoch_insert
+        AFTER INSERT ON items
+        BEGIN
+            UPDATE items SET
+                created_at_ts = CAST(strftime('%s', NEW.created_at) AS INTEGER),
+                last_used_ts = CAST(strftime('%s', NEW.last_used) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+    """,
+    'trg_items_epoch_update': """
+        CREATE TRIGGER IF NOT EXISTS trg_items_epoch_update
+        AFTER UPDATE OF created_at, last_used ON items
+        BEGIN
+            UPDATE items SET
+                created_at_ts = CAST(strftime('%s', NEW.created_at) AS INTEGER),
+                last_used_ts = CAST(strftime('%s', NEW.last_used) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+    """,
+}
+
+INDEXES = {
+    'idx_items_created_at_ts': "CREATE INDEX IF NOT EXISTS idx_items_created_at_ts ON items(created_at_ts)",
+    'idx_items_last_used_ts': "CREATE INDEX IF NOT EXISTS idx_items_last_used_ts ON items(last_used_ts)",
+}
+
+
+def upgrade(conn):
+    """Agregar columnas epoch, rellenarlas y crear triggers e índices"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(items)")}
+    for column in EPOCH_COLUMNS:
+        if column not in columns:
+            conn.execute(f"ALTER TABLE items ADD COLUMN {column} INTEGER")
+
+    conn.execute("""
+        UPDATE items SET
+            created_at_ts = CAST(strftime('%s', created_at) AS INTEGER),
+            last_used_ts = CAST(strftime('%s', last_used) AS INTEGER)
+    """)
+
+    for sql in TRIGGERS.values():
+        conn.execute(sql)
+    for name, sql in INDEXES.items():
+        conn.execute(sql)
+        logger.info(f"Index {name} created")
+
+
+def downgrade(conn):
+    """Eliminar triggers e índices (las columnas quedan, SQLite no las elimina sin reconstruir)"""
+    for name in TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for name in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
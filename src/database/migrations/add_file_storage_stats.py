@@ -0,0 +1,117 @@
+"""
+Migración: Agregar tabla agregada file_storage_stats
+Fecha: 2026-10-19
+Versión: 1.0
+
+Mantiene totales de archivos almacenados (items PATH con file_hash)
+agrupados por file_type. Los totales se actualizan mediante triggers en
+la misma transacción que crea, modifica o elimina el item, por lo que
+FileManager.get_storage_stats() ya no necesita recorrer el almacenamiento.
+
+También agrega los campos de metadatos de archivos a items si faltan
+(bases de datos creadas con el esquema inicial de DBManager).
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+FILE_METADATA_COLUMNS = {
+    'file_size': 'INTEGER DEFAULT NULL',
+    'file_type': 'VARCHAR(50) DEFAULT NULL',
+    'file_extension': 'VARCHAR(10) DEFAULT NULL',
+    'original_filename': 'VARCHAR(255) DEFAULT NULL',
+    'file_hash': 'VARCHAR(64) DEFAULT NULL',
+}
+
+
+def upgrade(conn):
+    """Crear tabla file_storage_stats, triggers y cargar totales iniciales"""
+    # Asegurar columnas de metadatos de archivos en items
+    existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(items)")}
+    for column, definition in FILE_METADATA_COLUMNS.items():
+        if column not in existing_columns:
+            conn.execute(f"ALTER TABLE items ADD COLUMN {column} {definition}")
+            logger.info(f"Column items.{column} added")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS file_storage_stats (
+            file_type TEXT PRIMARY KEY,
+            file_count INTEGER NOT NULL DEFAULT 0,
+            total_size INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Alta de archivo
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_file_storage_stats_insert
+        AFTER INSERT ON items
+        WHEN NEW.type = 'PATH' AND NEW.file_hash IS NOT NULL
+        BEGIN
+            INSERT INTO file_storage_stats (file_type, file_count, total_size, updated_at)
+            VALUES (COALESCE(NEW.file_type, 'OTROS'), 1, COALESCE(NEW.file_size, 0), CURRENT_TIMESTAMP)
+            ON CONFLICT(file_type) DO UPDATE SET
+                file_count = file_count + 1,
+                total_size = total_size + excluded.total_size,
+                updated_at = CURRENT_TIMESTAMP;
+        END
+    """)
+
+    # Baja de archivo (incluye borrados en cascada desde categories)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_file_storage_stats_delete
+        AFTER DELETE ON items
+        WHEN OLD.type = 'PATH' AND OLD.file_hash IS NOT NULL
+        BEGIN
+            UPDATE file_storage_stats
+            SET file_count = file_count - 1,
+                total_size = total_size - COALESCE(OLD.file_size, 0),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE file_type = COALESCE(OLD.file_type, 'OTROS');
+        END
+    """)
+
+    # Cambio de metadatos: restar valores anteriores y sumar los nuevos
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_file_storage_stats_update
+        AFTER UPDATE OF type, file_type, file_size, file_hash ON items
+        BEGIN
+            UPDATE file_storage_stats
+            SET file_count = file_count - 1,
+                total_size = total_size - COALESCE(OLD.file_size, 0),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE file_type = COALESCE(OLD.file_type, 'OTROS')
+              AND OLD.type = 'PATH' AND OLD.file_hash IS NOT NULL;
+
+            INSERT INTO file_storage_stats (file_type, file_count, total_size, updated_at)
+            SELECT COALESCE(NEW.file_type, 'OTROS'), 1, COALESCE(NEW.file_size, 0), CURRENT_TIMESTAMP
+            WHERE NEW.type = 'PATH' AND NEW.file_hash IS NOT NULL
+            ON CONFLICT(file_type) DO UPDATE SET
+                file_count = file_count + 1,
+                total_size = total_size + excluded.total_size,
+                updated_at = CURRENT_TIMESTAMP;
+        END
+    """)
+
+    # Carga inicial desde los items existentes
+    conn.execute("DELETE FROM file_storage_stats")
+    conn.execute("""
+        INSERT INTO file_storage_stats (file_type, file_count, total_size)
+        SELECT COALESCE(file_type, 'OTROS'), COUNT(*), COALESCE(SUM(file_size), 0)
+        FROM items
+        WHERE type = 'PATH' AND file_hash IS NOT NULL
+        GROUP BY COALESCE(file_type, 'OTROS')
+    """)
+
+    logger.info("Table file_storage_stats created and populated")
+
+
+def downgrade(conn):
+    """Eliminar tabla file_storage_stats y sus triggers"""
+    conn.execute("DROP TRIGGER IF EXISTS trg_file_storage_stats_insert")
+    conn.execute("DROP TRIGGER IF EXISTS trg_file_storage_stats_delete")
+    conn.execute("DROP TRIGGER IF EXISTS trg_file_storage_stats_update")
+    conn.execute("DROP TABLE IF EXISTS file_storage_stats")
+    logger.info("Table file_storage_stats dropped")
@@ -0,0 +1,63 @@
+"""
+Migración: Claves de orden con huecos
+Fecha: 2026-10-19
+Versión: 1.0
+
+Renumera una sola vez las columnas de orden de las colecciones reordenables
+(categories.order_index, items.favorite_order, items.orden_lista por lista,
+speed_dials.position y notebook_tabs.position) a múltiplos de ORDER_GAP,
+conservando el orden actual. A partir de aquí un drag & drop cambia solo la
+clave de la fila movida (ver database.ordering).
+
+No cambia el esquema: las columnas siguen siendo INTEGER.
+"""
+
+import logging
+
+from database.ordering import COLLECTIONS, renormalize
+
+logger = logging.getLogger(__name__)
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def upgrade(conn):
+    """Renumerar las claves de orden existentes"""
+    for name, collection in COLLECTIONS.items():
+        if not _table_exists(conn, collection.table):
+            continue
+        # Sin tocar updated_at: el contenido no cambia
+        written = renormalize(conn, collection._replace(touch=""), min_gap=None)
+        logger.info(f"Order keys for {name} renumbered: {written} rows")
+
+
+def downgrade(conn):
+    """Volver a posiciones consecutivas (0, 1, 2, ... / 1, 2, 3, ... en listas y favoritos)"""
+    for collection in COLLECTIONS.values():
+        if not _table_exists(conn, collection.table):
+            continue
+        start = 1 if collection.table == 'items' else 0
+        group_columns = "".join(f"{column}, " for column in collection.group_by)
+        where = f"WHERE {collection.where}" if collection.where else ""
+        rows = conn.execute(
+            f"SELECT {group_columns}id FROM {collection.table} {where} "
+            f"ORDER BY {group_columns}{collection.column}, id"
+        ).fetchall()
+        size = len(collection.group_by)
+        updates = []
+        previous_group = None
+        position = start
+        for row in rows:
+            group = tuple(row[:size])
+            if group != previous_group:
+                previous_group = group
+                position = start
+            updates.append((position, row[size]))
+            position += 1
+        conn.executemany(
+            f"UPDATE {collection.table} SET {collection.column} = ? WHERE id = ?", updates
+        )
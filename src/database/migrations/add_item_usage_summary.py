@@ -0,0 +1,147 @@
+"""
+Migración: Resumen de uso por item
+Fecha: 2026-10-19
+Versión: 1.0
+
+Crea item_usage_summary (una fila por item con ejecuciones, éxitos, errores,
+tiempo acumulado de las ejecuciones correctas y el último error), la rellena
+desde item_usage_history y la mantiene con triggers: cada registro de uso
+actualiza el resumen en la misma transacción, y los borrados de historial
+(retención, limpieza de items olvidados, borrado en cascada) lo descuentan.
+
+Las estadísticas de un item (UsageTracker.get_item_stats) se leen así con
+una búsqueda por clave primaria en lugar de varios agregados sobre el historial.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+TABLE = """
+    CREATE TABLE IF NOT EXISTS item_usage_summary (
+        item_id INTEGER PRIMARY KEY,
+        executions INTEGER NOT NULL DEFAULT 0,
+        success_count INTEGER NOT NULL DEFAULT 0,
+        error_count INTEGER NOT NULL DEFAULT 0,
+        success_time_ms INTEGER NOT NULL DEFAULT 0,
+        last_error_id INTEGER,
+        last_error_at TEXT,
+        last_error_message TEXT,
+        last_error_time_ms INTEGER
+    )
+"""
+
+# Último error de un item según el historial (para rellenar y tras borrar el último)
+_LAST_ERROR_SQL = """
+    SELECT id, used_at, error_message, execution_time_ms
+    FROM item_usage_history
+    WHERE item_id = {item} AND success = 0
+    ORDER BY used_at DESC, id DESC
+    LIMIT 1
+"""
+
+TRIGGERS = {
+    'trg_usage_summary_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_usage_summary_insert
+        AFTER INSERT ON item_usage_history
+        BEGIN
+            INSERT INTO item_usage_summary (
+                item_id, executions, success_count, error_count, success_time_ms,
+                last_error_id, last_error_at, last_error_message, last_error_time_ms
+            )
+            VALUES (
+                NEW.item_id, 1,
+                CASE WHEN NEW.success = 1 THEN 1 ELSE 0 END,
+                CASE WHEN NEW.success = 0 THEN 1 ELSE 0 END,
+                CASE WHEN NEW.success = 1 THEN COALESCE(NEW.execution_time_ms, 0) ELSE 0 END,
+                CASE WHEN NEW.success = 0 THEN NEW.id END,
+                CASE WHEN NEW.success = 0 THEN NEW.used_at END,
+                CASE WHEN NEW.success = 0 THEN NEW.error_message END,
+                CASE WHEN NEW.success = 0 THEN NEW.execution_time_ms END
+            )
+            ON CONFLICT(item_id) DO UPDATE SET
+                executions = executions + 1,
+                success_count = success_count + excluded.success_count,
+                error_count = error_count + excluded.error_count,
+                success_time_ms = success_time_ms + excluded.success_time_ms,
+                last_error_id = CASE WHEN excluded.last_error_id IS NOT NULL
+                    AND (last_error_at IS NULL OR excluded.last_error_at >= last_error_at)
+                    THEN excluded.last_error_id ELSE last_error_id END,
+                last_error_at = CASE WHEN excluded.last_error_id IS NOT NULL
+                    AND (last_error_at IS NULL OR excluded.last_error_at >= last_error_at)
+                    THEN excluded.last_error_at ELSE last_error_at END,
+                last_error_message = CASE WHEN excluded.last_error_id IS NOT NULL
+                    AND (last_error_at IS NULL OR excluded.last_error_at >= last_error_at)
+                    THEN excluded.last_error_message ELSE last_error_message END,
+                last_error_time_ms = CASE WHEN excluded.last_error_id IS NOT NULL
+                    AND (last_error_at IS NULL OR excluded.last_error_at >= last_error_at)
+                    THEN excluded.last_error_time_ms ELSE last_error_time_ms END;
+        END
+    """,
+    'trg_usage_summary_delete': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_usage_summary_delete
+        AFTER DELETE ON item_usage_history
+        BEGIN
+            UPDATE item_usage_summary SET
+                executions = executions - 1,
+                success_count = success_count - (CASE WHEN OLD.success = 1 THEN 1 ELSE 0 END),
+                error_count = error_count - (CASE WHEN OLD.success = 0 THEN 1 ELSE 0 END),
+                success_time_ms = success_time_ms
+                    - (CASE WHEN OLD.success = 1 THEN COALESCE(OLD.execution_time_ms, 0) ELSE 0 END)
+            WHERE item_id = OLD.item_id;
+
+            UPDATE item_usage_summary
+            SET (last_error_id, last_error_at, last_error_message, last_error_time_ms) = (
+                {_LAST_ERROR_SQL.format(item='OLD.item_id')}
+            )
+            WHERE item_id = OLD.item_id AND last_error_id = OLD.id;
+        END
+    """,
+    'trg_usage_summary_item_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_usage_summary_item_delete
+        AFTER DELETE ON items
+        BEGIN
+            DELETE FROM item_usage_summary WHERE item_id = OLD.id;
+        END
+    """,
+}
+
+
+def upgrade(conn):
+    """Crear item_usage_summary, rellenarla desde el historial y crear los triggers"""
+    conn.execute(TABLE)
+
+    conn.execute("""
+        INSERT OR REPLACE INTO item_usage_summary (
+            item_id, executions, success_count, error_count, success_time_ms
+        )
+        SELECT
+            item_id,
+            COUNT(*),
+            SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN success = 1 THEN COALESCE(execution_time_ms, 0) ELSE 0 END)
+        FROM item_usage_history
+        GROUP BY item_id
+    """)
+    conn.execute(f"""
+        UPDATE item_usage_summary
+        SET (last_error_id, last_error_at, last_error_message, last_error_time_ms) = (
+            {_LAST_ERROR_SQL.format(item='item_usage_summary.item_id')}
+        )
+        WHERE error_count > 0
+    """)
+    count = conn.execute("SELECT COUNT(*) FROM item_usage_summary").fetchone()[0]
+    logger.info(f"Table item_usage_summary created with {count} items")
+
+    for name, sql in TRIGGERS.items():
+        conn.execute(sql)
+        logger.info(f"Trigger {name} created")
+
+
+def downgrade(conn):
+    """Eliminar triggers y tabla de resumen"""
+    for name in TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    conn.execute("DROP TABLE IF EXISTS item_usage_summary")
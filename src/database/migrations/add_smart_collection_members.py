@@ -0,0 +1,114 @@
+"""
+Migración: Pertenencia materializada de Smart Collections
+Fecha: 2026-10-19
+Versión: 1.0
+
+Crea:
+- smart_collection_members: (collection_id, item_id) de cada colección
+- smart_collection_counts: número de items por colección (lectura O(1)),
+  mantenido por triggers sobre smart_collection_members
+- smart_collection_dirty: items insertados/modificados pendientes de
+  reevaluar; SmartCollectionsManager los procesa antes de leer
+
+Los triggers sobre items encolan solo cambios en columnas que usan los
+filtros (no use_count / last_used), y solo si hay colecciones materializadas.
+La evaluación de los filtros se hace en SmartCollectionsManager porque la
+búsqueda de texto necesita content_text() (función Python).
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Columnas de items que intervienen en los filtros de una colección
+FILTER_COLUMNS = (
+    'category_id', 'type', 'is_favorite', 'is_sensitive', 'is_active', 'is_archived',
+    'label', 'content', 'content_compressed', 'tags', 'created_at',
+)
+
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS smart_collection_members (
+        collection_id INTEGER NOT NULL,
+        item_id INTEGER NOT NULL,
+        PRIMARY KEY (collection_id, item_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_smart_collection_members_item
+    ON smart_collection_members(item_id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS smart_collection_counts (
+        collection_id INTEGER PRIMARY KEY,
+        item_count INTEGER NOT NULL DEFAULT 0,
+        built_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS smart_collection_dirty (
+        item_id INTEGER PRIMARY KEY
+    )
+    """,
+]
+
+TRIGGERS = {
+    'trg_scm_member_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_scm_member_insert
+        AFTER INSERT ON smart_collection_members
+        BEGIN
+            UPDATE smart_collection_counts SET item_count = item_count + 1
+            WHERE collection_id = NEW.collection_id;
+        END
+    """,
+    'trg_scm_member_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_scm_member_delete
+        AFTER DELETE ON smart_collection_members
+        BEGIN
+            UPDATE smart_collection_counts SET item_count = item_count - 1
+            WHERE collection_id = OLD.collection_id;
+        END
+    """,
+    'trg_scm_item_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_scm_item_insert
+        AFTER INSERT ON items
+        WHEN EXISTS (SELECT 1 FROM smart_collection_counts)
+        BEGIN
+            INSERT OR IGNORE INTO smart_collection_dirty (item_id) VALUES (NEW.id);
+        END
+    """,
+    'trg_scm_item_update': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_scm_item_update
+        AFTER UPDATE OF {', '.join(FILTER_COLUMNS)} ON items
+        WHEN EXISTS (SELECT 1 FROM smart_collection_counts)
+        BEGIN
+            INSERT OR IGNORE INTO smart_collection_dirty (item_id) VALUES (NEW.id);
+        END
+    """,
+    'trg_scm_item_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_scm_item_delete
+        AFTER DELETE ON items
+        BEGIN
+            DELETE FROM smart_collection_members WHERE item_id = OLD.id;
+            DELETE FROM smart_collection_dirty WHERE item_id = OLD.id;
+        END
+    """,
+}
+
+
+def upgrade(conn):
+    """Crear tablas de pertenencia y triggers (las colecciones se materializan al leerlas)"""
+    for sql in TABLES:
+        conn.execute(sql)
+    for name, sql in TRIGGERS.items():
+        conn.execute(sql)
+        logger.info(f"Trigger {name} created")
+
+
+def downgrade(conn):
+    """Eliminar triggers y tablas de pertenencia"""
+    for name in TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for table in ('smart_collection_dirty', 'smart_collection_counts', 'smart_collection_members'):
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,40 @@
+"""
+Migración: Límite del historial de portapapeles
+Fecha: 2026-10-19
+Versión: 1.0
+
+La setting heredada max_history (número de entradas del historial) pasa a
+clipboard_history_max_entries, que es la que usa DBManager.add_to_history
+para recortar el historial. Si el usuario ya tiene clipboard_history_max_entries
+se conserva; en ambos casos se elimina max_history.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+LEGACY_KEY = 'max_history'
+NEW_KEY = 'clipboard_history_max_entries'
+
+
+def upgrade(conn):
+    """Copiar max_history a clipboard_history_max_entries"""
+    row = conn.execute("SELECT value FROM settings WHERE key = ?", (LEGACY_KEY,)).fetchone()
+    if row is None:
+        return
+
+    conn.execute("""
+        INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)
+    """, (NEW_KEY, row[0]))
+    conn.execute("DELETE FROM settings WHERE key = ?", (LEGACY_KEY,))
+    logger.info(f"Setting {LEGACY_KEY} migrated to {NEW_KEY}")
+
+
+def downgrade(conn):
+    """Restaurar max_history desde clipboard_history_max_entries"""
+    row = conn.execute("SELECT value FROM settings WHERE key = ?", (NEW_KEY,)).fetchone()
+    if row is not None:
+        conn.execute("""
+            INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)
+        """, (LEGACY_KEY, row[0]))
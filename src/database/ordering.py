@@ -0,0 +1,256 @@
+"""
+Ordering keys - Claves de orden con huecos para colecciones reordenables
+
+Las colecciones que el usuario reordena con drag & drop (categorías,
+favoritos, pasos de listas, speed dials y pestañas del notebook) guardan su
+orden en una columna entera con huecos de ORDER_GAP entre filas. Mover un
+elemento solo cambia su propia clave: recibe un valor en el hueco entre sus
+nuevos vecinos. Cuando un hueco se agota, el grupo afectado se renumera
+(renormalize); el mantenimiento en segundo plano renumera de antemano los
+grupos con huecos pequeños.
+"""
+
+import logging
+from bisect import bisect_left
+from itertools import groupby
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Separación entre claves consecutivas tras renumerar
+ORDER_GAP = 1024
+# Grupos con algún hueco menor se renumeran en el mantenimiento
+RENORMALIZE_MIN_GAP = 8
+
+
+class OrderedCollection(NamedTuple):
+    """Tabla y columna de orden de una colección reordenable"""
+    table: str
+    column: str
+    group_by: Tuple[str, ...] = ()  # Columnas que separan grupos independientes
+    where: str = ""                 # Filtro de pertenencia a la colección
+    touch: str = ""                 # Asignaciones extra al cambiar la clave
+
+
+COLLECTIONS: Dict[str, OrderedCollection] = {
+    'categories': OrderedCollection(
+        'categories', 'order_index', touch="updated_at = CURRENT_TIMESTAMP"
+    ),
+    'favorites': OrderedCollection(
+        'items', 'favorite_order', where="is_favorite = 1", touch="updated_at = CURRENT_TIMESTAMP"
+    ),
+    'list_items': OrderedCollection(
+        'items', 'orden_lista', group_by=('category_id', 'list_group'), where="is_list = 1 AND is_active = 1"
+    ),
+    'speed_dials': OrderedCollection('speed_dials', 'position'),
+    'notebook_tabs': OrderedCollection(
+        'notebook_tabs', 'position', touch="updated_at = CURRENT_TIMESTAMP"
+    ),
+}
+
+
+# ==================== Cálculo de claves ====================
+
+def spaced_keys(count: int) -> List[int]:
+    """Claves renumeradas para count filas (ORDER_GAP, 2*ORDER_GAP, ...)"""
+    return [ORDER_GAP * (index + 1) for index in range(count)]
+
+
+def key_after(key) -> int:
+    """Clave para agregar detrás de la última (None = colección vacía)"""
+    return ORDER_GAP if key is None else int(key) + ORDER_GAP
+
+
+def _increasing_positions(keys: Sequence) -> set:
+    """Posiciones de la subsecuencia estrictamente creciente más larga (ignora None)"""
+    tails: List = []            # Menor clave final de cada longitud
+    tail_positions: List[int] = []
+    previous: Dict[int, Optional[int]] = {}
+
+    for position, key in enumerate(keys):
+        if key is None:
+            continue
+        length = bisect_left(tails, key)
+        if length == len(tails):
+            tails.append(key)
+            tail_positions.append(position)
+        else:
+            tails[length] = key
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else None
+
+    kept = set()
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        kept.add(position)
+        position = previous[position]
+    return kept
+
+
+def _fill_gap(count: int, low, high) -> Optional[List[int]]:
+    """count claves crecientes entre low y high (None = sin límite)"""
+    if count == 0:
+        return []
+    if low is None and high is None:
+        return spaced_keys(count)
+    if low is None:
+        return [int(high) - ORDER_GAP * (count - index) for index in range(count)]
+    if high is None:
+        return [int(low) + ORDER_GAP * (index + 1) for index in range(count)]
+    if high - low <= count:
+        return None
+    step = (high - low) / (count + 1)
+    return [int(low + step * (index + 1)) for index in range(count)]
+
+
+def plan_reorder(current: Dict[int, object], ordered_ids: Sequence[int]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Claves mínimas a cambiar para que ordered_ids quede en ese orden
+
+    Las filas cuyas claves ya están en orden creciente (la subsecuencia más
+    larga) se conservan; las demás reciben claves repartidas en el hueco
+    entre sus vecinas conservadas. Mover un elemento cambia una sola clave.
+
+    Args:
+        current: Clave actual de cada fila {id: clave}
+        ordered_ids: IDs en el orden deseado
+
+    Returns:
+        List[(id, clave)] a escribir, o None si algún hueco no alcanza
+    """
+    keys = [current.get(row_id) for row_id in ordered_ids]
+    kept = _increasing_positions(keys)
+
+    updates: List[Tuple[int, int]] = []
+    pending: List[int] = []
+    low = None
+    for position, row_id in enumerate(ordered_ids):
+        if position not in kept:
+            pending.append(row_id)
+            continue
+        filled = _fill_gap(len(pending), low, keys[position])
+        if filled is None:
+            return None
+        updates.extend(zip(pending, filled))
+        pending = []
+        low = keys[position]
+
+    updates.extend(zip(pending, _fill_gap(len(pending), low, None)))
+    return updates
+
+
+# ==================== Acceso a la base de datos ====================
+
+def _group_filter(collection: OrderedCollection, group: Sequence) -> Tuple[str, tuple]:
+    conditions = [collection.where] if collection.where else []
+    conditions.extend(f"{column} IS ?" for column in collection.group_by)
+    clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return clause, tuple(group)
+
+
+def load_order(conn, collection: OrderedCollection, group: Sequence = ()) -> List[Tuple[int, object]]:
+    """[(id, clave)] de un grupo en su orden actual"""
+    clause, params = _group_filter(collection, group)
+    rows = conn.execute(
+        f"SELECT id, {collection.column} FROM {collection.table} {clause} "
+        f"ORDER BY {collection.column}, id",
+        params
+    ).fetchall()
+    return [(row[0], row[1]) for row in rows]
+
+
+def write_keys(conn, collection: OrderedCollection, updates: Sequence[Tuple[int, int]]) -> int:
+    """Escribir claves nuevas [(id, clave)]; devuelve filas escritas"""
+    if not updates:
+        return 0
+    assignments = f"{collection.column} = ?" + (f", {collection.touch}" if collection.touch else "")
+    conn.executemany(
+        f"UPDATE {collection.table} SET {assignments} WHERE id = ?",
+        [(key, row_id) for row_id, key in updates]
+    )
+    return len(updates)
+
+
+def next_key(conn, collection: OrderedCollection, group: Sequence = ()) -> int:
+    """Clave para agregar una fila al final del grupo"""
+    clause, params = _group_filter(collection, group)
+    row = conn.execute(
+        f"SELECT MAX({collection.column}) FROM {collection.table} {clause}", params
+    ).fetchone()
+    return key_after(row[0] if row else None)
+
+
+def apply_order(conn, collection: OrderedCollection, ordered_ids: Sequence[int], group: Sequence = ()) -> int:
+    """
+    Guardar un orden nuevo cambiando el menor número de claves
+
+    Los IDs que no pertenecen al grupo se ignoran. Si no queda hueco, el
+    grupo se renumera completo en el orden pedido (las filas no incluidas en
+    ordered_ids quedan al final, en su orden actual).
+
+    Returns:
+        int: Filas escritas
+    """
+    rows = load_order(conn, collection, group)
+    current = dict(rows)
+    seen = set()
+    ordered_ids = [row_id for row_id in ordered_ids
+                   if row_id in current and not (row_id in seen or seen.add(row_id))]
+
+    updates = plan_reorder(current, ordered_ids)
+    if updates is None:
+        full_order = ordered_ids + [row_id for row_id, _ in rows if row_id not in seen]
+        updates = [(row_id, key) for row_id, key in zip(full_order, spaced_keys(len(full_order)))
+                   if current[row_id] != key]
+        logger.debug(f"{collection.table}.{collection.column}: no gap left, renumbered {len(updates)} rows")
+    return write_keys(conn, collection, updates)
+
+
+def move_to_position(conn, collection: OrderedCollection, row_id: int, position: int,
+                     group: Sequence = ()) -> Optional[int]:
+    """
+    Mover una fila a una posición (0-based) dentro de su grupo
+
+    Returns:
+        int: Filas escritas (1 salvo renumeración), None si la fila no está en el grupo
+    """
+    ordered_ids = [current_id for current_id, _ in load_order(conn, collection, group)]
+    if row_id not in ordered_ids:
+        return None
+    ordered_ids.remove(row_id)
+    ordered_ids.insert(max(0, min(position, len(ordered_ids))), row_id)
+    return apply_order(conn, collection, ordered_ids, group)
+
+
+def renormalize(conn, collection: OrderedCollection, min_gap: Optional[int] = RENORMALIZE_MIN_GAP) -> int:
+    """
+    Renumerar los grupos con huecos agotados o claves repetidas
+
+    Args:
+        conn: Conexión SQLite
+        collection: Colección a revisar
+        min_gap: Hueco mínimo aceptable (None = renumerar todos los grupos)
+
+    Returns:
+        int: Filas escritas
+    """
+    group_columns = "".join(f"{column}, " for column in collection.group_by)
+    where = f"WHERE {collection.where}" if collection.where else ""
+    rows = conn.execute(
+        f"SELECT {group_columns}id, {collection.column} FROM {collection.table} {where} "
+        f"ORDER BY {group_columns}{collection.column}, id"
+    ).fetchall()
+
+    size = len(collection.group_by)
+    written = 0
+    for _, group_rows in groupby(rows, key=lambda row: tuple(row[:size])):
+        entries = [(row[size], row[size + 1]) for row in group_rows]
+        keys = [key for _, key in entries]
+        if min_gap is not None and None not in keys and all(
+                later - earlier >= min_gap for earlier, later in zip(keys, keys[1:])):
+            continue
+        updates = [(row_id, key) for (row_id, old_key), key in zip(entries, spaced_keys(len(entries)))
+                   if old_key != key]
+        written += write_keys(conn, collection, updates)
+    return written
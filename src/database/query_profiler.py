@@ -0,0 +1,361 @@
+"""
+Query Profiler - Instrumentación de consultas SQLite
+
+Las conexiones creadas con `factory=ProfiledConnection` miden cada sentencia
+(ejecución + primer fetch) y acumulan, por SQL normalizado, un histograma de
+latencias. Las sentencias que superan el umbral se registran en un log de
+consultas lentas junto con su EXPLAIN QUERY PLAN, y la primera vez que se ve
+una sentencia sobre `items` o `item_usage_history` se comprueba si hace un
+recorrido completo de la tabla (SCAN sin índice).
+
+La medición está desactivada por defecto; se activa desde el panel de
+desarrollo o con el ajuste `query_profiler_enabled`.
+
+Uso:
+    conn = sqlite3.connect(path, factory=ProfiledConnection)
+    get_query_profiler().enabled = True
+    get_query_profiler().snapshot()
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+SLOW_QUERY_THRESHOLD_MS = 50.0
+SLOW_LOG_SIZE = 200
+# Límites superiores (ms) de cada cubeta del histograma; la última es +inf
+HISTOGRAM_BOUNDS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+# Tablas grandes en las que un SCAN sin índice es un problema
+WATCHED_TABLES = ('items', 'item_usage_history')
+
+_EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE')
+_SQL_KEYWORDS = {
+    'WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS', 'ON', 'USING',
+    'ORDER', 'GROUP', 'LIMIT', 'HAVING', 'UNION', 'SET', 'AS', 'NATURAL',
+}
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACES_RE = re.compile(r"\s+")
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_SCAN_RE = re.compile(r"^SCAN (\w+)(.*)$")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(sql: str) -> str:
+    """
+    Clave de agrupación de una sentencia: espacios colapsados, literales
+    reemplazados por ? y listas IN (?, ?, ...) reducidas a IN (?...)
+    """
+    normalized = _STRING_RE.sub('?', sql)
+    normalized = _NUMBER_RE.sub('?', normalized)
+    normalized = _SPACES_RE.sub(' ', normalized).strip().rstrip(';')
+    return _IN_LIST_RE.sub('IN (?...)', normalized)
+
+
+def _table_aliases(sql: str) -> Dict[str, str]:
+    """Alias (o nombre) -> tabla, según las cláusulas FROM/JOIN"""
+    aliases = {}
+    for table, alias in _TABLE_RE.findall(sql):
+        aliases[table] = table
+        if alias and alias.upper() not in _SQL_KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+def statement_tables(sql: str) -> List[str]:
+    """Tablas (nombres completos) de las cláusulas FROM/JOIN/UPDATE/INTO"""
+    return [table for table, _ in _TABLE_RE.findall(sql)]
+
+
+def detect_full_scans(sql: str, plan: Sequence[Sequence[Any]]) -> List[str]:
+    """
+    Tablas vigiladas que el plan recorre completas
+
+    Args:
+        sql: Sentencia original (para resolver alias)
+        plan: Filas de EXPLAIN QUERY PLAN (id, parent, notused, detail)
+
+    Returns:
+        List[str]: Nombres de tabla (sin repetir) con SCAN sin índice
+    """
+    aliases = _table_aliases(sql)
+    tables = []
+    for row in plan:
+        match = _SCAN_RE.match(str(row[3]))
+        if not match or 'INDEX' in match.group(2):
+            continue
+        table = aliases.get(match.group(1), match.group(1))
+        if table in WATCHED_TABLES and table not in tables:
+            tables.append(table)
+    return tables
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: Any = ()) -> List[tuple]:
+    """EXPLAIN QUERY PLAN de la sentencia (lista vacía si no aplica)"""
+    if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+        return []
+    try:
+        cursor = conn.cursor(sqlite3.Cursor).execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [tuple(row) for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        logger.debug(f"EXPLAIN failed: {e}")
+        return []
+
+
+class QueryStats:
+    """Estadísticas acumuladas de una sentencia normalizada"""
+
+    __slots__ = ('sql', 'count', 'total_ms', 'max_ms', 'buckets', 'plan', 'full_scans', 'checked')
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.plan: List[tuple] = []
+        self.full_scans: List[str] = []
+        self.checked = False
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Percentil aproximado (límite superior de la cubeta)"""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return HISTOGRAM_BOUNDS_MS[index] if index < len(HISTOGRAM_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'sql': self.sql,
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max_ms, 3),
+            'histogram': list(self.buckets),
+            'plan': [row[3] for row in self.plan],
+            'full_scans': list(self.full_scans),
+        }
+
+
+class QueryProfiler:
+    """Acumula las mediciones de todas las conexiones perfiladas"""
+
+    def __init__(self, slow_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+                 slow_log_size: int = SLOW_LOG_SIZE):
+        # Desactivado por defecto: sin coste por sentencia salvo que se pida
+        self.enabled = False
+        self.slow_threshold_ms = slow_threshold_ms
+        self._stats: Dict[str, QueryStats] = {}
+        self._slow_log = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measuring(self, enabled: bool = True):
+        """Activar (o desactivar) la medición durante el bloque y restaurar el estado previo"""
+        previous = self.enabled
+        self.enabled = enabled
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    def record(self, conn: Optional[sqlite3.Connection], sql: str, params: Any,
+               elapsed_ms: float) -> None:
+        """
+        Registrar una ejecución
+
+        Args:
+            conn: Conexión usada (para EXPLAIN); None si no se debe explicar
+            sql: Sentencia tal como se ejecutó
+            params: Parámetros de la sentencia
+            elapsed_ms: Duración medida
+        """
+        key = normalize_sql(sql)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = QueryStats(key)
+            stats.add(elapsed_ms)
+            # Sin conexión no hay plan: la comprobación queda para otra ejecución
+            check = conn is not None and not stats.checked
+            if check:
+                stats.checked = True
+
+        slow = elapsed_ms >= self.slow_threshold_ms
+        if not (check or slow):
+            return
+
+        # Plan solo la primera vez (tablas vigiladas) y en cada consulta lenta
+        watched = any(table in WATCHED_TABLES for table in statement_tables(key))
+        plan = explain(conn, sql, params) if conn is not None and (slow or watched) else []
+        full_scans = detect_full_scans(sql, plan)
+
+        if check and plan:
+            with self._lock:
+                stats.plan = plan
+                stats.full_scans = full_scans
+            if full_scans:
+                logger.info(f"Full table scan on {', '.join(full_scans)}: {key}")
+
+        if slow:
+            entry = {
+                'at': datetime.now().isoformat(timespec='seconds'),
+                'elapsed_ms': round(elapsed_ms, 3),
+                'sql': key,
+                'plan': [row[3] for row in plan],
+                'full_scans': full_scans,
+            }
+            with self._lock:
+                self._slow_log.append(entry)
+            plan_text = "; ".join(entry['plan']) or "n/a"
+            logger.warning(f"Slow query ({elapsed_ms:.1f} ms): {key} | plan: {plan_text}")
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Estadísticas por sentencia, de mayor a menor tiempo total"""
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._stats.values()]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Log de consultas lentas (más reciente primero)"""
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def full_scans(self) -> List[Dict[str, Any]]:
+        """Sentencias con recorrido completo de una tabla vigilada"""
+        return [row for row in self.snapshot() if row['full_scans']]
+
+    def reset(self) -> None:
+        """Borrar estadísticas y log"""
+        with self._lock:
+            self._stats.clear()
+            self._slow_log.clear()
+
+
+_profiler = QueryProfiler()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Profiler global del proceso"""
+    return _profiler
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """
+    Cursor que mide cada sentencia
+
+    La medición incluye el primer fetch*() posterior (SQLite evalúa las
+    consultas de forma perezosa); se cierra en el siguiente execute, en
+    close() o al destruir el cursor.
+    """
+
+    _pending = None
+
+    def _flush(self, explainable: bool = True) -> None:
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            sql, params, elapsed_ms, can_explain = pending
+            conn = self.connection if explainable and can_explain else None
+            _profiler.record(conn, sql, params, elapsed_ms)
+
+    def _measure(self, method, sql, params, explainable):
+        self._flush()
+        if not _profiler.enabled:
+            return method(self, sql, params)
+        start = time.perf_counter()
+        try:
+            return method(self, sql, params)
+        finally:
+            self._pending = (sql, params, (time.perf_counter() - start) * 1000, explainable)
+
+    def execute(self, sql, parameters=()):
+        return self._measure(sqlite3.Cursor.execute, sql, parameters, True)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._measure(sqlite3.Cursor.executemany, sql, seq_of_parameters, False)
+
+    def executescript(self, sql_script):
+        self._flush()
+        if not _profiler.enabled:
+            return super().executescript(sql_script)
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            _profiler.record(None, sql_script, (), (time.perf_counter() - start) * 1000)
+
+    def _timed_fetch(self, method, *args):
+        if self._pending is None:
+            return method(self, *args)
+        start = time.perf_counter()
+        try:
+            return method(self, *args)
+        finally:
+            sql, params, elapsed_ms, explainable = self._pending
+            self._pending = (sql, params, elapsed_ms + (time.perf_counter() - start) * 1000, explainable)
+            self._flush()
+
+    def fetchone(self):
+        return self._timed_fetch(sqlite3.Cursor.fetchone)
+
+    def fetchmany(self, size=None):
+        if size is None:
+            return self._timed_fetch(sqlite3.Cursor.fetchmany)
+        return self._timed_fetch(sqlite3.Cursor.fetchmany, size)
+
+    def fetchall(self):
+        return self._timed_fetch(sqlite3.Cursor.fetchall)
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def __del__(self):
+        # Sin EXPLAIN: el recolector puede destruir el cursor en cualquier hilo
+        try:
+            self._flush(explainable=False)
+        except Exception:
+            pass
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Conexión cuyos cursores (incluidos los de execute()) son ProfiledCursor"""
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
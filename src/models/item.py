@@ -5,6 +5,8 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 
+from utils.compression import decompress_text
+
 
 class ItemType(Enum):
     """Enum for different types of items"""
@@ -41,11 +43,14 @@ class Item:
         file_type: Optional[str] = None,
         file_extension: Optional[str] = None,
         original_filename: Optional[str] = None,
-        file_hash: Optional[str] = None
+        file_hash: Optional[str] = None,
+        # Contenido tal como está almacenado (zlib) - se descomprime al primer acceso
+        content_compressed: bool = False
     ):
         self.id = item_id
         self.label = label
         self.content = content
+        self._content_compressed = content_compressed
         self.type = item_type if isinstance(item_type, ItemType) else ItemType(item_type)
         self.icon = icon
         self.is_sensitive = is_sensitive
@@ -69,6 +74,19 @@ class Item:
         self.created_at = datetime.now()
         self.last_used = datetime.now()
 
+    @property
+    def content(self) -> str:
+        """Contenido del item (descomprimido bajo demanda)"""
+        if self._content_compressed:
+            self._content = decompress_text(self._content, True)
+            self._content_compressed = False
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._content_compressed = False
+
     def update_last_used(self) -> None:
         """Update the last used timestamp"""
         self.last_used = datetime.now()
@@ -0,0 +1,102 @@
+"""
+Compression helpers - Compresión zlib transparente para contenido grande
+"""
+
+import hashlib
+import zlib
+from typing import Dict, Tuple, Union
+
+# Contenido por debajo de este tamaño (bytes UTF-8) se guarda sin comprimir
+DEFAULT_COMPRESSION_THRESHOLD = 4096
+# Umbral para items.content / notebook_tabs.content (sobrescribible en settings)
+CONTENT_COMPRESSION_THRESHOLD = 16 * 1024
+COMPRESSION_LEVEL = 6
+
+
+def content_hash(text: str) -> str:
+    """SHA256 hexadecimal del texto (UTF-8)"""
+    return hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def compress_text(text: str, threshold: int = DEFAULT_COMPRESSION_THRESHOLD) -> Tuple[Union[str, bytes], bool]:
+    """
+    Comprimir texto si supera el umbral y la compresión ahorra espacio
+
+    Args:
+        text: Texto original
+        threshold: Tamaño mínimo en bytes para intentar comprimir
+
+    Returns:
+        Tuple (payload, is_compressed): bytes zlib si se comprimió, o el texto original
+    """
+    if text is None:
+        return text, False
+
+    raw = text.encode('utf-8', errors='surrogatepass')
+    if len(raw) < threshold:
+        return text, False
+
+    compressed = zlib.compress(raw, COMPRESSION_LEVEL)
+    if len(compressed) >= len(raw):
+        return text, False
+    return compressed, True
+
+
+def decompress_text(payload: Union[str, bytes, None], is_compressed: bool) -> Union[str, None]:
+    """
+    Revertir compress_text
+
+    Args:
+        payload: Valor almacenado
+        is_compressed: Marcador de compresión almacenado junto al valor
+
+    Returns:
+        str: Texto original
+    """
+    if not is_compressed or payload is None:
+        return payload
+    return zlib.decompress(payload).decode('utf-8', errors='surrogatepass')
+
+
+def payload_size(payload: Union[str, bytes, None]) -> int:
+    """Tamaño en bytes de un valor almacenado"""
+    if payload is None:
+        return 0
+    if isinstance(payload, bytes):
+        return len(payload)
+    return len(payload.encode('utf-8', errors='surrogatepass'))
+
+
+def restore_content(row: Dict, column: str = 'content', flag: str = 'content_compressed') -> Dict:
+    """
+    Descomprimir en sitio el contenido de una fila (items / notebook_tabs)
+
+    Args:
+        row: Fila como diccionario
+        column: Columna de contenido
+        flag: Columna marcador de compresión
+
+    Returns:
+        Dict: La misma fila, con el contenido en texto plano
+    """
+    if row.get(flag):
+        row[column] = decompress_text(row[column], True)
+        row[flag] = 0
+    return row
+
+
+def _sql_content_text(payload, is_compressed):
+    if is_compressed and isinstance(payload, bytes):
+        return decompress_text(payload, True)
+    return payload
+
+
+def register_sqlite_functions(conn) -> None:
+    """
+    Registrar content_text(content, content_compressed) en una conexión SQLite
+
+    Permite aplicar LIKE sobre contenido comprimido:
+        CASE WHEN content_compressed = 1
+             THEN content_text(content, 1) ELSE content END LIKE ?
+    """
+    conn.create_function('content_text', 2, _sql_content_text, deterministic=True)
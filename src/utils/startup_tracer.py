@@ -0,0 +1,239 @@
+"""
+Startup Tracer - Medición de las fases de arranque
+
+Registra spans (nombre, inicio, duración, profundidad) alrededor de cada
+fase del arranque y guarda un timeline por ejecución en un archivo JSON con
+los últimos MAX_LAUNCHES arranques.
+
+El tracer solo mide entre start() y finish(): fuera de ese intervalo
+startup_span() no hace nada, por lo que el código compartido (DBManager,
+MainController, MainWindow) puede instrumentarse sin coste en tests ni
+después del arranque.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+TIMELINE_FILENAME = "startup_timeline.json"
+MAX_LAUNCHES = 30
+# Una fase es regresión si supera la mediana previa en este factor...
+REGRESSION_FACTOR = 1.25
+# ...y en al menos estos milisegundos (evita ruido en fases muy cortas)
+REGRESSION_MIN_MS = 20.0
+
+
+class StartupTracer:
+    """Acumula los spans de un arranque"""
+
+    def __init__(self):
+        self._origin: Optional[float] = None
+        self._finished = False
+        self._spans: List[Dict[str, Any]] = []
+        self._metadata: Dict[str, Any] = {}
+        self._started_at: Optional[str] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.output_path: Optional[Path] = None
+
+    @property
+    def active(self) -> bool:
+        """True entre start() y finish()"""
+        return self._origin is not None and not self._finished
+
+    def start(self, origin: Optional[float] = None, output_path: Optional[Path] = None) -> None:
+        """
+        Iniciar la medición
+
+        Args:
+            origin: Instante de referencia (time.perf_counter) - por defecto ahora
+            output_path: Archivo JSON donde se guardará el timeline
+        """
+        self._origin = origin if origin is not None else time.perf_counter()
+        self._finished = False
+        self._spans = []
+        self._metadata = {}
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+        if output_path is not None:
+            self.output_path = Path(output_path)
+
+    def _ms(self, instant: float) -> float:
+        return round((instant - self._origin) * 1000, 2)
+
+    def record(self, name: str, start: float, end: float, depth: int = 0) -> None:
+        """Registrar un span medido externamente (p.ej. imports previos a start())"""
+        if not self.active:
+            return
+        with self._lock:
+            self._spans.append({
+                'name': name,
+                'start_ms': self._ms(start),
+                'duration_ms': round((end - start) * 1000, 2),
+                'depth': depth,
+            })
+
+    @contextmanager
+    def span(self, name: str):
+        """Medir el bloque como una fase de arranque (no-op si no está activo)"""
+        if not self.active:
+            yield
+            return
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        depth = len(stack)
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            self.record(name, start, end, depth)
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Adjuntar un dato al timeline (nº de items, login interactivo, ...)"""
+        if self.active:
+            self._metadata[key] = value
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        Terminar la medición
+
+        Returns:
+            Optional[Dict]: Timeline del arranque o None si no estaba activo
+        """
+        if not self.active:
+            return None
+        total_ms = self._ms(time.perf_counter())
+        self._finished = True
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: (s['start_ms'], s['depth']))
+        return {
+            'started_at': self._started_at,
+            'total_ms': total_ms,
+            'spans': spans,
+            'metadata': dict(self._metadata),
+        }
+
+
+_tracer = StartupTracer()
+
+
+def get_startup_tracer() -> StartupTracer:
+    """Tracer global del proceso"""
+    return _tracer
+
+
+def startup_span(name: str):
+    """Atajo para get_startup_tracer().span(name)"""
+    return _tracer.span(name)
+
+
+# ========== PERSISTENCIA ==========
+
+def load_launches(path: Path) -> List[Dict[str, Any]]:
+    """
+    Leer los timelines guardados (del más antiguo al más reciente)
+
+    Returns:
+        List[Dict]: Arranques; lista vacía si el archivo no existe o está dañado
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return list(data.get('launches', []))
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"Could not read startup timeline {path}: {e}")
+        return []
+
+
+def save_launch(launch: Dict[str, Any], path: Path, max_launches: int = MAX_LAUNCHES) -> None:
+    """Agregar un arranque al archivo, conservando solo los últimos max_launches"""
+    path = Path(path)
+    launches = load_launches(path)
+    launches.append(launch)
+    launches = launches[-max_launches:]
+
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'launches': launches}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# ========== COMPARACIÓN ==========
+
+def _phase_totals(launch: Dict[str, Any]) -> Dict[str, float]:
+    """Duración por fase (las fases repetidas se suman)"""
+    totals: Dict[str, float] = {}
+    for span in launch.get('spans', []):
+        totals[span['name']] = totals.get(span['name'], 0.0) + span['duration_ms']
+    totals['total'] = launch.get('total_ms', 0.0)
+    return totals
+
+
+def compare_launches(launches: List[Dict[str, Any]], last_n: int = 10) -> Dict[str, Any]:
+    """
+    Comparar los últimos N arranques fase a fase
+
+    La línea base de cada fase es la mediana de los arranques anteriores al
+    más reciente; se marca regresión cuando el último la supera en
+    REGRESSION_FACTOR y REGRESSION_MIN_MS.
+
+    Args:
+        launches: Arranques del más antiguo al más reciente (load_launches)
+        last_n: Número de arranques a comparar
+
+    Returns:
+        Dict: {'launches': [...más reciente primero], 'phases': [{'name',
+              'depth', 'durations', 'baseline_ms', 'latest_ms', 'regression'}]}
+    """
+    recent = list(reversed(launches[-last_n:])) if last_n > 0 else []
+    totals = [_phase_totals(launch) for launch in recent]
+
+    # Orden de fases: el del arranque más reciente, luego las que ya no aparecen
+    names: List[str] = []
+    depths: Dict[str, int] = {}
+    for launch in recent:
+        for span in launch.get('spans', []):
+            if span['name'] not in depths:
+                names.append(span['name'])
+                depths[span['name']] = span.get('depth', 0)
+    names.append('total')
+    depths['total'] = 0
+
+    phases = []
+    for name in names:
+        durations = [phase.get(name) for phase in totals]
+        latest = durations[0] if durations else None
+        previous = [d for d in durations[1:] if d is not None]
+        baseline = median(previous) if previous else None
+        regression = (
+            latest is not None and baseline is not None
+            and latest > baseline * REGRESSION_FACTOR
+            and latest - baseline >= REGRESSION_MIN_MS
+        )
+        phases.append({
+            'name': name,
+            'depth': depths[name],
+            'durations': durations,
+            'baseline_ms': baseline,
+            'latest_ms': latest,
+            'regression': regression,
+        })
+
+    return {'launches': recent, 'phases': phases}
@@ -7,100 +7,53 @@ Date: 2025-11-02
 import logging
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QScrollArea, QFrame
+    QPushButton, QLineEdit, QListView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QTimer
+from PyQt6.QtGui import QShortcut, QKeySequence
 
 logger = logging.getLogger(__name__)
 
 
-class BookmarkItemWidget(QWidget):
-    """Widget para mostrar un marcador individual."""
+# Número máximo de resultados de búsqueda mostrados en el panel
+SEARCH_RESULT_LIMIT = 500
+# Espera tras la última pulsación antes de buscar (ms)
+SEARCH_DEBOUNCE_MS = 150
 
-    delete_clicked = pyqtSignal(int)  # bookmark_id
-    bookmark_clicked = pyqtSignal(str)  # url
 
-    def __init__(self, bookmark_id: int, title: str, url: str, parent=None):
-        super().__init__(parent)
-        self.bookmark_id = bookmark_id
-        self.title = title
-        self.url = url
+class BookmarksListModel(QAbstractListModel):
+    """Modelo de marcadores para un QListView (solo se pintan las filas visibles)."""
 
-        self._setup_ui()
+    BookmarkIdRole = Qt.ItemDataRole.UserRole + 1
+    UrlRole = Qt.ItemDataRole.UserRole + 2
 
-    def _setup_ui(self):
-        """Configura la interfaz del widget de marcador."""
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-
-        # Contenedor para título y URL
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-
-        # Título (clickeable)
-        self.title_label = QLabel(self.title)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #00d4ff;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QLabel:hover {
-                color: #00ff00;
-                text-decoration: underline;
-            }
-        """)
-        self.title_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.title_label.mousePressEvent = lambda e: self.bookmark_clicked.emit(self.url)
-        info_layout.addWidget(self.title_label)
-
-        # URL (truncada si es muy larga)
-        truncated_url = self.url[:60] + "..." if len(self.url) > 60 else self.url
-        self.url_label = QLabel(truncated_url)
-        self.url_label.setStyleSheet("""
-            QLabel {
-                color: #808080;
-                font-size: 10px;
-            }
-        """)
-        self.url_label.setToolTip(self.url)
-        info_layout.addWidget(self.url_label)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bookmarks = []
 
-        layout.addLayout(info_layout, 1)
+    def set_bookmarks(self, bookmarks):
+        """Reemplaza la lista de marcadores."""
+        self.beginResetModel()
+        self._bookmarks = list(bookmarks)
+        self.endResetModel()
 
-        # Botón eliminar
-        self.delete_btn = QPushButton("✕")
-        self.delete_btn.setFixedSize(25, 25)
-        self.delete_btn.setToolTip("Eliminar marcador")
-        self.delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self.bookmark_id))
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff0000;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-        """)
-        layout.addWidget(self.delete_btn)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._bookmarks)
 
-        self.setLayout(layout)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._bookmarks):
+            return None
 
-        # Estilo del widget
-        self.setStyleSheet("""
-            BookmarkItemWidget {
-                background-color: #16213e;
-                border: 1px solid #0f3460;
-                border-radius: 5px;
-            }
-            BookmarkItemWidget:hover {
-                border: 1px solid #00d4ff;
-            }
-        """)
+        bookmark = self._bookmarks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            url = bookmark['url']
+            truncated_url = url[:60] + "..." if len(url) > 60 else url
+            return f"{bookmark['title']}\n{truncated_url}"
+        if role == Qt.ItemDataRole.ToolTipRole or role == self.UrlRole:
+            return bookmark['url']
+        if role == self.BookmarkIdRole:
+            return bookmark['id']
+        return None
 
 
 class BookmarksPanel(QWidget):
@@ -163,26 +116,98 @@ class BookmarksPanel(QWidget):
 
         main_layout.addLayout(header_layout)
 
-        # Área de scroll para los marcadores
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Búsqueda (índice FTS, con espera entre pulsaciones)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Buscar en marcadores...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setStyleSheet("""
+            QLineEdit {
+                background-color: #16213e;
+                color: #ffffff;
+                border: 1px solid #0f3460;
+                border-radius: 5px;
+                padding: 5px;
+            }
+            QLineEdit:focus {
+                border: 1px solid #00d4ff;
+            }
+        """)
+        self.search_input.returnPressed.connect(self._open_selected)
+        main_layout.addWidget(self.search_input)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh_bookmarks)
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        # Lista virtualizada de marcadores
+        self.bookmarks_model = BookmarksListModel(self)
+        self.bookmarks_view = QListView()
+        self.bookmarks_view.setModel(self.bookmarks_model)
+        self.bookmarks_view.setUniformItemSizes(True)
+        self.bookmarks_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.bookmarks_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Un click solo selecciona (para eliminar); se abre con doble click o Enter
+        self.bookmarks_view.doubleClicked.connect(self._on_bookmark_activated)
+        self.bookmarks_view.setStyleSheet("""
+            QListView {
                 border: 1px solid #0f3460;
                 background-color: #1a1a2e;
+                color: #00d4ff;
+                font-size: 12px;
+            }
+            QListView::item {
+                background-color: #16213e;
+                border: 1px solid #0f3460;
+                border-radius: 5px;
+                padding: 5px;
+                margin: 2px;
+            }
+            QListView::item:hover, QListView::item:selected {
+                border: 1px solid #00d4ff;
             }
         """)
+        main_layout.addWidget(self.bookmarks_view)
 
-        # Contenedor de marcadores
-        self.bookmarks_container = QWidget()
-        self.bookmarks_layout = QVBoxLayout(self.bookmarks_container)
-        self.bookmarks_layout.setSpacing(5)
-        self.bookmarks_layout.setContentsMargins(5, 5, 5, 5)
-        self.bookmarks_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # Mensaje cuando no hay resultados
+        self.empty_label = QLabel("No hay marcadores guardados")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("""
+            QLabel {
+                color: #808080;
+                font-size: 12px;
+                padding: 20px;
+            }
+        """)
+        self.empty_label.hide()
+        main_layout.addWidget(self.empty_label)
 
-        scroll_area.setWidget(self.bookmarks_container)
-        main_layout.addWidget(scroll_area)
+        # Eliminar el marcador seleccionado
+        self.delete_btn = QPushButton("✕ Eliminar seleccionado")
+        self.delete_btn.setToolTip("Eliminar marcador (Supr)")
+        self.delete_btn.clicked.connect(self._on_delete_selected)
+        self.delete_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ff0000;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                font-weight: bold;
+                padding: 5px;
+            }
+            QPushButton:hover {
+                background-color: #cc0000;
+            }
+        """)
+        main_layout.addWidget(self.delete_btn)
+
+        delete_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Delete), self.bookmarks_view)
+        delete_shortcut.activated.connect(self._on_delete_selected)
+        for key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            open_shortcut = QShortcut(QKeySequence(key), self.bookmarks_view)
+            open_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+            open_shortcut.activated.connect(self._open_selected)
 
         self.setLayout(main_layout)
 
@@ -197,49 +222,46 @@ class BookmarksPanel(QWidget):
         """)
 
     def refresh_bookmarks(self):
-        """Recarga la lista de marcadores desde la base de datos."""
-        # Limpiar lista actual
-        while self.bookmarks_layout.count():
-            item = self.bookmarks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Cargar marcadores
-        bookmarks = self.db.get_bookmarks()
-
-        if not bookmarks:
-            # Mostrar mensaje si no hay marcadores
-            no_bookmarks_label = QLabel("No hay marcadores guardados")
-            no_bookmarks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_bookmarks_label.setStyleSheet("""
-                QLabel {
-                    color: #808080;
-                    font-size: 12px;
-                    padding: 20px;
-                }
-            """)
-            self.bookmarks_layout.addWidget(no_bookmarks_label)
+        """Recarga la lista de marcadores (filtrada por la búsqueda actual)."""
+        self.search_timer.stop()
+        query = self.search_input.text().strip()
+
+        if query:
+            bookmarks = self.db.search_bookmarks(query, SEARCH_RESULT_LIMIT)
+            self.empty_label.setText("Sin resultados")
         else:
-            # Agregar widgets de marcadores
-            for bookmark in bookmarks:
-                bookmark_widget = BookmarkItemWidget(
-                    bookmark['id'],
-                    bookmark['title'],
-                    bookmark['url']
-                )
-                bookmark_widget.bookmark_clicked.connect(self._on_bookmark_clicked)
-                bookmark_widget.delete_clicked.connect(self._on_delete_bookmark)
-                self.bookmarks_layout.addWidget(bookmark_widget)
+            bookmarks = self.db.get_bookmarks()
+            self.empty_label.setText("No hay marcadores guardados")
 
-        logger.info(f"Panel de marcadores actualizado: {len(bookmarks)} marcadores")
+        self.bookmarks_model.set_bookmarks(bookmarks)
+        self.bookmarks_view.setVisible(bool(bookmarks))
+        self.empty_label.setVisible(not bookmarks)
+        self.delete_btn.setEnabled(bool(bookmarks))
+        if bookmarks:
+            self.bookmarks_view.setCurrentIndex(self.bookmarks_model.index(0))
 
-    def _on_bookmark_clicked(self, url: str):
-        """Handler cuando se hace click en un marcador."""
-        self.bookmark_selected.emit(url)
-        self.close()
+        logger.info(f"Panel de marcadores actualizado: {len(bookmarks)} marcadores")
 
-    def _on_delete_bookmark(self, bookmark_id: int):
-        """Handler cuando se elimina un marcador."""
+    def _open_selected(self):
+        """Abre el marcador seleccionado (Enter en la búsqueda o en la lista)."""
+        index = self.bookmarks_view.currentIndex()
+        if index.isValid():
+            self._on_bookmark_activated(index)
+
+    def _on_bookmark_activated(self, index: QModelIndex):
+        """Handler cuando se hace doble click o Enter sobre un marcador."""
+        url = index.data(BookmarksListModel.UrlRole)
+        if url:
+            self.bookmark_selected.emit(url)
+            self.close()
+
+    def _on_delete_selected(self):
+        """Handler cuando se elimina el marcador seleccionado."""
+        index = self.bookmarks_view.currentIndex()
+        if not index.isValid():
+            return
+
+        bookmark_id = index.data(BookmarksListModel.BookmarkIdRole)
         if self.db.delete_bookmark(bookmark_id):
             logger.info(f"Marcador {bookmark_id} eliminado")
             self.refresh_bookmarks()
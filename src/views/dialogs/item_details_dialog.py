@@ -12,6 +12,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item
 from database.db_manager import DBManager
+from core.usage_tracker import UsageTracker
 import logging
 
 logger = logging.getLogger(__name__)
@@ -297,7 +298,15 @@ class ItemDetailsDialog(QDialog):
 
         if hasattr(self.item, 'list_group') and self.item.list_group:
             props.append(("Grupo de lista", self.item.list_group))
-            props.append(("Orden en lista", str(self.item.orden_lista)))
+            # orden_lista es una clave con huecos: se muestra la posición del paso
+            position = None
+            if str(self.item.id).isdigit():
+                try:
+                    position = self.db.get_list_item_position(int(self.item.id))
+                except Exception as e:
+                    logger.error(f"Error getting list position: {e}")
+            if position is not None:
+                props.append(("Orden en lista", str(position)))
 
         return props
 
@@ -305,12 +314,28 @@ class ItemDetailsDialog(QDialog):
         """Crear grupo de estadísticas"""
         stats_items = []
 
+        # Resumen de uso (una búsqueda en item_usage_summary)
+        usage = {}
+        try:
+            usage = UsageTracker(str(self.db.db_path)).get_item_stats(self.item.id)
+        except Exception as e:
+            logger.error(f"Error getting usage stats: {e}")
+
         # Use count
-        use_count = getattr(self.item, 'use_count', 0)
+        use_count = usage.get('use_count', getattr(self.item, 'use_count', 0))
         stats_items.append(("Usos totales", f"{use_count} veces"))
 
+        if usage.get('use_count'):
+            stats_items.append(("Tiempo promedio", f"{usage['avg_execution_time']:.2f} s"))
+            stats_items.append(("Tasa de éxito", f"{usage['success_rate']:.0f}%"))
+            stats_items.append(("Errores", str(usage['error_count'])))
+        last_error = usage.get('last_error')
+        if last_error:
+            message = last_error.get('error_message') or "Sin mensaje"
+            stats_items.append(("Último error", f"{last_error.get('used_at')} - {message[:120]}"))
+
         # Last used
-        last_used = getattr(self.item, 'last_used', None)
+        last_used = usage.get('last_used') or getattr(self.item, 'last_used', None)
         if last_used:
             try:
                 if isinstance(last_used, datetime):
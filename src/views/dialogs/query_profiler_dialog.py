@@ -0,0 +1,235 @@
+"""
+Query Profiler Dialog - Panel de desarrollo de consultas SQL
+Autor: Widget Sidebar Team
+Fecha: 2026-10-19
+
+Muestra las estadísticas del QueryProfiler: latencia por sentencia
+normalizada, log de consultas lentas con su EXPLAIN QUERY PLAN y las
+sentencias que recorren completas las tablas items / item_usage_history.
+La casilla "Medir" activa el profiler y lo recuerda en el ajuste
+query_profiler_enabled para los siguientes arranques.
+"""
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                              QPushButton, QDoubleSpinBox, QCheckBox, QTabWidget,
+                              QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from database.query_profiler import get_query_profiler
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfilerDialog(QDialog):
+    """Diálogo con las estadísticas de consultas SQL"""
+
+    STATEMENT_COLUMNS = ["SQL", "Ejecuciones", "Total (ms)", "Media", "p50", "p95", "Máx", "Full scan"]
+    SLOW_COLUMNS = ["Hora", "ms", "SQL", "Plan"]
+
+    def __init__(self, settings=None, parent=None):
+        super().__init__(parent)
+        self.profiler = get_query_profiler()
+        self.settings = settings  # SettingsStore: recuerda 'query_profiler_enabled'
+        self.init_ui()
+        self.load_report()
+
+    def init_ui(self):
+        """Inicializar UI"""
+        self.setWindowTitle("🛠 Perfil de Consultas SQL")
+        self.setMinimumSize(1000, 600)
+
+        layout = QVBoxLayout(self)
+
+        # Header
+        header_layout = QHBoxLayout()
+        header = QLabel("Latencia de consultas SQL en esta sesión")
+        header_font = QFont()
+        header_font.setPointSize(11)
+        header_font.setBold(True)
+        header.setFont(header_font)
+        header_layout.addWidget(header)
+        header_layout.addStretch()
+
+        self.enabled_check = QCheckBox("Medir")
+        self.enabled_check.setChecked(self.profiler.enabled)
+        self.enabled_check.toggled.connect(self.on_enabled_toggled)
+        header_layout.addWidget(self.enabled_check)
+
+        header_layout.addWidget(QLabel("Umbral lento (ms):"))
+        self.threshold_spin = QDoubleSpinBox()
+        self.threshold_spin.setRange(1, 60000)
+        self.threshold_spin.setDecimals(0)
+        self.threshold_spin.setValue(self.profiler.slow_threshold_ms)
+        self.threshold_spin.valueChanged.connect(self.on_threshold_changed)
+        header_layout.addWidget(self.threshold_spin)
+        layout.addLayout(header_layout)
+
+        # Pestañas
+        self.tabs = QTabWidget()
+        self.statements_table = self._create_table(self.STATEMENT_COLUMNS)
+        self.slow_table = self._create_table(self.SLOW_COLUMNS)
+        self.scans_table = self._create_table(self.STATEMENT_COLUMNS)
+        self.tabs.addTab(self.statements_table, "Sentencias")
+        self.tabs.addTab(self.slow_table, "Consultas lentas")
+        self.tabs.addTab(self.scans_table, "Full scans")
+        layout.addWidget(self.tabs)
+
+        # Info
+        self.info_label = QLabel()
+        self.info_label.setStyleSheet("color: #858585; font-style: italic; font-size: 9pt;")
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        # Botones
+        btn_layout = QHBoxLayout()
+        self.refresh_btn = QPushButton("🔄 Actualizar")
+        self.refresh_btn.clicked.connect(self.load_report)
+        btn_layout.addWidget(self.refresh_btn)
+        self.reset_btn = QPushButton("🗑 Reiniciar")
+        self.reset_btn.clicked.connect(self.on_reset)
+        btn_layout.addWidget(self.reset_btn)
+        btn_layout.addStretch()
+        self.close_btn = QPushButton("Cerrar")
+        self.close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+
+        # Estilos
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e1e;
+            }
+            QLabel, QCheckBox {
+                color: #cccccc;
+                padding: 5px;
+            }
+            QTabWidget::pane {
+                border: 1px solid #3e3e42;
+            }
+            QTabBar::tab {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                padding: 6px 12px;
+            }
+            QTabBar::tab:selected {
+                background-color: #0e639c;
+                color: #ffffff;
+            }
+            QTableWidget {
+                background-color: #252526;
+                alternate-background-color: #2d2d2d;
+                color: #cccccc;
+                gridline-color: #3e3e42;
+                border: 1px solid #3e3e42;
+            }
+            QHeaderView::section {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                padding: 5px;
+                border: 1px solid #3e3e42;
+            }
+            QDoubleSpinBox {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                border: 1px solid #3e3e42;
+                padding: 3px;
+            }
+            QPushButton {
+                background-color: #0e639c;
+                color: #ffffff;
+                border: none;
+                padding: 8px 15px;
+                border-radius: 3px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #1177bb;
+            }
+        """)
+
+    @staticmethod
+    def _create_table(columns) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.verticalHeader().setVisible(False)
+        header_view = table.horizontalHeader()
+        for col in range(len(columns)):
+            header_view.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        sql_col = columns.index("SQL")
+        header_view.setSectionResizeMode(sql_col, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    def load_report(self):
+        """Cargar estadísticas del profiler"""
+        statements = self.profiler.snapshot()
+        slow = self.profiler.slow_queries()
+        scans = [row for row in statements if row['full_scans']]
+
+        self._fill_statements(self.statements_table, statements)
+        self._fill_statements(self.scans_table, scans)
+
+        self.slow_table.setRowCount(len(slow))
+        for row, entry in enumerate(slow):
+            self.slow_table.setItem(row, 0, QTableWidgetItem(entry['at'].replace('T', ' ')))
+            self.slow_table.setItem(row, 1, self._ms_item(entry['elapsed_ms']))
+            sql_item = QTableWidgetItem(entry['sql'])
+            sql_item.setToolTip(entry['sql'])
+            self.slow_table.setItem(row, 2, sql_item)
+            plan_item = QTableWidgetItem("; ".join(entry['plan']) or "—")
+            plan_item.setToolTip("\n".join(entry['plan']))
+            if entry['full_scans']:
+                plan_item.setForeground(QColor("#f48771"))
+            self.slow_table.setItem(row, 3, plan_item)
+
+        total_ms = sum(row['total_ms'] for row in statements)
+        executions = sum(row['count'] for row in statements)
+        self.info_label.setText(
+            f"{len(statements)} sentencias distintas, {executions} ejecuciones, "
+            f"{total_ms:.0f} ms en total. {len(slow)} consultas lentas "
+            f"(≥ {self.profiler.slow_threshold_ms:.0f} ms), {len(scans)} con full scan "
+            f"de items / item_usage_history."
+        )
+
+    def _fill_statements(self, table: QTableWidget, rows):
+        table.setRowCount(len(rows))
+        for row, stats in enumerate(rows):
+            sql_item = QTableWidgetItem(stats['sql'])
+            sql_item.setToolTip(stats['sql'] + ("\n\n" + "\n".join(stats['plan']) if stats['plan'] else ""))
+            table.setItem(row, 0, sql_item)
+            count_item = QTableWidgetItem(str(stats['count']))
+            count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            table.setItem(row, 1, count_item)
+            for col, key in enumerate(('total_ms', 'avg_ms', 'p50_ms', 'p95_ms', 'max_ms'), start=2):
+                table.setItem(row, col, self._ms_item(stats[key]))
+            scan_item = QTableWidgetItem(", ".join(stats['full_scans']))
+            if stats['full_scans']:
+                scan_item.setBackground(QColor("#5a1d1d"))
+                scan_item.setForeground(QColor("#f48771"))
+            table.setItem(row, 7, scan_item)
+
+    def on_enabled_toggled(self, checked: bool):
+        self.profiler.enabled = checked
+        if self.settings is not None:
+            self.settings.set('query_profiler_enabled', checked)
+
+    def on_threshold_changed(self, value: float):
+        self.profiler.slow_threshold_ms = value
+
+    def on_reset(self):
+        self.profiler.reset()
+        self.load_report()
+
+    @staticmethod
+    def _ms_item(value) -> QTableWidgetItem:
+        """Celda numérica alineada a la derecha"""
+        item = QTableWidgetItem("—" if value is None else f"{value:.1f}")
+        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return item
@@ -353,6 +353,11 @@ class SmartCollectionsDialog(QDialog):
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
 
+        rebuild_btn = QPushButton("🧮 Recalcular")
+        rebuild_btn.setToolTip("Reconstruir la pertenencia de todas las colecciones")
+        rebuild_btn.clicked.connect(self.rebuild_collections)
+        buttons_layout.addWidget(rebuild_btn)
+
         refresh_btn = QPushButton("🔄 Actualizar")
         refresh_btn.clicked.connect(self.load_collections)
         buttons_layout.addWidget(refresh_btn)
@@ -410,6 +415,11 @@ class SmartCollectionsDialog(QDialog):
             logger.error(f"Error loading smart collections: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Error al cargar colecciones:\n{str(e)}")
 
+    def rebuild_collections(self):
+        """Reconstruir la pertenencia materializada de todas las colecciones"""
+        self.manager.rebuild_all()
+        self.load_collections(self.search_input.text().strip())
+
     def filter_collections(self):
         """Filtrar colecciones según el texto de búsqueda"""
         search_query = self.search_input.text().strip()
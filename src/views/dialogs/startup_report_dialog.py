@@ -0,0 +1,189 @@
+"""
+Startup Report Dialog - Comparación de tiempos de arranque
+Autor: Widget Sidebar Team
+Fecha: 2026-10-19
+
+Muestra, fase a fase, la duración de los últimos N arranques guardados por
+el StartupTracer y resalta las fases del último arranque que superan la
+mediana de los anteriores.
+"""
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                              QPushButton, QSpinBox, QTableWidget,
+                              QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from utils.startup_tracer import (get_startup_tracer, load_launches, compare_launches,
+                                  TIMELINE_FILENAME, REGRESSION_FACTOR)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReportDialog(QDialog):
+    """Diálogo con el informe de los últimos arranques"""
+
+    DEFAULT_LAUNCHES = 10
+
+    def __init__(self, timeline_path: Path = None, parent=None):
+        super().__init__(parent)
+        self.timeline_path = Path(
+            timeline_path or get_startup_tracer().output_path or TIMELINE_FILENAME
+        )
+        self.init_ui()
+        self.load_report()
+
+    def init_ui(self):
+        """Inicializar UI"""
+        self.setWindowTitle("⏱ Informe de Arranque")
+        self.setMinimumSize(800, 500)
+
+        layout = QVBoxLayout(self)
+
+        # Header
+        header_layout = QHBoxLayout()
+        header = QLabel("Duración de cada fase del arranque (ms)")
+        header_font = QFont()
+        header_font.setPointSize(11)
+        header_font.setBold(True)
+        header.setFont(header_font)
+        header_layout.addWidget(header)
+        header_layout.addStretch()
+
+        header_layout.addWidget(QLabel("Arranques:"))
+        self.launches_spin = QSpinBox()
+        self.launches_spin.setRange(2, 30)
+        self.launches_spin.setValue(self.DEFAULT_LAUNCHES)
+        self.launches_spin.valueChanged.connect(self.load_report)
+        header_layout.addWidget(self.launches_spin)
+        layout.addLayout(header_layout)
+
+        # Tabla: fases x arranques
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        # Info
+        self.info_label = QLabel()
+        self.info_label.setStyleSheet("color: #858585; font-style: italic; font-size: 9pt;")
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        # Botones
+        btn_layout = QHBoxLayout()
+        self.refresh_btn = QPushButton("🔄 Actualizar")
+        self.refresh_btn.clicked.connect(self.load_report)
+        btn_layout.addWidget(self.refresh_btn)
+        btn_layout.addStretch()
+        self.close_btn = QPushButton("Cerrar")
+        self.close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+
+        # Estilos
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e1e;
+            }
+            QLabel {
+                color: #cccccc;
+                padding: 5px;
+            }
+            QTableWidget {
+                background-color: #252526;
+                alternate-background-color: #2d2d2d;
+                color: #cccccc;
+                gridline-color: #3e3e42;
+                border: 1px solid #3e3e42;
+            }
+            QHeaderView::section {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                padding: 5px;
+                border: 1px solid #3e3e42;
+            }
+            QSpinBox {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                border: 1px solid #3e3e42;
+                padding: 3px;
+            }
+            QPushButton {
+                background-color: #0e639c;
+                color: #ffffff;
+                border: none;
+                padding: 8px 15px;
+                border-radius: 3px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #1177bb;
+            }
+        """)
+
+    def load_report(self):
+        """Cargar y mostrar la comparación de arranques"""
+        launches = load_launches(self.timeline_path)
+        report = compare_launches(launches, self.launches_spin.value())
+        recent = report['launches']
+
+        if not recent:
+            self.table.setRowCount(0)
+            self.table.setColumnCount(0)
+            self.info_label.setText(f"No hay arranques registrados en {self.timeline_path}")
+            return
+
+        headers = ["Fase", "Mediana previa"]
+        for launch in recent:
+            label = (launch.get('started_at') or '').replace('T', '\n')
+            # El login interactivo incluye el tiempo del usuario
+            if launch.get('metadata', {}).get('auth_prompted'):
+                label += " 🔑"
+            headers.append(label)
+
+        self.table.setColumnCount(len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.setRowCount(len(report['phases']))
+
+        regressions = []
+        for row, phase in enumerate(report['phases']):
+            name_item = QTableWidgetItem("    " * phase['depth'] + phase['name'])
+            if phase['name'] == 'total':
+                font = name_item.font()
+                font.setBold(True)
+                name_item.setFont(font)
+            self.table.setItem(row, 0, name_item)
+            self.table.setItem(row, 1, self._ms_item(phase['baseline_ms']))
+
+            for col, duration in enumerate(phase['durations'], start=2):
+                cell = self._ms_item(duration)
+                if col == 2 and phase['regression']:
+                    cell.setBackground(QColor("#5a1d1d"))
+                    cell.setForeground(QColor("#f48771"))
+                self.table.setItem(row, col, cell)
+
+            if phase['regression']:
+                regressions.append(phase['name'])
+
+        header_view = self.table.horizontalHeader()
+        header_view.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, len(headers)):
+            header_view.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+
+        info = (f"{len(recent)} arranques (más reciente primero). "
+                f"Regresión: último arranque > {REGRESSION_FACTOR:.2f}x la mediana previa.")
+        if regressions:
+            info += f" ⚠ Fases más lentas: {', '.join(regressions)}"
+        self.info_label.setText(info)
+
+    @staticmethod
+    def _ms_item(value) -> QTableWidgetItem:
+        """Celda numérica alineada a la derecha"""
+        item = QTableWidgetItem("—" if value is None else f"{value:.1f}")
+        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return item
@@ -7,8 +7,9 @@ Fecha: 2025-01-23
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                               QPushButton, QTabWidget, QWidget, QFrame,
                               QTableWidget, QTableWidgetItem, QMessageBox,
-                              QFileDialog, QTextEdit, QComboBox, QGroupBox)
-from PyQt6.QtCore import Qt
+                              QFileDialog, QTextEdit, QComboBox, QGroupBox,
+                              QStackedWidget)
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 import sys
 from pathlib import Path
@@ -17,11 +18,14 @@ from datetime import datetime
 # Matplotlib imports
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 import matplotlib.pyplot as plt
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.stats_manager import StatsManager
 from core.favorites_manager import FavoritesManager
+from core.db_maintenance import DatabaseMaintenanceService
+from core.stats_dashboard_loader import StatsDashboardLoader, ChartCache, TABS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,10 +37,25 @@ plt.style.use('dark_background')
 class StatsDashboard(QDialog):
     """Dashboard completo de estadísticas con gráficos"""
 
-    def __init__(self, parent=None):
+    # Emitida desde el hilo de mantenimiento; Qt la entrega en el hilo de la UI
+    maintenance_finished = pyqtSignal(dict)
+    # Emitida desde el hilo del loader: tab, período, versión, datos (None = sin cambios)
+    tab_loaded = pyqtSignal(str, object, object, object)
+
+    def __init__(self, parent=None, maintenance_service: DatabaseMaintenanceService = None):
         super().__init__(parent)
         self.stats_manager = StatsManager()
         self.favorites_manager = FavoritesManager()
+        self.maintenance_service = maintenance_service or DatabaseMaintenanceService()
+        self.maintenance_finished.connect(self.on_maintenance_finished)
+
+        # Pestañas cargadas al activarse, en segundo plano
+        self.loader = StatsDashboardLoader(str(self.stats_manager.db_path), on_loaded=self.tab_loaded.emit)
+        self.tab_loaded.connect(self.on_tab_loaded)
+        self.chart_cache = ChartCache()
+        self._data_version = None  # Versión de los datos mostrados
+        self._tab_versions = {}  # tab -> (período, versión) que muestra
+
         self.init_ui()
         self.load_data()
 
@@ -78,6 +97,7 @@ class StatsDashboard(QDialog):
         self.health_tab = self.create_health_tab()
         self.tabs.addTab(self.health_tab, "🏥 Salud del Widget")
 
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         layout.addWidget(self.tabs)
 
         # Botones
@@ -91,6 +111,10 @@ class StatsDashboard(QDialog):
         self.export_btn.clicked.connect(self.export_report)
         btn_layout.addWidget(self.export_btn)
 
+        self.export_history_btn = QPushButton("📤 Exportar Historial")
+        self.export_history_btn.clicked.connect(self.export_usage_history)
+        btn_layout.addWidget(self.export_history_btn)
+
         btn_layout.addStretch()
 
         self.close_btn = QPushButton("Cerrar")
@@ -197,9 +221,8 @@ class StatsDashboard(QDialog):
         layout.addLayout(metrics_layout)
 
         # Top 10 más usados (gráfico de barras horizontal)
-        self.top_items_figure = Figure(figsize=(10, 5), facecolor='#252526')
-        self.top_items_canvas = FigureCanvas(self.top_items_figure)
-        layout.addWidget(self.top_items_canvas)
+        self.top_items_stack = QStackedWidget()
+        layout.addWidget(self.top_items_stack)
 
         return widget
 
@@ -213,22 +236,22 @@ class StatsDashboard(QDialog):
         period_layout.addWidget(QLabel("Período:"))
 
         self.period_combo = QComboBox()
-        self.period_combo.addItems(["Últimos 7 días", "Últimos 30 días", "Últimos 90 días"])
-        self.period_combo.currentTextChanged.connect(self.update_usage_chart)
+        for text, days in (("Últimos 7 días", 7), ("Últimos 30 días", 30),
+                           ("Últimos 90 días", 90), ("Último año", 365)):
+            self.period_combo.addItem(text, days)
+        self.period_combo.currentIndexChanged.connect(self.update_usage_chart)
         period_layout.addWidget(self.period_combo)
 
         period_layout.addStretch()
         layout.addLayout(period_layout)
 
         # Gráfico de línea: Uso por día
-        self.usage_timeline_figure = Figure(figsize=(10, 4), facecolor='#252526')
-        self.usage_timeline_canvas = FigureCanvas(self.usage_timeline_figure)
-        layout.addWidget(self.usage_timeline_canvas)
+        self.usage_timeline_stack = QStackedWidget()
+        layout.addWidget(self.usage_timeline_stack)
 
         # Gráfico de barras: Uso por hora del día
-        self.usage_by_hour_figure = Figure(figsize=(10, 3), facecolor='#252526')
-        self.usage_by_hour_canvas = FigureCanvas(self.usage_by_hour_figure)
-        layout.addWidget(self.usage_by_hour_canvas)
+        self.usage_by_hour_stack = QStackedWidget()
+        layout.addWidget(self.usage_by_hour_stack)
 
         return widget
 
@@ -238,9 +261,8 @@ class StatsDashboard(QDialog):
         layout = QVBoxLayout(widget)
 
         # Gráfico de torta: Uso por categoría
-        self.categories_pie_figure = Figure(figsize=(8, 6), facecolor='#252526')
-        self.categories_pie_canvas = FigureCanvas(self.categories_pie_figure)
-        layout.addWidget(self.categories_pie_canvas)
+        self.categories_pie_stack = QStackedWidget()
+        layout.addWidget(self.categories_pie_stack)
 
         # Tabla con detalle de categorías
         self.categories_table = QTableWidget()
@@ -313,9 +335,9 @@ class StatsDashboard(QDialog):
         cleanup_btn.clicked.connect(self.show_cleanup_dialog)
         actions_layout.addWidget(cleanup_btn)
 
-        optimize_btn = QPushButton("⚡ Optimizar Base de Datos")
-        optimize_btn.clicked.connect(self.optimize_database)
-        actions_layout.addWidget(optimize_btn)
+        self.optimize_btn = QPushButton("⚡ Optimizar Base de Datos")
+        self.optimize_btn.clicked.connect(self.optimize_database)
+        actions_layout.addWidget(self.optimize_btn)
 
         actions_layout.addStretch()
         layout.addLayout(actions_layout)
@@ -369,47 +391,148 @@ class StatsDashboard(QDialog):
 
         return card
 
-    def load_data(self):
-        """Cargar todos los datos"""
-        try:
-            logger.info("Loading dashboard data...")
-            self.load_summary_data()
-            self.load_usage_data()
-            self.load_categories_data()
-            self.load_performance_data()
-            self.load_health_data()
-            logger.info("Dashboard data loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading dashboard data: {e}")
-            QMessageBox.critical(self, "Error", f"Error al cargar datos:\n{str(e)}")
-
-    def load_summary_data(self):
-        """Cargar datos del resumen"""
-        try:
-            stats = self.stats_manager.get_dashboard_stats()
+    # ==================== Carga por Pestaña ====================
 
-            # Actualizar cards
-            self.update_metric_card(self.total_executions_card, str(stats.get('total_executions', 0)))
-            self.update_metric_card(self.week_executions_card, str(stats.get('executions_week', 0)))
-            self.update_metric_card(self.today_executions_card, str(stats.get('executions_today', 0)))
-            self.update_metric_card(self.success_rate_card, f"{stats.get('success_rate', 0):.1f}%")
+    def load_data(self):
+        """Actualizar la pestaña visible (las demás se recargan al activarse si cambiaron los datos)"""
+        tab = TABS[self.tabs.currentIndex()]
+        period = self.current_period(tab)
+        known_version = None
+        if self._data_version is not None and self._tab_versions.get(tab) == (period, self._data_version):
+            known_version = self._data_version
+        self.request_tab(tab, period, known_version)
+
+    def on_tab_changed(self, index: int):
+        """Cargar la pestaña la primera vez que se activa"""
+        if 0 <= index < len(TABS):
+            self.load_tab(TABS[index])
+
+    def load_tab(self, tab: str):
+        """Mostrar una pestaña desde lo ya dibujado o pedir sus datos al loader"""
+        period = self.current_period(tab)
+        if not self.show_cached_tab(tab, period):
+            self.request_tab(tab, period)
+
+    def request_tab(self, tab: str, period=None, known_version=None):
+        """Encolar la lectura de una pestaña en el hilo del loader"""
+        logger.debug(f"Loading dashboard tab {tab} (period={period})")
+        self.refresh_btn.setEnabled(False)
+        self.loader.request(tab, period, known_version)
+
+    def current_period(self, tab: str = 'usage'):
+        """Días del selector de período (solo la pestaña de uso depende de él)"""
+        return self.period_combo.currentData() if tab == 'usage' else None
+
+    def show_cached_tab(self, tab: str, period) -> bool:
+        """
+        Mostrar una pestaña sin consultas ni redibujado
+
+        Returns:
+            bool: True si lo que muestra (o los gráficos en caché) corresponde
+                a la versión actual de los datos
+        """
+        version = self._data_version
+        if version is None:
+            return False
+        if self._tab_versions.get(tab) == (period, version):
+            return True
+        if tab != 'usage':
+            return False
+
+        timeline = self.chart_cache.get(('usage_timeline', period, version))
+        by_hour = self.chart_cache.get(('usage_by_hour', None, version))
+        if timeline is None or by_hour is None:
+            return False
+        self.usage_timeline_stack.setCurrentWidget(timeline)
+        self.usage_by_hour_stack.setCurrentWidget(by_hour)
+        self._tab_versions[tab] = (period, version)
+        return True
+
+    def on_tab_loaded(self, tab: str, period, version, data):
+        """Mostrar los datos leídos por el loader (hilo de la UI)"""
+        if not self.loader.pending_count():
+            self.refresh_btn.setEnabled(True)
+
+        if data is None:
+            # Datos sin cambios desde lo que ya se muestra
+            if not self.show_cached_tab(tab, period):
+                self.request_tab(tab, period)
+            return
 
-            # Gráfico top 10
-            most_used = self.stats_manager.get_most_used_items(limit=10)
-            self.plot_top_items(most_used)
+        if data.get('error'):
+            QMessageBox.critical(self, "Error", f"Error al cargar datos:\n{data['error']}")
+            return
 
+        if version != self._data_version:
+            # Datos nuevos: lo dibujado con la versión anterior ya no sirve
+            self._data_version = version
+            self.release_charts(self.chart_cache.discard_stale(version))
+            self._tab_versions.clear()
+
+        renderers = {
+            'summary': self.render_summary,
+            'usage': self.render_usage,
+            'categories': self.render_categories,
+            'performance': self.render_performance,
+            'health': self.render_health,
+        }
+        try:
+            renderers[tab](data, period)
+            self._tab_versions[tab] = (period, version)
         except Exception as e:
-            logger.error(f"Error loading summary data: {e}")
-
-    def plot_top_items(self, items: list):
+            logger.error(f"Error rendering dashboard tab {tab}: {e}")
+            QMessageBox.critical(self, "Error", f"Error al mostrar datos:\n{str(e)}")
+
+    def show_chart(self, stack: QStackedWidget, name: str, period, figsize: tuple, plot, *args):
+        """
+        Mostrar un gráfico desde la caché o dibujarlo una vez
+
+        Args:
+            stack: Contenedor del gráfico en la pestaña
+            name: Nombre del gráfico (parte de la clave de caché)
+            period: Período que representa (None si no depende de él)
+            figsize: Tamaño de la figura
+            plot: Función (figure, *args) que dibuja el gráfico
+        """
+        key = (name, period, self._data_version)
+        canvas = self.chart_cache.get(key)
+        if canvas is None:
+            figure = Figure(figsize=figsize, facecolor='#252526')
+            canvas = FigureCanvas(figure)
+            plot(figure, *args)
+            canvas.draw()
+            stack.addWidget(canvas)
+            self.release_charts(self.chart_cache.put(key, canvas))
+        stack.setCurrentWidget(canvas)
+
+    def release_charts(self, canvases: list):
+        """Liberar gráficos expulsados de la caché"""
+        for canvas in canvases:
+            stack = canvas.parentWidget()
+            if isinstance(stack, QStackedWidget):
+                stack.removeWidget(canvas)
+            canvas.figure.clear()
+            canvas.deleteLater()
+
+    def render_summary(self, data: dict, period=None):
+        """Mostrar el resumen"""
+        stats = data.get('stats', {})
+        self.update_metric_card(self.total_executions_card, str(stats.get('total_executions', 0)))
+        self.update_metric_card(self.week_executions_card, str(stats.get('executions_week', 0)))
+        self.update_metric_card(self.today_executions_card, str(stats.get('executions_today', 0)))
+        self.update_metric_card(self.success_rate_card, f"{stats.get('success_rate', 0):.1f}%")
+
+        # Gráfico top 10
+        self.show_chart(self.top_items_stack, 'top_items', None, (10, 5),
+                        self.plot_top_items, data.get('most_used', []))
+
+    def plot_top_items(self, figure: Figure, items: list):
         """Graficar top items"""
-        self.top_items_figure.clear()
-        ax = self.top_items_figure.add_subplot(111)
+        ax = figure.add_subplot(111)
 
         if not items:
             ax.text(0.5, 0.5, 'No hay datos disponibles',
                    ha='center', va='center', fontsize=14, color='#858585')
-            self.top_items_canvas.draw()
             return
 
         labels = []
@@ -438,8 +561,7 @@ class StatsDashboard(QDialog):
                    f' {int(width)}',
                    ha='left', va='center', color='#cccccc', fontsize=9)
 
-        self.top_items_figure.tight_layout()
-        self.top_items_canvas.draw()
+        figure.tight_layout()
 
     def update_metric_card(self, card: QFrame, value: str):
         """Actualizar valor de card"""
@@ -447,44 +569,28 @@ class StatsDashboard(QDialog):
         if value_label:
             value_label.setText(value)
 
-    def load_usage_data(self):
-        """Cargar datos de uso en el tiempo"""
-        try:
-            # Obtener días según selector
-            period_text = self.period_combo.currentText()
-            if "7" in period_text:
-                days = 7
-            elif "30" in period_text:
-                days = 30
-            else:
-                days = 90
-
-            # Uso por día
-            usage_by_day = self.stats_manager.get_usage_by_day(days=days)
-            self.plot_usage_timeline(usage_by_day, days)
-
-            # Uso por hora
-            usage_by_hour = self.stats_manager.get_usage_by_hour(days=7)
-            self.plot_usage_by_hour(usage_by_hour)
-
-        except Exception as e:
-            logger.error(f"Error loading usage data: {e}")
+    def render_usage(self, data: dict, period=None):
+        """Mostrar el uso en el tiempo"""
+        days = period or 7
+        self.show_chart(self.usage_timeline_stack, 'usage_timeline', period, (10, 4),
+                        self.plot_usage_timeline, data.get('by_day', []), days)
+        self.show_chart(self.usage_by_hour_stack, 'usage_by_hour', None, (10, 3),
+                        self.plot_usage_by_hour, data.get('by_hour', []))
 
-    def plot_usage_timeline(self, data: list, days: int):
-        """Graficar línea de tiempo de uso"""
-        self.usage_timeline_figure.clear()
-        ax = self.usage_timeline_figure.add_subplot(111)
+    def plot_usage_timeline(self, figure: Figure, data: list, days: int):
+        """Graficar línea de tiempo de uso (data ya reducida a pocos puntos)"""
+        ax = figure.add_subplot(111)
 
         if not data:
             ax.text(0.5, 0.5, 'No hay datos disponibles',
                    ha='center', va='center', fontsize=12, color='#858585')
-            self.usage_timeline_canvas.draw()
             return
 
         dates = [item['date'] for item in data]
         counts = [item['count'] for item in data]
 
-        ax.plot(dates, counts, marker='o', color='#007acc', linewidth=2, markersize=6)
+        marker = 'o' if len(dates) <= 31 else None
+        ax.plot(dates, counts, marker=marker, color='#007acc', linewidth=2, markersize=6)
         ax.fill_between(dates, counts, alpha=0.3, color='#007acc')
         ax.set_xlabel('Fecha', color='#cccccc')
         ax.set_ylabel('Ejecuciones', color='#cccccc')
@@ -492,22 +598,20 @@ class StatsDashboard(QDialog):
         ax.tick_params(colors='#cccccc')
         ax.set_facecolor('#252526')
         ax.grid(True, alpha=0.2, color='#3e3e42')
+        ax.xaxis.set_major_locator(MaxNLocator(15))
 
         # Rotar labels de fecha
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
 
-        self.usage_timeline_figure.tight_layout()
-        self.usage_timeline_canvas.draw()
+        figure.tight_layout()
 
-    def plot_usage_by_hour(self, data: list):
+    def plot_usage_by_hour(self, figure: Figure, data: list):
         """Graficar uso por hora del día"""
-        self.usage_by_hour_figure.clear()
-        ax = self.usage_by_hour_figure.add_subplot(111)
+        ax = figure.add_subplot(111)
 
         if not data:
             ax.text(0.5, 0.5, 'No hay datos disponibles',
                    ha='center', va='center', fontsize=12, color='#858585')
-            self.usage_by_hour_canvas.draw()
             return
 
         hours = [item['hour'] for item in data]
@@ -522,32 +626,27 @@ class StatsDashboard(QDialog):
         ax.set_xticks(range(0, 24))
         ax.grid(True, alpha=0.2, color='#3e3e42', axis='y')
 
-        self.usage_by_hour_figure.tight_layout()
-        self.usage_by_hour_canvas.draw()
+        figure.tight_layout()
 
     def update_usage_chart(self):
         """Actualizar gráfico de uso al cambiar período"""
-        self.load_usage_data()
-
-    def load_categories_data(self):
-        """Cargar datos de categorías"""
-        try:
-            usage_by_category = self.stats_manager.get_usage_by_category()
-            self.plot_categories_pie(usage_by_category)
-            self.populate_categories_table(usage_by_category)
+        self.load_tab('usage')
 
-        except Exception as e:
-            logger.error(f"Error loading categories data: {e}")
+    def render_categories(self, data: dict, period=None):
+        """Mostrar el uso por categoría"""
+        usage_by_category = data.get('categories', [])
+        self.show_chart(self.categories_pie_stack, 'categories_pie', None, (8, 6),
+                        self.plot_categories_pie, usage_by_category)
+        self.populate_categories_table(usage_by_category)
 
-    def plot_categories_pie(self, data: list):
+    def plot_categories_pie(self, figure: Figure, data: list):
         """Graficar torta de categorías"""
-        self.categories_pie_figure.clear()
-        ax = self.categories_pie_figure.add_subplot(111)
+        ax = figure.add_subplot(111)
+        data = [item for item in data if item['total_uses']]
 
-        if not data or len(data) == 0:
+        if not data:
             ax.text(0.5, 0.5, 'No hay datos disponibles',
                    ha='center', va='center', fontsize=12, color='#858585')
-            self.categories_pie_canvas.draw()
             return
 
         labels = [item['category_name'] for item in data]
@@ -569,8 +668,7 @@ class StatsDashboard(QDialog):
         ax.set_title('Uso por Categoría', fontsize=12, fontweight='bold', color='#cccccc', pad=15)
         ax.set_facecolor('#252526')
 
-        self.categories_pie_figure.tight_layout()
-        self.categories_pie_canvas.draw()
+        figure.tight_layout()
 
     def populate_categories_table(self, data: list):
         """Poblar tabla de categorías"""
@@ -597,19 +695,10 @@ class StatsDashboard(QDialog):
             percentage = (item['total_uses'] / total_uses * 100) if total_uses > 0 else 0
             self.categories_table.setItem(row, 3, QTableWidgetItem(f"{percentage:.1f}%"))
 
-    def load_performance_data(self):
-        """Cargar datos de rendimiento"""
-        try:
-            # Items lentos
-            slow_items = self.stats_manager.get_slowest_items(limit=10, min_executions=5)
-            self.populate_slow_items_table(slow_items)
-
-            # Items con errores
-            failing_items = self.stats_manager.get_most_failing_items(limit=10, min_executions=5)
-            self.populate_error_items_table(failing_items)
-
-        except Exception as e:
-            logger.error(f"Error loading performance data: {e}")
+    def render_performance(self, data: dict, period=None):
+        """Mostrar los items lentos y con errores"""
+        self.populate_slow_items_table(data.get('slow', []))
+        self.populate_error_items_table(data.get('failing', []))
 
     def populate_slow_items_table(self, items: list):
         """Poblar tabla de items lentos"""
@@ -652,14 +741,9 @@ class StatsDashboard(QDialog):
             error_rate = item.get('error_rate', 0)
             self.error_items_table.setItem(row, 3, QTableWidgetItem(f"{error_rate:.1f}%"))
 
-    def load_health_data(self):
-        """Cargar datos de salud"""
-        try:
-            health_report = self.stats_manager.get_health_report()
-            self.display_health_report(health_report)
-
-        except Exception as e:
-            logger.error(f"Error loading health data: {e}")
+    def render_health(self, data: dict, period=None):
+        """Mostrar el reporte de salud"""
+        self.display_health_report(data.get('report', {}))
 
     def display_health_report(self, report: dict):
         """Mostrar reporte de salud"""
@@ -720,34 +804,64 @@ class StatsDashboard(QDialog):
             self.load_data()
 
     def optimize_database(self):
-        """Optimizar base de datos"""
-        try:
-            import sqlite3
-            conn = sqlite3.connect("widget_sidebar.db")
-            cursor = conn.cursor()
-
-            # VACUUM para optimizar
-            cursor.execute("VACUUM")
-
-            # Analizar para actualizar estadísticas
-            cursor.execute("ANALYZE")
-
-            conn.commit()
-            conn.close()
-
+        """Optimizar base de datos (mantenimiento en segundo plano)"""
+        started = self.maintenance_service.run_async(
+            force=True, on_finished=self.maintenance_finished.emit
+        )
+        if not started:
             QMessageBox.information(
                 self,
-                "Éxito",
-                "Base de datos optimizada correctamente"
+                "Mantenimiento",
+                "Ya hay un mantenimiento de la base de datos en curso"
             )
+            return
 
-        except Exception as e:
-            logger.error(f"Error optimizing database: {e}")
+        self.optimize_btn.setEnabled(False)
+        self.optimize_btn.setText("⏳ Optimizando...")
+
+    def on_maintenance_finished(self, result: dict):
+        """Mostrar el resultado del mantenimiento"""
+        self.optimize_btn.setEnabled(True)
+        self.optimize_btn.setText("⚡ Optimizar Base de Datos")
+
+        if result.get('error'):
+            logger.error(f"Error optimizing database: {result['error']}")
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Error al optimizar base de datos:\n{str(e)}"
+                f"Error al optimizar base de datos:\n{result['error']}"
             )
+            return
+
+        steps = result.get('steps', {})
+        lines = [f"Duración: {result.get('duration_ms', 0) / 1000:.1f} s"]
+        retention = steps.get('history_retention', {})
+        lines.append(f"Historial eliminado: {retention.get('deleted', 0)} registros")
+        vacuum = steps.get('incremental_vacuum', {})
+        lines.append(f"Espacio liberado: {vacuum.get('freed_bytes', 0) / 1024:.0f} KB")
+        check = steps.get('quick_check', {})
+        lines.append("Integridad: " + ("OK" if check.get('ok') else "revisar el log"))
+        failed = [name for name, summary in steps.items() if 'error' in summary]
+        if failed:
+            lines.append(f"Pasos con error: {', '.join(failed)}")
+
+        QMessageBox.information(
+            self,
+            "Éxito",
+            "Base de datos optimizada correctamente\n\n" + "\n".join(lines)
+        )
+        self.load_data()
+
+    def done(self, result: int):
+        """Esperar la lectura en curso antes de cerrar"""
+        self.loader.close()
+        super().done(result)
+
+    def export_usage_history(self):
+        """Exportar el historial de uso completo (CSV/NDJSON en segundo plano)"""
+        from views.dialogs.usage_export_dialog import UsageExportDialog
+        dialog = UsageExportDialog(str(self.stats_manager.db_path), self)
+        dialog.exec()
 
     def export_report(self):
         """Exportar reporte a archivo"""
@@ -0,0 +1,218 @@
+"""
+Usage Export Dialog - Exportación del historial de uso
+Autor: Widget Sidebar Team
+Fecha: 2026-10-19
+
+Exporta item_usage_history con los datos de cada item a CSV o NDJSON,
+filtrado por fechas y categoría y opcionalmente comprimido con gzip.
+La exportación corre en un hilo en segundo plano (UsageHistoryExporter)
+y el progreso llega a la UI por señales.
+"""
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
+                              QLabel, QPushButton, QComboBox, QCheckBox,
+                              QDateEdit, QProgressBar, QFileDialog, QMessageBox)
+from PyQt6.QtCore import QDate, pyqtSignal
+from PyQt6.QtGui import QFont
+import sys
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from core.usage_exporter import UsageHistoryExporter
+from database.db_manager import DBManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class UsageExportDialog(QDialog):
+    """Diálogo de exportación del historial de uso"""
+
+    # Emitidas desde el hilo de exportación; Qt las entrega en el hilo de la UI
+    export_progress = pyqtSignal(int, int)  # filas escritas, total
+    export_finished = pyqtSignal(dict)
+
+    def __init__(self, db_path: str, parent=None):
+        super().__init__(parent)
+        self.db_path = str(db_path)
+        self.exporter = UsageHistoryExporter(self.db_path)
+        self.export_progress.connect(self.on_export_progress)
+        self.export_finished.connect(self.on_export_finished)
+        self.init_ui()
+        self.load_categories()
+
+    def init_ui(self):
+        """Inicializar UI"""
+        self.setWindowTitle("💾 Exportar Historial de Uso")
+        self.setMinimumWidth(480)
+
+        layout = QVBoxLayout(self)
+
+        # Header
+        header = QLabel("Exportar el historial de ejecuciones")
+        header_font = QFont()
+        header_font.setPointSize(11)
+        header_font.setBold(True)
+        header.setFont(header_font)
+        layout.addWidget(header)
+
+        form = QFormLayout()
+
+        # Rango de fechas
+        self.all_dates_check = QCheckBox("Todo el historial")
+        self.all_dates_check.toggled.connect(self.on_all_dates_toggled)
+        form.addRow(self.all_dates_check)
+
+        today = QDate.currentDate()
+        self.date_from_edit = QDateEdit(today.addDays(-30))
+        self.date_from_edit.setCalendarPopup(True)
+        self.date_from_edit.setDisplayFormat("yyyy-MM-dd")
+        form.addRow("Desde:", self.date_from_edit)
+
+        self.date_to_edit = QDateEdit(today)
+        self.date_to_edit.setCalendarPopup(True)
+        self.date_to_edit.setDisplayFormat("yyyy-MM-dd")
+        form.addRow("Hasta:", self.date_to_edit)
+
+        # Categoría
+        self.category_combo = QComboBox()
+        self.category_combo.addItem("Todas las categorías", None)
+        form.addRow("Categoría:", self.category_combo)
+
+        # Formato
+        self.format_combo = QComboBox()
+        self.format_combo.addItem("CSV", 'csv')
+        self.format_combo.addItem("NDJSON (un JSON por línea)", 'ndjson')
+        form.addRow("Formato:", self.format_combo)
+
+        self.compress_check = QCheckBox("Comprimir con gzip (.gz)")
+        form.addRow(self.compress_check)
+
+        layout.addLayout(form)
+
+        # Progreso
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        # Botones
+        btn_layout = QHBoxLayout()
+
+        self.export_btn = QPushButton("💾 Exportar")
+        self.export_btn.clicked.connect(self.start_export)
+        btn_layout.addWidget(self.export_btn)
+
+        self.cancel_btn = QPushButton("Cancelar exportación")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.exporter.cancel)
+        btn_layout.addWidget(self.cancel_btn)
+
+        btn_layout.addStretch()
+
+        self.close_btn = QPushButton("Cerrar")
+        self.close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.close_btn)
+
+        layout.addLayout(btn_layout)
+
+    def load_categories(self):
+        """Cargar las categorías del filtro"""
+        db = DBManager(self.db_path)
+        try:
+            for category in db.get_categories(include_inactive=True):
+                self.category_combo.addItem(category['name'], category['id'])
+        except Exception as e:
+            logger.error(f"Error loading categories for usage export: {e}")
+        finally:
+            db.close()
+
+    def on_all_dates_toggled(self, checked: bool):
+        """Activar/desactivar el rango de fechas"""
+        self.date_from_edit.setEnabled(not checked)
+        self.date_to_edit.setEnabled(not checked)
+
+    def start_export(self):
+        """Elegir archivo y exportar en segundo plano"""
+        fmt = self.format_combo.currentData()
+        compress = self.compress_check.isChecked()
+        extension = f".{fmt}" + (".gz" if compress else "")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Exportar Historial de Uso",
+            f"historial_uso_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}",
+            "Todos los archivos (*)"
+        )
+        if not file_path:
+            return
+        if compress and not file_path.endswith('.gz'):
+            file_path += '.gz'
+
+        date_from = date_to = None
+        if not self.all_dates_check.isChecked():
+            date_from = self.date_from_edit.date().toString("yyyy-MM-dd")
+            date_to = self.date_to_edit.date().toString("yyyy-MM-dd")
+            if date_from > date_to:
+                QMessageBox.warning(self, "Exportar", "La fecha inicial es posterior a la final")
+                return
+
+        category_id = self.category_combo.currentData()
+        started = self.exporter.export_async(
+            file_path,
+            on_finished=self.export_finished.emit,
+            fmt=fmt,
+            date_from=date_from,
+            date_to=date_to,
+            category_ids=[category_id] if category_id is not None else None,
+            compress=compress,
+            on_progress=self.export_progress.emit,
+        )
+        if not started:
+            QMessageBox.information(self, "Exportar", "Ya hay una exportación en curso")
+            return
+
+        self.export_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.progress_bar.setValue(0)
+        self.status_label.setText("⏳ Exportando...")
+
+    def on_export_progress(self, written: int, total: int):
+        """Actualizar el progreso"""
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(min(written, max(total, 1)))
+        self.status_label.setText(f"⏳ {written:,} de {total:,} registros")
+
+    def on_export_finished(self, result: dict):
+        """Mostrar el resultado de la exportación"""
+        self.export_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+
+        if result.get('error'):
+            self.status_label.setText("❌ Error al exportar")
+            QMessageBox.critical(self, "Error", f"Error al exportar el historial:\n{result['error']}")
+            return
+        if result.get('cancelled'):
+            self.status_label.setText("Exportación cancelada")
+            return
+
+        self.progress_bar.setMaximum(max(result.get('total', 0), 1))
+        self.progress_bar.setValue(self.progress_bar.maximum())
+        self.status_label.setText(
+            f"✓ {result.get('rows', 0):,} registros, {result.get('bytes', 0) / 1024:.0f} KB "
+            f"en {result.get('duration_ms', 0) / 1000:.1f} s"
+        )
+        QMessageBox.information(
+            self,
+            "Éxito",
+            f"Historial exportado correctamente:\n{result['path']}"
+        )
+
+    def done(self, result: int):
+        """Cancelar y esperar la exportación en curso antes de cerrar"""
+        if self.exporter.is_running():
+            self.exporter.cancel()
+            self.exporter.wait()
+        super().done(result)
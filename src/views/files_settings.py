@@ -15,17 +15,21 @@ from PyQt6.QtGui import QFont
 
 from core.config_manager import ConfigManager
 from core.file_manager import FileManager
+from core.thumbnail_service import get_thumbnail_service
 
 
 class FilesSettings(QWidget):
     """Widget de configuración de archivos"""
 
     settings_changed = pyqtSignal()  # Emitido cuando cambia configuración
+    storage_reconciled = pyqtSignal(dict)  # Emitido desde el hilo de reconciliación
 
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.file_manager = FileManager(config_manager)
+        self._reconciler = None
+        self.storage_reconciled.connect(self._on_storage_reconciled)
 
         self.init_ui()
         self.load_settings()
@@ -372,33 +376,14 @@ class FilesSettings(QWidget):
 
     def _update_statistics(self):
         """Actualizar estadísticas de almacenamiento"""
-        # Contar archivos guardados (items con file_hash)
-        # Esto requiere acceso a DBManager
-        try:
-            from database.db_manager import DBManager
-            db_path = Path(__file__).parent.parent.parent / "widget_sidebar.db"
-            db = DBManager(str(db_path))
-
-            # Contar items con file_hash (archivos guardados)
-            cursor = db.conn.execute(
-                "SELECT COUNT(*) FROM items WHERE file_hash IS NOT NULL"
-            )
-            file_count = cursor.fetchone()[0]
+        # Totales instantáneos desde la tabla agregada file_storage_stats
+        self._show_storage_stats()
 
-            # Calcular espacio total
-            cursor = db.conn.execute(
-                "SELECT SUM(file_size) FROM items WHERE file_hash IS NOT NULL"
+        # Corregir desviaciones contra el disco en segundo plano
+        if self._reconciler is None or not self._reconciler.is_running():
+            self._reconciler = self.file_manager.start_storage_reconcile(
+                on_finished=lambda result: self.storage_reconciled.emit(result)
             )
-            total_size = cursor.fetchone()[0] or 0
-
-            db.close()
-
-            self.stats_files_count.setText(f"{file_count} archivos")
-            self.stats_total_size.setText(self.file_manager.format_file_size(total_size))
-
-        except Exception as e:
-            self.stats_files_count.setText("Error al cargar")
-            self.stats_total_size.setText("Error al cargar")
 
         # Estado de ruta base
         base_path = self.base_path_input.text()
@@ -409,6 +394,24 @@ class FilesSettings(QWidget):
             self.stats_base_path_exists.setText("❌ No configurada o no existe")
             self.stats_base_path_exists.setStyleSheet("color: red;")
 
+    def _show_storage_stats(self):
+        """Mostrar totales de archivos guardados y espacio utilizado"""
+        stats = self.file_manager.get_storage_stats()
+        self.stats_files_count.setText(f"{stats['total_items']} archivos")
+        self.stats_total_size.setText(stats['total_size_formatted'])
+
+        if stats['by_type']:
+            breakdown = "\n".join(
+                f"{self.file_manager.get_file_icon_by_type(file_type)} {file_type}: "
+                f"{entry['count']} ({self.file_manager.format_file_size(entry['size'])})"
+                for file_type, entry in stats['by_type'].items()
+            )
+            self.stats_total_size.setToolTip(breakdown)
+
+    def _on_storage_reconciled(self, result: dict):
+        """Refrescar estadísticas cuando termina la reconciliación"""
+        self._show_storage_stats()
+
     def _open_base_folder(self):
         """Abrir carpeta base en explorador de archivos"""
         base_path = self.base_path_input.text()
@@ -453,6 +456,7 @@ class FilesSettings(QWidget):
             # Guardar ruta base
             if base_path:
                 self.config_manager.set_files_base_path(base_path)
+                get_thumbnail_service().set_base_path(base_path)
 
             # Guardar configuración de carpetas
             self.config_manager.set_files_folders_config(folders_config)
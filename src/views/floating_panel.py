@@ -45,6 +45,9 @@ class FloatingPanel(QWidget):
     # Signal emitted when URL should be opened in embedded browser
     url_open_requested = pyqtSignal(str)
 
+    # Signal emitted when a restored shell is shown before its content was read
+    content_requested = pyqtSignal(int)  # panel_id
+
     def __init__(self, config_manager=None, list_controller=None, panel_id=None, custom_name=None, custom_color=None, parent=None, main_window=None):
         super().__init__(parent)
         self.current_category = None
@@ -64,6 +67,11 @@ class FloatingPanel(QWidget):
         self.normal_width = None  # Ancho normal antes de minimizar
         self.normal_position = None  # Posición normal antes de minimizar
 
+        # Restauración diferida (ver restore_as_shell)
+        self.is_content_loaded = True  # False mientras el panel es solo una ventana vacía
+        self._awaiting_content = False  # Lectura en segundo plano pendiente
+        self._preloaded_category = None  # Categoría leída en segundo plano, aún sin renderizar
+
         # Panel persistence attributes
         self.panel_id = panel_id  # ID del panel en la base de datos (None si no está guardado)
         self.custom_name = custom_name  # Nombre personalizado del panel
@@ -462,8 +470,95 @@ class FloatingPanel(QWidget):
             # Guardar referencia para que no se destruya
             self._show_animation = animation
 
-    def load_category(self, category: Category):
-        """Load and display items and lists from a category"""
+        # Restauración diferida: renderizar items al hacerse visible
+        if not self.is_content_loaded:
+            QTimer.singleShot(0, self.load_deferred_content)
+
+    # ==================== Restauración diferida ====================
+
+    def restore_as_shell(self, category: Category, filter_config: dict = None):
+        """Restore a pinned panel without items: header, filters and a loading label
+
+        Items are set later with set_preloaded_category (read in background) and
+        rendered the first time the panel is visible and not minimized.
+
+        Args:
+            category: Category without items (id, name, icon from the panel row)
+            filter_config: Saved filter configuration (applied without rendering)
+        """
+        self.current_category = category
+        self.is_content_loaded = False
+        self._awaiting_content = True
+        self._preloaded_category = None
+
+        self.header_label.setText(category.name)
+        self.copy_all_button.setEnabled(False)
+
+        # Mantener los filtros guardados (el auto-guardado del panel los serializa)
+        if filter_config:
+            self.apply_filter_config(filter_config)
+
+        loading_label = QLabel("Cargando...")
+        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        loading_label.setStyleSheet("color: #888888; font-size: 10pt; padding: 8px; background-color: transparent;")
+        self.items_layout.insertWidget(self.items_layout.count() - 1, loading_label)
+
+    def set_preloaded_category(self, category: Category = None):
+        """Receive the category read in background (None if it failed)"""
+        if self.is_content_loaded or not self._awaiting_content:
+            return
+
+        self._awaiting_content = False
+        self._preloaded_category = category
+        self.load_deferred_content()
+
+    def _can_render_content(self) -> bool:
+        return self.isVisible() and not self.is_minimized
+
+    def load_deferred_content(self, request_priority: bool = False):
+        """Render the items of a restored shell if it is visible and not minimized
+
+        Args:
+            request_priority: Ask to read this panel first if its content is not ready
+        """
+        if self.is_content_loaded or not self._can_render_content():
+            return
+
+        if self._awaiting_content:
+            # Maximizado antes de que termine la lectura: adelantarla
+            if request_priority and self.panel_id is not None:
+                self.content_requested.emit(self.panel_id)
+            return
+
+        category = self._preloaded_category
+        if category is None and self.config_manager:
+            category = self.config_manager.get_category(self.current_category.id)
+        if category is None:
+            logger.warning(f"Could not load content for panel {self.panel_id}")
+            return
+
+        self.is_content_loaded = True
+        self._preloaded_category = None
+
+        # load_category limpia la búsqueda: reaplicar los filtros del shell
+        filter_config = {
+            'advanced_filters': self.current_filters,
+            'state_filter': self.current_state_filter,
+            'search_text': self.search_bar.search_input.text()
+        }
+        self.load_category(category, activate=False)
+        if filter_config['advanced_filters'] or filter_config['state_filter'] != 'normal' or filter_config['search_text']:
+            self.apply_filter_config(filter_config)
+
+        logger.info(f"Deferred content rendered for panel {self.panel_id} ({len(self.all_items)} items)")
+
+    def load_category(self, category: Category, activate: bool = True):
+        """Load and display items and lists from a category
+
+        Args:
+            category: Category with its items
+            activate: Show, raise and focus the panel (False for deferred restoration)
+        """
         logger.info(f"Loading category: {category.name} with {len(category.items)} items")
 
         self.current_category = category
@@ -475,7 +570,7 @@ class FloatingPanel(QWidget):
         self.all_lists = []
         if self.list_controller and hasattr(category, 'id'):
             try:
-                self.all_lists = self.list_controller.get_lists(category.id)
+                self.all_lists = self.list_controller.get_lists_with_steps(category.id)
                 logger.info(f"Loaded {len(self.all_lists)} lists from category {category.name}")
             except Exception as e:
                 logger.error(f"Error loading lists: {e}", exc_info=True)
@@ -505,9 +600,10 @@ class FloatingPanel(QWidget):
             self.new_list_button.setEnabled(False)
 
         # Show the window
-        self.show()
-        self.raise_()
-        self.activateWindow()
+        if activate:
+            self.show()
+            self.raise_()
+            self.activateWindow()
 
     def display_items(self, items):
         """Display a list of items (mantiene compatibilidad hacia atrás)"""
@@ -531,7 +627,7 @@ class FloatingPanel(QWidget):
 
         Args:
             items: List of Item objects (solo items normales, no items de listas)
-            lists: List of list metadata dicts from ListController.get_lists()
+            lists: List of list metadata dicts from ListController.get_lists_with_steps()
         """
         logger.info(f"Displaying {len(items)} items and {len(lists)} lists")
 
@@ -591,23 +687,16 @@ class FloatingPanel(QWidget):
             """)
             self.items_layout.insertWidget(self.items_layout.count() - 1, lists_header)
 
-            # Add lists
+            # Add lists (steps come with the list metadata; their content loads on expand)
             for idx, list_data in enumerate(lists):
                 logger.debug(f"Creating list widget {idx+1}/{len(lists)}: {list_data.get('list_group')}")
 
-                # Obtener items de la lista
-                list_items = []
-                if self.list_controller and hasattr(self.current_category, 'id'):
-                    list_items = self.list_controller.get_list_items(
-                        self.current_category.id,
-                        list_data.get('list_group')
-                    )
-
                 # Crear ListWidget
                 list_widget = ListWidget(
                     list_data=list_data,
                     category_id=int(self.current_category.id) if hasattr(self.current_category, 'id') and self.current_category.id else None,
-                    list_items=list_items
+                    list_items=list_data.get('steps', []),
+                    content_loader=self.list_controller.get_step_contents if self.list_controller else None
                 )
 
                 # Conectar señales
@@ -739,7 +828,7 @@ class FloatingPanel(QWidget):
                 if self.current_category:
                     # Necesitamos actualizar la categoría desde la base de datos
                     # Por ahora solo recargamos la vista
-                    self.all_lists = self.list_controller.get_lists(category_id)
+                    self.all_lists = self.list_controller.get_lists_with_steps(category_id)
                     self.display_items_and_lists(self.all_items, self.all_lists)
             else:
                 logger.warning(f"Failed to delete list '{list_group}': {message}")
@@ -882,6 +971,12 @@ class FloatingPanel(QWidget):
             logger.warning("Cannot reload: no current category or config manager")
             return
 
+        if not self.is_content_loaded:
+            # Aún sin renderizar: descartar lo leído, se leerá de nuevo al mostrarse
+            self._awaiting_content = False
+            self._preloaded_category = None
+            return
+
         try:
             # Obtener items actualizados desde DB
             if hasattr(self.current_category, 'id'):
@@ -900,7 +995,7 @@ class FloatingPanel(QWidget):
 
                     # Recargar listas
                     if self.list_controller:
-                        self.all_lists = self.list_controller.get_lists(category_id)
+                        self.all_lists = self.list_controller.get_lists_with_steps(category_id)
 
                     # Re-renderizar
                     self.display_items_and_lists(self.all_items, self.all_lists)
@@ -912,11 +1007,19 @@ class FloatingPanel(QWidget):
 
     def on_search_changed(self, query: str):
         """Handle search query change with filtering"""
-        if not self.current_category:
+        if not self.current_category or not self.is_content_loaded:
             return
 
-        # Aplicar filtros avanzados primero a items
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
+        # Aplicar filtros avanzados primero a items: en SQL para categorías guardadas,
+        # en memoria para items que aún no están en la base de datos
+        category_db_id = self._get_category_db_id()
+        if self.current_filters and category_db_id is not None:
+            filtered_items = self.filter_engine.fetch_items(
+                self.config_manager.db, self.current_filters, category_id=category_db_id,
+                include_inactive=True, exclude_lists=True, unsaved_items=self.all_items
+            )
+        else:
+            filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
 
         # Aplicar filtro de estado (is_active, is_archived)
         filtered_items = self.filter_items_by_state(filtered_items)
@@ -949,6 +1052,15 @@ class FloatingPanel(QWidget):
         # Update filter badge when search changes
         self.update_filter_badge()
 
+    def _get_category_db_id(self):
+        """ID en base de datos de la categoría actual (None si no está guardada)"""
+        if not self.config_manager or not hasattr(self.config_manager, 'db'):
+            return None
+        try:
+            return int(self.current_category.id)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
     def on_filters_changed(self, filters: dict):
         """Handle cuando cambian los filtros avanzados"""
         logger.info(f"Filters changed: {filters}")
@@ -1478,6 +1590,9 @@ class FloatingPanel(QWidget):
             self.minimize_button.setToolTip("Minimizar panel")
             logger.info(f"Panel '{self.header_label.text()}' MAXIMIZADO")
 
+            # Restauración diferida: primer renderizado al maximizar
+            self.load_deferred_content(request_priority=True)
+
     def apply_custom_styling(self):
         """Apply custom color to panel header if custom_color is set"""
         if self.custom_color:
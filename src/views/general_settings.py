@@ -17,6 +17,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from views.dialogs.password_verify_dialog import PasswordVerifyDialog
+from database.db_manager import CLIPBOARD_HISTORY_MAX_ENTRIES, CLIPBOARD_HISTORY_MAX_BYTES
+from core.db_maintenance import DEFAULT_INTERVAL_HOURS, DEFAULT_IDLE_SECONDS, DEFAULT_RETENTION_DAYS
 
 logger = logging.getLogger(__name__)
 
@@ -98,18 +100,79 @@ class GeneralSettings(QWidget):
         clipboard_layout = QFormLayout()
         clipboard_layout.setSpacing(10)
 
-        # Max history items
+        # Capture toggle (system-wide clipboard history)
+        self.clipboard_history_check = QCheckBox("Guardar historial del portapapeles")
+        self.clipboard_history_check.setChecked(True)
+        self.clipboard_history_check.setToolTip(
+            "Registra lo que se copia en cualquier aplicación.\n"
+            "Lo marcado como oculto por gestores de contraseñas nunca se guarda."
+        )
+        self.clipboard_history_check.stateChanged.connect(self.settings_changed)
+        clipboard_layout.addRow(self.clipboard_history_check)
+
+        # Max history items (clipboard_history_max_entries)
         self.max_history_spin = QSpinBox()
         self.max_history_spin.setMinimum(10)
-        self.max_history_spin.setMaximum(50)
-        self.max_history_spin.setValue(20)
+        self.max_history_spin.setMaximum(100000)
+        self.max_history_spin.setSingleStep(100)
+        self.max_history_spin.setValue(CLIPBOARD_HISTORY_MAX_ENTRIES)
         self.max_history_spin.setSuffix(" items")
         self.max_history_spin.valueChanged.connect(self.settings_changed)
         clipboard_layout.addRow("Máximo items historial:", self.max_history_spin)
 
+        # Max history size (clipboard_history_max_bytes)
+        self.max_history_mb_spin = QSpinBox()
+        self.max_history_mb_spin.setMinimum(1)
+        self.max_history_mb_spin.setMaximum(1024)
+        self.max_history_mb_spin.setValue(CLIPBOARD_HISTORY_MAX_BYTES // (1024 * 1024))
+        self.max_history_mb_spin.setSuffix(" MB")
+        self.max_history_mb_spin.valueChanged.connect(self.settings_changed)
+        clipboard_layout.addRow("Tamaño máximo historial:", self.max_history_mb_spin)
+
         clipboard_group.setLayout(clipboard_layout)
         main_layout.addWidget(clipboard_group)
 
+        # Database maintenance group
+        maintenance_group = QGroupBox("Mantenimiento de base de datos")
+        maintenance_group.setStyleSheet(behavior_group.styleSheet())
+        maintenance_layout = QFormLayout()
+        maintenance_layout.setSpacing(10)
+
+        self.maintenance_check = QCheckBox("Mantenimiento automático en segundo plano")
+        self.maintenance_check.setChecked(True)
+        self.maintenance_check.setToolTip("Optimiza y verifica la base de datos cuando no se usa la aplicación")
+        self.maintenance_check.stateChanged.connect(self.settings_changed)
+        maintenance_layout.addRow(self.maintenance_check)
+
+        self.maintenance_interval_spin = QSpinBox()
+        self.maintenance_interval_spin.setRange(1, 24 * 30)
+        self.maintenance_interval_spin.setValue(DEFAULT_INTERVAL_HOURS)
+        self.maintenance_interval_spin.setSuffix(" h")
+        self.maintenance_interval_spin.valueChanged.connect(self.settings_changed)
+        maintenance_layout.addRow("Cada:", self.maintenance_interval_spin)
+
+        self.maintenance_idle_spin = QSpinBox()
+        self.maintenance_idle_spin.setRange(30, 3600)
+        self.maintenance_idle_spin.setSingleStep(30)
+        self.maintenance_idle_spin.setValue(DEFAULT_IDLE_SECONDS)
+        self.maintenance_idle_spin.setSuffix(" s")
+        self.maintenance_idle_spin.valueChanged.connect(self.settings_changed)
+        maintenance_layout.addRow("Tras inactividad de:", self.maintenance_idle_spin)
+
+        # history_retention_days (0 = keep everything)
+        self.history_retention_spin = QSpinBox()
+        self.history_retention_spin.setRange(0, 3650)
+        self.history_retention_spin.setSingleStep(30)
+        self.history_retention_spin.setSpecialValueText("Sin límite")
+        self.history_retention_spin.setValue(DEFAULT_RETENTION_DAYS)
+        self.history_retention_spin.setSuffix(" días")
+        self.history_retention_spin.setToolTip("El historial de uso más antiguo se elimina en el mantenimiento")
+        self.history_retention_spin.valueChanged.connect(self.settings_changed)
+        maintenance_layout.addRow("Conservar historial de uso:", self.history_retention_spin)
+
+        maintenance_group.setLayout(maintenance_layout)
+        main_layout.addWidget(maintenance_group)
+
         # Import/Export group
         io_group = QGroupBox("Importar/Exportar")
         io_group.setStyleSheet(behavior_group.styleSheet())
@@ -222,9 +285,26 @@ class GeneralSettings(QWidget):
         start_windows = self.config_manager.get_setting("start_with_windows", False)
         self.start_windows_check.setChecked(start_windows)
 
-        # Load max history
-        max_history = self.config_manager.get_setting("max_history", 20)
-        self.max_history_spin.setValue(max_history)
+        # Load clipboard history settings
+        self.clipboard_history_check.setChecked(
+            bool(self.config_manager.get_setting("clipboard_history_enabled", True))
+        )
+        max_entries = self.config_manager.get_setting("clipboard_history_max_entries", CLIPBOARD_HISTORY_MAX_ENTRIES)
+        self.max_history_spin.setValue(int(max_entries))
+        max_bytes = self.config_manager.get_setting("clipboard_history_max_bytes", CLIPBOARD_HISTORY_MAX_BYTES)
+        self.max_history_mb_spin.setValue(max(1, int(max_bytes) // (1024 * 1024)))
+
+        # Load database maintenance settings
+        self.maintenance_check.setChecked(bool(self.config_manager.get_setting("maintenance_enabled", True)))
+        self.maintenance_interval_spin.setValue(
+            int(self.config_manager.get_setting("maintenance_interval_hours", DEFAULT_INTERVAL_HOURS))
+        )
+        self.maintenance_idle_spin.setValue(
+            int(self.config_manager.get_setting("maintenance_idle_seconds", DEFAULT_IDLE_SECONDS))
+        )
+        self.history_retention_spin.setValue(
+            int(self.config_manager.get_setting("history_retention_days", DEFAULT_RETENTION_DAYS))
+        )
 
     def export_config(self):
         """Export configuration to JSON file"""
@@ -337,5 +417,11 @@ class GeneralSettings(QWidget):
             "minimize_to_tray": self.minimize_tray_check.isChecked(),
             "always_on_top": self.always_on_top_check.isChecked(),
             "start_with_windows": self.start_windows_check.isChecked(),
-            "max_history": self.max_history_spin.value()
+            "clipboard_history_enabled": self.clipboard_history_check.isChecked(),
+            "clipboard_history_max_entries": self.max_history_spin.value(),
+            "clipboard_history_max_bytes": self.max_history_mb_spin.value() * 1024 * 1024,
+            "maintenance_enabled": self.maintenance_check.isChecked(),
+            "maintenance_interval_hours": self.maintenance_interval_spin.value(),
+            "maintenance_idle_seconds": self.maintenance_idle_spin.value(),
+            "history_retention_days": self.history_retention_spin.value()
         }
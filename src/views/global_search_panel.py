@@ -374,8 +374,11 @@ class GlobalSearchPanel(QWidget):
         logger.debug(f"Total items before filter: {len(self.all_items)}")
         logger.debug(f"Current filters: {self.current_filters}")
 
-        # Aplicar filtros avanzados primero
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
+        # Aplicar filtros avanzados primero (en SQL: la consulta trae solo las filas que cumplen)
+        if self.current_filters and self.db_manager:
+            filtered_items = self.filter_engine.fetch_items(self.db_manager, self.current_filters)
+        else:
+            filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
         logger.debug(f"Items after advanced filters: {len(filtered_items)}")
 
         # Luego aplicar búsqueda si hay query
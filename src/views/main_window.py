@@ -23,7 +23,8 @@ from views.pinned_panels_manager_window import PinnedPanelsManagerWindow
 from views.dialogs.popular_items_dialog import PopularItemsDialog
 from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
 from views.dialogs.suggestions_dialog import FavoriteSuggestionsDialog
-from views.dialogs.stats_dashboard import StatsDashboard
+from views.dialogs.startup_report_dialog import StartupReportDialog
+from views.dialogs.query_profiler_dialog import QueryProfilerDialog
 from views.dialogs.panel_config_dialog import PanelConfigDialog
 from views.dialogs.quick_create_dialog import QuickCreateDialog
 from views.category_filter_window import CategoryFilterWindow
@@ -32,6 +33,9 @@ from core.hotkey_manager import HotkeyManager
 from core.tray_manager import TrayManager
 from core.session_manager import SessionManager
 from core.notification_manager import NotificationManager
+from core.thumbnail_service import get_thumbnail_service
+from core.activity_filter import UserActivityFilter
+from utils.startup_tracer import startup_span
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -63,6 +67,8 @@ class MainWindow(QMainWindow):
     # Signals
     category_selected = pyqtSignal(str)  # category_id
     item_selected = pyqtSignal(object)  # Item
+    pinned_panel_content_loaded = pyqtSignal(int, object)  # panel_id, dict de filas o None
+    setting_changed = pyqtSignal(str, object)  # key, value (desde SettingsStore)
 
     def __init__(self, controller=None):
         super().__init__()
@@ -87,6 +93,23 @@ class MainWindow(QMainWindow):
         self.panel_shortcuts = {}  # Dict[panel_id, QShortcut] - Track keyboard shortcuts for panels
         self.panel_by_shortcut = {}  # Dict[shortcut_str, panel] - Quick lookup panel by shortcut
 
+        # Carga diferida del contenido de paneles anclados restaurados
+        self.pinned_panel_loader = None
+        self.pinned_panel_content_loaded.connect(self.on_pinned_panel_content_loaded)
+
+        # Reaccionar a cambios de settings sin releerlas
+        self.setting_changed.connect(self.on_setting_changed)
+        if self.config_manager:
+            self.config_manager.settings.add_listener(self.setting_changed.emit)
+            # Thumbnails resolve relative paths against the configured files folder
+            get_thumbnail_service(base_path=self.config_manager.get_files_base_path())
+
+        # Any keyboard/mouse input in the app postpones background DB maintenance
+        self.activity_filter = None
+        if controller and QApplication.instance():
+            self.activity_filter = UserActivityFilter(controller.maintenance_service.notify_activity, parent=self)
+            QApplication.instance().installEventFilter(self.activity_filter)
+
         # Minimizar/Maximizar estado
         self.is_minimized = False
         self.normal_height = None  # Se guardará después de calcular
@@ -103,7 +126,8 @@ class MainWindow(QMainWindow):
         self.check_notifications_delayed()
 
         # AUTO-RESTORE: Restore pinned panels from database on startup
-        self.restore_pinned_panels_on_startup()
+        with startup_span('window.pinned_panels'):
+            self.restore_pinned_panels_on_startup()
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -292,6 +316,8 @@ class MainWindow(QMainWindow):
             logger.info("Closing pinned panel")
             if sender_panel in self.pinned_panels:
                 self.pinned_panels.remove(sender_panel)
+                if self.pinned_panel_loader and sender_panel.panel_id is not None:
+                    self.pinned_panel_loader.cancel(sender_panel.panel_id)
                 sender_panel.deleteLater()
                 logger.info(f"Pinned panel removed. Remaining pinned panels: {len(self.pinned_panels)}")
 
@@ -953,6 +979,8 @@ class MainWindow(QMainWindow):
         self.tray_manager.hide_window_requested.connect(self.hide_window)
         self.tray_manager.settings_requested.connect(self.show_settings)
         self.tray_manager.stats_dashboard_requested.connect(self.show_stats_dashboard)
+        self.tray_manager.startup_report_requested.connect(self.show_startup_report)
+        self.tray_manager.query_profiler_requested.connect(self.show_query_profiler)
         self.tray_manager.popular_items_requested.connect(self.show_popular_items)
         self.tray_manager.forgotten_items_requested.connect(self.show_forgotten_items)
         self.tray_manager.pinned_panels_requested.connect(self.open_pinned_panels_window)
@@ -1054,13 +1082,18 @@ class MainWindow(QMainWindow):
             categories = self.controller.get_categories()
             self.sidebar.load_categories(categories)
 
-        # Apply appearance settings (opacity, etc.)
-        if self.config_manager:
-            opacity = self.config_manager.get_setting("opacity", 0.95)
-            self.setWindowOpacity(opacity)
+        # Appearance settings (opacity, etc.) are applied by on_setting_changed
 
         print("Settings applied")
 
+    def on_setting_changed(self, key: str, value):
+        """Apply a changed setting (emitted by SettingsStore through setting_changed)"""
+        if key == "opacity":
+            try:
+                self.setWindowOpacity(float(value))
+            except (TypeError, ValueError):
+                logger.warning(f"Invalid opacity setting: {value!r}")
+
     def logout_session(self):
         """Logout current session"""
         logger.info("Logging out...")
@@ -1101,6 +1134,18 @@ class MainWindow(QMainWindow):
         if self.hotkey_manager:
             self.hotkey_manager.stop()
 
+        # Stop background database maintenance
+        if self.controller:
+            self.controller.maintenance_service.stop()
+
+        # Stop background loading of pinned panels
+        if self.pinned_panel_loader:
+            self.pinned_panel_loader.close()
+
+        # Write pending settings and panel state
+        if self.config_manager:
+            self.config_manager.settings.flush()
+
         # Cleanup tray
         if self.tray_manager:
             self.tray_manager.cleanup()
@@ -1222,12 +1267,34 @@ class MainWindow(QMainWindow):
     def show_stats_dashboard(self):
         """Mostrar dashboard completo de estadísticas"""
         try:
-            dialog = StatsDashboard(self)
+            # Import diferido: el dashboard carga matplotlib
+            from views.dialogs.stats_dashboard import StatsDashboard
+            maintenance_service = self.controller.maintenance_service if self.controller else None
+            dialog = StatsDashboard(self, maintenance_service=maintenance_service)
             dialog.exec()
         except Exception as e:
             logger.error(f"Error showing stats dashboard: {e}")
             QMessageBox.critical(self, "Error", f"Error al mostrar dashboard de estadísticas:\n{str(e)}")
 
+    def show_startup_report(self):
+        """Mostrar informe de tiempos de arranque"""
+        try:
+            dialog = StartupReportDialog(parent=self)
+            dialog.exec()
+        except Exception as e:
+            logger.error(f"Error showing startup report: {e}")
+            QMessageBox.critical(self, "Error", f"Error al mostrar informe de arranque:\n{str(e)}")
+
+    def show_query_profiler(self):
+        """Mostrar panel de desarrollo con el perfil de consultas SQL"""
+        try:
+            settings = self.config_manager.settings if self.config_manager else None
+            dialog = QueryProfilerDialog(settings=settings, parent=self)
+            dialog.exec()
+        except Exception as e:
+            logger.error(f"Error showing query profiler: {e}")
+            QMessageBox.critical(self, "Error", f"Error al mostrar perfil de consultas:\n{str(e)}")
+
     def show_favorite_suggestions(self):
         """Mostrar diálogo de sugerencias de favoritos"""
         try:
@@ -1422,13 +1489,18 @@ class MainWindow(QMainWindow):
         self.show_pinned_panels_manager()
 
     def restore_pinned_panels_on_startup(self):
-        """AUTO-RESTORE: Restore active pinned panels from database on application startup"""
+        """AUTO-RESTORE: Restore active pinned panels from database on application startup
+
+        Panels are restored as lightweight shells (geometry, header, filters).
+        Their items are read by PinnedPanelContentLoader in background and
+        rendered when each panel is first visible and not minimized.
+        """
         if not self.controller:
             logger.warning("No controller available - skipping panel restoration")
             return
 
         try:
-            # Get all active panels from database
+            # Get all active panels from database (panel rows only, no items)
             active_panels = self.controller.pinned_panels_manager.restore_panels_on_startup()
 
             if not active_panels:
@@ -1437,17 +1509,28 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Restoring {len(active_panels)} active panels from database...")
 
+            from models.category import Category
+            from core.pinned_panel_loader import PinnedPanelContentLoader
+            if self.pinned_panel_loader is None:
+                self.pinned_panel_loader = PinnedPanelContentLoader(
+                    self.config_manager.db.db_path,
+                    on_loaded=self.pinned_panel_content_loaded.emit
+                )
+
+            restored_ids = []
+
             # Restore each panel
             for panel_data in active_panels:
                 try:
                     panel_id = panel_data['id']
                     category_id = panel_data['category_id']
 
-                    # Get category
-                    category = self.controller.get_category(str(category_id))
-                    if not category:
-                        logger.warning(f"Category {category_id} not found for panel {panel_id} - skipping")
-                        continue
+                    # Category shell from the panel row (items are loaded later)
+                    category = Category(
+                        category_id=str(category_id),
+                        name=panel_data.get('category_name') or "",
+                        icon=panel_data.get('category_icon') or ""
+                    )
 
                     # Create new floating panel with saved configuration
                     restored_panel = FloatingPanel(
@@ -1465,9 +1548,15 @@ class MainWindow(QMainWindow):
                     restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
                     restored_panel.customization_requested.connect(self.on_panel_customization_requested)
                     restored_panel.url_open_requested.connect(self.on_url_open_in_browser)
+                    restored_panel.content_requested.connect(self.on_pinned_panel_content_requested)
 
-                    # Load category
-                    restored_panel.load_category(category)
+                    # Restore saved filters without rendering items
+                    filter_config = None
+                    if panel_data.get('filter_config'):
+                        filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
+                            panel_data['filter_config']
+                        )
+                    restored_panel.restore_as_shell(category, filter_config)
 
                     # Restore position and size
                     restored_panel.move(panel_data['x_position'], panel_data['y_position'])
@@ -1486,39 +1575,61 @@ class MainWindow(QMainWindow):
                     if panel_data.get('is_minimized'):
                         restored_panel.toggle_minimize()
 
-                    # Restore filter configuration if available
-                    if panel_data.get('filter_config'):
-                        filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
-                            panel_data['filter_config']
-                        )
-                        if filter_config:
-                            restored_panel.apply_filter_config(filter_config)
-                            logger.debug(f"Applied saved filters to panel {panel_id}")
-
                     # Add to pinned panels list
                     self.pinned_panels.append(restored_panel)
-
-                    # Update last_opened in database
-                    self.controller.pinned_panels_manager.mark_panel_opened(panel_id)
+                    restored_ids.append(panel_id)
 
                     # Register keyboard shortcut if one is assigned
                     if panel_data.get('keyboard_shortcut'):
                         self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
 
+                    # Queue background read of the items
+                    self.pinned_panel_loader.request(panel_id, category_id)
+
                     # Show panel
                     restored_panel.show()
 
-                    logger.info(f"Panel {panel_id} (Category: {category.name}) restored successfully")
+                    logger.info(f"Panel {panel_id} (Category: {category.name}) restored as shell")
 
                 except Exception as e:
                     logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
                     continue
 
+            # Update last_opened in database (one transaction for all panels)
+            self.controller.pinned_panels_manager.mark_panels_opened(restored_ids)
+
             logger.info(f"Panel restoration complete: {len(self.pinned_panels)}/{len(active_panels)} panels restored")
 
         except Exception as e:
             logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
 
+    def _find_pinned_panel(self, panel_id: int):
+        """Pinned panel with the given database ID (None if not open)"""
+        for panel in self.pinned_panels:
+            if panel.panel_id == panel_id:
+                return panel
+        return None
+
+    def on_pinned_panel_content_requested(self, panel_id: int):
+        """A restored shell became visible before its items were read: read it first"""
+        panel = self._find_pinned_panel(panel_id)
+        if panel and self.pinned_panel_loader:
+            self.pinned_panel_loader.request(panel_id, panel.current_category.id, priority=True)
+
+    def on_pinned_panel_content_loaded(self, panel_id: int, content):
+        """Items of a restored panel read in background (runs in the UI thread)"""
+        panel = self._find_pinned_panel(panel_id)
+        if not panel:
+            return
+
+        category = None
+        if content:
+            try:
+                category = self.config_manager.build_category(content['category'], content['items'])
+            except Exception as e:
+                logger.error(f"Error building category for panel {panel_id}: {e}", exc_info=True)
+        panel.set_preloaded_category(category)
+
     def on_restore_panel_requested(self, panel_id: int):
         """Handle request to restore/open a saved panel"""
         logger.info(f"[MAIN WINDOW] Restore panel requested: {panel_id}")
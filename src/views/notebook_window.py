@@ -11,7 +11,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPoint
 from PyQt6.QtGui import QIcon, QAction
-from views.widgets.notebook_tab import NotebookTab
+from views.widgets.notebook_tab import NotebookTab, NotebookTabPlaceholder
+from core.notebook_autosave import NotebookAutosaveService
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,8 +41,9 @@ class APPBARDATA(ctypes.Structure):
 # Constantes
 NOTEBOOK_WIDTH = 450
 NOTEBOOK_MIN_HEIGHT = 600
-NOTEBOOK_AUTOSAVE_INTERVAL = 5000  # 5 segundos
+NOTEBOOK_AUTOSAVE_INTERVAL = 5000  # 5 segundos (flush a BD; el journal se escribe en cada cambio)
 NOTEBOOK_MAX_TABS = 10
+NOTEBOOK_MEMORY_BUDGET_MB = 4  # Contenido máximo de pestañas cargadas (setting notebook_memory_budget_mb)
 
 
 class NotebookWindow(QWidget):
@@ -49,12 +52,14 @@ class NotebookWindow(QWidget):
     # Señales
     closed = pyqtSignal()
     tab_saved_as_item = pyqtSignal(dict)  # Cuando se guarda un item
+    autosave_finished = pyqtSignal(dict)  # Resultado del flush en segundo plano
 
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
         self.notebook_manager = controller.notebook_manager
         self.appbar_registered = False  # Estado del AppBar
+        self._tab_last_active = {}  # tab_id -> momento de la última activación
 
         # Para dragging de ventana
         self.drag_position = QPoint()
@@ -70,6 +75,11 @@ class NotebookWindow(QWidget):
             Qt.WindowType.WindowStaysOnTopHint
         )
 
+        # Auto-guardado incremental (recupera cambios de un cierre inesperado)
+        self.autosave = NotebookAutosaveService(str(self.controller.config_manager.db.db_path))
+        self.autosave.recover()
+        self.autosave_finished.connect(self.on_autosave_finished)
+
         self.setup_ui()
         self.load_tabs()
         self.setup_autosave()
@@ -163,8 +173,8 @@ class NotebookWindow(QWidget):
         return title_bar
 
     def load_tabs(self):
-        """Cargar pestañas persistentes desde BD"""
-        tabs = self.notebook_manager.get_all_tabs()
+        """Cargar pestañas persistentes desde BD (solo metadatos; el contenido al activarlas)"""
+        tabs = self.notebook_manager.get_tab_summaries()
 
         if not tabs:
             # Si no hay tabs, crear una por defecto
@@ -172,10 +182,12 @@ class NotebookWindow(QWidget):
             self.add_new_tab()
             return
 
-        # Cargar cada tab
+        # Cargar cada tab como placeholder
         logger.info(f"Loading {len(tabs)} tabs from database")
+        self.tab_widget.blockSignals(True)
         for tab_data in tabs:
             self.add_tab_from_data(tab_data)
+        self.tab_widget.blockSignals(False)
 
         # Restaurar tab activa
         try:
@@ -188,6 +200,27 @@ class NotebookWindow(QWidget):
         except Exception as e:
             logger.warning(f"Could not restore active tab: {e}")
 
+        self.load_tab(self.tab_widget.currentIndex())
+
+    def _create_tab_widget(self, tab_id, tab_data=None):
+        """Construir el editor de una pestaña y conectar sus señales"""
+        categories = self.controller.get_categories()
+        db_path = str(self.controller.config_manager.db.db_path)
+
+        tab_widget = NotebookTab(
+            tab_id=tab_id,
+            tab_data=tab_data,
+            categories=categories,
+            db_path=db_path
+        )
+        self.autosave.set_saved(tab_id, self._tab_fields(tab_widget.get_data()))
+
+        # Conectar señales
+        tab_widget.save_requested.connect(self.on_save_as_item)
+        tab_widget.content_changed.connect(self.on_tab_content_changed)
+        tab_widget.cancel_requested.connect(self.on_cancel_requested)
+        return tab_widget
+
     def add_new_tab(self):
         """Agregar nueva pestaña vacía"""
         # Verificar límite
@@ -204,14 +237,7 @@ class NotebookWindow(QWidget):
         logger.info(f"Created new tab with ID: {tab_id}")
 
         # Crear widget
-        categories = self.controller.get_categories()
-        db_path = str(self.controller.config_manager.db.db_path)
-        tab_widget = NotebookTab(tab_id=tab_id, categories=categories, db_path=db_path)
-
-        # Conectar señales
-        tab_widget.save_requested.connect(self.on_save_as_item)
-        tab_widget.content_changed.connect(self.on_tab_content_changed)
-        tab_widget.cancel_requested.connect(self.on_cancel_requested)
+        tab_widget = self._create_tab_widget(tab_id)
 
         # Agregar al tab widget
         index = self.tab_widget.addTab(tab_widget, "Sin titulo")
@@ -220,21 +246,8 @@ class NotebookWindow(QWidget):
         logger.debug(f"Tab widget added at index {index}")
 
     def add_tab_from_data(self, tab_data):
-        """Agregar pestaña con datos existentes"""
-        categories = self.controller.get_categories()
-        db_path = str(self.controller.config_manager.db.db_path)
-
-        tab_widget = NotebookTab(
-            tab_id=tab_data['id'],
-            tab_data=tab_data,
-            categories=categories,
-            db_path=db_path
-        )
-
-        # Conectar señales
-        tab_widget.save_requested.connect(self.on_save_as_item)
-        tab_widget.content_changed.connect(self.on_tab_content_changed)
-        tab_widget.cancel_requested.connect(self.on_cancel_requested)
+        """Agregar pestaña sin cargar (placeholder con metadatos)"""
+        tab_widget = NotebookTabPlaceholder(tab_id=tab_data['id'], tab_data=tab_data)
 
         # Agregar al tab widget
         title = tab_data.get('title', 'Sin titulo')
@@ -245,7 +258,86 @@ class NotebookWindow(QWidget):
         display_title = title[:25] + "..." if len(title) > 25 else title
 
         self.tab_widget.addTab(tab_widget, display_title)
-        logger.debug(f"Tab loaded from data: {title}")
+        logger.debug(f"Tab placeholder added: {title}")
+
+    def _replace_tab_widget(self, index, new_widget):
+        """Sustituir el widget de una pestaña conservando título y pestaña activa"""
+        current_index = self.tab_widget.currentIndex()
+        old_widget = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, new_widget, title)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+
+        old_widget.deleteLater()
+
+    def load_tab(self, index):
+        """Cargar contenido y construir el editor de una pestaña (primera activación)"""
+        placeholder = self.tab_widget.widget(index)
+        if placeholder is None or placeholder.is_loaded:
+            return
+
+        tab_data = self.notebook_manager.get_tab(placeholder.tab_id)
+        if tab_data is None:
+            logger.warning(f"Tab {placeholder.tab_id} no longer exists")
+            return
+
+        self._replace_tab_widget(index, self._create_tab_widget(placeholder.tab_id, tab_data))
+        logger.debug(f"Tab {placeholder.tab_id} loaded at index {index}")
+
+    def unload_tab(self, index):
+        """Descargar el editor de una pestaña sin cambios pendientes"""
+        tab_widget = self.tab_widget.widget(index)
+        if tab_widget is None or not tab_widget.is_loaded or not tab_widget.tab_id:
+            return False
+
+        data = tab_widget.get_data()
+        if self.autosave.mark_dirty(tab_widget.tab_id, self._tab_fields(data)) or \
+                self.autosave.is_dirty(tab_widget.tab_id):
+            # Se descargará cuando el auto-guardado lo haya escrito
+            return False
+
+        placeholder = NotebookTabPlaceholder(tab_id=tab_widget.tab_id, tab_data={
+            'id': tab_widget.tab_id,
+            'title': data['label'],
+            'category_id': data['category_id'],
+            'item_type': data['item_type'],
+        })
+        self._replace_tab_widget(index, placeholder)
+        logger.debug(f"Tab {tab_widget.tab_id} unloaded at index {index}")
+        return True
+
+    def enforce_memory_budget(self):
+        """Descargar las pestañas inactivas menos usadas si se supera el presupuesto"""
+        try:
+            budget_mb = float(self.controller.config_manager.get_setting(
+                'notebook_memory_budget_mb', NOTEBOOK_MEMORY_BUDGET_MB
+            ))
+        except (TypeError, ValueError):
+            budget_mb = NOTEBOOK_MEMORY_BUDGET_MB
+
+        current_index = self.tab_widget.currentIndex()
+        loaded = []
+        for i in range(self.tab_widget.count()):
+            tab_widget = self.tab_widget.widget(i)
+            if not tab_widget.is_loaded or not tab_widget.tab_id:
+                continue
+            loaded.append({
+                'id': tab_widget.tab_id,
+                'size': tab_widget.content_input.document().characterCount(),
+                'last_active': self._tab_last_active.get(tab_widget.tab_id, 0),
+                'can_unload': i != current_index,
+            })
+
+        to_unload = self.notebook_manager.select_tabs_to_unload(loaded, budget_mb * 1024 * 1024)
+        for tab_id in to_unload:
+            for i in range(self.tab_widget.count()):
+                if self.tab_widget.widget(i).tab_id == tab_id:
+                    self.unload_tab(i)
+                    break
 
     def close_tab(self, index):
         """Cerrar pestaña"""
@@ -276,6 +368,8 @@ class NotebookWindow(QWidget):
 
         # Eliminar de BD
         if tab_widget.tab_id:
+            self.autosave.discard(tab_widget.tab_id)
+            self._tab_last_active.pop(tab_widget.tab_id, None)
             self.notebook_manager.delete_tab(tab_widget.tab_id)
             logger.info(f"Tab deleted from database: {tab_widget.tab_id}")
 
@@ -288,6 +382,13 @@ class NotebookWindow(QWidget):
         if index < 0:
             return
 
+        # Construir el editor en la primera activación
+        self.load_tab(index)
+        tab_widget = self.tab_widget.widget(index)
+        if tab_widget is not None and tab_widget.tab_id:
+            self._tab_last_active[tab_widget.tab_id] = time.monotonic()
+        self.enforce_memory_budget()
+
         # Guardar índice en settings
         self.controller.config_manager.set_setting(
             'notebook_last_active_tab', index
@@ -315,6 +416,10 @@ class NotebookWindow(QWidget):
 
         self.tab_widget.setTabText(current_index, display_title)
 
+        # Marcar para el próximo auto-guardado (solo si el contenido cambió)
+        if current_widget.tab_id:
+            self.autosave.mark_dirty(current_widget.tab_id, self._tab_fields(data))
+
     def on_save_as_item(self, data):
         """Guardar nota como item definitivo"""
         try:
@@ -462,34 +567,45 @@ class NotebookWindow(QWidget):
         self.autosave_timer.start(NOTEBOOK_AUTOSAVE_INTERVAL)
         logger.info(f"Auto-save configured: every {NOTEBOOK_AUTOSAVE_INTERVAL}ms")
 
+    @staticmethod
+    def _tab_fields(data):
+        """Campos de notebook_tabs a partir de los datos del formulario"""
+        return {
+            'title': data['label'] or 'Sin titulo',
+            'content': data['content'],
+            'category_id': data['category_id'],
+            'item_type': data['item_type'],
+            'tags': data['tags'],
+            'description': data['description'],
+            'is_sensitive': data['is_sensitive'],
+            'is_active': data['is_active'],
+            'is_archived': data['is_archived'],
+        }
+
     def autosave_all_tabs(self):
-        """Auto-guardar todas las pestañas en BD"""
-        saved_count = 0
+        """Auto-guardar en segundo plano las pestañas modificadas"""
+        self.autosave.flush_async(on_finished=self.autosave_finished.emit)
 
+    def save_all_tabs(self):
+        """Guardar de forma síncrona (incluye cambios aún en el debounce de la pestaña)"""
         for i in range(self.tab_widget.count()):
             tab_widget = self.tab_widget.widget(i)
-            data = tab_widget.get_data()
+            if tab_widget.is_loaded and tab_widget.tab_id:
+                self.autosave.mark_dirty(tab_widget.tab_id, self._tab_fields(tab_widget.get_data()))
+        self.on_autosave_finished(self.autosave.flush())
 
-            if tab_widget.tab_id:
-                success = self.notebook_manager.update_tab(
-                    tab_widget.tab_id,
-                    title=data['label'] or 'Sin titulo',
-                    content=data['content'],
-                    category_id=data['category_id'],
-                    item_type=data['item_type'],
-                    tags=data['tags'],
-                    description=data['description'],
-                    is_sensitive=data['is_sensitive'],
-                    is_active=data['is_active'],
-                    is_archived=data['is_archived']
-                )
-
-                if success:
-                    saved_count += 1
-                    tab_widget.has_unsaved_changes = False
+    def on_autosave_finished(self, result):
+        """Resultado del flush: limpiar el estado de las pestañas guardadas"""
+        saved = set(result.get('saved', []))
+        for i in range(self.tab_widget.count()):
+            tab_widget = self.tab_widget.widget(i)
+            if tab_widget.tab_id in saved and not self.autosave.is_dirty(tab_widget.tab_id):
+                tab_widget.has_unsaved_changes = False
 
-        if saved_count > 0:
-            logger.debug(f"Auto-saved {saved_count} tabs")
+        if saved:
+            logger.debug(f"Auto-saved {len(saved)} tabs in {result.get('duration_ms', 0)}ms")
+            # Las pestañas que ya no tienen cambios pendientes pueden descargarse
+            self.enforce_memory_budget()
 
     def showEvent(self, event):
         """Cuando la ventana se muestra, registrar AppBar"""
@@ -508,8 +624,8 @@ class NotebookWindow(QWidget):
         """Al cerrar, ocultar ventana en lugar de destruirla (comportamiento como navegador embebido)"""
         logger.info("NotebookWindow close requested - hiding instead of closing")
 
-        # Auto-guardar todas las tabs
-        self.autosave_all_tabs()
+        # Guardar las tabs modificadas
+        self.save_all_tabs()
 
         # Desregistrar AppBar antes de ocultar
         self.unregister_appbar()
@@ -201,7 +201,8 @@ class SessionDialog(QDialog):
         """Carga las sesiones en la lista."""
         self.sessions_list.clear()
 
-        sessions = self.session_manager.get_all_sessions(include_auto_save=False)
+        # Incluye el anillo de snapshots auto-guardados
+        sessions = self.session_manager.get_all_sessions(include_auto_save=True)
 
         if not sessions:
             # Mostrar mensaje si no hay sesiones
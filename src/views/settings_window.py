@@ -296,7 +296,12 @@ class SettingsWindow(QDialog):
             self.config_manager.set_setting("minimize_to_tray", general_settings["minimize_to_tray"])
             self.config_manager.set_setting("always_on_top", general_settings["always_on_top"])
             self.config_manager.set_setting("start_with_windows", general_settings["start_with_windows"])
-            self.config_manager.set_setting("max_history", general_settings["max_history"])
+            self.config_manager.set_setting("clipboard_history_enabled", general_settings["clipboard_history_enabled"])
+            self.config_manager.set_setting("clipboard_history_max_entries", general_settings["clipboard_history_max_entries"])
+            self.config_manager.set_setting("clipboard_history_max_bytes", general_settings["clipboard_history_max_bytes"])
+            for key in ("maintenance_enabled", "maintenance_interval_hours",
+                        "maintenance_idle_seconds", "history_retention_days"):
+                self.config_manager.set_setting(key, general_settings[key])
             logger.debug("General settings saved")
 
             # Save categories
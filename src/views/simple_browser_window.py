@@ -5,6 +5,7 @@ Date: 2025-11-02
 """
 
 import sys
+import time
 import logging
 import ctypes
 import urllib.parse
@@ -12,9 +13,9 @@ from ctypes import wintypes
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QPushButton, QLabel, QApplication, QTabWidget, QTabBar, QMenu, QFrame
+    QPushButton, QLabel, QApplication, QTabWidget, QTabBar, QMenu, QFrame, QCompleter
 )
-from PyQt6.QtCore import Qt, QUrl, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QUrl, pyqtSignal, QTimer, QStringListModel
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage
 from PyQt6.QtGui import QAction, QKeyEvent
@@ -35,8 +36,11 @@ class CustomWebEngineView(QWebEngineView):
     save_snippet_requested = pyqtSignal(str)  # Emite el texto seleccionado
     save_file_as_item_requested = pyqtSignal(str)  # Emite la URL del archivo
 
+    is_discarded = False  # Renderer vivo (ver DiscardedTabPlaceholder)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.last_active = time.monotonic()
         self.selected_text = ""
         self.context_menu_pos = None  # Guardar posición del menú contextual
         self.clicked_element_url = ""  # URL del elemento clickeado (imagen/link)
@@ -220,6 +224,44 @@ class CustomWebEngineView(QWebEngineView):
         return False
 
 
+# ===========================================================================
+# Placeholder de pestaña descartada
+# ===========================================================================
+class DiscardedTabPlaceholder(QWidget):
+    """
+    Pestaña sin renderer: conserva URL, título y scroll y se recarga al activarla.
+
+    Expone url() y title() como QWebEngineView para que el resto de la
+    ventana (menú de pestañas, sesiones) no distinga entre ambos.
+    """
+
+    is_discarded = True
+
+    def __init__(self, url: str = "", title: str = "", scroll_position=(0.0, 0.0),
+                 last_active: float = 0.0, parent=None):
+        super().__init__(parent)
+        self._url = url
+        self._title = title
+        self.scroll_position = scroll_position
+        self.last_active = last_active
+
+        layout = QVBoxLayout(self)
+        label = QLabel(f"💤 {title or url or 'Pestaña suspendida'}")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setWordWrap(True)
+        label.setStyleSheet("color: #00d4ff; font-size: 12px;")
+        layout.addWidget(label)
+
+    def url(self) -> QUrl:
+        return QUrl(self._url)
+
+    def title(self) -> str:
+        return self._title
+
+    def stop(self):
+        """Compatibilidad con QWebEngineView (no hay carga en curso)"""
+
+
 # ===========================================================================
 # Search Bar Widget for Web Browser
 # ===========================================================================
@@ -424,7 +466,7 @@ class SimpleBrowserWindow(QWidget):
         self.resize_start_x = None
 
         # Sistema de pestañas
-        self.tabs = []  # Lista de QWebEngineView (una por pestaña)
+        self.tabs = []  # QWebEngineView o DiscardedTabPlaceholder (una por pestaña)
         self.tab_widget = None  # QTabWidget
         self.is_loading = False  # Estado de carga
 
@@ -444,6 +486,16 @@ class SimpleBrowserWindow(QWidget):
             self.session_manager = BrowserSessionManager(self.db)
             logger.info("BrowserSessionManager inicializado")
 
+        # Descarte de pestañas en segundo plano
+        from src.core.browser_tab_discarder import BrowserTabDiscardPolicy
+        self.discard_policy = BrowserTabDiscardPolicy(self.db)
+
+        # Búsqueda de marcadores y autocompletado de la barra de URL
+        self.bookmark_search = None
+        if self.db:
+            from src.core.bookmark_search import BookmarkSearchService
+            self.bookmark_search = BookmarkSearchService(self.db)
+
         logger.info(f"Inicializando SimpleBrowserWindow con URL: {url}")
 
         self._setup_window()
@@ -457,6 +509,7 @@ class SimpleBrowserWindow(QWidget):
         # Restaurar última sesión si existe
         if self.session_manager:
             QTimer.singleShot(200, self._restore_last_session)
+            self._setup_session_autosave()
 
         # Cargar URL inicial de forma asíncrona si no se restaura sesión
         if not self.session_manager:
@@ -563,6 +616,7 @@ class SimpleBrowserWindow(QWidget):
         self.url_bar.setPlaceholderText("Ingresa una URL...")
         self.url_bar.setText(self.url)
         self.url_bar.returnPressed.connect(self._on_url_entered)
+        self._setup_url_completer()
         nav_layout.addWidget(self.url_bar)
 
         # Botón copiar URL
@@ -820,14 +874,8 @@ class SimpleBrowserWindow(QWidget):
         """)
         return new_tab_btn
 
-    def add_new_tab(self, url: str = "https://www.google.com", title: str = "Nueva pestaña"):
-        """
-        Agrega una nueva pestaña al navegador.
-
-        Args:
-            url: URL inicial de la pestaña
-            title: Título de la pestaña
-        """
+    def _create_browser(self) -> CustomWebEngineView:
+        """Crea un CustomWebEngineView configurado y con sus señales conectadas."""
         # Crear nuevo CustomWebEngineView con perfil persistente
         browser = CustomWebEngineView()
 
@@ -854,6 +902,25 @@ class SimpleBrowserWindow(QWidget):
         browser.titleChanged.connect(lambda title: self._on_title_changed(title))
         browser.save_snippet_requested.connect(self.save_snippet_as_item)
         browser.save_file_as_item_requested.connect(self.save_file_as_path_item)
+        return browser
+
+    def _open_in_browser(self, browser: QWebEngineView, url: str):
+        """Carga una URL en un browser, o Speed Dial si no hay URL propia."""
+        if url and url != "https://www.google.com" and url != "about:blank":
+            browser.setUrl(QUrl(url if url.startswith(('http://', 'https://')) else 'https://' + url))
+        else:
+            # Cargar Speed Dial por defecto en nuevas pestañas
+            QTimer.singleShot(100, lambda: self._load_speed_dial_in_browser(browser))
+
+    def add_new_tab(self, url: str = "https://www.google.com", title: str = "Nueva pestaña"):
+        """
+        Agrega una nueva pestaña al navegador.
+
+        Args:
+            url: URL inicial de la pestaña
+            title: Título de la pestaña
+        """
+        browser = self._create_browser()
 
         # Agregar a la lista de pestañas
         self.tabs.append(browser)
@@ -865,22 +932,109 @@ class SimpleBrowserWindow(QWidget):
         self.tab_widget.setCurrentIndex(tab_index)
 
         # Cargar URL o Speed Dial
-        if url and url != "https://www.google.com":
-            browser.setUrl(QUrl(url if url.startswith(('http://', 'https://')) else 'https://' + url))
-        else:
-            # Cargar Speed Dial por defecto en nuevas pestañas
-            QTimer.singleShot(100, lambda: self._load_speed_dial_in_browser(browser))
+        self._open_in_browser(browser, url)
 
         logger.info(f"Nueva pestaña agregada: {title} ({url})")
 
+    def add_discarded_tab(self, url: str, title: str = "Nueva pestaña"):
+        """
+        Agrega una pestaña sin cargar (se carga al activarla).
+
+        Args:
+            url: URL de la pestaña
+            title: Título de la pestaña
+        """
+        placeholder = DiscardedTabPlaceholder(url=url, title=title)
+        self.tabs.append(placeholder)
+        short_title = title[:20] + "..." if len(title) > 20 else title
+        self.tab_widget.addTab(placeholder, short_title or "Nueva pestaña")
+        logger.debug(f"Pestaña suspendida agregada: {title} ({url})")
+
+    def _replace_tab(self, index: int, widget: QWidget):
+        """Sustituye el widget de una pestaña conservando título y pestaña activa."""
+        current_index = self.tab_widget.currentIndex()
+        title = self.tab_widget.tabText(index)
+
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+
+        self.tabs[index] = widget
+
+    def discard_tab(self, index: int) -> bool:
+        """
+        Descarta el renderer de una pestaña en segundo plano.
+
+        Args:
+            index: Índice de la pestaña
+
+        Returns:
+            True si se descartó
+        """
+        if not (0 <= index < len(self.tabs)) or index == self.tab_widget.currentIndex():
+            return False
+        browser = self.tabs[index]
+        if browser.is_discarded:
+            return False
+
+        scroll = browser.page().scrollPosition()
+        placeholder = DiscardedTabPlaceholder(
+            url=browser.url().toString(),
+            title=browser.title() or self.tab_widget.tabText(index),
+            scroll_position=(scroll.x(), scroll.y()),
+            last_active=browser.last_active
+        )
+        self._replace_tab(index, placeholder)
+        browser.deleteLater()
+        logger.info(f"Pestaña {index} descartada: {placeholder.title()}")
+        return True
+
+    def _restore_discarded_tab(self, index: int):
+        """Recrea el renderer de una pestaña descartada y recupera su scroll."""
+        placeholder = self.tabs[index]
+        browser = self._create_browser()
+        self._replace_tab(index, browser)
+
+        x, y = placeholder.scroll_position
+        if x or y:
+            def _restore_scroll(success, browser=browser):
+                browser.loadFinished.disconnect(_restore_scroll)
+                if success:
+                    browser.page().runJavaScript(f"window.scrollTo({x}, {y});")
+            browser.loadFinished.connect(_restore_scroll)
+
+        self._open_in_browser(browser, placeholder.url().toString())
+        placeholder.deleteLater()
+        logger.info(f"Pestaña {index} recargada: {placeholder.title()}")
+
+    def _enforce_tab_limits(self):
+        """Descarta las pestañas en segundo plano menos usadas que exceden el límite."""
+        current_index = self.tab_widget.currentIndex()
+        live_tabs = [
+            {
+                'key': browser,
+                'last_active': browser.last_active,
+                'can_discard': i != current_index and not browser.page().recentlyAudible(),
+            }
+            for i, browser in enumerate(self.tabs) if not browser.is_discarded
+        ]
+        for browser in self.discard_policy.select_tabs_to_discard(live_tabs):
+            self.discard_tab(self.tabs.index(browser))
+
     def _on_tab_changed(self, index: int):
         """Handler cuando cambia la pestaña activa."""
         if index >= 0 and index < len(self.tabs):
+            if self.tabs[index].is_discarded:
+                self._restore_discarded_tab(index)
             browser = self.tabs[index]
+            browser.last_active = time.monotonic()
             # Actualizar barra de URL con la URL de la pestaña activa
             current_url = browser.url().toString()
             if current_url:
                 self.url_bar.setText(current_url)
+            self._enforce_tab_limits()
             logger.debug(f"Pestaña activa cambiada a índice {index}")
 
     def _on_close_tab(self, index: int):
@@ -1139,6 +1293,35 @@ class SimpleBrowserWindow(QWidget):
         self.bookmarks_panel.show()
         self.bookmarks_panel.raise_()
         self.bookmarks_panel.activateWindow()
+        self.bookmarks_panel.search_input.setFocus()
+
+    def _setup_url_completer(self):
+        """Autocompletado de la barra de URL desde el índice de prefijos de marcadores."""
+        if not self.bookmark_search:
+            return
+
+        self.url_completion_model = QStringListModel(self)
+        self.url_completer = QCompleter(self.url_completion_model, self)
+        # Las sugerencias ya vienen filtradas por el índice (sin esquema / 'www.')
+        self.url_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.url_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.url_completer.activated.connect(self._on_url_completion_activated)
+        self.url_bar.setCompleter(self.url_completer)
+        self.url_bar.textEdited.connect(self._on_url_text_edited)
+
+    def _on_url_text_edited(self, text: str):
+        """Actualiza las sugerencias mientras se escribe en la barra de URL."""
+        suggestions = self.bookmark_search.complete_url(text)
+        self.url_completion_model.setStringList(suggestions)
+        if suggestions:
+            self.url_completer.complete()
+        else:
+            self.url_completer.popup().hide()
+
+    def _on_url_completion_activated(self, url: str):
+        """Navega a la sugerencia elegida en la barra de URL."""
+        self.url_bar.setText(url)
+        self._on_url_entered()
 
     def _on_bookmark_selected(self, url: str):
         """Handler cuando se selecciona un marcador del panel."""
@@ -1515,6 +1698,24 @@ class SimpleBrowserWindow(QWidget):
 
         return tabs_data
 
+    def _setup_session_autosave(self):
+        """Configura el auto-guardado periódico de la sesión (en segundo plano)."""
+        try:
+            interval = int(self.db.get_setting('browser_session_autosave_seconds', 60))
+        except (TypeError, ValueError):
+            interval = 60
+
+        self.session_autosave_timer = QTimer(self)
+        self.session_autosave_timer.timeout.connect(self._autosave_session)
+        if interval > 0:
+            self.session_autosave_timer.start(interval * 1000)
+            logger.info(f"Auto-guardado de sesión cada {interval}s")
+
+    def _autosave_session(self):
+        """Snapshot periódico: solo se escriben las pestañas que cambiaron."""
+        if self.session_manager and len(self.tabs) > 0:
+            self.session_manager.autosave_async(self._get_current_tabs_data())
+
     def save_current_session(self):
         """Guarda la sesión actual con un nombre personalizado."""
         if not self.session_manager:
@@ -2032,35 +2233,38 @@ class SimpleBrowserWindow(QWidget):
             # Contar cuántas pestañas viejas hay
             old_tabs_count = len(self.tabs)
 
-            # Restaurar cada pestaña de la sesión
-            active_index = 0
+            # Restaurar cada pestaña de la sesión (solo la activa se carga ahora;
+            # el resto quedan suspendidas hasta activarlas)
+            tabs_data = [tab for tab in tabs_data if tab.get('url')]
+            active_index = next(
+                (i for i, tab in enumerate(tabs_data) if tab.get('is_active')), 0
+            )
             for i, tab in enumerate(tabs_data):
-                url = tab.get('url', '')
+                url = tab['url']
                 title = tab.get('title', 'Nueva pestaña')
-                is_active = tab.get('is_active', False)
 
-                if is_active:
-                    active_index = i
-
-                # Agregar pestaña nueva
-                if url:
+                if i == active_index:
                     self.add_new_tab(url, title)
+                else:
+                    self.add_discarded_tab(url, title)
 
             # Cerrar las pestañas viejas (las primeras N)
             # Ahora las nuevas están al final, las viejas al principio
             # Cerrar desde el final de las viejas para no afectar índices
             for i in range(old_tabs_count - 1, -1, -1):
                 if i < self.tab_widget.count() and i < len(self.tabs):
+                    # Eliminar la referencia del browser (antes de removeTab, que
+                    # puede emitir currentChanged y debe ver la lista ya actualizada)
+                    old_browser = self.tabs.pop(i)
                     # Remover del widget
                     self.tab_widget.removeTab(i)
-                    # Eliminar la referencia del browser
-                    old_browser = self.tabs.pop(i)
                     old_browser.deleteLater()
                     logger.debug(f"Pestaña vieja {i} cerrada")
 
             # Activar la pestaña que estaba activa en la sesión
             if len(self.tabs) > 0 and active_index < len(self.tabs):
                 self.tab_widget.setCurrentIndex(active_index)
+                self._enforce_tab_limits()
 
             logger.info(f"Sesión restaurada con {len(tabs_data)} pestañas")
 
@@ -2160,6 +2364,8 @@ class SimpleBrowserWindow(QWidget):
         logger.info("Cerrando SimpleBrowserWindow")
 
         # Auto-guardar sesión actual antes de cerrar
+        if self.session_manager:
+            self.session_autosave_timer.stop()
         if self.session_manager and len(self.tabs) > 0:
             try:
                 tabs_data = self._get_current_tabs_data()
@@ -2,8 +2,8 @@
 Item Button Widget
 """
 from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QSizePolicy
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QEvent
+from PyQt6.QtGui import QFont, QPixmap
 import sys
 import webbrowser
 import os
@@ -17,6 +17,7 @@ from core.usage_tracker import UsageTracker
 from core.favorites_manager import FavoritesManager
 from core.file_manager import FileManager
 from core.config_manager import ConfigManager
+from core.thumbnail_service import get_thumbnail_service, ThumbnailService, THUMBNAIL_SIZE
 from views.command_output_dialog import CommandOutputDialog
 from views.dialogs.item_details_dialog import ItemDetailsDialog
 import time
@@ -50,6 +51,10 @@ class ItemButton(QFrame):
         # Favorites management
         self.favorites_manager = FavoritesManager()
 
+        # Thumbnail (PATH image/video items) - requested on first paint
+        self.thumbnail_label = None
+        self._thumbnail_requested = False
+
         self.init_ui()
 
     def _resolve_path(self, content_path: str) -> Path:
@@ -106,10 +111,12 @@ class ItemButton(QFrame):
             content_preview = self.item.content[:150]  # First 150 chars
             if len(self.item.content) > 150:
                 content_preview += "..."
-            self.setToolTip(content_preview)
+            self._tooltip_base = content_preview
         else:
             # Para items sensibles, solo mostrar el label
-            self.setToolTip(self.item.label)
+            self._tooltip_base = self.item.label
+        # Las estadísticas de uso se añaden al mostrar el tooltip (event)
+        self.setToolTip(self._tooltip_base)
 
         # Main layout
         main_layout = QHBoxLayout(self)
@@ -129,6 +136,20 @@ class ItemButton(QFrame):
             color_indicator.setToolTip(f"Color: {self.item.color}")
             main_layout.addWidget(color_indicator)
 
+        # Thumbnail for PATH image/video items with saved files
+        if self._supports_thumbnail():
+            self.thumbnail_label = QLabel(self.item.get_file_type_icon())
+            self.thumbnail_label.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+            self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.thumbnail_label.setStyleSheet("""
+                QLabel {
+                    background-color: #252526;
+                    border-radius: 3px;
+                    font-size: 18pt;
+                }
+            """)
+            main_layout.addWidget(self.thumbnail_label)
+
         # Left side: Item info (label + badges + tags + stats)
         left_layout = QVBoxLayout()
         left_layout.setSpacing(5)
@@ -786,6 +807,42 @@ class ItemButton(QFrame):
                 }
             """)
 
+    def _supports_thumbnail(self) -> bool:
+        """Check if this item can show a thumbnail (saved image/video file)"""
+        return (self.item.type == ItemType.PATH and
+                not self.item.is_sensitive and
+                bool(getattr(self.item, 'file_hash', None)) and
+                ThumbnailService.supports(getattr(self.item, 'file_type', None)))
+
+    def _request_thumbnail(self):
+        """Request thumbnail from the background service (only when visible)"""
+        self._thumbnail_requested = True
+        cached_path = get_thumbnail_service().request(
+            self.item.file_hash, self.item.content, self.item.file_type,
+            callback=self._set_thumbnail
+        )
+        if cached_path:
+            self._set_thumbnail(cached_path)
+
+    def _set_thumbnail(self, path: str):
+        pixmap = QPixmap(path)
+        if not pixmap.isNull() and self.thumbnail_label:
+            self.thumbnail_label.setText("")
+            self.thumbnail_label.setPixmap(pixmap)
+
+    def paintEvent(self, event):
+        """Request thumbnail the first time the row is actually painted (visible)"""
+        super().paintEvent(event)
+        if self.thumbnail_label and not self._thumbnail_requested:
+            self._request_thumbnail()
+
+    def hideEvent(self, event):
+        """Cancel pending thumbnail generation for rows no longer shown"""
+        if self._thumbnail_requested and self.thumbnail_label and self.thumbnail_label.pixmap().isNull():
+            get_thumbnail_service().cancel(self.item.file_hash, callback=self._set_thumbnail)
+            self._thumbnail_requested = False
+        super().hideEvent(event)
+
     def get_display_label(self):
         """Get display label (ofuscado si es sensible y no revelado)"""
         # Get file type icon if this is a PATH item with file metadata
@@ -902,16 +959,30 @@ class ItemButton(QFrame):
         # Badge "Nuevo" deshabilitado
         return ""
 
+    def event(self, event):
+        """Completar el tooltip con el resumen de uso al pasar el cursor"""
+        if event.type() == QEvent.Type.ToolTip and getattr(self.item, 'id', None):
+            stats_text = self.get_usage_stats()
+            self.setToolTip(f"{self._tooltip_base}\n\n📊 {stats_text}" if stats_text else self._tooltip_base)
+        return super().event(event)
+
     def get_usage_stats(self) -> str:
-        """Obtener estadísticas de uso (use_count + last_used)"""
-        use_count = getattr(self.item, 'use_count', 0)
-        last_used = getattr(self.item, 'last_used', None)
+        """Obtener estadísticas de uso (item_usage_summary: usos, último uso, tiempo, éxito)"""
+        stats = {}
+        if getattr(self.item, 'id', None):
+            stats = self.usage_tracker.get_item_stats(self.item.id)
+        use_count = stats.get('use_count', getattr(self.item, 'use_count', 0)) or 0
+        last_used = stats.get('last_used') or getattr(self.item, 'last_used', None)
 
         parts = []
 
         # Use count
         if use_count > 0:
             parts.append(f"{use_count} usos")
+            if stats.get('avg_execution_time'):
+                parts.append(f"{stats['avg_execution_time']:.2f} s")
+            if stats.get('error_count'):
+                parts.append(f"{stats['success_rate']:.0f}% éxito")
         else:
             parts.append("Sin usar")
 
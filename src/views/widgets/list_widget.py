@@ -4,7 +4,7 @@ Widget para representar una lista completa con pasos expandibles/colapsables
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QScrollArea, QSizePolicy
@@ -166,7 +166,8 @@ class ListWidget(QFrame):
     copy_all_requested = pyqtSignal(str, int)  # (list_group, category_id)
 
     def __init__(self, list_data: Dict[str, Any], category_id: int,
-                 list_items: List[Dict[str, Any]], parent=None):
+                 list_items: List[Dict[str, Any]],
+                 content_loader: Optional[Callable[[List[int]], Dict[int, str]]] = None, parent=None):
         """
         Inicializa el widget de lista
 
@@ -174,13 +175,17 @@ class ListWidget(QFrame):
             list_data: Diccionario con metadata de la lista (list_group, item_count, etc)
             category_id: ID de la categoría
             list_items: Lista de items/pasos ordenados
+            content_loader: Función que devuelve el contenido de los pasos por ID;
+                            si se indica, el contenido se carga al expandir
             parent: Widget padre
         """
         super().__init__(parent)
         self.list_data = list_data
         self.category_id = category_id
         self.list_items = list_items
+        self.content_loader = content_loader
         self.is_expanded = False
+        self.steps_populated = False
 
         self.list_group = list_data.get('list_group', 'Lista sin nombre')
         self.item_count = list_data.get('item_count', len(list_items))
@@ -257,16 +262,7 @@ class ListWidget(QFrame):
         self.steps_layout.setSpacing(6)
         self.steps_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Agregar pasos
-        for item in self.list_items:
-            step_widget = ListStepPreview(
-                step_number=item.get('orden_lista', 0),
-                label=item.get('label', 'Sin nombre'),
-                content=item.get('content', ''),
-                item_type=item.get('type', 'TEXT')
-            )
-            step_widget.step_copied.connect(self.on_step_copied)
-            self.steps_layout.addWidget(step_widget)
+        # Los pasos se crean al expandir por primera vez (populate_steps)
 
         steps_scroll.setWidget(steps_container)
         content_layout.addWidget(steps_scroll)
@@ -365,6 +361,32 @@ class ListWidget(QFrame):
             }
         """)
 
+    def populate_steps(self):
+        """Crea los previews de los pasos, cargando antes su contenido si hace falta"""
+        if self.steps_populated:
+            return
+        self.steps_populated = True
+
+        if self.content_loader:
+            missing = [item['id'] for item in self.list_items if 'content' not in item and 'id' in item]
+            if missing:
+                contents = self.content_loader(missing)
+                for item in self.list_items:
+                    if item.get('id') in contents:
+                        item['content'] = contents[item['id']]
+                logger.debug(f"[LIST_WIDGET] Loaded content of {len(contents)} steps for '{self.list_group}'")
+
+        # orden_lista es una clave con huecos: el número es la posición
+        for step_number, item in enumerate(self.list_items, start=1):
+            step_widget = ListStepPreview(
+                step_number=step_number,
+                label=item.get('label', 'Sin nombre'),
+                content=item.get('content', ''),
+                item_type=item.get('type', 'TEXT')
+            )
+            step_widget.step_copied.connect(self.on_step_copied)
+            self.steps_layout.addWidget(step_widget)
+
     def toggle_expanded(self):
         """Alterna entre estado expandido y colapsado"""
         self.is_expanded = not self.is_expanded
@@ -377,6 +399,7 @@ class ListWidget(QFrame):
     def expand(self):
         """Expande el widget para mostrar los pasos"""
         self.is_expanded = True
+        self.populate_steps()
         self.toggle_btn.setText("▲")
         self.content_widget.setVisible(True)
 
@@ -27,6 +27,8 @@ class NotebookTab(QWidget):
     content_changed = pyqtSignal(dict)  # Para auto-guardado (emite datos del formulario)
     cancel_requested = pyqtSignal()  # Cuando se hace click en cancelar
 
+    is_loaded = True  # Editor completo (ver NotebookTabPlaceholder)
+
     def __init__(self, tab_id=None, tab_data=None, categories=None, db_path=None, parent=None):
         super().__init__(parent)
         self.tab_id = tab_id
@@ -577,3 +579,21 @@ class NotebookTab(QWidget):
                     background-color: #353535;
                 }
             """)
+
+
+class NotebookTabPlaceholder(QWidget):
+    """Pestaña sin cargar: solo metadatos; el editor se construye al activarla"""
+
+    is_loaded = False
+
+    def __init__(self, tab_id, tab_data=None, parent=None):
+        super().__init__(parent)
+        self.tab_id = tab_id
+        self.tab_data = tab_data or {}
+        self.has_unsaved_changes = False
+
+        layout = QVBoxLayout(self)
+        label = QLabel("Cargando nota...")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("color: #808080; font-size: 13px;")
+        layout.addWidget(label)
@@ -0,0 +1,25 @@
+"""
+Configuración común de pytest
+
+Varios tests cuentan consultas con el QueryProfiler global, que está
+desactivado por defecto: se activa durante cada test y se restaura después
+para que el resultado no dependa del orden de ejecución.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.query_profiler import get_query_profiler
+
+
+@pytest.fixture(autouse=True)
+def query_profiler_measuring():
+    """QueryProfiler activo durante el test (estado previo restaurado al terminar)"""
+    with get_query_profiler().measuring():
+        yield
@@ -0,0 +1,125 @@
+"""
+Script de testing para el generador de bibliotecas de benchmarks
+Prueba que la generación es determinista, que las listas y el historial de
+uso son coherentes y que la comparación de resultados detecta regresiones
+"""
+
+import sys
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Agregar raíz y src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+sys.path.insert(0, str(root_dir))
+
+from benchmarks.generator import generate_library
+from benchmarks.runner import compare_results
+
+REFERENCE = datetime(2026, 1, 1)
+
+
+def _dump(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        items = conn.execute(
+            "SELECT label, content, type, tags, is_list, list_group, orden_lista, "
+            "is_favorite, use_count, last_used FROM items ORDER BY id"
+        ).fetchall()
+        usage = conn.execute(
+            "SELECT item_id, used_at, success FROM item_usage_history ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+    return items, usage
+
+
+def test_generation_is_deterministic():
+    """Misma semilla -> mismos datos; otra semilla -> datos distintos"""
+    print("\n" + "="*60)
+    print("TEST 1: GENERACIÓN DETERMINISTA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = generate_library(str(Path(tmp) / "a.db"), 300, seed=7,
+                                 usage_rows_per_item=5, reference=REFERENCE)
+        generate_library(str(Path(tmp) / "b.db"), 300, seed=7,
+                         usage_rows_per_item=5, reference=REFERENCE)
+        generate_library(str(Path(tmp) / "c.db"), 300, seed=8,
+                         usage_rows_per_item=5, reference=REFERENCE)
+
+        assert _dump(Path(tmp) / "a.db") == _dump(Path(tmp) / "b.db")
+        assert _dump(Path(tmp) / "a.db") != _dump(Path(tmp) / "c.db")
+        assert first['size'] == 300
+        assert first['usage_rows'] == 1500
+        print(f"  ✓ Resumen: {first}")
+
+
+def test_lists_and_usage_are_consistent():
+    """Listas con pasos consecutivos y use_count igual al historial"""
+    print("\n" + "="*60)
+    print("TEST 2: LISTAS E HISTORIAL COHERENTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "lib.db"
+        summary = generate_library(str(db_path), 1000, seed=42,
+                                   usage_rows_per_item=4, reference=REFERENCE)
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1000
+            assert conn.execute("SELECT COUNT(*) FROM item_usage_history").fetchone()[0] == 4000
+
+            groups = conn.execute("""
+                SELECT list_group, COUNT(*), MIN(orden_lista), MAX(orden_lista)
+                FROM items WHERE is_list = 1 GROUP BY list_group
+            """).fetchall()
+            assert len(groups) == summary['lists'] > 0
+            for _, count, first, last in groups:
+                assert first == 1 and last == count
+
+            mismatched = conn.execute("""
+                SELECT COUNT(*) FROM items i
+                WHERE i.use_count != (SELECT COUNT(*) FROM item_usage_history h WHERE h.item_id = i.id)
+                   OR i.last_used IS NOT (SELECT MAX(used_at) FROM item_usage_history h WHERE h.item_id = i.id)
+            """).fetchone()[0]
+            assert mismatched == 0
+
+            # Popularidad Zipf: el item más usado concentra muchos usos
+            top = conn.execute("SELECT MAX(use_count) FROM items").fetchone()[0]
+            assert top > 4 * 10
+            newest = conn.execute("SELECT MAX(used_at) FROM item_usage_history").fetchone()[0]
+            assert newest < REFERENCE.strftime('%Y-%m-%d %H:%M:%S')
+        finally:
+            conn.close()
+        print(f"  ✓ {summary['lists']} listas, historial coherente (máx. {top} usos)")
+
+
+def test_compare_results_flags_regressions():
+    """compare_results marca los casos que empeoran por encima del umbral"""
+    print("\n" + "="*60)
+    print("TEST 3: COMPARACIÓN DE RESULTADOS")
+    print("="*60)
+
+    before = {'sizes': {'1000': {'results': {
+        'search': {'median_ms': 10.0}, 'stats': {'median_ms': 10.0}, 'tiny': {'median_ms': 0.1}}}}}
+    after = {'sizes': {'1000': {'results': {
+        'search': {'median_ms': 20.0}, 'stats': {'median_ms': 10.5}, 'tiny': {'median_ms': 0.5},
+        'new': {'error': 'ImportError'}}}}}
+
+    rows = {row['case']: row for row in compare_results(before, after)}
+    assert rows['search']['regression']
+    assert not rows['stats']['regression']
+    assert not rows['tiny']['regression']  # ratio alto pero por debajo de REGRESSION_MIN_MS
+    assert rows['new']['before_ms'] is None and rows['new']['error'] == 'ImportError'
+    print("  ✓ Regresiones detectadas correctamente")
+
+
+if __name__ == "__main__":
+    test_generation_is_deterministic()
+    test_lists_and_usage_are_consistent()
+    test_compare_results_flags_regressions()
+    print("\n✓ Todos los tests pasaron")
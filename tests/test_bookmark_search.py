@@ -0,0 +1,122 @@
+"""
+Script de testing para la búsqueda de marcadores
+Prueba el índice FTS sobre título y URL (sincronizado por triggers), el
+respaldo con LIKE para términos cortos y el índice de prefijos de URL
+usado por el autocompletado de la barra de direcciones
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core.bookmark_search import BookmarkSearchService, UrlPrefixIndex
+
+
+def _add_bookmarks(db):
+    ids = {}
+    ids['github'] = db.add_bookmark("GitHub - repositorios", "https://github.com/widget/sidebar")
+    ids['docs'] = db.add_bookmark("Python Docs", "https://docs.python.org/3/library/sqlite3.html")
+    ids['qt'] = db.add_bookmark("Qt for Python", "https://www.qt.io/qt-for-python")
+    ids['mail'] = db.add_bookmark("Correo 50% off", "http://mail.example.com")
+    return ids
+
+
+def test_fts_search():
+    """Búsqueda por subcadena en título y URL, mantenida por triggers"""
+    print("\n" + "="*60)
+    print("TEST 1: BÚSQUEDA FTS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        ids = _add_bookmarks(db)
+
+        def titles(query):
+            return [bookmark['title'] for bookmark in db.search_bookmarks(query)]
+
+        assert sorted(titles("python")) == ["Python Docs", "Qt for Python"]
+        assert titles("sqlite3") == ["Python Docs"]
+        assert titles("hub repos") == ["GitHub - repositorios"]
+        assert titles("inexistente") == []
+
+        if db._bookmarks_fts_tokenizer():
+            profiler = get_query_profiler()
+            profiler.reset()
+            db.search_bookmarks("python")
+            assert any('bookmarks_fts MATCH' in row['sql'] for row in profiler.snapshot())
+
+        # Los triggers mantienen el índice al editar y borrar
+        db.update_bookmark(ids['github'], title="GitLab espejo")
+        assert titles("gitlab") == ["GitLab espejo"]
+        assert titles("repositorios") == []
+        db.delete_bookmark(ids['docs'])
+        assert titles("sqlite3") == []
+
+        # Términos cortos y comodines usan LIKE literal
+        assert titles("qt") == ["Qt for Python"]
+        assert titles("50%") == ["Correo 50% off"]
+        assert len(db.search_bookmarks("")) == 3
+        db.close()
+    print("  ✓ Título y URL indexados y sincronizados")
+
+
+def test_url_prefix_index():
+    """El índice de prefijos ignora esquema y 'www.'"""
+    print("\n" + "="*60)
+    print("TEST 2: ÍNDICE DE PREFIJOS DE URL")
+    print("="*60)
+
+    index = UrlPrefixIndex([
+        {'url': "https://github.com/widget/sidebar"},
+        {'url': "https://github.com"},
+        {'url': "https://www.gitlab.com"},
+        {'url': "http://mail.example.com"},
+    ])
+    assert index.complete("git") == [
+        "https://github.com", "https://github.com/widget/sidebar", "https://www.gitlab.com"
+    ]
+    assert index.complete("https://www.GitL") == ["https://www.gitlab.com"]
+    assert index.complete("github.com/", limit=1) == ["https://github.com/widget/sidebar"]
+    assert index.complete("") == []
+    assert index.complete("zzz") == []
+    print("  ✓ Sugerencias por prefijo")
+
+
+def test_completion_follows_changes():
+    """El autocompletado se reconstruye solo cuando cambian los marcadores"""
+    print("\n" + "="*60)
+    print("TEST 3: AUTOCOMPLETADO SINCRONIZADO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        ids = _add_bookmarks(db)
+        service = BookmarkSearchService(db)
+
+        assert service.complete_url("docs.py") == ["https://docs.python.org/3/library/sqlite3.html"]
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        service.complete_url("githu")
+        service.complete_url("github.c")
+        assert not any('FROM bookmarks' in row['sql'] for row in profiler.snapshot())
+
+        db.delete_bookmark(ids['docs'])
+        db.add_bookmark("Docs nuevos", "https://docs.rs")
+        assert service.complete_url("docs") == ["https://docs.rs"]
+        assert service.search("nuevos")[0]['url'] == "https://docs.rs"
+        db.close()
+    print("  ✓ Índice en memoria invalidado por versión")
+
+
+if __name__ == "__main__":
+    test_fts_search()
+    test_url_prefix_index()
+    test_completion_follows_changes()
+    print("\n✓ Todos los tests pasaron")
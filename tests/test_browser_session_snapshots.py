@@ -0,0 +1,135 @@
+"""
+Script de testing para los snapshots auto-guardados de sesiones del navegador
+Prueba que save_session escribe en una transacción, que el auto-guardado
+periódico solo escribe las pestañas cambiadas y que el anillo de snapshots
+queda acotado
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core import browser_session_manager
+from core.browser_session_manager import BrowserSessionManager
+
+
+def _tabs(*urls, active=0):
+    return [
+        {'url': url, 'title': url.split('//')[-1], 'position': i, 'is_active': i == active}
+        for i, url in enumerate(urls)
+    ]
+
+
+def _statement_count(prefix):
+    return sum(row['count'] for row in get_query_profiler().snapshot() if row['sql'].startswith(prefix))
+
+
+def test_save_session_single_transaction():
+    """save_session inserta sesión y pestañas con executemany"""
+    print("\n" + "="*60)
+    print("TEST 1: GUARDADO EN UNA TRANSACCIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        session_id = db.save_session("Manual", _tabs("https://a.com", "https://b.com", active=1))
+        assert session_id
+        tabs = db.get_session_tabs(session_id)
+        assert [tab['url'] for tab in tabs] == ["https://a.com", "https://b.com"]
+        assert [tab['is_active'] for tab in tabs] == [0, 1]
+
+        # Comportamiento previo: un auto-save reemplaza a los anteriores
+        first = db.save_session("Auto", _tabs("https://a.com"), is_auto_save=True)
+        second = db.save_session("Auto", _tabs("https://c.com"), is_auto_save=True)
+        assert db.get_last_auto_save_session()['id'] == second
+        assert db.get_session_tabs(first) == []
+        assert len(db.get_sessions(include_auto_save=True)) == 2
+        db.close()
+    print("  ✓ Sesión y pestañas guardadas juntas")
+
+
+def test_autosave_writes_only_changes():
+    """El snapshot periódico solo escribe las pestañas modificadas"""
+    print("\n" + "="*60)
+    print("TEST 2: AUTO-GUARDADO POR DIFERENCIAS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        manager = BrowserSessionManager(db)
+        urls = [f"https://site{i}.com" for i in range(10)]
+
+        result = manager.autosave_snapshot(_tabs(*urls))
+        assert result['new_snapshot'] and result['written'] == 10
+        session_id = result['session_id']
+
+        assert manager.autosave_snapshot(_tabs(*urls))['written'] == 0
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        urls[3] = "https://changed.com"
+        result = manager.autosave_snapshot(_tabs(*urls, active=3))
+        # Cambian la URL de la pestaña 3 y la activa (0 -> 3)
+        assert result == {'session_id': session_id, 'written': 2, 'new_snapshot': False}
+        assert _statement_count("INSERT INTO session_tabs") == 0
+
+        # Pestañas añadidas y cerradas
+        result = manager.autosave_snapshot(_tabs(*(urls[:4] + ["https://new.com"]), active=3))
+        assert result['written'] == 1
+        tabs = db.get_session_tabs(session_id)
+        assert [tab['url'] for tab in tabs] == urls[:4] + ["https://new.com"]
+        assert manager.restore_last_session()[3]['is_active'] == 1
+
+        # En segundo plano con la misma lógica
+        results = []
+        assert manager.autosave_async(_tabs("https://solo.com"), on_finished=results.append)
+        manager._autosave_thread.join()
+        assert results[0]['written'] == 1
+        assert [tab['url'] for tab in db.get_session_tabs(session_id)] == ["https://solo.com"]
+        manager._close_autosave_db()
+        db.close()
+    print("  ✓ Solo pestañas cambiadas, añadidas o cerradas")
+
+
+def test_snapshot_ring():
+    """Cada rotación crea un snapshot y se conservan los N más recientes"""
+    print("\n" + "="*60)
+    print("TEST 3: ANILLO DE SNAPSHOTS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        db.set_setting('browser_session_snapshots', 3)
+        original_rotation = browser_session_manager.SNAPSHOT_ROTATION_SECONDS
+        browser_session_manager.SNAPSHOT_ROTATION_SECONDS = 0
+        try:
+            manager = BrowserSessionManager(db)
+            ids = [manager.autosave_snapshot(_tabs(f"https://run{i}.com"))['session_id']
+                   for i in range(5)]
+        finally:
+            browser_session_manager.SNAPSHOT_ROTATION_SECONDS = original_rotation
+
+        sessions = db.get_sessions(include_auto_save=True)
+        assert sorted(session['id'] for session in sessions) == ids[-3:]
+        assert manager.restore_last_session()[0]['url'] == "https://run4.com"
+
+        # Si el snapshot en curso se elimina se crea uno nuevo
+        db.delete_session(ids[-1])
+        result = manager.autosave_snapshot(_tabs("https://after.com"))
+        assert result['new_snapshot'] and result['session_id'] not in ids
+        manager.auto_save_on_close(_tabs("https://after.com"))
+        db.close()
+    print("  ✓ Snapshots acotados y restaurables")
+
+
+if __name__ == "__main__":
+    test_save_session_single_transaction()
+    test_autosave_writes_only_changes()
+    test_snapshot_ring()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,74 @@
+"""
+Script de testing para la política de descarte de pestañas del navegador
+Prueba el límite de pestañas vivas (por número y por presupuesto de
+memoria) y la elección LRU de las pestañas a descartar
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.browser_tab_discarder import (
+    BrowserTabDiscardPolicy, DEFAULT_MAX_LIVE_TABS, ESTIMATED_TAB_MEMORY_MB
+)
+
+
+def _tabs(count, current):
+    return [
+        {'key': f"tab{i}", 'last_active': float(i), 'can_discard': i != current}
+        for i in range(count)
+    ]
+
+
+def test_live_tab_limit():
+    """El límite es el menor entre número de pestañas y presupuesto"""
+    print("\n" + "="*60)
+    print("TEST 1: LÍMITE DE PESTAÑAS VIVAS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        policy = BrowserTabDiscardPolicy(db)
+        assert policy.max_live_tabs() == DEFAULT_MAX_LIVE_TABS
+
+        db.set_setting('browser_max_live_tabs', 10)
+        db.set_setting('browser_tab_memory_budget_mb', ESTIMATED_TAB_MEMORY_MB * 3)
+        policy.reload_settings()
+        assert policy.max_live_tabs() == 3
+
+        # Siempre queda al menos la pestaña activa
+        db.set_setting('browser_tab_memory_budget_mb', 0)
+        policy.reload_settings()
+        assert policy.max_live_tabs() == 1
+        db.close()
+    print("  ✓ Límite configurable por número y memoria")
+
+
+def test_select_tabs_to_discard():
+    """Se descartan las pestañas menos usadas, nunca la activa"""
+    print("\n" + "="*60)
+    print("TEST 2: SELECCIÓN LRU")
+    print("="*60)
+
+    policy = BrowserTabDiscardPolicy()
+    policy.max_tabs = 3
+    assert policy.select_tabs_to_discard(_tabs(3, current=0)) == []
+    assert policy.select_tabs_to_discard(_tabs(5, current=4)) == ['tab0', 'tab1']
+    # La activa es la menos usada: se salta
+    assert policy.select_tabs_to_discard(_tabs(5, current=0)) == ['tab1', 'tab2']
+
+    tabs = _tabs(5, current=4)
+    tabs[0]['can_discard'] = False  # reproduciendo audio
+    assert policy.select_tabs_to_discard(tabs) == ['tab1', 'tab2']
+    print("  ✓ Pestañas en segundo plano descartadas por antigüedad")
+
+
+if __name__ == "__main__":
+    test_live_tab_limit()
+    test_select_tabs_to_discard()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,103 @@
+"""
+Script de testing para el historial de portapapeles persistente
+Prueba deduplicación por hash, compresión de entradas grandes y recorte
+por cantidad y bytes totales
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+
+
+def test_dedupe_and_compression():
+    """El mismo contenido no se duplica y el contenido grande se comprime"""
+    print("\n" + "="*60)
+    print("TEST 1: DEDUPLICACIÓN Y COMPRESIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+
+        db.add_to_history(None, "git status")
+        db.add_to_history(None, "docker ps")
+        db.add_to_history(None, "git status")
+        big_text = "log line 0123456789\n" * 2000
+        db.add_to_history(None, big_text)
+
+        history = db.get_history(limit=10)
+        assert [entry['content'] for entry in history] == [big_text, "git status", "docker ps"]
+        assert history[1]['copy_count'] == 2
+        assert history[0]['is_compressed'] == 1
+        assert history[0]['content_size'] < len(big_text) // 10
+        print("  ✓ Duplicados fusionados y contenido grande comprimido")
+        db.close()
+
+
+def test_trim_by_count_and_bytes():
+    """El recorte respeta tanto la cantidad como el tamaño total"""
+    print("\n" + "="*60)
+    print("TEST 2: RECORTE POR CANTIDAD Y BYTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        for i in range(10):
+            db.add_to_history(None, f"entry-{i:02d}")  # 8 bytes cada una
+
+        db.trim_history(keep_latest=5)
+        assert [e['content'] for e in db.get_history(limit=20)] == [f"entry-{i:02d}" for i in range(9, 4, -1)]
+
+        db.trim_history(keep_latest=5, max_bytes=24)
+        assert [e['content'] for e in db.get_history(limit=20)] == ["entry-09", "entry-08", "entry-07"]
+
+        db.set_setting('clipboard_history_max_entries', 2)
+        db.add_to_history(None, "nueva")
+        assert [e['content'] for e in db.get_history(limit=20)] == ["nueva", "entry-09"]
+        print("  ✓ Recorte correcto")
+        db.close()
+
+
+def test_legacy_max_history_and_explicit_limits():
+    """max_history se migra y los límites pasados por el llamador se respetan"""
+    print("\n" + "="*60)
+    print("TEST 3: MIGRACIÓN DE max_history Y LÍMITES EXPLÍCITOS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        assert db.get_setting('max_history') is None
+        assert db.get_setting('clipboard_history_max_entries') is None
+
+        # Base de datos anterior a la migración con el límite heredado
+        conn = db.connect()
+        conn.execute("INSERT INTO settings (key, value) VALUES ('max_history', '3')")
+        conn.execute("PRAGMA user_version = 11")
+        conn.commit()
+        db.close()
+
+        db = DBManager(db_path)
+        assert db.get_setting('clipboard_history_max_entries') == 3
+        assert db.get_setting('max_history') is None
+        for i in range(5):
+            db.add_to_history(None, f"entry-{i}")
+        assert [e['content'] for e in db.get_history(limit=20)] == ["entry-4", "entry-3", "entry-2"]
+        print("  ✓ max_history migrado a clipboard_history_max_entries")
+
+        db.add_to_history(None, "entry-5", max_entries=2, max_bytes=1024)
+        assert [e['content'] for e in db.get_history(limit=20)] == ["entry-5", "entry-4"]
+        print("  ✓ Límites explícitos respetados")
+        db.close()
+
+
+if __name__ == "__main__":
+    test_dedupe_and_compression()
+    test_trim_by_count_and_bytes()
+    test_legacy_max_history_and_explicit_limits()
+    print("\n✓ Todos los tests pasaron")
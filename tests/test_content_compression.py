@@ -0,0 +1,110 @@
+"""
+Script de testing para la compresión transparente de contenido
+Prueba items y pestañas del notebook por encima del umbral, búsqueda sobre
+contenido comprimido, la migración de datos existentes y la carga diferida
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.migrations import add_content_compression
+from models.item import Item
+from core.stats_manager import StatsManager
+
+BIG_TEXT = "SELECT id, label FROM items WHERE category_id = 1;\n" * 1000
+
+
+def test_items_round_trip_and_search():
+    """El contenido grande se guarda comprimido y se lee/busca de forma transparente"""
+    print("\n" + "="*60)
+    print("TEST 1: ITEMS COMPRIMIDOS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Test")
+        big_id = db.add_item(category_id, "Script", BIG_TEXT, item_type='CODE')
+        small_id = db.add_item(category_id, "Corto", "git status")
+
+        raw = db.execute_query("SELECT content, content_compressed FROM items WHERE id = ?", (big_id,))[0]
+        assert raw['content_compressed'] == 1
+        assert len(raw['content']) < len(BIG_TEXT) // 10
+
+        raw_small = db.execute_query("SELECT content_compressed FROM items WHERE id = ?", (small_id,))[0]
+        assert raw_small['content_compressed'] == 0
+
+        found = db.search_items("category_id = 1")
+        assert [item['id'] for item in found] == [big_id]
+        assert found[0]['content'] == BIG_TEXT
+
+        # Carga diferida: el Item recibe el payload y descomprime al primer acceso
+        item = Item(str(big_id), "Script", raw['content'], content_compressed=True)
+        assert item.content == BIG_TEXT
+        assert item.to_dict()['content'] == BIG_TEXT
+
+        # Las estadísticas (conexión propia) también devuelven el texto plano
+        db.execute_update("UPDATE items SET use_count = 3 WHERE id = ?", (big_id,))
+        stats = StatsManager(str(Path(tmp) / "test.db"))
+        top = stats.get_most_used_items(limit=1)
+        assert top[0]['id'] == big_id and top[0]['content'] == BIG_TEXT
+        assert any(row['content'] == BIG_TEXT for row in stats.get_most_used_items(limit=5, days=7))
+        print("  ✓ Lectura, búsqueda y carga diferida correctas")
+        db.close()
+
+
+def test_notebook_tabs_and_threshold():
+    """Las pestañas del notebook también se comprimen y el umbral es configurable"""
+    print("\n" + "="*60)
+    print("TEST 2: NOTEBOOK Y UMBRAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        tab_id = db.add_notebook_tab("Notas")
+        db.update_notebook_tab(tab_id, content=BIG_TEXT)
+        assert db.get_notebook_tab(tab_id)['content'] == BIG_TEXT
+        assert db.get_notebook_tabs()[0]['content_compressed'] == 0
+
+        db.set_setting('content_compression_threshold', 0)
+        db.update_notebook_tab(tab_id, content=BIG_TEXT)
+        raw = db.execute_query("SELECT content_compressed FROM notebook_tabs WHERE id = ?", (tab_id,))[0]
+        assert raw['content_compressed'] == 0
+        print("  ✓ Notebook comprimido y umbral 0 desactiva la compresión")
+        db.close()
+
+
+def test_migration_compresses_existing_rows():
+    """La migración comprime una sola vez el contenido grande existente"""
+    print("\n" + "="*60)
+    print("TEST 3: MIGRACIÓN DE DATOS EXISTENTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Test")
+        db.execute_update(
+            "INSERT INTO items (category_id, label, content) VALUES (?, ?, ?)",
+            (category_id, "Legacy", BIG_TEXT)
+        )
+
+        with db.transaction() as conn:
+            add_content_compression.upgrade(conn)
+
+        rows = db.execute_query("SELECT content_compressed FROM items")
+        assert [row['content_compressed'] for row in rows] == [1]
+        assert db.search_items("Legacy")[0]['content'] == BIG_TEXT
+        print("  ✓ Contenido existente comprimido")
+        db.close()
+
+
+if __name__ == "__main__":
+    test_items_round_trip_and_search()
+    test_notebook_tabs_and_threshold()
+    test_migration_compresses_existing_rows()
+    print("\n✓ Todos los tests pasaron")
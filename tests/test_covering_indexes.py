@@ -0,0 +1,123 @@
+"""
+Script de testing para la migración de índices de consultas frecuentes
+Ejecuta las consultas reales de FavoritesManager, StatsManager, UsageTracker
+y DBManager y comprueba con EXPLAIN QUERY PLAN (capturado por el
+QueryProfiler) que cada una usa su índice
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.migrations import get_schema_version, SCHEMA_MIGRATIONS
+from database.query_profiler import get_query_profiler
+from core.favorites_manager import FavoritesManager
+from core.stats_manager import StatsManager
+from core.usage_tracker import UsageTracker
+
+
+def _create_library(db_path):
+    db = DBManager(str(db_path))
+    category_id = db.execute_update(
+        "INSERT INTO categories (name, icon, order_index) VALUES ('Bench', '📁', 99)")
+    for i in range(60):
+        db.execute_update("""
+            INSERT INTO items (category_id, label, content, type, is_favorite, favorite_order,
+                               use_count, file_hash)
+            VALUES (?, ?, ?, 'TEXT', ?, ?, ?, ?)
+        """, (category_id, f"Item {i}", f"content {i}", int(i % 10 == 0), i, i % 5,
+              f"hash-{i}" if i % 3 == 0 else None))
+    db.execute_many(
+        "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success) "
+        "VALUES (?, datetime('now', ?), ?, ?)",
+        [(1 + i % 60, f"-{i % 30} days", 10 * i, int(i % 9 != 0)) for i in range(500)]
+    )
+    return db, category_id
+
+
+def _plan_for(fragment):
+    """Plan (detalle) de la sentencia registrada que contiene el fragmento"""
+    matches = [row for row in get_query_profiler().snapshot() if fragment in row['sql']]
+    assert matches, f"Statement not executed: {fragment}"
+    return " | ".join(matches[0]['plan'])
+
+
+def test_migration_registered():
+    """La migración crea item_usage_history y deja la versión al día"""
+    print("\n" + "="*60)
+    print("TEST 1: MIGRACIÓN APLICADA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        conn = db.connect()
+        assert get_schema_version(conn) == SCHEMA_MIGRATIONS[-1][0]
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name in ('idx_items_favorites', 'idx_items_favorites_category', 'idx_items_file_hash',
+                     'idx_items_use_count', 'idx_usage_item_used_at', 'idx_usage_used_at'):
+            assert name in indexes, name
+        assert 'idx_usage_item_id' not in indexes
+        db.close()
+    print("  ✓ Índices creados")
+
+
+def test_hot_queries_use_indexes():
+    """Cada consulta frecuente usa su índice"""
+    print("\n" + "="*60)
+    print("TEST 2: PLANES DE LAS CONSULTAS FRECUENTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db, category_id = _create_library(db_path)
+        profiler = get_query_profiler()
+        profiler.reset()
+
+        favorites = FavoritesManager(str(db_path))
+        assert len(favorites.get_all_favorites()) == 6
+        favorites.get_favorites_by_category(category_id)
+
+        stats = StatsManager(str(db_path))
+        assert stats.get_most_used_items(limit=5, days=7)
+        assert stats.get_most_used_items(limit=5)
+        stats.get_slowest_items(limit=5, min_executions=1)
+
+        tracker = UsageTracker(str(db_path))
+        tracker.get_total_executions_today()
+        tracker.get_usage_history(1, limit=5)
+
+        assert db.get_item_by_hash("hash-3")['label'] == "Item 3"
+        db.close()
+
+        expected = {
+            "WHERE is_favorite = ? ORDER BY favorite_order": "idx_items_favorites",
+            "WHERE is_favorite = ? AND category_id = ?": "idx_items_favorites_category",
+            "LEFT JOIN item_usage_history h ON i.id = h.item_id AND h.used_at":
+                "COVERING INDEX idx_usage_item_used_at",
+            "WHERE use_count > ? ORDER BY use_count DESC": "idx_items_use_count",
+            "AVG(h.execution_time_ms)": "COVERING INDEX idx_usage_item_used_at",
+            "FROM item_usage_history WHERE used_at >= date": "COVERING INDEX idx_usage_used_at",
+            "FROM item_usage_history WHERE item_id = ? ORDER BY used_at DESC": "idx_usage_item_used_at",
+            "WHERE file_hash = ?": "idx_items_file_hash",
+        }
+        for fragment, index in expected.items():
+            plan = _plan_for(fragment)
+            print(f"  {index:<42} {plan}")
+            assert index in plan, f"{fragment}: {plan}"
+
+        # El historial nunca se recorre completo (items sí en los GROUP BY i.id)
+        assert not [row for row in profiler.full_scans()
+                    if 'item_usage_history' in row['full_scans']]
+    print("  ✓ Todas las consultas usan su índice")
+
+
+if __name__ == "__main__":
+    test_migration_registered()
+    test_hot_queries_use_indexes()
+    print("\n✓ Todos los tests pasaron")
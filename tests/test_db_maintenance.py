@@ -0,0 +1,184 @@
+"""
+Script de testing para DatabaseMaintenanceService
+Prueba la retención de historial por lotes, el vacuum incremental, el
+quick_check, el registro de ejecuciones y la programación por inactividad
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.db_maintenance import DatabaseMaintenanceService
+from core.usage_tracker import UsageTracker
+
+
+def _create_library(db_path, old_rows=1200, recent_rows=50):
+    db = DBManager(str(db_path))
+    category_id = db.execute_update(
+        "INSERT INTO categories (name, icon, order_index) VALUES ('Maint', '📁', 99)")
+    item_id = db.execute_update(
+        "INSERT INTO items (category_id, label, content, type) VALUES (?, 'Item', 'x', 'TEXT')",
+        (category_id,))
+    db.execute_many(
+        "INSERT INTO item_usage_history (item_id, used_at) VALUES (?, datetime('now', ?))",
+        [(item_id, '-200 days')] * old_rows + [(item_id, '-1 days')] * recent_rows
+    )
+    return db
+
+
+def test_history_retention_batches():
+    """El historial antiguo se elimina por lotes; el reciente se conserva"""
+    print("\n" + "="*60)
+    print("TEST 1: RETENCIÓN DE HISTORIAL POR LOTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db = _create_library(db_path)
+
+        tracker = UsageTracker(str(db_path))
+        assert tracker.cleanup_old_history_batch(90, 500) == 500
+
+        # Sin retención configurada no se borra nada
+        service = DatabaseMaintenanceService(str(db_path))
+        service.HISTORY_BATCH_SIZE = 300
+        result = service.run(steps=['history_retention'])
+        assert result['steps']['history_retention']['deleted'] == 0
+        assert result['steps']['history_retention']['skipped'] == 'retention disabled'
+
+        db.set_setting('history_retention_days', 90)
+        result = service.run(steps=['history_retention'])
+        assert result['steps']['history_retention']['deleted'] == 700
+        remaining = db.execute_query("SELECT COUNT(*) AS n FROM item_usage_history")[0]['n']
+        assert remaining == 50
+
+        # 0 días = sin límite
+        db.set_setting('history_retention_days', 0)
+        result = service.run(steps=['history_retention'])
+        assert result['steps']['history_retention']['deleted'] == 0
+        db.close()
+    print("  ✓ 1200 registros antiguos eliminados, 50 recientes conservados")
+
+
+def test_full_run_and_log():
+    """Ejecución completa: vacuum incremental, quick_check y registro"""
+    print("\n" + "="*60)
+    print("TEST 2: EJECUCIÓN COMPLETA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db = _create_library(db_path, old_rows=5000)
+        db.set_setting('history_retention_days', 90)
+        conn = db.connect()
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        db.close()
+
+        service = DatabaseMaintenanceService(str(db_path))
+        result = service.run()
+        steps = result['steps']
+        print(f"  {steps}")
+        assert not result['cancelled'] and 'error' not in result
+        assert steps['history_retention']['deleted'] == 5000
+        assert steps['optimize']['done']
+        assert steps['incremental_vacuum']['freed_bytes'] > 0
+        assert steps['wal_checkpoint']['skipped'].startswith('journal_mode')
+        assert steps['quick_check']['ok'] and steps['quick_check']['tables'] > 5
+
+        db = DBManager(str(db_path))
+        assert db.connect().execute("PRAGMA freelist_count").fetchone()[0] == 0
+        assert db.get_setting('maintenance_last_run') == result['started_at']
+        db.close()
+        log = service.get_log()
+        assert len(log) == 1 and log[0]['steps']['quick_check']['ok']
+        assert not service.is_due()
+
+        # Tablas grandes: omitidas en la ejecución programada, comprobadas en la manual
+        db = _create_library(db_path, old_rows=300, recent_rows=0)
+        db.close()
+        service.QUICK_CHECK_MAX_ROWS = 100
+        check = service.run(steps=['quick_check'])['steps']['quick_check']
+        assert check['ok'] and check['skipped_tables'] == ['item_usage_history']
+        check = service.run(force=True, steps=['quick_check'])['steps']['quick_check']
+        assert check['ok'] and 'skipped_tables' not in check
+    print("  ✓ Pasos ejecutados y registrados")
+
+
+def test_legacy_database_conversion():
+    """Las bases sin auto_vacuum solo se convierten en ejecución manual"""
+    print("\n" + "="*60)
+    print("TEST 3: CONVERSIÓN A VACUUM INCREMENTAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db = _create_library(db_path)
+        conn = db.connect()
+        conn.execute("PRAGMA auto_vacuum = NONE")
+        conn.execute("VACUUM")
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+        db.close()
+
+        service = DatabaseMaintenanceService(str(db_path))
+        result = service.run(steps=['incremental_vacuum'])
+        assert 'skipped' in result['steps']['incremental_vacuum']
+
+        result = service.run(force=True, steps=['incremental_vacuum'])
+        assert result['steps']['incremental_vacuum']['converted']
+        db = DBManager(str(db_path))
+        assert db.connect().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        db.close()
+    print("  ✓ Conversión solo en ejecución forzada")
+
+
+def test_scheduling_and_stop():
+    """Inactividad, intervalo, ejecución asíncrona y cancelación"""
+    print("\n" + "="*60)
+    print("TEST 4: PROGRAMACIÓN Y CANCELACIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db = _create_library(db_path, old_rows=2000)
+        db.set_setting('history_retention_days', 90)
+
+        service = DatabaseMaintenanceService(str(db_path))
+        db.set_setting('maintenance_idle_seconds', 0)
+        assert service.is_due()
+        service.notify_activity()
+        db.set_setting('maintenance_idle_seconds', 60)
+        assert not service.is_due()
+        db.set_setting('maintenance_enabled', False)
+        db.set_setting('maintenance_idle_seconds', 0)
+        assert not service.is_due()
+        db.set_setting('maintenance_enabled', True)
+
+        # Detenido antes de empezar: se cancela en la primera porción
+        service.stop()
+        assert service._run_sliced(iter([None, None]), force=True) is False
+
+        # Ejecución asíncrona con callback
+        results = []
+        assert service.run_async(force=True, on_finished=results.append)
+        assert not service.run_async(force=True)
+        deadline = time.time() + 10
+        while not results and time.time() < deadline:
+            time.sleep(0.05)
+        assert results and results[0]['steps']['history_retention']['deleted'] == 2000
+        assert not service.is_running()
+        db.close()
+    print("  ✓ Programación por inactividad y ejecución en segundo plano")
+
+
+if __name__ == "__main__":
+    test_history_retention_batches()
+    test_full_run_and_log()
+    test_legacy_database_conversion()
+    test_scheduling_and_stop()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,176 @@
+"""
+Script de testing para la compilación a SQL de AdvancedFilterEngine
+Prueba que build_query devuelve los mismos items que apply_filters en
+memoria, que las columnas epoch se mantienen por triggers y que los
+filtros de fecha usan su índice
+"""
+
+import sys
+import json
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.advanced_filter_engine import AdvancedFilterEngine
+from models.item import Item, ItemType
+
+
+ITEMS = [
+    # label, type, tags, is_favorite, use_count, last_used (días atrás o None), is_list
+    ('deploy', 'CODE', '["git", "docker"]', 1, 12, 1, 0),
+    ('docs', 'URL', '["python"]', 0, 3, 20, 0),
+    ('legacy', 'TEXT', 'git, python', 0, 0, None, 0),
+    ('notes', 'TEXT', None, 1, 5, 60, 0),
+    ('empty', 'PATH', '[]', 0, 1, 2, 0),
+    ('step 1', 'CODE', '["git"]', 0, 7, 3, 1),
+]
+
+
+def _create_library(db_path):
+    db = DBManager(str(db_path))
+    category_id = db.execute_update(
+        "INSERT INTO categories (name, icon, order_index) VALUES ('Filtros', '📁', 99)")
+    for label, item_type, tags, favorite, use_count, days, is_list in ITEMS:
+        db.execute_update("""
+            INSERT INTO items (category_id, label, content, type, tags, is_favorite, use_count,
+                               last_used, is_list)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CASE WHEN ? IS NULL THEN NULL
+                                              ELSE datetime('now', '-' || ? || ' days') END, ?)
+        """, (category_id, label, f"content {label}", item_type, tags, favorite, use_count,
+              days, days, is_list))
+    return db, category_id
+
+
+def _load_rows(db, query, params):
+    """Filas preparadas como get_items_by_query (sin desencriptar)"""
+    rows = db.execute_query(query, tuple(params))
+    for row in rows:
+        try:
+            row['tags'] = json.loads(row['tags']) if row['tags'] else []
+        except json.JSONDecodeError:
+            row['tags'] = [tag.strip() for tag in row['tags'].split(',') if tag.strip()]
+    return rows
+
+
+def test_epoch_columns():
+    """Los triggers mantienen created_at_ts y last_used_ts"""
+    print("\n" + "="*60)
+    print("TEST 1: COLUMNAS EPOCH")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, _ = _create_library(Path(tmp) / "test.db")
+        rows = db.execute_query("""
+            SELECT label, created_at_ts, last_used_ts,
+                   CAST(strftime('%s', last_used) AS INTEGER) AS expected
+            FROM items
+        """)
+        for row in rows:
+            assert row['created_at_ts'] is not None
+            assert row['last_used_ts'] == row['expected']
+
+        db.execute_update("UPDATE items SET last_used = CURRENT_TIMESTAMP WHERE label = 'legacy'")
+        row = db.execute_query("SELECT last_used_ts FROM items WHERE label = 'legacy'")[0]
+        assert row['last_used_ts'] is not None
+        db.close()
+    print("  ✓ Columnas epoch sincronizadas en INSERT y UPDATE")
+
+
+def test_sql_matches_in_memory():
+    """build_query y apply_filters devuelven los mismos items"""
+    print("\n" + "="*60)
+    print("TEST 2: SQL EQUIVALENTE A FILTRADO EN MEMORIA")
+    print("="*60)
+
+    engine = AdvancedFilterEngine()
+    cases = [
+        {'type': ['CODE', 'URL']},
+        {'is_favorite': True},
+        {'has_tags': False},
+        {'has_tags': True},
+        {'is_list': True},
+        {'tags': {'values': ['git'], 'mode': 'OR'}},
+        {'tags': {'values': ['git', 'python'], 'mode': 'AND'}},
+        {'tags': {'values': ['docker', 'python'], 'mode': 'OR'}, 'sort_by': 'label_asc'},
+        {'use_count': {'operator': '>=', 'value': 5}, 'sort_by': 'use_count_desc'},
+        {'use_count': {'operator': '=', 'value': 0}},
+        {'last_used': {'preset': 'never'}},
+        {'type': ['TEXT', 'CODE'], 'sort_by': 'use_count_asc', 'top_n': 2},
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, _ = _create_library(Path(tmp) / "test.db")
+        query, params = engine.build_query({})
+        all_items = [engine._row_to_item(row) for row in _load_rows(db, query, params)]
+        assert len(all_items) == len(ITEMS)
+
+        for filters in cases:
+            query, params = engine.build_query(filters)
+            from_sql = [row['label'] for row in _load_rows(db, query, params)]
+            in_memory = [item.label for item in engine.apply_filters(all_items, filters)]
+            print(f"  {str(filters):<75} {from_sql}")
+            if 'sort_by' in filters:
+                assert from_sql == in_memory, (filters, from_sql, in_memory)
+            else:
+                assert sorted(from_sql) == sorted(in_memory), (filters, from_sql, in_memory)
+        db.close()
+    print("  ✓ Resultados idénticos")
+
+
+def test_date_filters_use_index():
+    """Los filtros de fecha comparan epoch con índice"""
+    print("\n" + "="*60)
+    print("TEST 3: FILTROS DE FECHA")
+    print("="*60)
+
+    engine = AdvancedFilterEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        db, category_id = _create_library(Path(tmp) / "test.db")
+
+        query, params = engine.build_query({'last_used': {'preset': 'last_7_days'},
+                                            'sort_by': 'recent'})
+        assert [row['label'] for row in _load_rows(db, query, params)] == \
+            ['deploy', 'empty', 'step 1']
+        plan = " | ".join(row[3] for row in db.connect().execute(f"EXPLAIN QUERY PLAN {query}", params))
+        assert 'idx_items_last_used_ts' in plan, plan
+
+        query, params = engine.build_query({'last_used': {'preset': 'last_30_days'}},
+                                           category_id=category_id, exclude_lists=True)
+        assert sorted(row['label'] for row in _load_rows(db, query, params)) == \
+            ['deploy', 'docs', 'empty']
+
+        query, params = engine.build_query({'created_at': {'preset': 'today'}, 'top_n': 3})
+        assert len(_load_rows(db, query, params)) == 3
+
+        # fetch_items trae las filas que cumplen; los items no guardados se filtran en memoria
+        matched = engine.fetch_items(db, {'last_used': {'preset': 'last_7_days'}, 'sort_by': 'recent'})
+        assert [item.label for item in matched] == ['deploy', 'empty', 'step 1']
+
+        query, params = engine.build_query({})
+        saved = [engine._row_to_item(row) for row in _load_rows(db, query, params)]
+        unsaved = Item(item_id="nuevo-1", label="sin guardar", content="x", item_type=ItemType.TEXT)
+        unsaved.last_used = datetime.now()
+        stale = Item(item_id="nuevo-2", label="antiguo", content="x", item_type=ItemType.TEXT)
+        stale.last_used = datetime.now() - timedelta(days=40)
+        matched = engine.fetch_items(db, {'last_used': {'preset': 'last_7_days'}, 'sort_by': 'recent'},
+                                     unsaved_items=saved + [unsaved, stale])
+        assert [item.label for item in matched] == ['sin guardar', 'deploy', 'empty', 'step 1']
+        assert not any(any(item is other for other in saved) for item in matched)
+
+        # Preset desconocido: se ignora, como en memoria
+        query, params = engine.build_query({'created_at': {'preset': 'someday'}})
+        assert len(_load_rows(db, query, params)) == len(ITEMS)
+        db.close()
+    print("  ✓ Rangos de fecha resueltos sobre columnas indexadas")
+
+
+if __name__ == "__main__":
+    test_epoch_columns()
+    test_sql_matches_in_memory()
+    test_date_filters_use_index()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,197 @@
+"""
+Script de testing para las claves de orden con huecos
+Prueba que reordenar categorías, favoritos, pasos de listas, speed dials y
+pestañas del notebook reescribe solo la clave del elemento movido, que un
+hueco agotado renumera el grupo, que el mantenimiento renumera de antemano y
+que las listas creadas en masa también reciben claves con huecos
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database import ordering
+from core.favorites_manager import FavoritesManager
+from core.ai_bulk_manager import AIBulkItemManager
+from models.bulk_item_data import BulkItemData
+
+
+def _keys(db, table, column, where="1 = 1"):
+    rows = db.execute_query(f"SELECT id, {column} AS k FROM {table} WHERE {where} ORDER BY {column}, id")
+    return {row['id']: row['k'] for row in rows}
+
+
+def _order(db, table, column, where="1 = 1"):
+    return list(_keys(db, table, column, where))
+
+
+def _changed(before, after):
+    return sum(1 for row_id, key in after.items() if before.get(row_id) != key)
+
+
+def test_plan_reorder():
+    """Mover un elemento cambia una clave; sin hueco se pide renumerar"""
+    print("\n" + "="*60)
+    print("TEST 1: CÁLCULO DE CLAVES")
+    print("="*60)
+
+    current = dict(zip(range(1, 6), ordering.spaced_keys(5)))
+    assert ordering.plan_reorder(current, [1, 2, 3, 4, 5]) == []
+    assert ordering.plan_reorder(current, [5, 1, 2, 3, 4]) == [(5, 0)]
+    assert ordering.plan_reorder(current, [1, 2, 3, 5, 4]) in ([(5, 3584)], [(4, 6144)])
+    assert ordering.plan_reorder(current, [2, 3, 4, 5, 1]) == [(1, 6144)]
+    assert ordering.plan_reorder({1: 1, 2: 2, 3: 3}, [1, 3, 2]) is None
+
+    # Claves repetidas o nulas reciben claves nuevas salvo una
+    current = {1: 0, 2: 0, 3: None}
+    plan = dict(ordering.plan_reorder(current, [1, 2, 3]))
+    assert len(plan) == 2
+    current.update(plan)
+    assert current[1] < current[2] < current[3]
+    print("  ✓ Subsecuencia creciente conservada")
+
+
+def test_single_row_reorders():
+    """Cada colección reescribe una sola fila por drag & drop"""
+    print("\n" + "="*60)
+    print("TEST 2: REORDENAR UNA FILA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+
+        # Categorías
+        cat_ids = [db.add_category(f"Cat {i}", icon="📁") for i in range(30)]
+        order = _order(db, 'categories', 'order_index')
+        before = _keys(db, 'categories', 'order_index')
+        order.insert(3, order.pop(25))
+        db.reorder_categories(order)
+        assert _order(db, 'categories', 'order_index') == order
+        assert _changed(before, _keys(db, 'categories', 'order_index')) == 1
+
+        # Pasos de una lista
+        step_ids = db.create_list(cat_ids[0], "Deploy", [{'label': f"Paso {i}"} for i in range(200)])
+        where = "is_list = 1 AND list_group = 'Deploy'"
+        before = _keys(db, 'items', 'orden_lista', where)
+        assert db.reorder_list_item(step_ids[150], 1)
+        order = _order(db, 'items', 'orden_lista', where)
+        assert order[0] == step_ids[150] and order[1:] == step_ids[:150] + step_ids[151:]
+        assert _changed(before, _keys(db, 'items', 'orden_lista', where)) == 1
+        assert db.reorder_list_item(step_ids[150], 200)
+        assert _order(db, 'items', 'orden_lista', where)[-1] == step_ids[150]
+
+        # Speed dials
+        dial_ids = [db.add_speed_dial(f"Sitio {i}", f"https://s{i}.example") for i in range(10)]
+        before = _keys(db, 'speed_dials', 'position')
+        version = db.get_speed_dial_version()
+        assert db.reorder_speed_dial(dial_ids[9], 2)
+        assert _order(db, 'speed_dials', 'position')[2] == dial_ids[9]
+        assert _changed(before, _keys(db, 'speed_dials', 'position')) == 1
+        assert db.get_speed_dial_version() == version + 1
+        assert not db.reorder_speed_dial(99999, 0)
+
+        # Pestañas del notebook
+        tab_ids = [db.add_notebook_tab(f"Tab {i}") for i in range(8)]
+        before = _keys(db, 'notebook_tabs', 'position')
+        new_order = tab_ids[1:] + tab_ids[:1]
+        assert db.reorder_notebook_tabs(new_order)
+        assert _order(db, 'notebook_tabs', 'position') == new_order
+        assert _changed(before, _keys(db, 'notebook_tabs', 'position')) == 1
+
+        # Favoritos (conexión propia del manager)
+        favorites = FavoritesManager(db_path)
+        item_ids = [db.add_item(cat_ids[1], f"Item {i}", "x") for i in range(50)]
+        for item_id in item_ids:
+            assert favorites.mark_as_favorite(item_id)
+        where = "is_favorite = 1"
+        before = _keys(db, 'items', 'favorite_order', where)
+        new_order = item_ids[:10] + [item_ids[40]] + item_ids[10:40] + item_ids[41:]
+        assert favorites.reorder_favorites(new_order)
+        assert _order(db, 'items', 'favorite_order', where) == new_order
+        assert _changed(before, _keys(db, 'items', 'favorite_order', where)) == 1
+        assert favorites.reorder_favorite(item_ids[0], 50)
+        assert _order(db, 'items', 'favorite_order', where)[-1] == item_ids[0]
+        db.close()
+    print("  ✓ Una clave escrita por movimiento")
+
+
+def test_renormalization():
+    """Huecos agotados: renumeración al reordenar y en el mantenimiento"""
+    print("\n" + "="*60)
+    print("TEST 3: RENUMERACIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        tab_ids = [db.add_notebook_tab(f"Tab {i}", position=i) for i in range(4)]
+
+        # Claves consecutivas (datos anteriores): el primer movimiento renumera
+        assert db.reorder_notebook_tabs([tab_ids[0], tab_ids[2], tab_ids[1], tab_ids[3]])
+        keys = _keys(db, 'notebook_tabs', 'position')
+        assert list(keys) == [tab_ids[0], tab_ids[2], tab_ids[1], tab_ids[3]]
+        assert sorted(keys.values()) == ordering.spaced_keys(4)
+
+        # Mover repetidamente al mismo hueco lo agota; el mantenimiento lo renumera
+        for _ in range(8):
+            order = _order(db, 'notebook_tabs', 'position')
+            db.reorder_notebook_tabs([order[0], order[2], order[1], order[3]])
+        assert db.renormalize_order_keys(['notebook_tabs'])['notebook_tabs'] > 0
+        assert sorted(_keys(db, 'notebook_tabs', 'position').values()) == ordering.spaced_keys(4)
+        assert db.renormalize_order_keys() == {name: 0 for name in ordering.COLLECTIONS}
+        db.close()
+    print("  ✓ Grupos renumerados solo cuando hace falta")
+
+
+def test_bulk_lists_and_positions():
+    """Las listas creadas en masa usan claves con huecos; la posición es 1, 2, 3"""
+    print("\n" + "="*60)
+    print("TEST 4: LISTAS CREADAS EN MASA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Deploy", icon="🚀")
+        db.create_list(category_id, "Release", [{'label': "Tag"}])
+        manager = AIBulkItemManager(db)
+        items = [
+            BulkItemData(label="Build", content="make", is_list=1, list_group="Setup", orden_lista=2),
+            BulkItemData(label="Clone", content="git clone", is_list=1, list_group="Setup", orden_lista=1),
+            BulkItemData(label="Test", content="make test", is_list=1, list_group="Setup"),
+            BulkItemData(label="Push", content="git push", is_list=1, list_group="Release"),
+            BulkItemData(label="Notas", content="texto"),
+        ]
+        assert manager.create_items_bulk(items, category_id).created_count == 5
+
+        where = f"category_id = {category_id} AND list_group = 'Setup'"
+        keys = _keys(db, 'items', 'orden_lista', where)
+        labels = [db.get_item(item_id)['label'] for item_id in keys]
+        assert labels == ["Clone", "Build", "Test"]
+        assert list(keys.values()) == ordering.spaced_keys(3)
+
+        # Pasos agregados a una lista existente: detrás de los que ya tenía
+        release = _keys(db, 'items', 'orden_lista', f"category_id = {category_id} AND list_group = 'Release'")
+        assert list(release.values()) == ordering.spaced_keys(2)
+
+        # Primer reordenamiento: una sola clave escrita
+        before = keys
+        db.reorder_list_item(list(keys)[2], 1)
+        assert _changed(before, _keys(db, 'items', 'orden_lista', where)) == 1
+        assert [db.get_list_item_position(item_id) for item_id in before] == [2, 3, 1]
+        notes_id = db.execute_query("SELECT id FROM items WHERE label = 'Notas'")[0]['id']
+        assert db.get_list_item_position(notes_id) is None
+        db.close()
+    print("  ✓ Claves con huecos y posición visible")
+
+
+if __name__ == "__main__":
+    test_plan_reorder()
+    test_single_row_reorders()
+    test_renormalization()
+    test_bulk_lists_and_positions()
+    print("\n✓ Todos los tests pasaron")
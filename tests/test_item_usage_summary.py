@@ -0,0 +1,172 @@
+"""
+Script de testing para el resumen de uso por item
+Prueba que item_usage_summary se mantiene en la misma transacción que cada
+registro de uso, que los borrados de historial lo descuentan (incluido el
+último error) y que get_item_stats lo lee con una sola consulta
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from database.migrations import add_item_usage_summary
+from core.usage_tracker import UsageTracker
+
+
+def _stats_from_history(db, item_id):
+    """Estadísticas calculadas con los agregados sobre el historial"""
+    row = db.execute_query("""
+        SELECT
+            COUNT(*) AS total,
+            SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) AS successful,
+            SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) AS errors,
+            AVG(CASE WHEN success = 1 THEN execution_time_ms END) AS avg_time
+        FROM item_usage_history WHERE item_id = ?
+    """, (item_id,))[0]
+    last_error = db.execute_query("""
+        SELECT * FROM item_usage_history WHERE item_id = ? AND success = 0
+        ORDER BY used_at DESC, id DESC LIMIT 1
+    """, (item_id,))
+    return {
+        'avg_execution_time': round(row['avg_time'] / 1000.0, 2) if row['avg_time'] else 0.0,
+        'success_rate': round(row['successful'] / row['total'] * 100, 2) if row['total'] else 100.0,
+        'error_count': row['errors'] or 0,
+        'last_error': last_error[0] if last_error else None,
+    }
+
+
+def _assert_matches_history(db, tracker, item_id):
+    stats = tracker.get_item_stats(item_id)
+    for key, value in _stats_from_history(db, item_id).items():
+        assert stats[key] == value, (key, stats[key], value)
+    return stats
+
+
+def test_summary_follows_usage():
+    """Cada registro de uso actualiza el resumen; la lectura es una consulta"""
+    print("\n" + "="*60)
+    print("TEST 1: RESUMEN ACTUALIZADO CON CADA USO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Comandos", icon="📁")
+        item_id = db.add_item(category_id, "Build", "make")
+        other_id = db.add_item(category_id, "Test", "pytest")
+        tracker = UsageTracker(db_path)
+
+        stats = tracker.get_item_stats(item_id)
+        assert stats['use_count'] == 0 and stats['success_rate'] == 100.0 and stats['last_error'] is None
+
+        tracker.track_usage(item_id, 1200)
+        tracker.track_usage(item_id, 800)
+        tracker.track_usage(item_id, 50, success=False, error_message="exit 2")
+        tracker.track_usage(item_id, 3000)
+        tracker.track_usage(other_id, 10, success=False, error_message="not found")
+
+        stats = _assert_matches_history(db, tracker, item_id)
+        assert stats['use_count'] == 4
+        assert stats['avg_execution_time'] == 1.67
+        assert stats['success_rate'] == 75.0
+        assert stats['last_error']['error_message'] == "exit 2"
+        assert _assert_matches_history(db, tracker, other_id)['error_count'] == 1
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        tracker.get_item_stats(item_id)
+        queries = profiler.snapshot()
+        assert sum(row['count'] for row in queries) == 1
+        assert not any('item_usage_history' in row['sql'] for row in queries)
+        db.close()
+    print("  ✓ Estadísticas iguales a los agregados, en una consulta")
+
+
+def test_summary_follows_deletes():
+    """Retención y borrado de items descuentan el resumen"""
+    print("\n" + "="*60)
+    print("TEST 2: BORRADOS DE HISTORIAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Comandos", icon="📁")
+        item_id = db.add_item(category_id, "Deploy", "./deploy.sh")
+        tracker = UsageTracker(db_path)
+
+        # Historial antiguo con un error anterior y otro más reciente
+        db.execute_many(
+            "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success, error_message) "
+            "VALUES (?, datetime('now', ?), ?, ?, ?)",
+            [
+                (item_id, '-200 days', 500, 1, None),
+                (item_id, '-150 days', 100, 0, "timeout"),
+                (item_id, '-100 days', 900, 1, None),
+            ]
+        )
+        tracker.track_usage(item_id, 2000, success=False, error_message="permiso denegado")
+        tracker.track_usage(item_id, 400)
+        assert _assert_matches_history(db, tracker, item_id)['last_error']['error_message'] == "permiso denegado"
+
+        assert tracker.cleanup_old_history_batch(90) == 3
+        stats = _assert_matches_history(db, tracker, item_id)
+        assert stats['error_count'] == 1 and stats['avg_execution_time'] == 0.4
+
+        # Borrar el último error recalcula el anterior (aquí ninguno)
+        db.execute_update("DELETE FROM item_usage_history WHERE success = 0")
+        assert _assert_matches_history(db, tracker, item_id)['last_error'] is None
+
+        db.delete_item(item_id)
+        assert db.execute_query("SELECT * FROM item_usage_summary WHERE item_id = ?", (item_id,)) == []
+        db.close()
+    print("  ✓ Contadores y último error descontados")
+
+
+def test_migration_backfill():
+    """La migración rellena el resumen desde el historial existente"""
+    print("\n" + "="*60)
+    print("TEST 3: RELLENO DESDE EL HISTORIAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Comandos", icon="📁")
+        item_ids = [db.add_item(category_id, f"Item {i}", "x") for i in range(3)]
+
+        conn = db.connect()
+        add_item_usage_summary.downgrade(conn)
+        conn.executemany(
+            "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success, error_message) "
+            "VALUES (?, datetime('now', ?), ?, ?, ?)",
+            [
+                (item_ids[0], '-3 days', 100, 1, None),
+                (item_ids[0], '-2 days', 300, 0, "fallo A"),
+                (item_ids[0], '-1 days', 500, 0, "fallo B"),
+                (item_ids[1], '-1 days', 700, 1, None),
+            ]
+        )
+        add_item_usage_summary.upgrade(conn)
+        conn.commit()
+
+        tracker = UsageTracker(db_path)
+        for item_id in item_ids:
+            _assert_matches_history(db, tracker, item_id)
+        assert tracker.get_last_error(item_ids[0])['error_message'] == "fallo B"
+        assert tracker.get_error_count(item_ids[2]) == 0
+        db.close()
+    print("  ✓ Resumen inicial igual a los agregados")
+
+
+if __name__ == "__main__":
+    test_summary_follows_usage()
+    test_summary_follows_deletes()
+    test_migration_backfill()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,67 @@
+"""
+Script de testing para LazyManager (inicialización diferida de subsistemas)
+Prueba que el manager real solo se construye en el primer uso, que las
+llamadas diferidas se reproducen y que cleanup es no-op sin cargar
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from core.lazy_manager import LazyManager
+
+
+class FakeBrowserManager:
+    """Manager de prueba que registra su construcción"""
+
+    instances = 0
+
+    def __init__(self):
+        FakeBrowserManager.instances += 1
+        self.main_window = None
+        self.cleaned = False
+
+    def set_main_window(self, main_window):
+        self.main_window = main_window
+
+    def cleanup(self):
+        self.cleaned = True
+
+    def toggle_browser(self):
+        return "toggled"
+
+
+def test_lazy_construction_and_deferred_calls():
+    """El manager se crea en el primer uso y recibe las llamadas diferidas"""
+    print("\n" + "="*60)
+    print("TEST 1: CONSTRUCCIÓN DIFERIDA")
+    print("="*60)
+
+    FakeBrowserManager.instances = 0
+    proxy = LazyManager('FakeBrowserManager', FakeBrowserManager,
+                        deferred_calls=('set_main_window',),
+                        noop_until_loaded=('cleanup',))
+
+    proxy.set_main_window("window")
+    proxy.cleanup()
+    assert FakeBrowserManager.instances == 0
+    assert not proxy.lazy_loaded
+
+    assert proxy.toggle_browser() == "toggled"
+    assert FakeBrowserManager.instances == 1
+    assert proxy.main_window == "window"
+
+    proxy.cleanup()
+    assert proxy.cleaned
+    proxy.home_url = "https://example.com"
+    assert proxy.lazy_get().home_url == "https://example.com"
+    assert FakeBrowserManager.instances == 1
+    print("  ✓ Manager creado una sola vez en el primer uso")
+
+
+if __name__ == "__main__":
+    test_lazy_construction_and_deferred_calls()
+    print("\n✓ Todos los tests pasaron")
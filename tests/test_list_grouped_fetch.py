@@ -0,0 +1,105 @@
+"""
+Script de testing para la lectura agrupada de listas
+Prueba que todas las listas de una categoría y sus pasos ordenados se leen
+en una sola consulta por idx_items_orden_lista, con el mismo resumen que
+get_lists_by_category, y que el contenido de los pasos se lee aparte
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+
+
+def _create_lists(db, category_id, count, steps=3):
+    created = {}
+    for i in range(count):
+        name = f"Lista {i:02d}"
+        created[name] = db.create_list(
+            category_id, name, [{'label': f"Paso {j}", 'content': f"cmd {i}.{j}"} for j in range(steps)]
+        )
+    return created
+
+
+def test_single_query():
+    """Listas y pasos en una consulta, mismo resumen que get_lists_by_category"""
+    print("\n" + "="*60)
+    print("TEST 1: LISTAS Y PASOS EN UNA CONSULTA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Scripts", icon="📁")
+        other_id = db.add_category("Otra", icon="📁")
+        created = _create_lists(db, category_id, 50)
+        _create_lists(db, other_id, 2)
+        db.add_item(category_id, "Item suelto", "x")
+
+        # Reordenar un paso: el orden viene de orden_lista
+        steps = created["Lista 07"]
+        db.reorder_list_item(steps[2], 1)
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        lists = db.get_lists_with_steps(category_id)
+        queries = profiler.snapshot()
+        assert sum(row['count'] for row in queries) == 1
+
+        summary = {row['list_group']: row for row in db.get_lists_by_category(category_id)}
+        assert [data['list_group'] for data in lists] == [row['list_group'] for row in db.get_lists_by_category(category_id)]
+        for data in lists:
+            expected = summary[data['list_group']]
+            for key in ('item_count', 'first_label', 'created_at', 'last_used'):
+                assert data[key] == expected[key], (key, data[key], expected[key])
+            assert all('content' not in step for step in data['steps'])
+
+        by_name = {data['list_group']: data for data in lists}
+        assert [step['id'] for step in by_name["Lista 07"]['steps']] == [steps[2], steps[0], steps[1]]
+        assert [step['label'] for step in by_name["Lista 00"]['steps']] == ["Paso 0", "Paso 1", "Paso 2"]
+
+        plan = " ".join(
+            str(row[3]) for row in db.connect().execute(
+                "EXPLAIN QUERY PLAN SELECT id, list_group, label, type, orden_lista, is_sensitive, created_at, last_used "
+                "FROM items WHERE category_id = ? AND is_list = 1 AND is_active = 1 "
+                "ORDER BY list_group, orden_lista, id", (category_id,)
+            )
+        )
+        assert 'idx_items_orden_lista' in plan and 'TEMP B-TREE' not in plan
+        db.close()
+    print("  ✓ 50 listas en una consulta por índice")
+
+
+def test_step_contents():
+    """El contenido de los pasos se lee por ID, descomprimido"""
+    print("\n" + "="*60)
+    print("TEST 2: CONTENIDO DE PASOS BAJO DEMANDA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Scripts", icon="📁")
+        large = "echo paso largo\n" * 2000
+        step_ids = db.create_list(category_id, "Deploy", [
+            {'label': "Corto", 'content': "git pull"},
+            {'label': "Largo", 'content': large},
+        ])
+        row = db.execute_query("SELECT content_compressed FROM items WHERE id = ?", (step_ids[1],))[0]
+        assert row['content_compressed'] == 1
+
+        contents = db.get_list_step_contents(step_ids)
+        assert contents == {step_ids[0]: "git pull", step_ids[1]: large}
+        assert db.get_list_step_contents([]) == {}
+        db.close()
+    print("  ✓ Contenido restaurado por ID")
+
+
+if __name__ == "__main__":
+    test_single_query()
+    test_step_contents()
+    print("\n✓ Todos los tests pasaron")
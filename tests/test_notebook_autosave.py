@@ -0,0 +1,132 @@
+"""
+Script de testing para el auto-guardado incremental del notebook
+Prueba que solo se escriben las pestañas modificadas (en una transacción),
+que el flush en segundo plano funciona y que el journal recupera los
+cambios tras un cierre sin guardar
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core.notebook_autosave import NotebookAutosaveService
+
+
+def _fields(title, content):
+    return {
+        'title': title, 'content': content, 'category_id': None, 'item_type': 'TEXT',
+        'tags': '', 'description': '', 'is_sensitive': False, 'is_active': True,
+        'is_archived': False,
+    }
+
+
+def _create_tabs(db_path, count=3):
+    db = DBManager(str(db_path))
+    tab_ids = [db.add_notebook_tab(title=f"Nota {i}") for i in range(count)]
+    service = NotebookAutosaveService(str(db_path))
+    for i, tab_id in enumerate(tab_ids):
+        service.set_saved(tab_id, _fields(f"Nota {i}", ''))
+    return db, service, tab_ids
+
+
+def test_only_dirty_tabs_written():
+    """Solo las pestañas con cambios se escriben, en una transacción"""
+    print("\n" + "="*60)
+    print("TEST 1: SOLO PESTAÑAS MODIFICADAS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, service, tab_ids = _create_tabs(Path(tmp) / "test.db")
+
+        # Mismo contenido que lo guardado: no queda pendiente
+        assert not service.mark_dirty(tab_ids[0], _fields("Nota 0", ''))
+        assert service.mark_dirty(tab_ids[1], _fields("Nota 1", 'texto'))
+        assert service.mark_dirty(tab_ids[2], _fields("Nota 2", 'otro'))
+        assert sorted(service.dirty_tab_ids()) == tab_ids[1:]
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        result = service.flush()
+        assert sorted(result['saved']) == tab_ids[1:]
+        updates = [row for row in profiler.snapshot() if row['sql'].startswith('UPDATE notebook_tabs')]
+        assert sum(row['count'] for row in updates) == 2
+        assert service.dirty_tab_ids() == []
+        assert db.get_notebook_tab(tab_ids[1])['content'] == 'texto'
+
+        # Sin cambios nuevos el siguiente flush no escribe nada
+        assert service.flush()['saved'] == []
+        assert not service.flush_async()
+
+        # Volver al estado guardado descarta el cambio pendiente
+        service.mark_dirty(tab_ids[1], _fields("Nota 1", 'editado'))
+        service.mark_dirty(tab_ids[1], _fields("Nota 1", 'texto'))
+        assert not service.is_dirty(tab_ids[1])
+        service.close()
+        db.close()
+    print("  ✓ Escrituras limitadas a pestañas modificadas")
+
+
+def test_flush_async():
+    """El flush en segundo plano guarda y notifica el resultado"""
+    print("\n" + "="*60)
+    print("TEST 2: FLUSH EN SEGUNDO PLANO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, service, tab_ids = _create_tabs(Path(tmp) / "test.db")
+        results = []
+
+        service.mark_dirty(tab_ids[0], _fields("Cambiada", 'async'))
+        assert service.flush_async(on_finished=results.append)
+        service.close()
+
+        assert results and results[0]['saved'] == [tab_ids[0]]
+        assert db.get_notebook_tab(tab_ids[0])['title'] == 'Cambiada'
+        assert not service.journal_path.exists()
+        db.close()
+    print("  ✓ Guardado en hilo worker con conexión propia")
+
+
+def test_journal_recovery():
+    """Los cambios sin flush se recuperan del journal al arrancar"""
+    print("\n" + "="*60)
+    print("TEST 3: RECUPERACIÓN DESDE JOURNAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        db, service, tab_ids = _create_tabs(db_path)
+
+        service.mark_dirty(tab_ids[0], _fields("Nota 0", 'versión 1'))
+        service.mark_dirty(tab_ids[0], _fields("Nota 0", 'versión 2'))
+        service.mark_dirty(tab_ids[2], _fields("Nota 2", 'borrada'))
+        service.discard(tab_ids[2])
+        db.delete_notebook_tab(tab_ids[2])
+        assert service.journal_path.exists()
+        # Cierre inesperado: no hay flush
+        assert db.get_notebook_tab(tab_ids[0])['content'] == ''
+
+        # Una línea corrupta al final (escritura interrumpida) se ignora
+        with open(service.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"tab_id": 1, "fie')
+
+        recovered = NotebookAutosaveService(str(db_path))
+        assert recovered.recover() == 1
+        assert db.get_notebook_tab(tab_ids[0])['content'] == 'versión 2'
+        assert not recovered.journal_path.exists()
+        recovered.close()
+        db.close()
+    print("  ✓ Última versión de cada pestaña recuperada")
+
+
+if __name__ == "__main__":
+    test_only_dirty_tabs_written()
+    test_flush_async()
+    test_journal_recovery()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,68 @@
+"""
+Script de testing para la carga diferida de pestañas del notebook
+Prueba que los metadatos se leen sin el contenido y la selección de
+pestañas a descargar según el presupuesto de memoria
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.notebook_manager import NotebookManager
+
+
+def test_tab_summaries_without_content():
+    """Los metadatos no incluyen el contenido"""
+    print("\n" + "="*60)
+    print("TEST 1: METADATOS SIN CONTENIDO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        manager = NotebookManager(db)
+        first = manager.create_tab("Log grande")
+        second = manager.create_tab("Nota")
+        manager.update_tab(first, content="línea de log\n" * 5000)
+
+        summaries = manager.get_tab_summaries()
+        assert [tab['id'] for tab in summaries] == [first, second]
+        assert all('content' not in tab for tab in summaries)
+        assert summaries[0]['title'] == "Log grande"
+        assert summaries[0]['content_size'] > 0
+        assert not summaries[1]['content_size']
+
+        # El contenido completo se obtiene al activar la pestaña
+        assert manager.get_tab(first)['content'].startswith("línea de log")
+        db.close()
+    print("  ✓ Pestañas restauradas solo con metadatos")
+
+
+def test_select_tabs_to_unload():
+    """Se descargan las pestañas menos usadas hasta cumplir el presupuesto"""
+    print("\n" + "="*60)
+    print("TEST 2: PRESUPUESTO DE MEMORIA")
+    print("="*60)
+
+    loaded = [
+        {'id': 1, 'size': 400, 'last_active': 10, 'can_unload': True},
+        {'id': 2, 'size': 300, 'last_active': 5, 'can_unload': True},
+        {'id': 3, 'size': 500, 'last_active': 1, 'can_unload': False},  # activa
+        {'id': 4, 'size': 100, 'last_active': 20, 'can_unload': True},
+    ]
+    assert NotebookManager.select_tabs_to_unload(loaded, 2000) == []
+    assert NotebookManager.select_tabs_to_unload(loaded, 1000) == [2]
+    assert NotebookManager.select_tabs_to_unload(loaded, 600) == [2, 1]
+    # La pestaña activa nunca se descarga aunque no quepa
+    assert NotebookManager.select_tabs_to_unload(loaded, 0) == [2, 1, 4]
+    print("  ✓ Descarga LRU respetando la pestaña activa")
+
+
+if __name__ == "__main__":
+    test_tab_summaries_without_content()
+    test_select_tabs_to_unload()
+    print("\n✓ Todos los tests pasaron")
@@ -119,7 +119,7 @@ def test_notebook_persistence():
         tab.content_input.setPlainText(f"Content for tab {i+1}")
 
     # Auto-guardar
-    window1.autosave_all_tabs()
+    window1.save_all_tabs()
     print(f"Tabs creadas: {window1.tab_widget.count()}")
 
     # Cerrar ventana
@@ -134,9 +134,10 @@ def test_notebook_persistence():
     print(f"Tabs cargadas: {window2.tab_widget.count()}")
 
     # Verificar contenido
+    # (las pestañas no activas son placeholders hasta que se activan)
     for i in range(window2.tab_widget.count()):
         tab = window2.tab_widget.widget(i)
-        print(f"  Tab {i+1}: {tab.name_input.text()}")
+        print(f"  Tab {i+1}: {window2.tab_widget.tabText(i)} (cargada: {tab.is_loaded})")
 
     window2.move(100, 100)
     window2.show()
@@ -0,0 +1,122 @@
+"""
+Script de testing para la restauración diferida de paneles anclados
+Prueba que la restauración lee solo las filas de paneles, que el contenido
+se lee en un hilo worker con su propia conexión (con prioridad para los
+paneles maximizados) y que las estadísticas se actualizan en un solo lote
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core.pinned_panels_manager import PinnedPanelsManager
+from core.pinned_panel_loader import PinnedPanelContentLoader
+
+
+def _create_panels(db, count):
+    panels = []
+    for i in range(count):
+        category_id = db.add_category(f"Categoría {i}", icon="📁")
+        panel_id = db.execute_update(
+            "INSERT INTO pinned_panels (category_id, x_position, y_position, width, height) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (category_id, 10 * i, 20, 300, 400)
+        )
+        panels.append((panel_id, category_id))
+    return panels
+
+
+def _wait_idle(loader, timeout=5):
+    deadline = time.monotonic() + timeout
+    while loader.is_running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_restore_reads_panel_rows_only():
+    """Los paneles se restauran con sus filas y se marcan abiertos en un lote"""
+    print("\n" + "="*60)
+    print("TEST 1: RESTAURACIÓN SIN ITEMS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        panels = _create_panels(db, 5)
+        manager = PinnedPanelsManager(db)
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        restored = manager.restore_panels_on_startup()
+        assert sorted(panel['id'] for panel in restored) == [panel_id for panel_id, _ in panels]
+        assert all(panel['category_name'].startswith("Categoría") for panel in restored)
+        assert not any('FROM items' in row['sql'] for row in profiler.snapshot())
+
+        profiler.reset()
+        manager.mark_panels_opened([panel['id'] for panel in restored])
+        updates = [row for row in profiler.snapshot() if row['sql'].lstrip().startswith('UPDATE pinned_panels')]
+        assert len(updates) == 1
+        assert all(panel['open_count'] == 1 for panel in db.get_pinned_panels())
+        db.close()
+    print("  ✓ Solo filas de paneles; estadísticas en una transacción")
+
+
+def test_loader_priority_and_cancel():
+    """El worker respeta el orden, la prioridad y las cancelaciones"""
+    print("\n" + "="*60)
+    print("TEST 2: CARGA EN SEGUNDO PLANO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        panels = _create_panels(db, 4)
+
+        started = threading.Event()
+        release = threading.Event()
+        loaded = []
+        connections = set()
+        main_thread = threading.get_ident()
+
+        def fetch(worker_db, category_id):
+            assert threading.get_ident() != main_thread
+            connections.add(id(worker_db))
+            started.set()
+            release.wait(5)
+            return worker_db.get_category(category_id)
+
+        loader = PinnedPanelContentLoader(
+            db_path, on_loaded=lambda panel_id, content: loaded.append((panel_id, content['name'])), fetch=fetch
+        )
+        for panel_id, category_id in panels:
+            loader.request(panel_id, category_id)
+        assert started.wait(5)
+        # El primero ya está en lectura: los repetidos no se vuelven a encolar
+        loader.request(*panels[0])
+        loader.request(*panels[1])
+        assert loader.pending_count() == 3
+
+        loader.request(*panels[3], priority=True)
+        loader.cancel(panels[2][0])
+        release.set()
+        _wait_idle(loader)
+        loader.close()
+
+        assert [panel_id for panel_id, _ in loaded] == [panels[0][0], panels[3][0], panels[1][0]]
+        assert loaded[1][1] == "Categoría 3"
+        assert len(connections) == 1 and id(db) not in connections
+        assert not loader.is_running()
+        db.close()
+    print("  ✓ Un hilo, conexión propia, prioridad y cancelación")
+
+
+if __name__ == "__main__":
+    test_restore_reads_panel_rows_only()
+    test_loader_priority_and_cancel()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,156 @@
+"""
+Script de testing para QueryProfiler (instrumentación de consultas)
+Prueba la normalización de SQL, el histograma por sentencia, el log de
+consultas lentas con EXPLAIN QUERY PLAN y la detección de full scans
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.query_profiler import (ProfiledConnection, QueryProfiler, get_query_profiler,
+                                     normalize_sql, detect_full_scans)
+
+
+def _create_connection():
+    conn = sqlite3.connect(":memory:", factory=ProfiledConnection)
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT, use_count INTEGER DEFAULT 0);
+        CREATE INDEX idx_items_use_count ON items(use_count);
+        CREATE TABLE item_usage_history (id INTEGER PRIMARY KEY, item_id INTEGER, used_at TEXT);
+    """)
+    conn.executemany("INSERT INTO items (label, use_count) VALUES (?, ?)",
+                     [(f"item {i}", i % 7) for i in range(200)])
+    return conn
+
+
+def test_normalize_sql():
+    """Literales, espacios y listas IN se normalizan"""
+    print("\n" + "="*60)
+    print("TEST 1: NORMALIZACIÓN DE SQL")
+    print("="*60)
+
+    a = normalize_sql("SELECT *  FROM items\n WHERE id = 5 AND label = 'it''s'")
+    b = normalize_sql("SELECT * FROM items WHERE id = 12 AND label = 'x'")
+    assert a == b == "SELECT * FROM items WHERE id = ? AND label = ?"
+    assert normalize_sql("SELECT * FROM items WHERE id IN (?, ?, ?)") == \
+        normalize_sql("SELECT * FROM items WHERE id IN (?,?)")
+    assert normalize_sql("SELECT * FROM t1") == "SELECT * FROM t1"
+    print("  ✓ Sentencias equivalentes comparten clave")
+
+
+def test_statement_histogram():
+    """Cada ejecución se cuenta en la sentencia normalizada"""
+    print("\n" + "="*60)
+    print("TEST 2: HISTOGRAMA POR SENTENCIA")
+    print("="*60)
+
+    profiler = get_query_profiler()
+    profiler.reset()
+    with profiler.measuring():
+        conn = _create_connection()
+        for item_id in range(1, 11):
+            conn.execute("SELECT label FROM items WHERE id = ?", (item_id,)).fetchone()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM items WHERE use_count > 3")
+        cursor.fetchall()
+        conn.close()
+
+    stats = {row['sql']: row for row in profiler.snapshot()}
+    by_id = stats["SELECT label FROM items WHERE id = ?"]
+    assert by_id['count'] == 10
+    assert sum(by_id['histogram']) == 10
+    assert by_id['p50_ms'] <= by_id['p95_ms']
+    assert by_id['full_scans'] == []
+    assert stats["SELECT COUNT(*) FROM items WHERE use_count > ?"]['count'] == 1
+    assert stats["INSERT INTO items (label, use_count) VALUES (?, ?)"]['count'] == 1
+    print(f"  ✓ {len(stats)} sentencias registradas")
+
+
+def test_full_scan_detection():
+    """Los SCAN sin índice sobre tablas vigiladas se marcan (con alias)"""
+    print("\n" + "="*60)
+    print("TEST 3: DETECCIÓN DE FULL SCANS")
+    print("="*60)
+
+    profiler = get_query_profiler()
+    profiler.reset()
+    with profiler.measuring():
+        conn = _create_connection()
+        conn.execute("SELECT i.id FROM items i WHERE i.label LIKE ?", ("%5%",)).fetchall()
+        conn.execute("SELECT * FROM items WHERE use_count = ?", (3,)).fetchall()
+        conn.execute("""
+            SELECT i.label FROM items AS i
+            WHERE i.id IN (SELECT h.item_id FROM item_usage_history h WHERE h.used_at > ?)
+        """, ("2026-01-01",)).fetchall()
+        # Nombre que contiene 'items' sin serlo: no se explica
+        conn.execute("CREATE TABLE items_archive (id INTEGER PRIMARY KEY, label TEXT)")
+        conn.execute("SELECT id FROM items_archive WHERE label = ?", ("x",)).fetchall()
+        # Cursor destruido sin fetch: se cuenta, pero sin EXPLAIN
+        conn.execute("SELECT id FROM items WHERE label = ?", ("x",))
+        conn.close()
+
+    stats = {row['sql']: row for row in profiler.snapshot()}
+    assert stats["SELECT id FROM items_archive WHERE label = ?"]['plan'] == []
+    assert stats["SELECT id FROM items WHERE label = ?"]['count'] == 1
+    assert stats["SELECT id FROM items WHERE label = ?"]['plan'] == []
+
+    scans = {row['sql']: row['full_scans'] for row in profiler.full_scans()}
+    assert scans["SELECT i.id FROM items i WHERE i.label LIKE ?"] == ['items']
+    assert "SELECT * FROM items WHERE use_count = ?" not in scans
+    subquery = [tables for sql, tables in scans.items() if 'used_at' in sql][0]
+    assert subquery == ['item_usage_history']
+
+    plan = [(2, 0, 0, 'SCAN items USING COVERING INDEX idx_items_use_count')]
+    assert detect_full_scans("SELECT COUNT(*) FROM items", plan) == []
+    print(f"  ✓ Full scans: {scans}")
+
+
+def test_slow_query_log():
+    """Las consultas por encima del umbral guardan su plan"""
+    print("\n" + "="*60)
+    print("TEST 4: LOG DE CONSULTAS LENTAS")
+    print("="*60)
+
+    profiler = get_query_profiler()
+    profiler.reset()
+    previous = profiler.slow_threshold_ms
+    profiler.slow_threshold_ms = 0
+    try:
+        with profiler.measuring():
+            conn = _create_connection()
+            conn.execute("SELECT label FROM items WHERE label LIKE ?", ("%9%",)).fetchall()
+            conn.close()
+    finally:
+        profiler.slow_threshold_ms = previous
+
+    slow = [entry for entry in profiler.slow_queries() if 'LIKE' in entry['sql']]
+    assert len(slow) == 1
+    assert slow[0]['plan'] and slow[0]['plan'][0].startswith('SCAN items')
+    assert slow[0]['full_scans'] == ['items']
+
+    # Desactivado: no se registra nada
+    profiler.reset()
+    enabled_before = profiler.enabled
+    with profiler.measuring(False):
+        conn = _create_connection()
+        conn.execute("SELECT 1").fetchone()
+        conn.close()
+    assert profiler.snapshot() == []
+    assert profiler.enabled == enabled_before
+    assert QueryProfiler().slow_queries() == []
+    assert not QueryProfiler().enabled
+    print("  ✓ Consulta lenta registrada con EXPLAIN QUERY PLAN")
+
+
+if __name__ == "__main__":
+    test_normalize_sql()
+    test_statement_histogram()
+    test_full_scan_detection()
+    test_slow_query_log()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,212 @@
+"""
+Script de testing para el store de settings con escritura diferida
+Prueba que las lecturas se sirven desde memoria con accesores tipados, que
+las escrituras de settings y estado de paneles se agrupan en una transacción,
+que los listeners reciben los cambios y que las escrituras directas con
+DBManager.set_setting actualizan la memoria
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core.settings_store import SettingsStore
+from core.pinned_panels_manager import PinnedPanelsManager
+
+
+class _PanelStub:
+    """Geometría y filtros de un FloatingPanel (sin Qt)"""
+
+    def __init__(self, x, y, width=300, height=400):
+        self._geometry = (x, y, width, height)
+        self.is_minimized = False
+        self.current_filters = {}
+        self.current_state_filter = 'archived'
+
+    def x(self):
+        return self._geometry[0]
+
+    def y(self):
+        return self._geometry[1]
+
+    def width(self):
+        return self._geometry[2]
+
+    def height(self):
+        return self._geometry[3]
+
+
+def _settings_queries():
+    return sum(row['count'] for row in get_query_profiler().snapshot() if 'settings' in row['sql'])
+
+
+def test_reads_from_memory():
+    """Las settings se leen una vez y se sirven tipadas desde memoria"""
+    print("\n" + "="*60)
+    print("TEST 1: LECTURAS EN MEMORIA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        db.set_setting('opacity', 0.8)
+        db.set_setting('max_items', "25")
+        db.set_setting('always_on_top', "true")
+        store = SettingsStore(db, flush_interval=60)
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        assert store.get_float('opacity') == 0.8
+        assert store.get_int('max_items') == 25
+        assert store.get_bool('always_on_top') is True
+        assert store.get_int('opacity_missing', 7) == 7
+        assert store.get_int('always_on_top', 3) == 3  # no convertible
+        assert store.get('missing') is None
+        assert _settings_queries() == 0
+
+        # Las copias no alteran la caché
+        store.set('hidden', [1, 2])
+        store.get('hidden').append(3)
+        assert store.get('hidden') == [1, 2]
+        store.close()
+        db.close()
+    print("  ✓ Sin consultas por lectura")
+
+
+def test_coalesced_flush():
+    """Settings y estado de paneles se escriben juntos en un lote"""
+    print("\n" + "="*60)
+    print("TEST 2: ESCRITURA AGRUPADA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        category_id = db.add_category("Panel", icon="📁")
+        panel_id = db.execute_update(
+            "INSERT INTO pinned_panels (category_id, x_position, y_position) VALUES (?, 0, 0)",
+            (category_id,)
+        )
+        store = SettingsStore(db, flush_interval=60)
+        manager = PinnedPanelsManager(db, state_store=store)
+
+        for width in range(300, 400, 10):
+            store.set('panel_width', width)
+        store.set('opacity', 0.5)
+        manager.update_panel_state(panel_id, _PanelStub(10, 20), include_filters=False)
+        manager.update_panel_state(panel_id, _PanelStub(15, 25, width=320), include_filters=False)
+
+        # Nada escrito todavía
+        assert db.get_setting('panel_width') != 390
+        assert db.execute_query("SELECT x_position FROM pinned_panels")[0]['x_position'] == 0
+
+        profiler = get_query_profiler()
+        profiler.reset()
+        assert store.flush() == 3
+        upserts = [row for row in profiler.snapshot() if 'INSERT INTO settings' in row['sql']]
+        assert len(upserts) == 1 and upserts[0]['count'] == 1  # un executemany
+        assert db.get_setting('panel_width') == 390
+        panel = db.get_panel_by_id(panel_id)
+        assert (panel['x_position'], panel['y_position'], panel['width']) == (15, 25, 320)
+        assert store.flush() == 0
+
+        # Las lecturas de paneles ven el estado pendiente
+        manager.update_panel_state(panel_id, _PanelStub(99, 25), include_filters=False)
+        assert manager.get_panel_by_id(panel_id)['x_position'] == 99
+        store.close()
+        db.close()
+    print("  ✓ Una transacción por lote")
+
+
+def test_background_flush_and_listeners():
+    """El hilo de escritura agrupa cambios; los listeners se notifican al instante"""
+    print("\n" + "="*60)
+    print("TEST 3: ESCRITURA EN SEGUNDO PLANO Y LISTENERS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        store = SettingsStore(db, flush_interval=0.05)
+
+        changes = []
+        opacity_changes = []
+        store.add_listener(lambda key, value: changes.append((key, value)))
+        store.add_listener(lambda key, value: opacity_changes.append(value), key='opacity')
+
+        assert store.set('opacity', 0.7)
+        assert not store.set('opacity', 0.7)
+        store.set('theme', 'light')
+        assert changes == [('opacity', 0.7), ('theme', 'light')]
+        assert opacity_changes == [0.7]
+
+        deadline = time.monotonic() + 5
+        while (store.has_pending() or store._flush_thread is not None) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        reader = DBManager(db_path)
+        assert reader.get_setting('theme') == 'light'
+        reader.close()
+
+        # Tras close() las escrituras son inmediatas
+        store.close()
+        store.set('theme', 'blue')
+        assert db.get_setting('theme') == 'blue'
+        db.close()
+    print("  ✓ Escritura diferida y notificaciones")
+
+
+def test_direct_writes_update_store():
+    """DBManager.set_setting (otra conexión incluida) actualiza la memoria"""
+    print("\n" + "="*60)
+    print("TEST 4: ESCRITURAS DIRECTAS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        store = SettingsStore(db, flush_interval=60)
+        changes = []
+        store.add_listener(lambda key, value: changes.append((key, value)))
+
+        # Como DatabaseMaintenanceService: su propia conexión
+        maintenance_db = DBManager(db_path)
+        maintenance_db.set_setting('maintenance_last_run', '2026-10-19T03:00:00')
+        assert store.get('maintenance_last_run') == '2026-10-19T03:00:00'
+        assert changes == [('maintenance_last_run', '2026-10-19T03:00:00')]
+
+        db.add_speed_dial("Docs", "https://example.com")
+        assert store.get_int('speed_dial_version') == db.get_speed_dial_version() > 0
+
+        # set() compara con el valor real de la BD: no se salta la escritura
+        store.set('theme', 'dark')
+        store.flush()
+        maintenance_db.set_setting('theme', 'light')
+        assert store.set('theme', 'dark')
+        store.flush()
+        assert maintenance_db.get_setting('theme') == 'dark'
+
+        # La escritura directa gana a un valor pendiente
+        store.set('panel_width', 300)
+        maintenance_db.set_setting('panel_width', 420)
+        assert not store.has_pending() and store.get('panel_width') == 420
+
+        # Cerrado, deja de recibir escrituras
+        store.close()
+        maintenance_db.set_setting('theme', 'blue')
+        assert store.get('theme') == 'dark'
+        maintenance_db.close()
+        db.close()
+    print("  ✓ Memoria sincronizada con set_setting")
+
+
+if __name__ == "__main__":
+    test_reads_from_memory()
+    test_coalesced_flush()
+    test_background_flush_and_listeners()
+    test_direct_writes_update_store()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,136 @@
+"""
+Script de testing para la pertenencia materializada de Smart Collections
+Prueba que los conteos materializados coinciden con la ejecución directa
+de los filtros, que solo se reevalúan los items modificados y que editar
+una colección o reconstruir todo deja la pertenencia al día
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.migrations.add_tag_groups_and_collections import migrate_add_tag_groups_and_collections
+from database.query_profiler import get_query_profiler
+from core.smart_collections_manager import SmartCollectionsManager
+
+
+def _create_library(db_path):
+    db = DBManager(str(db_path))
+    category_id = db.execute_update(
+        "INSERT INTO categories (name, icon, order_index) VALUES ('Colecciones', '📁', 99)")
+    for i in range(40):
+        db.execute_update("""
+            INSERT INTO items (category_id, label, content, type, tags, is_favorite)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (category_id, f"Item {i}", f"docker compose {i}" if i % 4 == 0 else f"content {i}",
+              ('TEXT', 'CODE', 'URL', 'PATH')[i % 4],
+              '["python", "api"]' if i % 3 == 0 else '["git"]', int(i % 5 == 0)))
+    migrate_add_tag_groups_and_collections(str(db_path))
+
+    manager = SmartCollectionsManager(str(db_path))
+    manager.create_collection(name="Python", tags_include="python")
+    manager.create_collection(name="Code favs", item_type="CODE", is_favorite=True)
+    manager.create_collection(name="Docker", search_text="docker", tags_exclude="git")
+    return db, manager, category_id
+
+
+def _assert_counts_match(manager):
+    collections = manager.get_all_collections_with_count()
+    assert any(collection['item_count'] for collection in collections)
+    for collection in collections:
+        expected = len(manager._execute_filters(collection))
+        assert collection['item_count'] == expected, (collection['name'], collection['item_count'], expected)
+        assert len(manager.execute_collection(collection['id'])) == expected
+
+
+def test_materialized_counts():
+    """Los conteos materializados coinciden con los filtros"""
+    print("\n" + "="*60)
+    print("TEST 1: CONTEOS MATERIALIZADOS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, manager, _ = _create_library(Path(tmp) / "test.db")
+        _assert_counts_match(manager)
+
+        # Sin cambios, leer conteos no toca la tabla items
+        profiler = get_query_profiler()
+        profiler.reset()
+        manager.get_all_collections_with_count()
+        assert not [row for row in profiler.snapshot()
+                    if 'FROM items' in row['sql'] or 'JOIN items' in row['sql']]
+        db.close()
+    print("  ✓ Conteos correctos y leídos sin recorrer items")
+
+
+def test_incremental_maintenance():
+    """Insertar, modificar y eliminar items solo reevalúa esos items"""
+    print("\n" + "="*60)
+    print("TEST 2: MANTENIMIENTO INCREMENTAL")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, manager, category_id = _create_library(Path(tmp) / "test.db")
+        python_id = manager.get_collection_by_name("Python")['id']
+        before = manager.get_collection_count(python_id)
+
+        new_id = db.execute_update(
+            "INSERT INTO items (category_id, label, content, type, tags) VALUES (?, 'New', 'x', 'TEXT', ?)",
+            (category_id, '["python"]'))
+        dirty = db.execute_query("SELECT item_id FROM smart_collection_dirty")
+        assert [row['item_id'] for row in dirty] == [new_id]
+        assert manager.get_collection_count(python_id) == before + 1
+
+        db.execute_update("UPDATE items SET tags = '[\"git\"]' WHERE id = ?", (new_id,))
+        assert manager.get_collection_count(python_id) == before
+
+        # use_count / last_used no afectan a los filtros: no se encola nada
+        db.execute_update("UPDATE items SET use_count = use_count + 1, last_used = CURRENT_TIMESTAMP")
+        assert db.execute_query("SELECT COUNT(*) AS n FROM smart_collection_dirty")[0]['n'] == 0
+
+        python_item = manager.execute_collection(python_id)[0]
+        db.execute_update("DELETE FROM items WHERE id = ?", (python_item['id'],))
+        assert manager.get_collection_count(python_id) == before - 1
+
+        _assert_counts_match(manager)
+        db.close()
+    print("  ✓ Pertenencia actualizada por item")
+
+
+def test_edit_and_rebuild():
+    """Editar la definición rematerializa; rebuild_all reconstruye todo"""
+    print("\n" + "="*60)
+    print("TEST 3: EDICIÓN Y RECONSTRUCCIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, manager, _ = _create_library(Path(tmp) / "test.db")
+        docker = manager.get_collection_by_name("Docker")
+        manager.get_all_collections_with_count()
+
+        assert manager.update_collection(docker['id'], tags_exclude=None)
+        _assert_counts_match(manager)
+
+        # Desfase artificial: rebuild_all lo corrige
+        db.execute_update("DELETE FROM smart_collection_members")
+        assert manager.rebuild_all() == len(manager.get_all_collections())
+        _assert_counts_match(manager)
+
+        assert manager.delete_collection(docker['id'])
+        rows = db.execute_query(
+            "SELECT COUNT(*) AS n FROM smart_collection_members WHERE collection_id = ?", (docker['id'],))
+        assert rows[0]['n'] == 0
+        db.close()
+    print("  ✓ Definiciones editadas y reconstrucción completa")
+
+
+if __name__ == "__main__":
+    test_materialized_counts()
+    test_incremental_maintenance()
+    test_edit_and_rebuild()
+    print("\n✓ Todos los tests pasaron")
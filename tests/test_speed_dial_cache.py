@@ -0,0 +1,155 @@
+"""
+Script de testing para la caché de renderizado de Speed Dial
+Prueba que la página se reutiliza mientras no cambian los datos, que
+agregar/editar/eliminar/reordenar la invalida, que la caché en disco
+sobrevive al proceso, que las imágenes locales se incrustan y que cambiar
+una imagen o recrear la base de datos no sirve una página antigua
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.query_profiler import get_query_profiler
+from core import speed_dial_generator
+from core.speed_dial_generator import SpeedDialGenerator
+
+
+def _speed_dial_selects():
+    return sum(row['count'] for row in get_query_profiler().snapshot()
+               if 'FROM speed_dials' in row['sql'] and row['sql'].lstrip().startswith('SELECT id'))
+
+
+def test_render_cache_invalidation():
+    """La página solo se regenera cuando cambia la versión de datos"""
+    print("\n" + "="*60)
+    print("TEST 1: INVALIDACIÓN POR VERSIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        generator = SpeedDialGenerator(db, cache_dir=Path(tmp) / "cache")
+        profiler = get_query_profiler()
+        profiler.reset()
+
+        first = generator.generate_html()
+        assert generator.generate_html() is first
+        assert _speed_dial_selects() == 1
+
+        github_id = db.add_speed_dial("GitHub", "https://github.com")
+        db.add_speed_dial("Docs", "https://docs.python.org")
+        html = generator.generate_html()
+        assert "GitHub" in html and html.index("GitHub") < html.index("Docs")
+
+        db.reorder_speed_dial(github_id, 5)
+        html = generator.generate_html()
+        assert html.index("Docs") < html.index("GitHub")
+
+        db.update_speed_dial(github_id, title="GitLab")
+        assert "GitLab" in generator.generate_html()
+
+        db.delete_speed_dial(github_id)
+        html = generator.generate_html()
+        assert "GitLab" not in html and "Docs" in html
+        db.close()
+    print("  ✓ Reutilizada sin cambios e invalidada en cada modificación")
+
+
+def test_disk_cache():
+    """La caché en disco evita regenerar en un proceso nuevo"""
+    print("\n" + "="*60)
+    print("TEST 2: CACHÉ EN DISCO")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        cache_dir = Path(tmp) / "cache"
+        db.add_speed_dial("GitHub", "https://github.com")
+        html = SpeedDialGenerator(db, cache_dir=cache_dir).generate_html()
+        assert len(list(cache_dir.glob("speed_dial_*.html"))) == 1
+
+        # Simular un proceso nuevo: sin caché en memoria
+        speed_dial_generator._html_cache.clear()
+        profiler = get_query_profiler()
+        profiler.reset()
+        assert SpeedDialGenerator(db, cache_dir=cache_dir).generate_html() == html
+        assert _speed_dial_selects() == 0
+
+        # Una versión nueva reemplaza el archivo anterior
+        db.add_speed_dial("Docs", "https://docs.python.org")
+        SpeedDialGenerator(db, cache_dir=cache_dir).generate_html()
+        assert len(list(cache_dir.glob("speed_dial_*.html"))) == 1
+        db.close()
+    print("  ✓ Página servida desde disco")
+
+
+def test_inline_local_icons():
+    """Las imágenes locales se incrustan como data URI una vez"""
+    print("\n" + "="*60)
+    print("TEST 3: ICONOS LOCALES INCRUSTADOS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        icon_path = Path(tmp) / "favicon.png"
+        icon_path.write_bytes(b"\x89PNG\r\n\x1a\nfake")
+        db.add_speed_dial("Local", "https://local.test", thumbnail_path=str(icon_path))
+        db.add_speed_dial("Missing", "https://missing.test", thumbnail_path=str(Path(tmp) / "nope.png"))
+
+        html = SpeedDialGenerator(db, cache_dir=Path(tmp) / "cache").generate_html()
+        assert html.count('src="data:image/png;base64,') == 1
+        assert (str(icon_path), icon_path.stat().st_mtime_ns) in speed_dial_generator._asset_cache
+        db.close()
+    print("  ✓ Icono local incrustado; rutas inexistentes usan el emoji")
+
+
+def test_stale_thumbnails_and_recreated_db():
+    """Una imagen modificada o una BD recreada no reutilizan la página cacheada"""
+    print("\n" + "="*60)
+    print("TEST 4: IMÁGENES MODIFICADAS Y BD RECREADA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        cache_dir = Path(tmp) / "cache"
+        db = DBManager(str(db_path))
+        icon_path = Path(tmp) / "favicon.png"
+        icon_path.write_bytes(b"\x89PNG\r\n\x1a\nold")
+        db.add_speed_dial("Local", "https://local.test", thumbnail_path=str(icon_path))
+
+        first = SpeedDialGenerator(db, cache_dir=cache_dir).generate_html()
+
+        # Misma ruta y misma versión de datos, imagen distinta
+        icon_path.write_bytes(b"\x89PNG\r\n\x1a\nnew image")
+        stat = icon_path.stat()
+        os.utime(icon_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        speed_dial_generator._html_cache.clear()
+        second = SpeedDialGenerator(db, cache_dir=cache_dir).generate_html()
+        assert second != first
+        assert len(list(cache_dir.glob("speed_dial_*.html"))) == 1
+        print("  ✓ Imagen modificada invalida la página")
+
+        # Recrear la BD: el contador de versión vuelve a empezar
+        db.close()
+        db_path.unlink()
+        db = DBManager(str(db_path))
+        db.add_speed_dial("Otra", "https://otra.test", thumbnail_path=str(icon_path))
+        html = SpeedDialGenerator(db, cache_dir=cache_dir).generate_html()
+        assert "Otra" in html and "Local" not in html
+        assert len(list(cache_dir.glob("speed_dial_*.html"))) == 1
+        db.close()
+    print("  ✓ BD recreada limpia la caché anterior")
+
+
+if __name__ == "__main__":
+    test_render_cache_invalidation()
+    test_disk_cache()
+    test_inline_local_icons()
+    test_stale_thumbnails_and_recreated_db()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,88 @@
+"""
+Script de testing para el trazado de fases de arranque
+Prueba spans anidados, persistencia de los últimos arranques y la
+detección de regresiones al comparar arranques
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from utils.startup_tracer import StartupTracer, save_launch, load_launches, compare_launches
+
+
+def make_launch(started_at, durations):
+    """Arranque sintético con una fase por entrada de durations"""
+    spans, offset = [], 0.0
+    for name, ms in durations.items():
+        spans.append({'name': name, 'start_ms': offset, 'duration_ms': ms, 'depth': 0})
+        offset += ms
+    return {'started_at': started_at, 'total_ms': offset, 'spans': spans, 'metadata': {}}
+
+
+def test_spans_and_persistence():
+    """Los spans se anidan, son no-op fuera del arranque y se guardan acotados"""
+    print("\n" + "="*60)
+    print("TEST 1: SPANS Y PERSISTENCIA")
+    print("="*60)
+
+    tracer = StartupTracer()
+    with tracer.span('ignored'):
+        pass
+    assert tracer.finish() is None
+
+    tracer.start()
+    with tracer.span('controller'):
+        with tracer.span('db.migrations'):
+            pass
+    tracer.set_metadata('items', 42)
+    launch = tracer.finish()
+
+    assert [(s['name'], s['depth']) for s in launch['spans']] == [('controller', 0), ('db.migrations', 1)]
+    assert launch['metadata'] == {'items': 42}
+    with tracer.span('after-finish'):
+        pass
+    assert not tracer.active
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "startup_timeline.json"
+        for i in range(5):
+            save_launch(dict(launch, started_at=f"launch-{i}"), path, max_launches=3)
+        assert [l['started_at'] for l in load_launches(path)] == ["launch-2", "launch-3", "launch-4"]
+
+        path.write_text("{not json", encoding='utf-8')
+        assert load_launches(path) == []
+    print("  ✓ Spans anidados y timeline acotado")
+
+
+def test_compare_detects_regression():
+    """La comparación marca fases que superan la mediana previa"""
+    print("\n" + "="*60)
+    print("TEST 2: COMPARACIÓN DE ARRANQUES")
+    print("="*60)
+
+    launches = [
+        make_launch("a", {'db.open': 100, 'controller': 400}),
+        make_launch("b", {'db.open': 110, 'controller': 420}),
+        make_launch("c", {'db.open': 105, 'controller': 900, 'window.create': 50}),
+    ]
+    report = compare_launches(launches, last_n=10)
+
+    assert [l['started_at'] for l in report['launches']] == ["c", "b", "a"]
+    phases = {p['name']: p for p in report['phases']}
+    assert phases['controller']['regression']
+    assert phases['controller']['baseline_ms'] == 410
+    assert not phases['db.open']['regression']
+    assert phases['window.create']['durations'] == [50, None, None]
+    assert phases['total']['latest_ms'] == 1055
+    print("  ✓ Regresión detectada en 'controller'")
+
+
+if __name__ == "__main__":
+    test_spans_and_persistence()
+    test_compare_detects_regression()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,166 @@
+"""
+Script de testing para la carga por pestañas del dashboard de estadísticas
+Prueba la reducción de líneas de tiempo largas, la caché de gráficos por
+(gráfico, período, versión) y que el loader solo repite las consultas de una
+pestaña cuando cambia la versión de los datos
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.stats_manager import StatsManager
+from core.usage_tracker import UsageTracker
+from core.stats_dashboard_loader import (
+    StatsDashboardLoader, ChartCache, downsample_series, fetch_tab_data, TABS
+)
+
+
+def test_downsample_series():
+    """Las series largas se reducen conservando extremos y picos"""
+    print("\n" + "="*60)
+    print("TEST 1: REDUCCIÓN DE LÍNEAS DE TIEMPO")
+    print("="*60)
+
+    points = [{'date': f"d{i:04d}", 'count': i % 7} for i in range(3650)]
+    points[1234]['count'] = 500
+    sampled = downsample_series(points, max_points=100)
+    assert len(sampled) == 100
+    assert sampled[0] is points[0] and sampled[-1] is points[-1]
+    assert points[1234] in sampled
+    dates = [point['date'] for point in sampled]
+    assert dates == sorted(dates) and len(set(dates)) == 100
+
+    short = points[:30]
+    assert downsample_series(short, max_points=100) == short
+    assert downsample_series([], max_points=100) == []
+    print("  ✓ 3650 puntos reducidos a 100 con el pico conservado")
+
+
+def test_chart_cache():
+    """Caché LRU por clave con descarte de versiones anteriores"""
+    print("\n" + "="*60)
+    print("TEST 2: CACHÉ DE GRÁFICOS")
+    print("="*60)
+
+    cache = ChartCache(max_entries=3)
+    assert cache.put(('usage_timeline', 7, 'v1'), 'a') == []
+    assert cache.put(('usage_timeline', 30, 'v1'), 'b') == []
+    assert cache.put(('top_items', None, 'v1'), 'c') == []
+    assert cache.get(('usage_timeline', 7, 'v1')) == 'a'
+    assert cache.put(('usage_timeline', 90, 'v1'), 'd') == ['b']
+    assert ('usage_timeline', 30, 'v1') not in cache
+
+    assert cache.put(('top_items', None, 'v2'), 'e') == ['c']
+    assert sorted(cache.discard_stale('v2')) == ['a', 'd']
+    assert len(cache) == 1 and cache.get(('top_items', None, 'v2')) == 'e'
+    print("  ✓ Expulsión LRU y descarte por versión")
+
+
+def test_loader_reuses_unchanged_version():
+    """Sin cambios en los datos, el loader no repite las consultas"""
+    print("\n" + "="*60)
+    print("TEST 3: LOADER Y VERSIÓN DE LOS DATOS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Comandos", icon="📁")
+        item_id = db.add_item(category_id, "Build", "make")
+        tracker = UsageTracker(db_path)
+        tracker.track_usage(item_id, 100)
+
+        stats = StatsManager(db_path)
+        by_day = stats.get_usage_by_day(days=30)
+        assert len(by_day) == 30 and by_day[-1]['count'] == 1
+        assert sum(point['count'] for point in by_day) == 1
+        by_hour = stats.get_usage_by_hour(days=7)
+        assert len(by_hour) == 24 and sum(point['count'] for point in by_hour) == 1
+        for tab in TABS:
+            assert isinstance(fetch_tab_data(stats, tab, 365), dict)
+        assert len(fetch_tab_data(stats, 'usage', 365)['by_day']) <= 120
+
+        fetched = []
+        results = []
+        done = threading.Event()
+
+        def fetch(manager, tab, period):
+            fetched.append((tab, period))
+            return fetch_tab_data(manager, tab, period)
+
+        def on_loaded(tab, period, version, data):
+            results.append((tab, period, version, data))
+            done.set()
+
+        loader = StatsDashboardLoader(db_path, on_loaded=on_loaded, fetch=fetch)
+
+        def load(tab, period=None, known_version=None):
+            done.clear()
+            loader.request(tab, period, known_version)
+            assert done.wait(10)
+            return results[-1]
+
+        _, _, version, data = load('summary')
+        assert data['stats']['total_executions'] == 1
+
+        # Misma versión: sin consultas de la pestaña
+        assert load('summary', known_version=version)[3] is None
+        assert fetched == [('summary', None)]
+
+        # Un uso nuevo cambia la versión y vuelve a leer
+        tracker.track_usage(item_id, 200)
+        _, _, new_version, data = load('summary', known_version=version)
+        assert new_version != version and data['stats']['total_executions'] == 2
+
+        # Editar un item también la cambia
+        db.execute_update("UPDATE items SET label = 'Build all', updated_at = datetime('now', '+1 minute') WHERE id = ?", (item_id,))
+        assert load('categories', known_version=new_version)[3] is not None
+
+        loader.close()
+        assert not loader.is_running()
+        db.close()
+    print("  ✓ Consultas repetidas solo con datos nuevos")
+
+
+def test_loader_reports_fetch_error():
+    """Si la lectura falla, on_loaded recibe el error en lugar de datos vacíos"""
+    print("\n" + "="*60)
+    print("TEST 4: ERROR AL LEER UNA PESTAÑA")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        DBManager(db_path).close()
+
+        results = []
+        done = threading.Event()
+
+        def fetch(manager, tab, period):
+            raise RuntimeError("disk I/O error")
+
+        def on_loaded(tab, period, version, data):
+            results.append((tab, data))
+            done.set()
+
+        loader = StatsDashboardLoader(db_path, on_loaded=on_loaded, fetch=fetch)
+        loader.request('summary')
+        assert done.wait(10)
+        loader.close()
+
+        assert results == [('summary', {'error': "disk I/O error"})]
+    print("  ✓ Error entregado al dashboard")
+
+
+if __name__ == "__main__":
+    test_downsample_series()
+    test_chart_cache()
+    test_loader_reuses_unchanged_version()
+    test_loader_reports_fetch_error()
+    print("\n✓ Todos los tests pasaron")
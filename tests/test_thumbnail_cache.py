@@ -0,0 +1,67 @@
+"""
+Script de testing para ThumbnailCache
+Prueba la caché en disco de miniaturas y su expulsión LRU por bytes
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from core.thumbnail_cache import ThumbnailCache
+
+
+def test_put_get_and_lru_eviction():
+    """Las entradas menos usadas se expulsan al superar max_bytes"""
+    print("\n" + "="*60)
+    print("TEST 1: EXPULSIÓN LRU POR BYTES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ThumbnailCache(tmp, max_bytes=250)
+
+        cache.put("aaa", 48, b"a" * 100)
+        cache.put("bbb", 48, b"b" * 100)
+        assert cache.get("aaa", 48) is not None  # "aaa" pasa a ser la más reciente
+
+        cache.put("ccc", 48, b"c" * 100)
+
+        assert cache.get("bbb", 48) is None
+        assert cache.get("aaa", 48) is not None
+        assert cache.get("ccc", 48) is not None
+        assert cache.get("aaa", 96) is None  # Distinto tamaño = distinta clave
+        assert cache.get_stats()['total_bytes'] == 200
+        assert not (Path(tmp) / ThumbnailCache.make_key("bbb", 48)).exists()
+        print("  ✓ Expulsión LRU correcta")
+
+
+def test_index_persisted_between_sessions():
+    """El índice se reconstruye desde disco respetando el orden de uso"""
+    print("\n" + "="*60)
+    print("TEST 2: PERSISTENCIA ENTRE SESIONES")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ThumbnailCache(tmp, max_bytes=1000)
+        old_path = cache.put("old", 48, b"o" * 100)
+        new_path = cache.put("new", 48, b"n" * 100)
+        past = time.time() - 3600
+        os.utime(old_path, (past, past))
+        os.utime(new_path, None)
+
+        reopened = ThumbnailCache(tmp, max_bytes=150)
+        assert reopened.get("old", 48) is None
+        assert reopened.get("new", 48) is not None
+        assert reopened.get_stats()['entries'] == 1
+        print("  ✓ Índice reconstruido y acotado")
+
+
+if __name__ == "__main__":
+    test_put_get_and_lru_eviction()
+    test_index_persisted_between_sessions()
+    print("\n✓ Todos los tests pasaron")
@@ -0,0 +1,146 @@
+"""
+Script de testing para la exportación del historial de uso
+Prueba que item_usage_history se exporta en streaming a CSV y NDJSON con los
+datos del item, filtrado por fechas y categoría, comprimido con gzip, con
+progreso por lotes, sin ordenar antes de la primera fila y con cancelación
+"""
+
+import csv
+import gzip
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Agregar src al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from core.usage_exporter import UsageHistoryExporter, build_export_query, EXPORT_COLUMNS
+
+
+def _create_history(db):
+    """Dos categorías con historial en enero y febrero de 2026"""
+    tools_id = db.add_category("Herramientas", icon="🔧")
+    docs_id = db.add_category("Docs", icon="📄")
+    build_id = db.add_item(tools_id, "Build", "make")
+    readme_id = db.add_item(docs_id, "Readme, v2", "cat README")
+    rows = []
+    for day in range(1, 29):
+        rows.append((build_id, f"2026-01-{day:02d} 10:00:00", 100 + day, 1, None))
+        rows.append((readme_id, f"2026-02-{day:02d} 09:30:00", 50, 0 if day % 7 == 0 else 1,
+                     "exit 1" if day % 7 == 0 else None))
+    db.execute_many(
+        "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success, error_message) "
+        "VALUES (?, ?, ?, ?, ?)", rows
+    )
+    return tools_id, docs_id, build_id, readme_id
+
+
+def test_export_formats():
+    """CSV y NDJSON con filtros, gzip y progreso"""
+    print("\n" + "="*60)
+    print("TEST 1: CSV, NDJSON Y FILTROS")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        tools_id, docs_id, build_id, readme_id = _create_history(db)
+        exporter = UsageHistoryExporter(db_path, batch_size=10)
+
+        # CSV completo, ordenado por fecha
+        progress = []
+        result = exporter.export(str(Path(tmp) / "all.csv"), on_progress=lambda *args: progress.append(args))
+        assert result['rows'] == result['total'] == 56 and not result['cancelled']
+        assert progress[0] == (0, 56) and progress[-1] == (56, 56) and len(progress) == 7
+        with open(Path(tmp) / "all.csv", encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0].keys()) == [name for name, _ in EXPORT_COLUMNS]
+        assert [row['used_at'] for row in rows] == sorted(row['used_at'] for row in rows)
+        assert rows[-1]['item_label'] == "Readme, v2" and rows[-1]['category_name'] == "Docs"
+        assert not list(Path(tmp).glob("*.part"))
+
+        # NDJSON comprimido: rango de fechas y categoría
+        result = exporter.export(str(Path(tmp) / "docs.ndjson.gz"), fmt='ndjson',
+                                 date_from="2026-02-07", date_to="2026-02-14", category_ids=[docs_id])
+        assert result['compressed'] and result['rows'] == 8
+        with gzip.open(Path(tmp) / "docs.ndjson.gz", 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == 8
+        assert records[0]['used_at'].startswith("2026-02-07") and records[-1]['used_at'].startswith("2026-02-14")
+        assert {record['item_id'] for record in records} == {readme_id}
+        assert [record['success'] for record in records].count(False) == 2
+        assert records[0]['error_message'] == "exit 1"
+
+        # Sin coincidencias: archivo con solo la cabecera
+        result = exporter.export(str(Path(tmp) / "none.csv"), category_ids=[tools_id], date_from="2026-02-01")
+        assert result['rows'] == 0
+        assert (Path(tmp) / "none.csv").read_text(encoding='utf-8').strip() == ",".join(name for name, _ in EXPORT_COLUMNS)
+        db.close()
+    print("  ✓ Filas, filtros, gzip y progreso por lote")
+
+
+def test_streaming_plan():
+    """El cursor recorre el historial por índice de fecha, sin ordenar antes"""
+    print("\n" + "="*60)
+    print("TEST 2: PLAN DE CONSULTA EN STREAMING")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "test.db"))
+        conn = db.connect()
+        for args in ((None, None, None), ("2026-01-01", "2026-01-31", None), ("2026-01-01", None, [1, 2])):
+            select_sql, _, params = build_export_query(*args)
+            plan = " ".join(str(row[3]) for row in conn.execute("EXPLAIN QUERY PLAN " + select_sql, params))
+            assert 'idx_usage_used_at' in plan and 'TEMP B-TREE' not in plan, plan
+        db.close()
+    print("  ✓ Recorrido por idx_usage_used_at en orden")
+
+
+def test_async_cancel():
+    """Exportación en segundo plano cancelada: sin archivo parcial"""
+    print("\n" + "="*60)
+    print("TEST 3: SEGUNDO PLANO Y CANCELACIÓN")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "test.db")
+        db = DBManager(db_path)
+        _create_history(db)
+        exporter = UsageHistoryExporter(db_path, batch_size=5)
+        target = Path(tmp) / "history.csv"
+
+        # Cancelar tras el primer lote
+        finished = threading.Event()
+        results = []
+
+        def on_progress(written, total):
+            if written:
+                exporter.cancel()
+
+        def on_finished(result):
+            results.append(result)
+            finished.set()
+
+        assert exporter.export_async(str(target), on_finished=on_finished, on_progress=on_progress)
+        assert finished.wait(10) and exporter.wait(10)
+        assert results[0]['cancelled'] and results[0]['rows'] == 5
+        assert not target.exists() and not list(Path(tmp).glob("*.part"))
+
+        # Una nueva exportación no arrastra la cancelación anterior
+        finished.clear()
+        assert exporter.export_async(str(target), on_finished=on_finished)
+        assert finished.wait(10) and exporter.wait(10)
+        assert results[1]['rows'] == 56 and target.exists()
+        db.close()
+    print("  ✓ Cancelación limpia y reanudable")
+
+
+if __name__ == "__main__":
+    test_export_formats()
+    test_streaming_plan()
+    test_async_cancel()
+    print("\n✓ Todos los tests pasaron")
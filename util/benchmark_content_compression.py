@@ -0,0 +1,113 @@
+"""
+Benchmark de la compresión de contenido (items.content)
+
+Crea una base de datos temporal con items pequeños y grandes (logs, JSON,
+scripts SQL) sin comprimir, mide tamaño de archivo y tiempo de lectura
+completa, aplica la migración add_content_compression + VACUUM y repite
+las mediciones.
+
+Uso:
+    python util/benchmark_content_compression.py --items 5000 --large-every 10
+"""
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / 'src'))
+
+from database.db_manager import DBManager
+from database.migrations import add_content_compression
+from utils.compression import restore_content
+
+
+def make_large_content(index: int) -> str:
+    """Contenido grande y repetitivo, como el que se pega en la práctica"""
+    kind = index % 3
+    if kind == 0:
+        return "\n".join(
+            f"2026-10-19 12:{i % 60:02d}:{i % 60:02d} INFO worker-{i % 8} request {i} done in {i % 250} ms"
+            for i in range(600)
+        )
+    if kind == 1:
+        return json.dumps(
+            [{"id": i, "name": f"record-{i}", "active": i % 2 == 0, "tags": ["a", "b"]} for i in range(800)],
+            indent=2
+        )
+    return "\n".join(
+        f"INSERT INTO items (category_id, label, content) VALUES ({i % 10}, 'label {i}', 'content {i}');"
+        for i in range(500)
+    )
+
+
+def populate(db: DBManager, total_items: int, large_every: int) -> None:
+    category_id = db.add_category("Benchmark")
+    rows = []
+    for i in range(total_items):
+        content = make_large_content(i) if i % large_every == 0 else f"git commit -m 'change {i}'"
+        rows.append((category_id, f"Item {i}", content))
+    db.execute_many("INSERT INTO items (category_id, label, content) VALUES (?, ?, ?)", rows)
+
+
+def measure(db: DBManager, repeat: int = 3) -> dict:
+    """Tamaño del archivo (tras VACUUM) y mejor tiempo de lectura completa"""
+    conn = db.connect()
+    conn.execute("VACUUM")
+    size = db.db_path.stat().st_size
+
+    scan_times, load_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute("SELECT * FROM items").fetchall()
+        scan_times.append(time.perf_counter() - start)
+
+        # Lectura completa descomprimiendo todo el contenido (peor caso)
+        start = time.perf_counter()
+        for row in conn.execute("SELECT * FROM items"):
+            restore_content(dict(row))
+        load_times.append(time.perf_counter() - start)
+
+    return {
+        'db_size_mb': size / (1024 * 1024),
+        'scan_ms': min(scan_times) * 1000,
+        'load_ms': min(load_times) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de compresión de contenido")
+    parser.add_argument('--items', type=int, default=5000, help="Número de items")
+    parser.add_argument('--large-every', type=int, default=10, help="Uno de cada N items es grande")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DBManager(str(Path(tmp) / "benchmark.db"))
+
+        # Insertar sin comprimir para reproducir una base de datos previa a la migración
+        db.set_setting('content_compression_threshold', 0)
+        populate(db, args.items, args.large_every)
+        before = measure(db)
+
+        conn = db.connect()
+        start = time.perf_counter()
+        with db.transaction():
+            add_content_compression.upgrade(conn)
+        migration_s = time.perf_counter() - start
+        after = measure(db)
+        db.close()
+
+    print("=" * 60)
+    print(f"COMPRESIÓN DE CONTENIDO - {args.items} items (1 grande cada {args.large_every})")
+    print("=" * 60)
+    print(f"{'':<22}{'antes':>12}{'después':>12}")
+    print(f"{'Tamaño DB (MB)':<22}{before['db_size_mb']:>12.2f}{after['db_size_mb']:>12.2f}")
+    print(f"{'SELECT * (ms)':<22}{before['scan_ms']:>12.1f}{after['scan_ms']:>12.1f}")
+    print(f"{'+ descompresión (ms)':<22}{before['load_ms']:>12.1f}{after['load_ms']:>12.1f}")
+    print(f"\nMigración: {migration_s:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
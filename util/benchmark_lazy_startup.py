@@ -0,0 +1,116 @@
+"""
+Benchmark de arranque en frío: imports diferidos vs. imports anticipados
+
+Lanza procesos Python nuevos que importan los módulos que carga el arranque
+(MainController, MainWindow) y mide tiempo y memoria. El escenario
+"anticipado" importa además los subsistemas que ahora se cargan en el
+primer uso (QtWebEngine, matplotlib, wizard IA, notebook), reproduciendo
+el arranque anterior.
+
+Uso:
+    python util/benchmark_lazy_startup.py --runs 5
+"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+
+STARTUP_MODULES = [
+    'PyQt6.QtWidgets',
+    'controllers.main_controller',
+    'views.main_window',
+]
+
+DEFERRED_MODULES = [
+    'PyQt6.QtWebEngineWidgets',
+    'core.browser_profile_manager',
+    'views.dialogs.stats_dashboard',
+    'views.dialogs.ai_bulk_wizard',
+    'views.notebook_window',
+]
+
+# Script ejecutado en cada proceso hijo: importa y reporta tiempo + memoria pico
+CHILD_SCRIPT = r"""
+import sys, time, json, importlib
+sys.path.insert(0, sys.argv[1])
+modules = json.loads(sys.argv[2])
+start = time.perf_counter()
+failed = []
+for name in modules:
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        failed.append(f"{name}: {e.__class__.__name__}")
+elapsed_ms = (time.perf_counter() - start) * 1000
+
+peak_mb = None
+try:
+    import resource
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak_kb / (1024 * 1024) if sys.platform == 'darwin' else peak_kb / 1024
+except ImportError:
+    try:
+        import psutil
+        peak_mb = psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except Exception:
+        pass
+
+print(json.dumps({'elapsed_ms': elapsed_ms, 'peak_mb': peak_mb, 'failed': failed}))
+"""
+
+
+def run_scenario(modules, runs: int) -> dict:
+    """Mejor tiempo y memoria pico de `runs` procesos nuevos"""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD_SCRIPT, str(root_dir / 'src'), json.dumps(modules)],
+            capture_output=True, text=True, cwd=str(root_dir)
+        )
+        lines = output.stdout.strip().splitlines()
+        if output.returncode != 0 or not lines:
+            raise RuntimeError(output.stderr.strip() or "child process failed")
+        results.append(json.loads(lines[-1]))
+
+    peaks = [r['peak_mb'] for r in results if r['peak_mb'] is not None]
+    return {
+        'elapsed_ms': min(r['elapsed_ms'] for r in results),
+        'peak_mb': min(peaks) if peaks else None,
+        'failed': results[0]['failed'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de imports diferidos en el arranque")
+    parser.add_argument('--runs', type=int, default=5, help="Procesos por escenario")
+    args = parser.parse_args()
+
+    lazy = run_scenario(STARTUP_MODULES, args.runs)
+    eager = run_scenario(STARTUP_MODULES + DEFERRED_MODULES, args.runs)
+
+    def fmt_mb(value):
+        return f"{value:.1f}" if value is not None else "n/d"
+
+    print("=" * 60)
+    print(f"ARRANQUE EN FRÍO - imports (mejor de {args.runs})")
+    print("=" * 60)
+    print(f"{'':<20}{'anticipado':>14}{'diferido':>14}{'ahorro':>12}")
+    print(f"{'Tiempo (ms)':<20}{eager['elapsed_ms']:>14.0f}{lazy['elapsed_ms']:>14.0f}"
+          f"{eager['elapsed_ms'] - lazy['elapsed_ms']:>12.0f}")
+    saving_mb = (eager['peak_mb'] - lazy['peak_mb']
+                 if eager['peak_mb'] is not None and lazy['peak_mb'] is not None else None)
+    print(f"{'Memoria pico (MB)':<20}{fmt_mb(eager['peak_mb']):>14}{fmt_mb(lazy['peak_mb']):>14}"
+          f"{fmt_mb(saving_mb):>12}")
+
+    failed = sorted(set(lazy['failed'] + eager['failed']))
+    if failed:
+        print("\nMódulos no importables en este entorno (excluidos de la medición):")
+        for entry in failed:
+            print(f"  - {entry}")
+
+
+if __name__ == "__main__":
+    main()